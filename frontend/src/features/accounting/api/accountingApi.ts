@@ -7,6 +7,7 @@ import type {
   ExpenseListParams,
   SpendingByCategory,
   ReceiptExtraction,
+  ReceiptBatch,
   TaxSummary,
   TaxEstimate,
   TaxProjectionRequest,
@@ -91,6 +92,21 @@ export const accountingApi = {
     return response.data;
   },
 
+  // Queued batch receipt extraction
+  queueReceiptBatch: async (files: File[]): Promise<ReceiptBatch> => {
+    const formData = new FormData();
+    files.forEach((file) => formData.append('files', file));
+    const response = await apiClient.post<ReceiptBatch>('/expenses/receipts/batch', formData, {
+      headers: { 'Content-Type': 'multipart/form-data' },
+    });
+    return response.data;
+  },
+
+  getReceiptBatch: async (batchId: string): Promise<ReceiptBatch> => {
+    const response = await apiClient.get<ReceiptBatch>(`/expenses/receipts/batch/${batchId}`);
+    return response.data;
+  },
+
   // Tax preparation
   getTaxSummary: async (taxYear?: number): Promise<TaxSummary> => {
     const response = await apiClient.get<TaxSummary>('/accounting/tax-summary', {
@@ -24,6 +24,7 @@ export const accountingKeys = {
   pendingTransactions: () => [...accountingKeys.all, 'pending-transactions'] as const,
   auditLog: () => [...accountingKeys.all, 'audit-log'] as const,
   auditLogList: (params?: AuditLogParams) => [...accountingKeys.auditLog(), params] as const,
+  receiptBatch: (batchId: string) => [...accountingKeys.all, 'receipt-batch', batchId] as const,
 };
 
 // Accounting summary
@@ -110,6 +111,23 @@ export function useExtractReceipt() {
   });
 }
 
+// Queued batch receipt extraction
+export function useQueueReceiptBatch() {
+  return useMutation({
+    mutationFn: (files: File[]) => accountingApi.queueReceiptBatch(files),
+  });
+}
+
+/** Poll a receipt batch's progress (refetches every 3s until it completes) */
+export function useReceiptBatch(batchId: string | null) {
+  return useQuery({
+    queryKey: accountingKeys.receiptBatch(batchId ?? ''),
+    queryFn: () => accountingApi.getReceiptBatch(batchId as string),
+    enabled: !!batchId,
+    refetchInterval: (query) => (query.state.data?.status === 'completed' ? false : 3000),
+  });
+}
+
 // Tax summary
 export function useTaxSummary(taxYear?: number) {
   return useQuery({
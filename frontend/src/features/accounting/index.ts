@@ -20,6 +20,8 @@ export {
   useDeleteExpense,
   useSpendingByCategory,
   useExtractReceipt,
+  useQueueReceiptBatch,
+  useReceiptBatch,
   useTaxSummary,
   useTaxEstimate,
   useProjectTax,
@@ -42,6 +44,8 @@ export type {
   ExpenseListParams,
   SpendingByCategory,
   ReceiptExtraction,
+  ReceiptBatch,
+  ReceiptBatchItem,
   TaxCategorySummary,
   TaxSummary,
   TaxEstimate,
@@ -93,6 +93,33 @@ export interface ReceiptExtraction {
   confidence: number;
 }
 
+// Queued batch receipt extraction
+export type ReceiptBatchStatus = 'queued' | 'processing' | 'completed';
+
+export interface ReceiptBatchItem {
+  id: string;
+  file_key: string;
+  file_name: string;
+  status: 'pending' | 'processing' | 'completed' | 'failed';
+  cached: boolean;
+  amount: number | null;
+  vendor: string | null;
+  category: ExpenseCategory | null;
+  confidence: number | null;
+  error: string | null;
+}
+
+export interface ReceiptBatch {
+  batch_id: string;
+  status: ReceiptBatchStatus;
+  total: number;
+  completed: number;
+  failed: number;
+  cached: number;
+  pending: number;
+  items: ReceiptBatchItem[];
+}
+
 // Tax preparation
 export interface TaxCategorySummary {
   category: string;
@@ -11,6 +11,8 @@ import type {
   Campaign,
   CampaignCancelResult,
   CampaignCreate,
+  CampaignEstimate,
+  CampaignEstimateRequest,
   CampaignRecipient,
   CampaignRetryResult,
   CampaignSendAccepted,
@@ -106,6 +108,16 @@ export const campaignsApi = {
     return response.data;
   },
 
+  estimateCampaign: async (
+    data: CampaignEstimateRequest,
+  ): Promise<CampaignEstimate> => {
+    const response = await apiClient.post<CampaignEstimate>(
+      '/campaigns/estimate',
+      data,
+    );
+    return response.data;
+  },
+
   uploadCsv: async (
     file: File,
     attestation: {
@@ -153,10 +153,12 @@ export function AudienceBuilder({
       audience.leads = filter;
     }
 
-    if (csvResult && csvResult.recipients.length > 0) {
+    if (csvResult && csvResult.staged_recipients > 0) {
       audience.ad_hoc = {
         csv_upload_id: csvResult.upload_id,
-        recipients: csvResult.recipients,
+        // Large uploads are not returned inline; the server reads them from
+        // the staged upload via csv_upload_id.
+        recipients: csvResult.recipients.length > 0 ? csvResult.recipients : null,
         staff_attestation_confirmed: attestationChecked,
         attestation_text_shown: ATTESTATION_TEXT,
         attestation_version: ATTESTATION_VERSION,
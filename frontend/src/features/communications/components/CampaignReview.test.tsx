@@ -69,6 +69,37 @@ describe('CampaignReview', () => {
     expect(estimate).toHaveTextContent(/hour/);
   });
 
+  it('shows server-side segment and cost estimate when provided', () => {
+    renderReview({
+      estimate: {
+        recipients: 10,
+        total_segments: 14,
+        gsm7_messages: 8,
+        ucs2_messages: 2,
+        gsm7_segments: 8,
+        ucs2_segments: 6,
+        max_segments_per_message: 3,
+        cost_per_segment: 0.01,
+        projected_cost: 0.14,
+        sends_per_hour: 100,
+        send_window_hours: 13,
+        estimated_send_hours: 0.1,
+        estimated_send_days: 1,
+        rate_limit: {
+          hourly_allowed: 100,
+          hourly_used: 0,
+          hourly_remaining: 100,
+          daily_allowed: 0,
+          daily_used: 0,
+          daily_remaining: 0,
+        },
+      },
+    });
+    expect(screen.getByTestId('segment-estimate')).toHaveTextContent('14 total segments');
+    expect(screen.getByTestId('projected-cost')).toHaveTextContent('$0.14');
+    expect(screen.getByTestId('time-estimate')).toHaveTextContent('~100/hour');
+  });
+
   describe('typed confirmation for ≥50 recipients', () => {
     const largePreview: AudiencePreview = { ...basePreview, total: 75, customers_count: 75 };
 
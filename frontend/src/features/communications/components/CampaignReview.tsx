@@ -3,7 +3,9 @@
  *
  * Shows per-source breakdown, consent filter summary, time-zone warning,
  * estimated completion time, send now / schedule options, and typed
- * confirmation friction for large audiences.
+ * confirmation friction for large audiences. When the server-side estimate
+ * is available, segment totals, projected cost and completion time come from
+ * it (full audience, current rate limits) instead of the client-side guess.
  *
  * Validates: Requirements 15.11, 15.12, 33, 36
  */
@@ -15,7 +17,7 @@ import { Input } from '@/components/ui/input';
 import { Label } from '@/components/ui/label';
 import { Alert, AlertDescription } from '@/components/ui/alert';
 import { Separator } from '@/components/ui/separator';
-import type { AudiencePreview, PollOption } from '../types/campaign';
+import type { AudiencePreview, CampaignEstimate, PollOption } from '../types/campaign';
 import { countSegments, renderTemplate } from '../utils/segmentCounter';
 import { renderPollOptionsBlock } from '../utils/pollOptions';
 
@@ -31,6 +33,8 @@ const LARGE_AUDIENCE_THRESHOLD = 50;
 export interface CampaignReviewProps {
   /** Audience preview data from the preview endpoint */
   preview: AudiencePreview | null;
+  /** Full-audience segment/cost estimate from the estimate endpoint */
+  estimate?: CampaignEstimate | null;
   /** Message body (for segment count) */
   messageBody: string;
   /** Whether the poll-options editor was enabled in the Message step */
@@ -46,16 +50,21 @@ export interface CampaignReviewProps {
 }
 
 /** Estimate completion time in human-readable format */
-function formatEstimate(totalRecipients: number): string {
+function formatEstimate(
+  totalRecipients: number,
+  sendsPerHour: number = SENDS_PER_HOUR,
+  windowHours: number = WINDOW_HOURS,
+): string {
   if (totalRecipients <= 0) return '0 minutes';
-  const hours = totalRecipients / SENDS_PER_HOUR;
+  if (sendsPerHour <= 0) return 'unknown';
+  const hours = totalRecipients / sendsPerHour;
   if (hours < 1) {
     const mins = Math.ceil(hours * 60);
     return `~${mins} minute${mins !== 1 ? 's' : ''}`;
   }
   // Account for time-window gaps (13h window per day)
-  const days = Math.floor(hours / WINDOW_HOURS);
-  const remainingHours = hours - days * WINDOW_HOURS;
+  const days = Math.floor(hours / windowHours);
+  const remainingHours = hours - days * windowHours;
   if (days > 0) {
     const rh = Math.ceil(remainingHours * 10) / 10;
     return `~${days} day${days !== 1 ? 's' : ''} ${rh > 0 ? `+ ${rh}h` : ''}`;
@@ -66,6 +75,7 @@ function formatEstimate(totalRecipients: number): string {
 
 export function CampaignReview({
   preview,
+  estimate = null,
   messageBody,
   pollEnabled = false,
   pollOptions = [],
@@ -113,7 +123,12 @@ export function CampaignReview({
   const confirmationValid = !isLargeAudience || typedConfirmation.trim().toUpperCase() === expectedConfirmation;
 
   // Estimated completion time
-  const estimatedTime = formatEstimate(total);
+  const sendsPerHour = estimate?.sends_per_hour ?? SENDS_PER_HOUR;
+  const estimatedTime = formatEstimate(
+    total,
+    sendsPerHour,
+    estimate?.send_window_hours ?? WINDOW_HOURS,
+  );
 
   // Handle confirm — explicit mode checks to prevent schedule falling through to send-now
   const handleConfirm = () => {
@@ -197,8 +212,8 @@ export function CampaignReview({
             Estimated completion: <span className="font-semibold">{estimatedTime}</span>
           </p>
           <p className="text-xs text-slate-500">
-            Sending at ~{SENDS_PER_HOUR}/hour within the 8 AM – 9 PM CT window
-            {segments > 1 && (
+            Sending at ~{Math.round(sendsPerHour)}/hour within the 8 AM – 9 PM CT window
+            {!estimate && segments > 1 && (
               <span className="text-amber-600">
                 {' '}· {segments} segments per message (cost ×{segments})
               </span>
@@ -207,6 +222,34 @@ export function CampaignReview({
         </div>
       </div>
 
+      {/* Full-audience segment / cost estimate */}
+      {estimate && (
+        <div
+          className="rounded-lg border border-slate-200 p-3 text-sm space-y-1"
+          data-testid="segment-estimate"
+        >
+          <p className="text-slate-700">
+            <span className="font-semibold">{estimate.total_segments}</span> total segment
+            {estimate.total_segments !== 1 ? 's' : ''} across {estimate.recipients} recipient
+            {estimate.recipients !== 1 ? 's' : ''}
+            {estimate.projected_cost !== null && (
+              <span data-testid="projected-cost">
+                {' '}· projected cost{' '}
+                <span className="font-semibold">${estimate.projected_cost.toFixed(2)}</span>
+              </span>
+            )}
+          </p>
+          <p className="text-xs text-slate-500">
+            {estimate.gsm7_messages} GSM-7 · {estimate.ucs2_messages} Unicode (UCS-2)
+            {estimate.max_segments_per_message > 1 && (
+              <span className="text-amber-600">
+                {' '}· up to {estimate.max_segments_per_message} segments per message
+              </span>
+            )}
+          </p>
+        </div>
+      )}
+
       {/* Message Preview */}
       <div className="rounded-lg border border-slate-200 p-4 space-y-2">
         <h4 className="text-sm font-semibold text-slate-700">Message Preview</h4>
@@ -9,6 +9,7 @@ const mockCreateCampaign = { mutateAsync: vi.fn(), isPending: false };
 const mockUpdateCampaign = { mutateAsync: vi.fn(), isPending: false };
 const mockSendCampaign = { mutateAsync: vi.fn(), isPending: false };
 const mockAudiencePreview = { mutate: vi.fn(), isPending: false };
+const mockCampaignEstimate = { mutate: vi.fn(), isPending: false };
 
 vi.mock('@/features/auth', () => ({
   useAuth: () => ({ user: { id: 'test-user-1' } }),
@@ -19,6 +20,7 @@ vi.mock('../hooks', () => ({
   useUpdateCampaign: () => mockUpdateCampaign,
   useSendCampaign: () => mockSendCampaign,
   useAudiencePreview: () => mockAudiencePreview,
+  useCampaignEstimate: () => mockCampaignEstimate,
 }));
 
 // Mock child components to isolate wizard logic
@@ -27,8 +27,14 @@ import {
   useUpdateCampaign,
   useSendCampaign,
   useAudiencePreview,
+  useCampaignEstimate,
 } from '../hooks';
-import type { TargetAudience, AudiencePreview, PollOption } from '../types/campaign';
+import type {
+  TargetAudience,
+  AudiencePreview,
+  CampaignEstimate,
+  PollOption,
+} from '../types/campaign';
 import { validatePollOptions } from '../utils/pollOptions';
 
 // --- Constants ---
@@ -81,12 +87,15 @@ export function NewTextCampaignModal({
 
   // --- Preview state (fetched when entering step 2) ---
   const [preview, setPreview] = useState<AudiencePreview | null>(null);
+  // --- Full-audience estimate (fetched when entering step 3) ---
+  const [estimate, setEstimate] = useState<CampaignEstimate | null>(null);
 
   // --- Mutations ---
   const createCampaign = useCreateCampaign();
   const updateCampaign = useUpdateCampaign();
   const sendCampaign = useSendCampaign();
   const audiencePreviewMutation = useAudiencePreview();
+  const campaignEstimateMutation = useCampaignEstimate();
 
   // --- Draft persistence (localStorage, debounced 500ms) ---
   const draftTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
@@ -234,9 +243,22 @@ export function NewTextCampaignModal({
           return;
         }
       }
+      // Server-side segment/cost estimate over the full audience
+      setEstimate(null);
+      campaignEstimateMutation.mutate(
+        {
+          body: messageBody,
+          target_audience: audience,
+          poll_options: pollEnabled && pollOptions.length >= 2 ? pollOptions : null,
+        },
+        {
+          onSuccess: (data) => setEstimate(data),
+          onError: () => setEstimate(null),
+        },
+      );
       setStep(2);
     }
-  }, [step, hasAudience, campaignId, audience, messageBody, pollEnabled, pollOptions, pollOptionsValid, createCampaign, updateCampaign, audiencePreviewMutation]);
+  }, [step, hasAudience, campaignId, audience, messageBody, pollEnabled, pollOptions, pollOptionsValid, createCampaign, updateCampaign, audiencePreviewMutation, campaignEstimateMutation]);
 
   const handleBack = useCallback(() => {
     if (step > 0) setStep((s) => (s - 1) as Step);
@@ -249,6 +271,7 @@ export function NewTextCampaignModal({
     setMessageBody('');
     setCampaignId(null);
     setPreview(null);
+    setEstimate(null);
     setPollEnabled(false);
     setPollOptions([]);
   }, []);
@@ -387,6 +410,7 @@ export function NewTextCampaignModal({
         {step === 2 && (
           <CampaignReview
             preview={preview}
+            estimate={estimate}
             messageBody={messageBody}
             pollEnabled={pollEnabled}
             pollOptions={pollOptions}
@@ -53,6 +53,7 @@ export { campaignKeys, useCampaigns, useCampaign, useCampaignStats, useCampaignR
 export { useCreateCampaign, useUpdateCampaign, useDeleteCampaign } from './useCreateCampaign';
 export { useSendCampaign, useCancelCampaign, useRetryFailed } from './useSendCampaign';
 export { useAudiencePreview } from './useAudiencePreview';
+export { useCampaignEstimate } from './useCampaignEstimate';
 export { useAudienceCsv } from './useAudienceCsv';
 export { useCampaignProgress, useWorkerHealth } from './useCampaignProgress';
 export { campaignResponseKeys, useCampaignResponseSummary, useCampaignResponses } from './useCampaignResponses';
@@ -0,0 +1,11 @@
+import { useMutation } from '@tanstack/react-query';
+import { campaignsApi } from '../api/campaignsApi';
+import type { CampaignEstimateRequest } from '../types/campaign';
+
+/** Estimate segments, cost and send duration for a draft over its full audience */
+export function useCampaignEstimate() {
+  return useMutation({
+    mutationFn: (data: CampaignEstimateRequest) =>
+      campaignsApi.estimateCampaign(data),
+  });
+}
@@ -34,6 +34,7 @@ export {
   useSendCampaign,
   useCancelCampaign,
   useAudiencePreview,
+  useCampaignEstimate,
   useAudienceCsv,
   useCampaignProgress,
   useWorkerHealth,
@@ -70,6 +71,8 @@ export type {
   CsvRejectedRow,
   CsvUploadResult,
   RateLimitInfo,
+  CampaignEstimate,
+  CampaignEstimateRequest,
   WorkerHealth,
   PollOption,
   CampaignResponseRow,
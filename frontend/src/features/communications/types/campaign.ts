@@ -232,8 +232,14 @@ export interface CsvUploadResult {
   will_become_ghost_leads: number;
   rejected: number;
   duplicates_collapsed: number;
+  /** Distinct recipients staged server-side under upload_id */
+  staged_recipients: number;
+  /** First 500 rejected rows; see `rejected` for the full count */
   rejected_rows: CsvRejectedRow[];
-  /** Parsed and normalized recipients — embed in target_audience.ad_hoc.recipients */
+  /**
+   * Parsed and normalized recipients — embed in target_audience.ad_hoc.recipients.
+   * Empty for uploads too large to return inline (use csv_upload_id).
+   */
   recipients: AdHocRecipientPayload[];
 }
 
@@ -248,6 +254,31 @@ export interface RateLimitInfo {
   daily_remaining: number;
 }
 
+// --- Campaign Estimate ---
+
+export interface CampaignEstimateRequest {
+  body: string;
+  target_audience: TargetAudience;
+  poll_options?: PollOption[] | null;
+}
+
+export interface CampaignEstimate {
+  recipients: number;
+  total_segments: number;
+  gsm7_messages: number;
+  ucs2_messages: number;
+  gsm7_segments: number;
+  ucs2_segments: number;
+  max_segments_per_message: number;
+  cost_per_segment: number | null;
+  projected_cost: number | null;
+  sends_per_hour: number;
+  send_window_hours: number;
+  estimated_send_hours: number | null;
+  estimated_send_days: number | null;
+  rate_limit: RateLimitInfo;
+}
+
 export interface WorkerHealth {
   last_tick_at: string | null;
   last_tick_duration_ms: number | null;
@@ -86,6 +86,8 @@ export type {
   CsvRejectedRow,
   CsvUploadResult,
   RateLimitInfo,
+  CampaignEstimate,
+  CampaignEstimateRequest,
   WorkerHealth,
   PollOption,
   CampaignResponseRow,
@@ -38,8 +38,8 @@ export function MassNotifyPanel() {
         lien_days_past_due: lienDaysPastDue,
         lien_min_amount: lienMinAmount,
       });
-      toast.success('Mass Notification Sent', {
-        description: `Targeted: ${result.targeted}, Sent: ${result.sent}, Skipped: ${result.skipped}, Failed: ${result.failed}`,
+      toast.success('Mass Notification Queued', {
+        description: `Targeted: ${result.targeted}, Queued: ${result.pending ?? 0}, Skipped: ${result.skipped}`,
       });
       setOpen(false);
     } catch (err: unknown) {
@@ -210,6 +210,9 @@ export interface MassNotifyResponse {
   sent: number;
   failed: number;
   skipped: number;
+  run_id?: string | null;
+  status?: string;
+  pending?: number;
 }
 
 // PDF generation types (Req 80)
@@ -1,21 +1,37 @@
 import { useState, useEffect, useRef, useCallback } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { Search, X, Users, Briefcase, Loader2 } from 'lucide-react';
+import { Search, X, Users, UserPlus, Briefcase, Loader2 } from 'lucide-react';
 import { useDebounce } from '@/shared/hooks';
-import { customerApi } from '@/features/customers/api/customerApi';
+import { apiClient } from '@/core/api';
 import { jobApi } from '@/features/jobs/api/jobApi';
-import type { Customer } from '@/features/customers/types';
 import type { Job } from '@/features/jobs/types';
 import { cn } from '@/shared/utils/cn';
 
 interface SearchResult {
-  type: 'customer' | 'job';
+  type: 'customer' | 'lead' | 'job';
   id: string;
   title: string;
   subtitle: string;
   href: string;
 }
 
+/** Ranked, typo-tolerant match from GET /search (customers and leads) */
+interface RankedSearchResult {
+  type: 'customer' | 'lead';
+  id: string;
+  title: string;
+  subtitle: string;
+  rank: number;
+}
+
+const searchCustomersAndLeads = async (query: string): Promise<RankedSearchResult[]> => {
+  const response = await apiClient.get<{ query: string; results: RankedSearchResult[] }>(
+    '/search',
+    { params: { q: query, limit: 8 } },
+  );
+  return response.data.results;
+};
+
 export function GlobalSearch() {
   const [query, setQuery] = useState('');
   const [isOpen, setIsOpen] = useState(false);
@@ -36,23 +52,24 @@ export function GlobalSearch() {
 
     setIsLoading(true);
     try {
-      // Note: Invoice API doesn't support search, so we only search customers and jobs
-      const [customersRes, jobsRes] = await Promise.allSettled([
-        customerApi.search(searchQuery),
+      // Note: Invoice API doesn't support search, so we only search customers,
+      // leads (ranked server-side) and jobs
+      const [rankedRes, jobsRes] = await Promise.allSettled([
+        searchCustomersAndLeads(searchQuery),
         jobApi.search(searchQuery),
       ]);
 
       const searchResults: SearchResult[] = [];
 
-      // Process customers
-      if (customersRes.status === 'fulfilled') {
-        customersRes.value.items.slice(0, 5).forEach((customer: Customer) => {
+      // Process customers and leads (already ordered by relevance)
+      if (rankedRes.status === 'fulfilled') {
+        rankedRes.value.forEach((hit) => {
           searchResults.push({
-            type: 'customer',
-            id: customer.id,
-            title: `${customer.first_name} ${customer.last_name}`,
-            subtitle: customer.phone,
-            href: `/customers/${customer.id}`,
+            type: hit.type,
+            id: hit.id,
+            title: hit.title,
+            subtitle: hit.subtitle,
+            href: hit.type === 'customer' ? `/customers/${hit.id}` : `/leads/${hit.id}`,
           });
         });
       }
@@ -150,6 +167,8 @@ export function GlobalSearch() {
     switch (type) {
       case 'customer':
         return <Users className="h-4 w-4 text-teal-500" />;
+      case 'lead':
+        return <UserPlus className="h-4 w-4 text-amber-500" />;
       case 'job':
         return <Briefcase className="h-4 w-4 text-blue-500" />;
     }
@@ -159,6 +178,8 @@ export function GlobalSearch() {
     switch (type) {
       case 'customer':
         return 'Customer';
+      case 'lead':
+        return 'Lead';
       case 'job':
         return 'Job';
     }
@@ -178,7 +199,7 @@ export function GlobalSearch() {
           }}
           onFocus={() => setIsOpen(true)}
           onKeyDown={handleKeyDown}
-          placeholder="Search customers, jobs..."
+          placeholder="Search customers, leads, jobs..."
           className="w-full bg-slate-50 border border-slate-200 rounded-lg pl-10 pr-10 py-2 text-sm text-slate-600 placeholder-slate-400 focus:outline-none focus:ring-2 focus:ring-teal-100 focus:border-teal-500 transition-colors"
           data-testid="global-search-input"
         />
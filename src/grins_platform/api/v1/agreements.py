@@ -38,6 +38,7 @@ from grins_platform.repositories.lead_repository import LeadRepository
 from grins_platform.schemas.agreement import (
     AgreementDetailResponse,
     AgreementJobSummary,
+    AgreementMetricsHistoryResponse,
     AgreementMetricsResponse,
     AgreementNotesUpdateRequest,
     AgreementRenewalRejectRequest,
@@ -47,11 +48,13 @@ from grins_platform.schemas.agreement import (
     AgreementTierResponse,
     DashboardSummaryExtension,
     DisclosureRecordResponse,
+    MonthlyAgreementMetricsResponse,
     MrrDataPointResponse,
     MrrHistoryResponse,
     PaginatedAgreementResponse,
     TierDistributionItemResponse,
     TierDistributionResponse,
+    TierMonthlyMetricsResponse,
 )
 from grins_platform.services.agreement_service import AgreementService
 from grins_platform.services.compliance_service import ComplianceService
@@ -482,14 +485,15 @@ async def get_agreement_metrics(
 async def get_mrr_history(
     _current_user: ManagerOrAdminUser,
     db: Annotated[AsyncSession, Depends(get_db_session)],
+    months: Annotated[int, Query(ge=1, le=36, description="Months of history")] = 12,
 ) -> MrrHistoryResponse:
-    """Get MRR over trailing 12 months.
+    """Get MRR over trailing months (12 by default).
 
     Validates: Requirement 22.3
     """
-    _endpoints.log_started("get_mrr_history")
+    _endpoints.log_started("get_mrr_history", months=months)
     service = MetricsService(session=db)
-    history = await service.get_mrr_history()
+    history = await service.get_mrr_history(months)
     _endpoints.log_completed("get_mrr_history", count=len(history.data_points))
     return MrrHistoryResponse(
         data_points=[
@@ -499,6 +503,52 @@ async def get_mrr_history(
     )
 
 
+@router.get(
+    "/metrics/history",
+    response_model=AgreementMetricsHistoryResponse,
+    summary="Get monthly agreement metrics snapshots",
+)
+async def get_agreement_metrics_history(
+    _current_user: ManagerOrAdminUser,
+    db: Annotated[AsyncSession, Depends(get_db_session)],
+    months: Annotated[
+        int,
+        Query(ge=1, le=36, description="Closed months of history"),
+    ] = 12,
+) -> AgreementMetricsHistoryResponse:
+    """Get MRR, active count, churn and renewal rate per closed month and tier.
+
+    Validates: Requirement 22.3
+    """
+    _endpoints.log_started("get_agreement_metrics_history", months=months)
+    service = MetricsService(session=db)
+    history = await service.get_metrics_history(months)
+    _endpoints.log_completed("get_agreement_metrics_history", count=len(history))
+    return AgreementMetricsHistoryResponse(
+        months=[
+            MonthlyAgreementMetricsResponse(
+                month=m.month,
+                active_count=m.active_count,
+                mrr=m.mrr,
+                churn_rate=m.churn_rate,
+                renewal_rate=m.renewal_rate,
+                tiers=[
+                    TierMonthlyMetricsResponse(
+                        tier_id=t.tier_id,
+                        tier_name=t.tier_name,
+                        active_count=t.active_count,
+                        mrr=t.mrr,
+                        churn_rate=t.churn_rate,
+                        renewal_rate=t.renewal_rate,
+                    )
+                    for t in m.tiers
+                ],
+            )
+            for m in history
+        ],
+    )
+
+
 @router.get(
     "/metrics/tier-distribution",
     response_model=TierDistributionResponse,
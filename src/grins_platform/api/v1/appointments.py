@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import math
 from datetime import date, timedelta
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
 from fastapi import (
@@ -169,6 +169,17 @@ async def list_appointments(
         pattern="^(asc|desc)$",
         description="Sort order (asc or desc)",
     ),
+    cursor: str | None = Query(
+        default=None,
+        description=(
+            "Keyset cursor (next_cursor of the previous page); send it empty "
+            "to start cursor paging"
+        ),
+    ),
+    count: Literal["exact", "cached", "none"] = Query(
+        default="cached",
+        description="Total count in cursor mode: exact, cached (first page) or none",
+    ),
 ) -> AppointmentPaginatedResponse:
     """List appointments with filtering and pagination.
 
@@ -185,20 +196,41 @@ async def list_appointments(
         },
     )
 
-    appointments, total = await service.list_appointments(
-        page=page,
-        page_size=page_size,
-        status=status_filter,
-        staff_id=staff_id,
-        job_id=job_id,
-        date_from=date_from,
-        date_to=date_to,
-        sort_by=sort_by,
-        sort_order=sort_order,
-        include_relationships=True,
-    )
+    next_cursor: str | None = None
+    total: int | None
+    if cursor is not None:
+        keyset_page = await service.list_appointments_keyset(
+            cursor=cursor,
+            page_size=page_size,
+            status=status_filter,
+            staff_id=staff_id,
+            job_id=job_id,
+            date_from=date_from,
+            date_to=date_to,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            count=count,
+            include_relationships=True,
+        )
+        appointments, total = keyset_page.items, keyset_page.total
+        next_cursor = keyset_page.next_cursor
+    else:
+        appointments, total = await service.list_appointments(
+            page=page,
+            page_size=page_size,
+            status=status_filter,
+            staff_id=staff_id,
+            job_id=job_id,
+            date_from=date_from,
+            date_to=date_to,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            include_relationships=True,
+        )
 
-    total_pages = math.ceil(total / page_size) if total > 0 else 0
+    total_pages: int | None = None
+    if total is not None:
+        total_pages = math.ceil(total / page_size) if total > 0 else 0
 
     _endpoints.log_completed("list_appointments", count=len(appointments), total=total)
 
@@ -215,6 +247,7 @@ async def list_appointments(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -8,14 +8,13 @@ Validates: Requirements 9.1, 9.2, 9.3, 9.4, 9.5, 9.6, 30, 44
 
 from __future__ import annotations
 
-import contextlib
-import os
 from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Depends, Request, Response, status
 
 from grins_platform.database import get_db_session as get_db
 from grins_platform.log_config import get_logger
+from grins_platform.redis_manager import get_redis_manager
 from grins_platform.services.sms.factory import get_sms_provider
 from grins_platform.services.sms_service import SMSService
 
@@ -32,17 +31,9 @@ _REDIS_KEY_PREFIX = "sms:webhook:processed:callrail"
 _REDIS_TTL_SECONDS = 86400  # 24 hours
 
 
-async def _get_redis() -> Redis | None:
-    """Return an async Redis client, or None if unavailable."""
-    redis_url = os.environ.get("REDIS_URL")
-    if not redis_url:
-        return None
-    try:
-        from redis.asyncio import Redis as _Redis  # noqa: PLC0415
-
-        return _Redis.from_url(redis_url, decode_responses=True)
-    except Exception:
-        return None
+def _get_redis() -> Redis | None:
+    """Return the shared pooled Redis client, or None if unavailable."""
+    return get_redis_manager().client
 
 
 async def _is_duplicate(
@@ -127,23 +118,18 @@ async def callrail_inbound(
     # 3. Idempotency dedupe via Redis
     conversation_id = str(payload.get("resource_id", ""))
     created_at = str(payload.get("created_at", ""))
-    redis = await _get_redis()
-    try:
-        if await _is_duplicate(redis, conversation_id, created_at):
-            logger.info(
-                "sms.webhook.duplicate_skipped",
-                provider="callrail",
-                conversation_id=conversation_id,
-            )
-            return Response(
-                content='{"status": "already_processed"}',
-                status_code=status.HTTP_200_OK,
-                media_type="application/json",
-            )
-    finally:
-        if redis is not None:
-            with contextlib.suppress(Exception):
-                await redis.aclose()
+    redis = _get_redis()
+    if await _is_duplicate(redis, conversation_id, created_at):
+        logger.info(
+            "sms.webhook.duplicate_skipped",
+            provider="callrail",
+            conversation_id=conversation_id,
+        )
+        return Response(
+            content='{"status": "already_processed"}',
+            status_code=status.HTTP_200_OK,
+            media_type="application/json",
+        )
 
     # 4. Parse inbound message and route to SMSService
     try:
@@ -175,13 +161,7 @@ async def callrail_inbound(
             media_type="application/json",
         )
 
-    mark_redis = await _get_redis()
-    try:
-        await _mark_processed(mark_redis, conversation_id, created_at)
-    finally:
-        if mark_redis is not None:
-            with contextlib.suppress(Exception):
-                await mark_redis.aclose()
+    await _mark_processed(redis, conversation_id, created_at)
 
     logger.info(
         "sms.webhook.inbound",
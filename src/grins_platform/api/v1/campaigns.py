@@ -43,6 +43,8 @@ from grins_platform.schemas.campaign import (
     AudiencePreviewResponse,
     CampaignCancelResult,
     CampaignCreate,
+    CampaignEstimateRequest,
+    CampaignEstimateResponse,
     CampaignRecipientResponse,
     CampaignResponse,
     CampaignRetryResult,
@@ -178,6 +180,7 @@ async def get_worker_health(
     from sqlalchemy import func  # noqa: PLC0415
 
     from grins_platform.models.campaign import CampaignRecipient  # noqa: PLC0415
+    from grins_platform.redis_manager import get_redis_manager  # noqa: PLC0415
     from grins_platform.schemas.campaign import RateLimitInfo  # noqa: PLC0415
     from grins_platform.services.sms.rate_limit_tracker import (  # noqa: PLC0415
         SMSRateLimitTracker,
@@ -192,13 +195,9 @@ async def get_worker_health(
     orphans_recovered = 0
     worker_status = "unknown"
 
-    redis_url = os.environ.get("REDIS_URL")
-    redis_client = None
-    if redis_url:
+    redis_client = get_redis_manager().client
+    if redis_client is not None:
         try:
-            from redis.asyncio import Redis  # noqa: PLC0415
-
-            redis_client = Redis.from_url(redis_url, decode_responses=True)
             raw = await redis_client.get("sms:worker:last_tick")
             if raw:
                 tick_data = json.loads(raw)
@@ -221,9 +220,6 @@ async def get_worker_health(
                 "get_worker_health",
                 reason="redis_read_failed",
             )
-        finally:
-            if redis_client:
-                await redis_client.aclose()
 
     # 2. Count pending and sending recipients from DB
     pending_result = await session.execute(
@@ -241,16 +237,12 @@ async def get_worker_health(
     provider_name = os.environ.get("SMS_PROVIDER", "callrail")
     account_id = os.environ.get("CALLRAIL_ACCOUNT_ID", "")
 
-    rl_redis = None
-    if redis_url:
+    if redis_client is not None:
         try:
-            from redis.asyncio import Redis  # noqa: PLC0415
-
-            rl_redis = Redis.from_url(redis_url, decode_responses=True)
             tracker = SMSRateLimitTracker(
                 provider=provider_name,
                 account_id=account_id,
-                redis_client=rl_redis,
+                redis_client=redis_client,
             )
             rl_result = await tracker.check()
             state = rl_result.state
@@ -267,9 +259,6 @@ async def get_worker_health(
                 "get_worker_health",
                 reason="rate_limit_read_failed",
             )
-        finally:
-            if rl_redis:
-                await rl_redis.aclose()
 
     _endpoints.log_completed("get_worker_health", status=worker_status)
     return WorkerHealthResponse(
@@ -311,6 +300,41 @@ async def preview_audience(
     return AudiencePreviewResponse(**result)
 
 
+@router.post(
+    "/estimate",
+    response_model=CampaignEstimateResponse,
+    summary="Estimate campaign segments and cost",
+    description=(
+        "Estimate total SMS segments, GSM-7/UCS-2 split, projected cost and "
+        "send duration for a draft body across its full audience."
+    ),
+)
+async def estimate_campaign(
+    data: CampaignEstimateRequest,
+    _current_user: ManagerOrAdminUser,
+    service: Annotated[CampaignService, Depends(get_campaign_service)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> CampaignEstimateResponse:
+    """Estimate a draft campaign before it is sent."""
+    _endpoints.log_started("estimate_campaign")
+    result = await service.estimate_campaign(
+        session,
+        data.body,
+        data.target_audience.model_dump(exclude_none=True),
+        (
+            [opt.model_dump(mode="json") for opt in data.poll_options]
+            if data.poll_options
+            else None
+        ),
+    )
+    _endpoints.log_completed(
+        "estimate_campaign",
+        recipients=result["recipients"],
+        total_segments=result["total_segments"],
+    )
+    return CampaignEstimateResponse(**result)
+
+
 @router.post(
     "/audience/csv",
     response_model=CsvUploadResult,
@@ -319,7 +343,8 @@ async def preview_audience(
     description=(
         "Upload a CSV file with phone, first_name, last_name columns. "
         "Returns upload_id and recipient breakdown. Ghost leads are NOT "
-        "created until final campaign send."
+        "created until final campaign send. Accepts up to 25 MB / "
+        "100,000 rows."
     ),
 )
 async def upload_csv_audience(
@@ -339,12 +364,12 @@ async def upload_csv_audience(
         Form(description="Attestation form version"),
     ] = "CSV_ATTESTATION_V1",
 ) -> CsvUploadResult:
-    """Parse a CSV audience file and return normalized recipients inline.
+    """Stream a CSV audience file into the staging table.
 
-    Recipients are returned directly in the response so the frontend can embed
-    them in ``target_audience.ad_hoc.recipients``. This removes the previous
-    Redis-staging dependency (which failed when Redis was unavailable or the
-    1-hour TTL expired between upload and send).
+    The file is decoded and matched in chunks and every recipient is staged
+    under ``upload_id``; campaigns reference it via
+    ``target_audience.ad_hoc.csv_upload_id``. Uploads small enough to embed
+    also return the recipients inline for ``target_audience.ad_hoc.recipients``.
 
     Validates: Requirements 13.9, 23.5, 25, 30, 31, 35, 41
     """
@@ -355,8 +380,7 @@ async def upload_csv_audience(
         bulk_insert_attestation_consent,
     )
     from grins_platform.services.sms.csv_upload import (  # noqa: PLC0415
-        match_recipients,
-        parse_csv,
+        stage_csv_upload,
     )
 
     _endpoints.log_started("upload_csv_audience")
@@ -367,67 +391,66 @@ async def upload_csv_audience(
             detail="Staff attestation must be confirmed before upload",
         )
 
-    raw_bytes = await file.read()
-
-    try:
-        parse_result = parse_csv(raw_bytes)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-
-    matched_customers, matched_leads, will_ghost = await match_recipients(
-        session,
-        parse_result.recipients,
-    )
-
     # Persist marketing consent records for every attested phone so the
     # send-time consent gate (check_sms_consent) allows delivery. The
     # attestation IS the consent record under staff-attestation consent
-    # method (Requirement 25).
-    if parse_result.recipients:
-        await bulk_insert_attestation_consent(
+    # method (Requirement 25). Inserted per chunk as the file is staged.
+    async def _record_consent(phones: list[str]) -> None:
+        _ = await bulk_insert_attestation_consent(
             session,
             staff_id=current_user.id,
-            phones=[r.phone_e164 for r in parse_result.recipients],
+            phones=phones,
             attestation_version=attestation_version,
             attestation_text=attestation_text_shown,
         )
 
+    try:
+        stage_result = await stage_csv_upload(
+            session,
+            file.file,
+            on_chunk=_record_consent,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
     # Emit audit event
     await log_csv_attestation_submitted(
         session,
-        upload_id=parse_result.upload_id,
+        upload_id=str(stage_result.upload_id),
         actor_id=current_user.id,
         actor_role=current_user.role,
-        phone_count=len(parse_result.recipients),
+        phone_count=stage_result.staged,
         attestation_version=attestation_version,
     )
 
     _endpoints.log_completed(
         "upload_csv_audience",
-        upload_id=parse_result.upload_id,
-        total_rows=parse_result.total_rows,
-        recipients=len(parse_result.recipients),
-        rejected=len(parse_result.rejected),
+        upload_id=str(stage_result.upload_id),
+        total_rows=stage_result.total_rows,
+        recipients=stage_result.staged,
+        rejected=stage_result.rejected_count,
+        inline=stage_result.inline_recipients is not None,
     )
 
     return CsvUploadResult(
-        upload_id=parse_result.upload_id,
-        total_rows=parse_result.total_rows,
-        matched_customers=matched_customers,
-        matched_leads=matched_leads,
-        will_become_ghost_leads=will_ghost,
-        rejected=len(parse_result.rejected),
-        duplicates_collapsed=parse_result.duplicates_collapsed,
+        upload_id=str(stage_result.upload_id),
+        total_rows=stage_result.total_rows,
+        matched_customers=stage_result.matched_customers,
+        matched_leads=stage_result.matched_leads,
+        will_become_ghost_leads=stage_result.will_become_ghost_leads,
+        rejected=stage_result.rejected_count,
+        duplicates_collapsed=stage_result.duplicates_collapsed,
+        staged_recipients=stage_result.staged,
         rejected_rows=[
             CsvRejectedRow(
                 row_number=r.row_number,
                 phone_raw=r.phone_raw,
                 reason=r.reason,
             )
-            for r in parse_result.rejected
+            for r in stage_result.rejected
         ],
         recipients=[
             AdHocRecipientPayload(
@@ -435,7 +458,7 @@ async def upload_csv_audience(
                 first_name=r.first_name,
                 last_name=r.last_name,
             )
-            for r in parse_result.recipients
+            for r in stage_result.inline_recipients or []
         ],
     )
 
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TC002
 
 from grins_platform.api.v1.dependencies import get_db_session
 from grins_platform.log_config import LoggerMixin
+from grins_platform.redis_manager import get_redis_manager
 from grins_platform.services.chat_service import ChatService
 
 router = APIRouter()
@@ -75,7 +76,7 @@ async def public_chat(
     """
     _endpoints.log_started("public_chat", session_id=data.session_id)
     try:
-        service = ChatService()
+        service = ChatService(redis_client=get_redis_manager().client)
         chat_session_id = data.session_id or str(uuid.uuid4())
         result = await service.handle_public_message(
             db=session,
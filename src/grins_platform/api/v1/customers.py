@@ -11,7 +11,7 @@ Validates: Requirement 1.1-1.6, 3.1-3.6, 4.1-4.7, 6.6, 7.1-7.6, 8.1-8.5,
 
 from __future__ import annotations
 
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
 from fastapi import (
@@ -20,10 +20,10 @@ from fastapi import (
     File,
     HTTPException,
     Query,
-    Response,
     UploadFile,
     status,
 )
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import (
     AsyncSession,  # noqa: TC002 - Required at runtime for FastAPI DI
 )
@@ -32,6 +32,7 @@ from grins_platform.api.v1.auth_dependencies import (
     CurrentActiveUser,  # noqa: TC001 - Required at runtime for FastAPI DI
 )
 from grins_platform.api.v1.dependencies import (
+    get_customer_import_service,
     get_customer_merge_service,
     get_customer_service,
     get_db_session,
@@ -70,12 +71,19 @@ from grins_platform.schemas.customer import (
 from grins_platform.schemas.customer_document import (
     CustomerDocumentResponse,
 )
+from grins_platform.schemas.customer_import import CustomerImportResult
 from grins_platform.schemas.customer_merge import (
+    BatchMergeRequest,
+    BatchMergeResponse,
     MergeCandidateResponse,
     MergeExecuteBody,
     MergePreviewResponse,
     PaginatedMergeCandidateResponse,
 )
+from grins_platform.services.customer_import_service import (
+    MAX_IMPORT_FILE_SIZE,
+    CustomerImportService,
+)
 from grins_platform.services.customer_merge_service import (
     CustomerMergeService,  # noqa: TC001 - Required at runtime for FastAPI DI
 )
@@ -89,6 +97,11 @@ from grins_platform.services.photo_service import (
     PhotoService,
     UploadContext,
 )
+from grins_platform.utils.tabular_export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+)
+from grins_platform.utils.tabular_import import import_format_for
 
 router = APIRouter()
 
@@ -239,6 +252,57 @@ async def get_duplicates(
     )
 
 
+# =============================================================================
+# POST /api/v1/customers/merge/batch — merge many reviewed candidates
+# =============================================================================
+
+
+@router.post(  # type: ignore[untyped-decorator]
+    "/merge/batch",
+    response_model=BatchMergeResponse,
+    summary="Merge many duplicate candidates",
+    description=(
+        "Merge reviewed candidates in one transaction, resolving merge chains. "
+        "Items that cannot be merged are rejected individually; use dry_run to "
+        "see the plan and row counts first."
+    ),
+)
+async def batch_merge_customers(
+    data: BatchMergeRequest,
+    current_user: CurrentActiveUser,
+    merge_service: Annotated[
+        CustomerMergeService,
+        Depends(get_customer_merge_service),
+    ],
+    db: Annotated[AsyncSession, Depends(get_db_session)],
+) -> BatchMergeResponse:
+    """Merge a batch of reviewed duplicate candidates.
+
+    Validates: CRM Changes Update 2 Req 6.1, 6.3
+    """
+    _endpoints.log_started(
+        "batch_merge_customers",
+        count=len(data.merges),
+        dry_run=data.dry_run,
+    )
+
+    result = await merge_service.execute_batch_merge(
+        db=db,
+        merges=data.merges,
+        dry_run=data.dry_run,
+        admin_id=current_user.id,
+    )
+    if not data.dry_run:
+        await db.commit()
+
+    _endpoints.log_completed(
+        "batch_merge_customers",
+        merged=result.merged,
+        rejected=result.rejected,
+    )
+    return result
+
+
 # =============================================================================
 # CRM Changes Update 2: POST /api/v1/customers/{id}/merge — execute merge
 # =============================================================================
@@ -575,6 +639,17 @@ async def list_customers(
         pattern="^(asc|desc)$",
         description="Sort order (asc or desc)",
     ),
+    cursor: str | None = Query(
+        default=None,
+        description=(
+            "Keyset cursor (next_cursor of the previous page); send it empty "
+            "to start cursor paging"
+        ),
+    ),
+    count: Literal["exact", "cached", "none"] = Query(
+        default="cached",
+        description="Total count in cursor mode: exact, cached (first page) or none",
+    ),
 ) -> PaginatedCustomerResponse:
     """List customers with filtering and pagination.
 
@@ -590,6 +665,8 @@ async def list_customers(
         search: Search by name or email
         sort_by: Field to sort by
         sort_order: Sort order (asc or desc)
+        cursor: Keyset cursor; when present, page is ignored
+        count: Total count mode for cursor paging
 
     Returns:
         PaginatedCustomerResponse with customers and pagination info
@@ -621,6 +698,8 @@ async def list_customers(
         is_subscription_property=is_subscription_property,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
+        count=count,
     )
 
     result = await service.list_customers(params)
@@ -870,54 +949,178 @@ async def get_customer_jobs(
 
 @router.post(  # type: ignore[untyped-decorator]
     "/export",
-    summary="Export customers to CSV",
-    description="Export customers to CSV format with optional city filter.",
+    summary="Export customers",
+    description=(
+        "Stream all customers matching the list filters as CSV, gzipped CSV or XLSX."
+    ),
 )
 async def export_customers(
     service: Annotated[CustomerService, Depends(get_customer_service)],
+    export_format: ExportFormat = Query(
+        default="csv",
+        alias="format",
+        description="Output format: csv, csv.gz or xlsx",
+    ),
+    limit: int | None = Query(
+        default=None,
+        ge=1,
+        description="Maximum records to export (default: all)",
+    ),
     city: str | None = Query(
         default=None,
         description="Filter by city",
     ),
-    limit: int = Query(
-        default=1000,
-        ge=1,
-        le=1000,
-        description="Maximum records to export (max 1000)",
+    status_filter: CustomerStatus | None = Query(
+        default=None,
+        alias="status",
+        description="Filter by customer status",
     ),
-) -> Response:
-    """Export customers to CSV.
+    is_priority: bool | None = Query(default=None),
+    is_red_flag: bool | None = Query(default=None),
+    is_slow_payer: bool | None = Query(default=None),
+    sms_opt_in: bool | None = Query(default=None),
+    search: str | None = Query(default=None),
+    property_type: PropertyType | None = Query(default=None),
+    is_hoa: bool | None = Query(default=None),
+    is_subscription_property: bool | None = Query(default=None),
+    sort_by: str = Query(default="last_name"),
+    sort_order: str = Query(default="asc", pattern="^(asc|desc)$"),
+) -> StreamingResponse:
+    """Export customers as a streamed file.
 
     Args:
         service: Injected CustomerService
-        city: Optional city filter
-        limit: Maximum records to export
+        export_format: csv, csv.gz or xlsx
+        limit: Optional cap on exported records
+        city: Filter by city
+        status_filter: Filter by customer status
+        is_priority: Filter by priority flag
+        is_red_flag: Filter by red flag
+        is_slow_payer: Filter by slow payer flag
+        sms_opt_in: Filter by SMS opt-in status
+        search: Search by name, email, phone or address
+        property_type: Filter by property type
+        is_hoa: Filter by HOA property flag
+        is_subscription_property: Filter by subscription property
+        sort_by: Field to sort by
+        sort_order: Sort order (asc or desc)
 
     Returns:
-        CSV file response
+        Streaming file response
 
     Validates: Requirement 12.1-12.2, 12.4
     """
-    _endpoints.log_started("export_customers", city=city, limit=limit)
+    _endpoints.log_started(
+        "export_customers",
+        export_format=export_format,
+        city=city,
+        limit=limit,
+    )
 
-    try:
-        csv_content = await service.export_customers_csv(city=city, limit=limit)
-    except BulkOperationError as e:
-        _endpoints.log_rejected("export_customers", reason="exceeds_limit")
+    params = CustomerListParams(
+        city=city,
+        status=status_filter,
+        is_priority=is_priority,
+        is_red_flag=is_red_flag,
+        is_slow_payer=is_slow_payer,
+        sms_opt_in=sms_opt_in,
+        search=search,
+        property_type=property_type,
+        is_hoa=is_hoa,
+        is_subscription_property=is_subscription_property,
+        sort_by=sort_by,
+        sort_order=sort_order,
+    )
+    chunks = service.export_customers(
+        params,
+        export_format=export_format,
+        limit=limit,
+    )
+
+    _endpoints.log_completed("export_customers", export_format=export_format)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (f"attachment; filename=customers.{export_format}"),
+        },
+    )
+
+
+# =============================================================================
+# POST /api/v1/customers/import - Bulk Import Customers
+# =============================================================================
+
+
+@router.post(  # type: ignore[untyped-decorator]
+    "/import",
+    response_model=CustomerImportResult,
+    summary="Import customers",
+    description=(
+        "Bulk import customers, each with an optional primary property, from a "
+        "CSV or XLSX file. Returns a per-row report of invalid and duplicate rows."
+    ),
+)
+async def import_customers(
+    _user: CurrentActiveUser,
+    db: Annotated[AsyncSession, Depends(get_db_session)],
+    import_service: Annotated[
+        CustomerImportService,
+        Depends(get_customer_import_service),
+    ],
+    file: Annotated[UploadFile, File(description="CSV or XLSX file to import")],
+    dry_run: bool = Query(
+        default=False,
+        description="Validate and report without creating customers",
+    ),
+) -> CustomerImportResult:
+    """Bulk import customers from an uploaded file.
+
+    Args:
+        _user: Authenticated user
+        db: Async database session
+        import_service: Injected CustomerImportService
+        file: Uploaded CSV or XLSX file
+        dry_run: Only validate and deduplicate
+
+    Returns:
+        CustomerImportResult with counts and row errors
+
+    Raises:
+        HTTPException: 400 if the file type is not supported
+
+    Validates: Requirement 1.2, 1.3, 2.2-2.4
+    """
+    _endpoints.log_started(
+        "import_customers",
+        file_name=file.filename or "unknown",
+        dry_run=dry_run,
+    )
+
+    import_format = import_format_for(file.filename)
+    if import_format is None:
+        _endpoints.log_rejected("import_customers", reason="unsupported_file_type")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-    else:
-        _endpoints.log_completed("export_customers")
-        return Response(
-            content=csv_content,
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": "attachment; filename=customers.csv",
-            },
+            detail="Unsupported file type; upload a .csv or .xlsx file",
         )
 
+    data = await file.read(MAX_IMPORT_FILE_SIZE + 1)
+    result = await import_service.import_customers(
+        db,
+        data,
+        import_format,
+        dry_run=dry_run,
+    )
+
+    _endpoints.log_completed(
+        "import_customers",
+        imported=result.imported,
+        duplicates=result.duplicates,
+        invalid=result.invalid,
+    )
+    return result
+
 
 # =============================================================================
 # Task 8.6: PUT /api/v1/customers/bulk/preferences - Bulk Update Preferences
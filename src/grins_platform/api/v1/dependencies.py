@@ -36,8 +36,10 @@ from grins_platform.repositories.service_offering_repository import (
 from grins_platform.repositories.staff_repository import StaffRepository
 from grins_platform.services.appointment_service import AppointmentService
 from grins_platform.services.campaign_service import CampaignService
+from grins_platform.services.customer_import_service import CustomerImportService
 from grins_platform.services.customer_merge_service import CustomerMergeService
 from grins_platform.services.customer_service import CustomerService
+from grins_platform.services.dashboard_metrics import dashboard_metrics_cache
 from grins_platform.services.dashboard_service import DashboardService
 from grins_platform.services.duplicate_detection_service import (
     DuplicateDetectionService,
@@ -80,7 +82,10 @@ async def get_customer_service(
         CustomerService instance
     """
     repository = CustomerRepository(session=session)
-    return CustomerService(repository=repository)
+    return CustomerService(
+        repository=repository,
+        duplicate_detector=DuplicateDetectionService(),
+    )
 
 
 def get_duplicate_detection_service() -> DuplicateDetectionService:
@@ -93,6 +98,11 @@ def get_customer_merge_service() -> CustomerMergeService:
     return CustomerMergeService()
 
 
+def get_customer_import_service() -> CustomerImportService:
+    """Get CustomerImportService dependency."""
+    return CustomerImportService()
+
+
 async def get_property_service(
     session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> PropertyService:
@@ -108,7 +118,10 @@ async def get_property_service(
         PropertyService instance
     """
     repository = PropertyRepository(session=session)
-    return PropertyService(repository=repository)
+    return PropertyService(
+        repository=repository,
+        duplicate_detector=DuplicateDetectionService(),
+    )
 
 
 async def get_service_offering_service(
@@ -262,6 +275,7 @@ async def get_dashboard_service(
         lead_repository=lead_repository,
         invoice_repository=invoice_repository,
         session=session,
+        metrics_cache=dashboard_metrics_cache,
     )
 
 
@@ -1,8 +1,9 @@
 """Expense API endpoints.
 
-Provides CRUD for expenses, category aggregation, and OCR receipt extraction.
+Provides CRUD for expenses, category aggregation, OCR receipt extraction,
+and queued batch receipt extraction with progress.
 
-Validates: CRM Gap Closure Req 53.2, 53.3, 53.5, 60.5
+Validates: CRM Gap Closure Req 53.2, 53.3, 53.5, 60.1, 60.5
 """
 
 from __future__ import annotations
@@ -10,7 +11,15 @@ from __future__ import annotations
 from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TC002
 
 from grins_platform.api.v1.auth_dependencies import (
@@ -26,9 +35,11 @@ from grins_platform.schemas.expense import (
     ExpenseByCategoryResponse,
     ExpenseCreate,
     ExpenseResponse,
+    ReceiptBatchResponse,
     ReceiptExtractionResponse,
 )
 from grins_platform.services.accounting_service import (
+    RECEIPT_BATCH_MAX_FILES,
     AccountingService,
     ReceiptExtractionError,
 )
@@ -93,28 +104,25 @@ async def get_expenses_by_category(
     "/extract-receipt",
     response_model=ReceiptExtractionResponse,
     summary="Extract receipt data via OCR",
-    description="Provide a receipt S3 file key for OCR amount/vendor extraction.",
+    description=(
+        "Upload a receipt for OCR amount/vendor extraction. A receipt "
+        "extracted before is answered from the result cache."
+    ),
 )
 async def extract_receipt(
     _current_user: CurrentActiveUser,
     service: Annotated[AccountingService, Depends(_get_accounting_service)],
-    receipt_file_key: str = Query(
-        ...,
-        description="S3 key of the uploaded receipt image",
-    ),
+    file: Annotated[UploadFile, File(description="Receipt image or PDF")],
 ) -> ReceiptExtractionResponse:
     """Extract receipt data via OCR.
 
-    Note: This endpoint accepts an S3 file key. The service downloads
-    the image from S3 and processes it via OpenAI Vision.
-
     Validates: CRM Gap Closure Req 60.5
     """
-    _endpoints.log_started("extract_receipt", file_key=receipt_file_key)
+    _endpoints.log_started("extract_receipt", file_name=file.filename or "unknown")
     try:
-        result = await service.extract_receipt(
-            image_data=b"",  # Placeholder — real impl downloads from S3
-            content_type="image/jpeg",
+        result = await service.extract_receipt_cached(
+            image_data=await file.read(),
+            content_type=file.content_type or "image/jpeg",
         )
     except ReceiptExtractionError as e:
         raise HTTPException(
@@ -126,6 +134,71 @@ async def extract_receipt(
         return result
 
 
+@router.post(
+    "/receipts/batch",
+    response_model=ReceiptBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue a batch of receipts for OCR",
+    description=(
+        f"Upload up to {RECEIPT_BATCH_MAX_FILES} receipts at once. Receipts are "
+        "extracted in the background; poll the returned batch for progress."
+    ),
+)
+async def queue_receipt_batch(
+    current_user: CurrentActiveUser,
+    service: Annotated[AccountingService, Depends(_get_accounting_service)],
+    files: Annotated[list[UploadFile], File(description="Receipt images or PDFs")],
+) -> ReceiptBatchResponse:
+    """Store a batch of receipts and queue them for extraction.
+
+    Validates: CRM Gap Closure Req 60.1, 60.5
+    """
+    _endpoints.log_started("queue_receipt_batch", count=len(files))
+    uploads = [(await f.read(), f.filename or "receipt") for f in files]
+    try:
+        result = await service.queue_receipt_extractions(
+            uploads,
+            created_by=current_user.id,
+        )
+    except ValueError as e:
+        _endpoints.log_rejected("queue_receipt_batch", reason=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    _endpoints.log_completed(
+        "queue_receipt_batch",
+        batch_id=str(result.batch_id),
+        total=result.total,
+        cached=result.cached,
+    )
+    return result
+
+
+@router.get(
+    "/receipts/batch/{batch_id}",
+    response_model=ReceiptBatchResponse,
+    summary="Get receipt batch progress",
+    description="Progress and per-receipt results of a queued receipt batch.",
+)
+async def get_receipt_batch(
+    batch_id: UUID,
+    _current_user: CurrentActiveUser,
+    service: Annotated[AccountingService, Depends(_get_accounting_service)],
+) -> ReceiptBatchResponse:
+    """Get the progress of a receipt extraction batch.
+
+    Validates: CRM Gap Closure Req 60.1
+    """
+    result = await service.get_receipt_batch(batch_id)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Receipt batch not found: {batch_id}",
+        )
+    return result
+
+
 # =============================================================================
 # CRUD endpoints
 # =============================================================================
@@ -10,7 +10,7 @@ Validates: Requirements 7.1-7.10, 8.1-8.10, 9.1-9.7, 10.1-10.7,
 
 from datetime import date as date_cls
 from decimal import Decimal
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -32,9 +32,13 @@ from grins_platform.repositories.invoice_repository import InvoiceRepository
 from grins_platform.repositories.job_repository import JobRepository
 from grins_platform.schemas.dashboard import PendingInvoiceMetricsResponse
 from grins_platform.schemas.invoice import (
+    InvoiceBatchGenerateRequest,
+    InvoiceBatchGenerateResponse,
     InvoiceCreate,
     InvoiceDetailResponse,
     InvoiceListParams,
+    InvoicePDFBatchRequest,
+    InvoicePDFBatchResponse,
     InvoiceResponse,
     InvoiceUpdate,
     LienDeadlineResponse,
@@ -221,6 +225,14 @@ async def list_invoices(
     ),
     sort_by: str = Query(default="created_at", description="Sort field"),
     sort_order: str = Query(default="desc", description="Sort order (asc/desc)"),
+    cursor: str | None = Query(
+        default=None,
+        description="Keyset cursor; send it empty to start cursor paging",
+    ),
+    count: Literal["exact", "cached", "none"] = Query(
+        default="cached",
+        description="Total count in cursor mode",
+    ),
 ) -> PaginatedInvoiceResponse:
     """List invoices with 9-axis composable AND filtering.
 
@@ -247,6 +259,8 @@ async def list_invoices(
         lien_eligible=lien_eligible,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
+        count=count,
     )
     return await service.list_invoices(params)
 
@@ -727,6 +741,39 @@ async def bulk_notify_invoices(
     }
 
 
+# =============================================================================
+# Batch Generation — Req 10.1-10.7
+# =============================================================================
+
+
+@router.post(
+    "/generate-batch",
+    response_model=InvoiceBatchGenerateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Invoice completed jobs in batch",
+    description=(
+        "Create draft invoices for every uninvoiced completed job matching "
+        "the filters, optionally queueing PDF rendering and sending."
+    ),
+)
+async def generate_invoices_batch(
+    request: InvoiceBatchGenerateRequest,
+    _current_user: ManagerOrAdminUser,
+    service: Annotated[InvoiceService, Depends(get_invoice_service)],
+) -> InvoiceBatchGenerateResponse:
+    """Generate invoices for completed jobs in one operation.
+
+    Validates: Requirements 10.1-10.7
+    """
+    _invoice_endpoints.log_started("generate_invoices_batch", limit=request.limit)
+    result = await service.generate_batch(request)
+    _invoice_endpoints.log_completed(
+        "generate_invoices_batch",
+        created=result.created,
+    )
+    return result
+
+
 # =============================================================================
 # Mass Notify — Req 29.3, 29.4
 # =============================================================================
@@ -735,15 +782,20 @@ async def bulk_notify_invoices(
 @router.post(
     "/mass-notify",
     response_model=MassNotifyResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Mass notify customers by invoice criteria",
-    description="Send bulk SMS to past-due, due-soon, or lien-eligible customers.",
+    description=(
+        "Queue bulk SMS to past-due, due-soon, or lien-eligible customers. "
+        "Messages are sent in the background; poll the returned run for "
+        "progress."
+    ),
 )
 async def mass_notify_invoices(
     request: MassNotifyRequest,
     _current_user: CurrentActiveUser,
     service: Annotated[InvoiceService, Depends(get_invoice_service)],
 ) -> MassNotifyResponse:
-    """Send mass notifications based on invoice criteria.
+    """Queue mass notifications based on invoice criteria.
 
     Validates: Requirements 29.3, 29.4
     Single-admin scope: Req 38.1 — all logged-in users have full privileges.
@@ -765,16 +817,76 @@ async def mass_notify_invoices(
         "mass_notify_invoices",
         notification_type=request.notification_type,
         targeted=result.targeted,
-        sent=result.sent,
+        run_id=str(result.run_id),
     )
     return result
 
 
+@router.get(
+    "/mass-notify/{run_id}",
+    response_model=MassNotifyResponse,
+    summary="Get mass notification progress",
+    description="Current counts of a queued mass notification run.",
+)
+async def get_mass_notify_run(
+    run_id: UUID,
+    _current_user: CurrentActiveUser,
+    service: Annotated[InvoiceService, Depends(get_invoice_service)],
+) -> MassNotifyResponse:
+    """Get the progress of a mass notification run.
+
+    Validates: Requirement 29.3
+    """
+    try:
+        return await service.get_mass_notify_run(run_id)
+    except InvalidInvoiceOperationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+
+
 # =============================================================================
 # Invoice PDF — Req 80
 # =============================================================================
 
 
+@router.post(
+    "/generate-pdfs",
+    response_model=InvoicePDFBatchResponse,
+    summary="Generate invoice PDFs in batch",
+    description=(
+        "Render PDFs for many invoices concurrently, reusing stored PDFs "
+        "whose content is unchanged."
+    ),
+)
+async def generate_invoice_pdfs(
+    request: InvoicePDFBatchRequest,
+    _current_user: ManagerOrAdminUser,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> InvoicePDFBatchResponse:
+    """Generate PDFs for a batch of invoices.
+
+    Validates: CRM Gap Closure Req 80.2
+    """
+    from grins_platform.services.invoice_pdf_service import (  # noqa: PLC0415
+        InvoicePDFService,
+    )
+
+    _invoice_endpoints.log_started(
+        "generate_invoice_pdfs",
+        count=len(request.invoice_ids),
+    )
+    result = await InvoicePDFService().generate_pdfs(session, request.invoice_ids)
+    _invoice_endpoints.log_completed(
+        "generate_invoice_pdfs",
+        generated=result.generated,
+        cached=result.cached,
+        failed=result.failed,
+    )
+    return result
+
+
 @router.post(
     "/{invoice_id}/generate-pdf",
     summary="Generate invoice PDF",
@@ -828,6 +940,7 @@ async def get_invoice_pdf(
     Validates: CRM Gap Closure Req 80.3
     """
     from grins_platform.services.invoice_pdf_service import (  # noqa: PLC0415
+        InvoiceNotFoundError as PDFInvoiceNotFoundError,
         InvoicePDFNotFoundError,
         InvoicePDFService,
     )
@@ -844,7 +957,7 @@ async def get_invoice_pdf(
             invoice_id=str(invoice_id),
         )
         return {"invoice_id": str(invoice_id), "download_url": url}
-    except InvoicePDFNotFoundError as e:
+    except (PDFInvoiceNotFoundError, InvoicePDFNotFoundError) as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
@@ -17,7 +17,7 @@ from datetime import (
     timezone,
 )
 from decimal import Decimal
-from typing import Annotated
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
@@ -370,6 +370,17 @@ async def list_jobs(
         ge=0,
         description="Number of items to skip. Converted to equivalent page number.",
     ),
+    cursor: str | None = Query(
+        default=None,
+        description=(
+            "Keyset cursor (next_cursor of the previous page); send it empty "
+            "to start cursor paging. Takes precedence over page/offset."
+        ),
+    ),
+    count: Literal["exact", "cached", "none"] = Query(
+        default="cached",
+        description="Total count in cursor mode: exact, cached (first page) or none",
+    ),
 ) -> PaginatedJobResponse:
     """List jobs with filtering and pagination.
 
@@ -393,29 +404,48 @@ async def list_jobs(
         },
     )
 
-    jobs, total = await service.list_jobs(
-        page=page,
-        page_size=page_size,
-        status=status_filter,
-        category=category,
-        customer_id=customer_id,
-        property_id=property_id,
-        service_offering_id=service_offering_id,
-        priority_level=priority_level,
-        date_from=date_from,
-        date_to=date_to,
-        search=search,
-        has_service_agreement=has_service_agreement,
-        property_type=property_type,
-        is_hoa=is_hoa,
-        is_subscription_property=is_subscription_property,
-        target_date_from=target_date_from,
-        target_date_to=target_date_to,
-        sort_by=sort_by,
-        sort_order=sort_order,
-    )
+    filters: dict[str, Any] = {
+        "status": status_filter,
+        "category": category,
+        "customer_id": customer_id,
+        "property_id": property_id,
+        "service_offering_id": service_offering_id,
+        "priority_level": priority_level,
+        "date_from": date_from,
+        "date_to": date_to,
+        "search": search,
+        "has_service_agreement": has_service_agreement,
+        "property_type": property_type,
+        "is_hoa": is_hoa,
+        "is_subscription_property": is_subscription_property,
+        "target_date_from": target_date_from,
+        "target_date_to": target_date_to,
+    }
+    next_cursor: str | None = None
+    total: int | None
+    if cursor is not None:
+        keyset_page = await service.list_jobs_keyset(
+            cursor=cursor,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            count=count,
+            **filters,
+        )
+        jobs, total = keyset_page.items, keyset_page.total
+        next_cursor = keyset_page.next_cursor
+    else:
+        jobs, total = await service.list_jobs(
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            **filters,
+        )
 
-    total_pages = math.ceil(total / page_size) if total > 0 else 0
+    total_pages: int | None = None
+    if total is not None:
+        total_pages = math.ceil(total / page_size) if total > 0 else 0
 
     _endpoints.log_completed("list_jobs", count=len(jobs), total=total)
 
@@ -436,6 +466,7 @@ async def list_jobs(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -11,7 +11,7 @@ Validates: Requirement 1.10, 5.10, 7.9, 12.2, 12.3, 13.1, 14.1, 15.2, 15.3, 15.4
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
 from fastapi import (
@@ -268,6 +268,11 @@ async def list_leads(
     ),
     sort_by: str = Query(default="created_at"),
     sort_order: str = Query(default="desc", pattern="^(asc|desc)$"),
+    cursor: str | None = Query(
+        default=None,
+        description="Keyset cursor; send it empty to start cursor paging",
+    ),
+    count: Literal["exact", "cached", "none"] = Query(default="cached"),
 ) -> PaginatedLeadResponse:
     """List leads with filtering and pagination.
 
@@ -292,6 +297,8 @@ async def list_leads(
         intake_tag=intake_tag,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
+        count=count,
     )
 
     result = await service.list_leads(params)
@@ -51,6 +51,7 @@ from grins_platform.api.v1.sales import router as sales_router
 from grins_platform.api.v1.sales_pipeline import router as sales_pipeline_router
 from grins_platform.api.v1.schedule import router as schedule_router
 from grins_platform.api.v1.schedule_clear import router as schedule_clear_router
+from grins_platform.api.v1.search import router as search_router
 from grins_platform.api.v1.sent_messages import router as sent_messages_router
 from grins_platform.api.v1.services import router as services_router
 from grins_platform.api.v1.settings import router as settings_router
@@ -366,6 +367,13 @@ api_router.include_router(
     tags=["audit"],
 )
 
+# Include global search endpoint
+api_router.include_router(
+    search_router,
+    prefix="/search",
+    tags=["search"],
+)
+
 # Include Sent Messages endpoints (Req 82)
 api_router.include_router(
     sent_messages_router,
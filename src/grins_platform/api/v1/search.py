@@ -0,0 +1,65 @@
+"""Global search API endpoint.
+
+Ranked, typo-tolerant search across customers and leads backed by the
+trigram-indexed ``search_text`` columns.
+
+Validates: Requirement 4.1-4.7, 5.1-5.5
+"""
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TC002
+
+from grins_platform.api.v1.auth_dependencies import (
+    CurrentActiveUser,  # noqa: TC001
+)
+from grins_platform.api.v1.dependencies import get_db_session
+from grins_platform.log_config import LoggerMixin
+from grins_platform.repositories.search_repository import SearchRepository
+from grins_platform.schemas.search import SearchResponse, SearchResult
+
+router = APIRouter()
+
+
+class _SearchEndpoints(LoggerMixin):
+    """Search API endpoint handlers with logging."""
+
+    DOMAIN = "api"
+
+
+_endpoints = _SearchEndpoints()
+
+
+@router.get(
+    "",
+    response_model=SearchResponse,
+    summary="Global search",
+    description=(
+        "Ranked, typo-tolerant search over customer and lead names, emails, "
+        "phone numbers and addresses."
+    ),
+)
+async def global_search(
+    _current_user: CurrentActiveUser,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    limit: int = Query(default=10, ge=1, le=50, description="Maximum results"),
+    types: Annotated[
+        list[Literal["customer", "lead"]] | None,
+        Query(description="Entity types to search (default: all)"),
+    ] = None,
+) -> SearchResponse:
+    """Search customers and leads, best matches first."""
+    _endpoints.log_started("global_search", limit=limit)
+
+    repo = SearchRepository(session)
+    hits = await repo.search(q, limit=limit, types=types or ("customer", "lead"))
+
+    _endpoints.log_completed("global_search", count=len(hits))
+    return SearchResponse(
+        query=q,
+        results=[SearchResult.model_validate(hit) for hit in hits],
+    )
@@ -8,7 +8,7 @@ Validates: CRM Gap Closure Req 82.1, 82.2, 82.3
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TC002
@@ -58,6 +58,14 @@ async def list_sent_messages(
     date_from: datetime | None = Query(default=None, description="Filter from date"),
     date_to: datetime | None = Query(default=None, description="Filter to date"),
     search: str | None = Query(default=None, description="Search content"),
+    cursor: str | None = Query(
+        default=None,
+        description="Keyset cursor; send it empty to start cursor paging",
+    ),
+    count: Literal["exact", "cached", "none"] = Query(
+        default="cached",
+        description="Total count in cursor mode",
+    ),
 ) -> SentMessageListResponse:
     """List sent messages with pagination and filters.
 
@@ -66,18 +74,34 @@ async def list_sent_messages(
     _endpoints.log_started("list_sent_messages", page=page)
 
     repo = SentMessageRepository(session)
-    messages, total = await repo.list_with_filters(
-        page=page,
-        page_size=page_size,
-        message_type=message_type,
-        delivery_status=delivery_status,
-        date_from=date_from,
-        date_to=date_to,
-        search=search,
-    )
+    next_cursor: str | None = None
+    total: int | None
+    if cursor is not None:
+        keyset_page = await repo.list_keyset(
+            cursor=cursor,
+            page_size=page_size,
+            count=count,
+            message_type=message_type,
+            delivery_status=delivery_status,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+        )
+        messages, total = keyset_page.items, keyset_page.total
+        next_cursor = keyset_page.next_cursor
+    else:
+        messages, total = await repo.list_with_filters(
+            page=page,
+            page_size=page_size,
+            message_type=message_type,
+            delivery_status=delivery_status,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+        )
 
     items = [SentMessageResponse.model_validate(m) for m in messages]
-    total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+    total_pages = None if total is None else (total + page_size - 1) // page_size
 
     _endpoints.log_completed("list_sent_messages", count=len(items), total=total)
     return SentMessageListResponse(
@@ -86,4 +110,5 @@ async def list_sent_messages(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
@@ -221,6 +221,7 @@ async def get_all_staff_locations(
     """
     _endpoints.log_started("get_all_staff_locations")
 
+    from grins_platform.redis_manager import get_redis_manager  # noqa: PLC0415
     from grins_platform.services.staff_location_service import (  # noqa: PLC0415
         StaffLocationService,
     )
@@ -229,7 +230,9 @@ async def get_all_staff_locations(
     staff_list = await service.get_available_staff()
     staff_ids = [s.id for s in staff_list]
 
-    location_service = StaffLocationService()
+    location_service = StaffLocationService(
+        redis_client=get_redis_manager().client,
+    )
     locations = await location_service.get_all_locations(staff_ids)
 
     result = [
@@ -458,11 +461,14 @@ async def update_staff_location(
             detail=f"Staff member not found: {e.staff_id}",
         ) from e
 
+    from grins_platform.redis_manager import get_redis_manager  # noqa: PLC0415
     from grins_platform.services.staff_location_service import (  # noqa: PLC0415
         StaffLocationService,
     )
 
-    location_service = StaffLocationService()
+    location_service = StaffLocationService(
+        redis_client=get_redis_manager().client,
+    )
     stored = await location_service.store_location(
         staff_id=staff_id,
         latitude=data.latitude,
@@ -53,6 +53,7 @@ from grins_platform.middleware.request_size import (
 from grins_platform.middleware.security_headers import (
     SecurityHeadersMiddleware,
 )
+from grins_platform.redis_manager import get_redis_manager
 from grins_platform.scheduler import get_scheduler
 from grins_platform.services.auth_service import validate_jwt_config
 from grins_platform.services.background_jobs import register_scheduled_jobs
@@ -64,6 +65,7 @@ from grins_platform.services.signwell.client import (
 )
 from grins_platform.services.google_sheets_poller import GoogleSheetsPoller
 from grins_platform.services.google_sheets_service import GoogleSheetsService
+from grins_platform.services.invoice_pdf_service import shutdown_pdf_render_executor
 from grins_platform.services.sms.audit import log_provider_switched
 from grins_platform.services.sms.factory import get_sms_provider
 from grins_platform.services.stripe_config import StripeSettings
@@ -91,6 +93,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     health = await db_manager.health_check()
     logger.info("app.startup_database_check", **health)
 
+    redis_manager = get_redis_manager()
+    redis_health = await redis_manager.health_check()
+    logger.info("app.startup_redis_check", **redis_health)
+
     # Stripe configuration check
     stripe_settings = StripeSettings()
     stripe_settings.log_configuration_status()
@@ -153,6 +159,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     if app.state.sheets_poller is not None:
         await app.state.sheets_poller.stop()
         logger.info("app.sheets_poller_stopped")
+    shutdown_pdf_render_executor()
+    await redis_manager.close()
     await db_manager.close()
     logger.info("app.shutdown_completed")
 
@@ -260,10 +268,12 @@ def create_app() -> FastAPI:
         """
         db_manager = get_database_manager()
         db_health = await db_manager.health_check()
+        redis_health = await get_redis_manager().health_check()
         return {
             "status": "healthy" if db_health["status"] == "healthy" else "degraded",
             "version": "1.0.0",
             "database": db_health,
+            "redis": redis_health,
         }
 
     return app
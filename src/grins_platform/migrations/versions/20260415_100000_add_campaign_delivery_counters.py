@@ -0,0 +1,64 @@
+"""Add ``campaign_delivery_counters`` for O(1) campaign status and stats.
+
+One row per campaign holding recipient counts by delivery state. The
+campaign worker and repository adjust the counts in the same transaction
+as each recipient state change; a periodic job reconciles them against
+``campaign_recipients``. Existing campaigns are backfilled here.
+
+Revision ID: 20260415_100000
+Revises: 20260414_100900
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_100000"
+down_revision: str | None = "20260414_100900"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COUNTED_STATES = ("pending", "sending", "sent", "failed", "cancelled", "opted_out")
+
+
+def upgrade() -> None:
+    """Create the counters table and backfill from recipient rows."""
+    op.create_table(
+        "campaign_delivery_counters",
+        sa.Column(
+            "campaign_id",
+            sa.UUID(),
+            sa.ForeignKey("campaigns.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        *[
+            sa.Column(state, sa.Integer(), nullable=False, server_default="0")
+            for state in _COUNTED_STATES
+        ],
+        sa.Column("reconciled_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+
+    filters = ", ".join(
+        f"count(*) FILTER (WHERE delivery_status = '{state}')"
+        for state in _COUNTED_STATES
+    )
+    op.execute(
+        "INSERT INTO campaign_delivery_counters "
+        f"(campaign_id, {', '.join(_COUNTED_STATES)}, reconciled_at, updated_at) "
+        f"SELECT campaign_id, {filters}, NOW(), NOW() "
+        "FROM campaign_recipients GROUP BY campaign_id",
+    )
+
+
+def downgrade() -> None:
+    """Drop the counters table."""
+    op.drop_table("campaign_delivery_counters")
@@ -0,0 +1,55 @@
+"""Add ``csv_upload_staged_recipients`` for streamed CSV audience uploads.
+
+The CSV upload endpoint streams files in chunks and stages each normalized,
+matched recipient here under the upload ID instead of returning every row
+inline. Campaigns reference large uploads via
+``target_audience.ad_hoc.csv_upload_id``. Rows are purged after 30 days.
+
+Revision ID: 20260415_100100
+Revises: 20260415_100000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_100100"
+down_revision: str | None = "20260415_100000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the staging table."""
+    op.create_table(
+        "csv_upload_staged_recipients",
+        sa.Column("upload_id", sa.UUID(), primary_key=True),
+        sa.Column("phone_e164", sa.String(20), primary_key=True),
+        sa.Column("first_name", sa.Text(), nullable=True),
+        sa.Column("last_name", sa.Text(), nullable=True),
+        sa.Column("row_number", sa.Integer(), nullable=False),
+        sa.Column("match_type", sa.String(20), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+    op.create_index(
+        "idx_csv_upload_staged_recipients_created_at",
+        "csv_upload_staged_recipients",
+        ["created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the staging table."""
+    op.drop_index(
+        "idx_csv_upload_staged_recipients_created_at",
+        table_name="csv_upload_staged_recipients",
+    )
+    op.drop_table("csv_upload_staged_recipients")
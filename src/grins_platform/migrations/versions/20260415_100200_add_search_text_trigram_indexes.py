@@ -0,0 +1,79 @@
+"""Add trigram-indexed ``search_text`` columns for customer/lead search.
+
+Enables ``pg_trgm`` and adds a stored generated ``search_text`` column to
+``customers`` (name, email, phone digits), ``leads`` (name, email, phone
+digits, address, city) and ``properties`` (address, city, ZIP), each with a
+GIN ``gin_trgm_ops`` index, so substring and typo-tolerant search no longer
+scans whole tables. Also indexes ``lower(properties.city)`` for the
+case-insensitive city filter.
+
+Revision ID: 20260415_100200
+Revises: 20260415_100100
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_100200"
+down_revision: str | None = "20260415_100100"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match the Computed() expressions on the models.
+_SEARCH_TEXT_SQL = {
+    "customers": (
+        "lower(first_name::text || ' ' || last_name::text || ' ' || "
+        "coalesce(email::text, '') || ' ' || "
+        "regexp_replace(phone::text, '[^0-9]', '', 'g'))"
+    ),
+    "leads": (
+        "lower(name::text || ' ' || coalesce(email::text, '') || ' ' || "
+        "regexp_replace(phone::text, '[^0-9]', '', 'g') || ' ' || "
+        "coalesce(address::text, '') || ' ' || coalesce(city::text, ''))"
+    ),
+    "properties": (
+        "lower(address::text || ' ' || city::text || ' ' || "
+        "coalesce(zip_code::text, ''))"
+    ),
+}
+
+
+def upgrade() -> None:
+    """Enable pg_trgm, add generated search columns and their indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, expression in _SEARCH_TEXT_SQL.items():
+        op.add_column(
+            table,
+            sa.Column(
+                "search_text",
+                sa.Text(),
+                sa.Computed(expression, persisted=True),
+                nullable=False,
+            ),
+        )
+        op.create_index(
+            f"idx_{table}_search_text_trgm",
+            table,
+            ["search_text"],
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        )
+
+    op.create_index(
+        "idx_properties_city_lower",
+        "properties",
+        [sa.text("lower(city)")],
+    )
+
+
+def downgrade() -> None:
+    """Drop the search indexes and columns (pg_trgm is left installed)."""
+    op.drop_index("idx_properties_city_lower", table_name="properties")
+    for table in reversed(list(_SEARCH_TEXT_SQL)):
+        op.drop_index(f"idx_{table}_search_text_trgm", table_name=table)
+        op.drop_column(table, "search_text")
@@ -0,0 +1,221 @@
+"""Add the ``customer_summaries`` projection and the triggers that maintain it.
+
+One row per customer with completed-job count, last service date, lifetime
+revenue, outstanding balance, active agreement tier and last contact. The
+``refresh_customer_summary(customer_id)`` function recomputes a row from its
+sources with indexed per-customer aggregates, under a per-customer advisory
+lock so concurrent refreshes of one customer cannot overwrite each other
+with stale totals. Row triggers on ``jobs``, ``invoices``,
+``service_agreements``, ``sent_messages`` and ``communications`` call it
+for the old and new owner of every relevant change, so merges and webhook
+writes stay covered. Existing customers are backfilled here.
+
+Revision ID: 20260415_100300
+Revises: 20260415_100200
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_100300"
+down_revision: str | None = "20260415_100200"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Invoice states that still expect money; agreement states that cover service.
+_OPEN_INVOICE_STATES = (
+    "'sent', 'viewed', 'partial', 'overdue', 'lien_warning', 'lien_filed'"
+)
+_ACTIVE_AGREEMENT_STATES = "'active', 'past_due', 'pending_renewal'"
+
+# table -> columns whose updates can change the summary
+_TRIGGERED_COLUMNS = {
+    "jobs": "status, completed_at, is_deleted, customer_id",
+    "invoices": "status, total_amount, paid_amount, customer_id",
+    "service_agreements": "status, tier_id, start_date, customer_id",
+    "sent_messages": "sent_at, customer_id",
+    "communications": "customer_id",
+}
+
+_REFRESH_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION refresh_customer_summary(p_customer_id uuid)
+RETURNS void AS $$
+BEGIN
+    IF p_customer_id IS NULL
+       OR NOT EXISTS (SELECT 1 FROM customers WHERE id = p_customer_id) THEN
+        RETURN;
+    END IF;
+
+    -- Refreshes of one customer run one at a time, and each statement
+    -- takes a fresh snapshot under READ COMMITTED: a refresh that waited
+    -- here aggregates every write the earlier one committed, so the last
+    -- writer never drops a concurrent transaction's change.
+    PERFORM pg_advisory_xact_lock(
+        hashtext('customer_summary'), hashtext(p_customer_id::text)
+    );
+
+    INSERT INTO customer_summaries (
+        customer_id, total_jobs, last_service_date, lifetime_revenue,
+        outstanding_balance, active_agreement_id, active_agreement_tier,
+        last_contact_at, refreshed_at
+    )
+    SELECT
+        p_customer_id, j.total_jobs, j.last_service_date, i.lifetime_revenue,
+        i.outstanding_balance, a.id, a.tier_name,
+        GREATEST(m.last_sent, c.last_communication), NOW()
+    FROM (
+        SELECT count(*) AS total_jobs, max(completed_at) AS last_service_date
+        FROM jobs
+        WHERE customer_id = p_customer_id
+          AND status = 'completed'
+          AND NOT is_deleted
+    ) j
+    CROSS JOIN (
+        SELECT
+            COALESCE(sum(paid_amount) FILTER (WHERE status <> 'cancelled'), 0)
+                AS lifetime_revenue,
+            COALESCE(
+                sum(GREATEST(total_amount - COALESCE(paid_amount, 0), 0))
+                    FILTER (WHERE status IN ({_OPEN_INVOICE_STATES})),
+                0
+            ) AS outstanding_balance
+        FROM invoices
+        WHERE customer_id = p_customer_id
+    ) i
+    CROSS JOIN (
+        SELECT max(sent_at) AS last_sent
+        FROM sent_messages
+        WHERE customer_id = p_customer_id
+    ) m
+    CROSS JOIN (
+        SELECT max(created_at) AS last_communication
+        FROM communications
+        WHERE customer_id = p_customer_id
+    ) c
+    LEFT JOIN LATERAL (
+        SELECT sa.id, t.name AS tier_name
+        FROM service_agreements sa
+        JOIN service_agreement_tiers t ON t.id = sa.tier_id
+        WHERE sa.customer_id = p_customer_id
+          AND sa.status IN ({_ACTIVE_AGREEMENT_STATES})
+        ORDER BY sa.start_date DESC NULLS LAST, sa.created_at DESC
+        LIMIT 1
+    ) a ON TRUE
+    ON CONFLICT (customer_id) DO UPDATE SET
+        total_jobs = EXCLUDED.total_jobs,
+        last_service_date = EXCLUDED.last_service_date,
+        lifetime_revenue = EXCLUDED.lifetime_revenue,
+        outstanding_balance = EXCLUDED.outstanding_balance,
+        active_agreement_id = EXCLUDED.active_agreement_id,
+        active_agreement_tier = EXCLUDED.active_agreement_tier,
+        last_contact_at = EXCLUDED.last_contact_at,
+        refreshed_at = EXCLUDED.refreshed_at;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION customer_summary_on_change()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_customer_summary(NEW.customer_id);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM refresh_customer_summary(OLD.customer_id);
+    ELSE
+        PERFORM refresh_customer_summary(NEW.customer_id);
+        IF OLD.customer_id IS DISTINCT FROM NEW.customer_id THEN
+            PERFORM refresh_customer_summary(OLD.customer_id);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# A tier rename changes the denormalized tier name of its active agreements.
+_TIER_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION customer_summary_on_tier_rename()
+RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_customer_summary(customer_id)
+    FROM service_agreements
+    WHERE tier_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    """Create the summary table, its refresh triggers, and backfill it."""
+    op.create_table(
+        "customer_summaries",
+        sa.Column(
+            "customer_id",
+            sa.UUID(),
+            sa.ForeignKey("customers.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("total_jobs", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_service_date", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column(
+            "lifetime_revenue",
+            sa.Numeric(12, 2),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "outstanding_balance",
+            sa.Numeric(12, 2),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column("active_agreement_id", sa.UUID(), nullable=True),
+        sa.Column("active_agreement_tier", sa.String(100), nullable=True),
+        sa.Column("last_contact_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column(
+            "refreshed_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+
+    op.execute(_REFRESH_FUNCTION)
+    op.execute(_TRIGGER_FUNCTION)
+    op.execute(_TIER_TRIGGER_FUNCTION)
+    for table, columns in _TRIGGERED_COLUMNS.items():
+        op.execute(f"""
+            CREATE TRIGGER customer_summary_{table}
+                AFTER INSERT OR DELETE OR UPDATE OF {columns} ON {table}
+                FOR EACH ROW
+                EXECUTE FUNCTION customer_summary_on_change();
+        """)
+    op.execute("""
+        CREATE TRIGGER customer_summary_service_agreement_tiers
+            AFTER UPDATE OF name ON service_agreement_tiers
+            FOR EACH ROW
+            WHEN (OLD.name IS DISTINCT FROM NEW.name)
+            EXECUTE FUNCTION customer_summary_on_tier_rename();
+    """)
+
+    op.execute("SELECT refresh_customer_summary(id) FROM customers")
+
+
+def downgrade() -> None:
+    """Drop the triggers, functions and summary table."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS customer_summary_service_agreement_tiers "
+        "ON service_agreement_tiers;",
+    )
+    for table in _TRIGGERED_COLUMNS:
+        op.execute(f"DROP TRIGGER IF EXISTS customer_summary_{table} ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS customer_summary_on_tier_rename();")
+    op.execute("DROP FUNCTION IF EXISTS customer_summary_on_change();")
+    op.execute("DROP FUNCTION IF EXISTS refresh_customer_summary(uuid);")
+    op.drop_table("customer_summaries")
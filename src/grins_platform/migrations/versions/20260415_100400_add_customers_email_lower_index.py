@@ -0,0 +1,35 @@
+"""Index ``lower(customers.email)``.
+
+Email lookups (the email lookup endpoint, duplicate detection neighbours and
+the bulk import's set-based duplicate check) compare case-insensitively,
+which the plain ``idx_customers_email`` index cannot serve.
+
+Revision ID: 20260415_100400
+Revises: 20260415_100300
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_100400"
+down_revision: str | None = "20260415_100300"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the case-insensitive email index."""
+    op.create_index(
+        "idx_customers_email_lower",
+        "customers",
+        [sa.text("lower(email)")],
+    )
+
+
+def downgrade() -> None:
+    """Drop the case-insensitive email index."""
+    op.drop_index("idx_customers_email_lower", table_name="customers")
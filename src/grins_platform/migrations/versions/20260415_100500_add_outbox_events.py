@@ -0,0 +1,76 @@
+"""Add the ``outbox_events`` table for deferred side effects.
+
+Public lead intake records its SMS and email confirmations here in the
+same transaction as the lead; a worker delivers them with retries.
+
+Revision ID: 20260415_100500
+Revises: 20260415_100400
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20260415_100500"
+down_revision: str | None = "20260415_100400"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create outbox_events and its due-event index."""
+    op.create_table(
+        "outbox_events",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("event_type", sa.String(100), nullable=False),
+        sa.Column("aggregate_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "payload",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "next_attempt_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column("processed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_outbox_events_due",
+        "outbox_events",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_outbox_events_aggregate_id",
+        "outbox_events",
+        ["aggregate_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop outbox_events."""
+    op.drop_index("ix_outbox_events_aggregate_id", table_name="outbox_events")
+    op.drop_index("ix_outbox_events_due", table_name="outbox_events")
+    op.drop_table("outbox_events")
@@ -0,0 +1,73 @@
+"""Add the ``agreement_metrics_snapshots`` table for monthly KPI history.
+
+One row per (month, tier) with end-of-month active count and MRR plus the
+month's cancellation and renewal transition counts. Rows are filled by the
+nightly snapshot job, which backfills missing months from
+``agreement_status_logs``.
+
+Revision ID: 20260415_100600
+Revises: 20260415_100500
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_100600"
+down_revision: str | None = "20260415_100500"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create agreement_metrics_snapshots."""
+    op.create_table(
+        "agreement_metrics_snapshots",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column(
+            "tier_id",
+            sa.UUID(),
+            sa.ForeignKey("service_agreement_tiers.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("active_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("mrr", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        sa.Column(
+            "cancelled_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column("renewed_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "not_renewed_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "computed_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.UniqueConstraint(
+            "month",
+            "tier_id",
+            name="uq_agreement_metrics_snapshots_month_tier",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop agreement_metrics_snapshots."""
+    op.drop_table("agreement_metrics_snapshots")
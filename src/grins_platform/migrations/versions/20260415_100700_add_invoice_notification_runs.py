@@ -0,0 +1,103 @@
+"""Add ``invoice_notification_runs`` and ``invoice_notification_items``.
+
+Invoice mass notifications become background runs: the request records a
+run and one pending item per targeted invoice, and a scheduled worker sends
+the pending items, so progress survives restarts.
+
+Revision ID: 20260415_100700
+Revises: 20260415_100600
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_100700"
+down_revision: str | None = "20260415_100600"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the run and item tables."""
+    op.create_table(
+        "invoice_notification_runs",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("notification_type", sa.String(30), nullable=False),
+        sa.Column("message_template", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("targeted", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sent", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("skipped", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column("completed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.create_table(
+        "invoice_notification_items",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column(
+            "run_id",
+            sa.UUID(),
+            sa.ForeignKey("invoice_notification_runs.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "invoice_id",
+            sa.UUID(),
+            sa.ForeignKey("invoices.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("error", sa.String(500), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column("processed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_invoice_notification_items_pending",
+        "invoice_notification_items",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_invoice_notification_items_run_id",
+        "invoice_notification_items",
+        ["run_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the run and item tables."""
+    op.drop_index(
+        "ix_invoice_notification_items_run_id",
+        table_name="invoice_notification_items",
+    )
+    op.drop_index(
+        "ix_invoice_notification_items_pending",
+        table_name="invoice_notification_items",
+    )
+    op.drop_table("invoice_notification_items")
+    op.drop_table("invoice_notification_runs")
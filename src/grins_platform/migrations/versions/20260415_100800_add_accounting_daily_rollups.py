@@ -0,0 +1,191 @@
+"""Add ``accounting_daily_rollups`` and the triggers that post to it.
+
+Ledger-style totals per (source, day, category, state). Row triggers on
+``invoices`` and ``expenses`` call ``accounting_rollup_post`` to reverse the
+old row's contribution and add the new one, so each write touches at most
+four rollup rows and concurrent writes to the same day accumulate through
+the upsert's row lock instead of racing a recompute. Existing invoices and
+expenses are backfilled here.
+
+Revision ID: 20260415_100800
+Revises: 20260415_100700
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_100800"
+down_revision: str | None = "20260415_100700"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_POST_FUNCTION = """
+CREATE OR REPLACE FUNCTION accounting_rollup_post(
+    p_source text,
+    p_day date,
+    p_category text,
+    p_state text,
+    p_amount numeric,
+    p_count integer
+)
+RETURNS void AS $$
+BEGIN
+    IF p_day IS NULL THEN
+        RETURN;
+    END IF;
+    INSERT INTO accounting_daily_rollups AS r (
+        source, day, category, state, amount, entry_count, updated_at
+    )
+    VALUES (
+        p_source, p_day, COALESCE(p_category, ''), COALESCE(p_state, ''),
+        COALESCE(p_amount, 0), p_count, NOW()
+    )
+    ON CONFLICT (source, day, category, state) DO UPDATE SET
+        amount = r.amount + EXCLUDED.amount,
+        entry_count = r.entry_count + EXCLUDED.entry_count,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+_INVOICE_FUNCTION = """
+CREATE OR REPLACE FUNCTION accounting_rollup_on_invoice()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM accounting_rollup_post(
+            'invoice', OLD.invoice_date, '', OLD.status, -OLD.total_amount, -1
+        );
+        PERFORM accounting_rollup_post(
+            'invoice_due', OLD.due_date, '', OLD.status, -OLD.total_amount, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM accounting_rollup_post(
+            'invoice', NEW.invoice_date, '', NEW.status, NEW.total_amount, 1
+        );
+        PERFORM accounting_rollup_post(
+            'invoice_due', NEW.due_date, '', NEW.status, NEW.total_amount, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+_EXPENSE_FUNCTION = """
+CREATE OR REPLACE FUNCTION accounting_rollup_on_expense()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM accounting_rollup_post(
+            'expense', OLD.date, OLD.category, '', -OLD.amount, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM accounting_rollup_post(
+            'expense', NEW.date, NEW.category, '', NEW.amount, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# table -> (trigger function, columns whose updates move a row between rollups)
+_TRIGGERED = {
+    "invoices": (
+        "accounting_rollup_on_invoice",
+        ("status", "total_amount", "invoice_date", "due_date"),
+    ),
+    "expenses": ("accounting_rollup_on_expense", ("category", "amount", "date")),
+}
+
+_BACKFILL = """
+INSERT INTO accounting_daily_rollups (
+    source, day, category, state, amount, entry_count
+)
+SELECT 'invoice', invoice_date, '', status, sum(total_amount), count(*)
+FROM invoices
+WHERE invoice_date IS NOT NULL
+GROUP BY invoice_date, status
+UNION ALL
+SELECT 'invoice_due', due_date, '', status, sum(total_amount), count(*)
+FROM invoices
+WHERE due_date IS NOT NULL
+GROUP BY due_date, status
+UNION ALL
+SELECT 'expense', date, category, '', sum(amount), count(*)
+FROM expenses
+GROUP BY date, category
+"""
+
+
+def upgrade() -> None:
+    """Create the rollup table, its posting triggers, and backfill it."""
+    op.create_table(
+        "accounting_daily_rollups",
+        sa.Column("source", sa.String(20), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("category", sa.String(30), nullable=False, server_default=""),
+        sa.Column("state", sa.String(50), nullable=False, server_default=""),
+        sa.Column(
+            "amount",
+            sa.Numeric(14, 2),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column("entry_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.PrimaryKeyConstraint("source", "day", "category", "state"),
+    )
+
+    op.execute(_POST_FUNCTION)
+    op.execute(_INVOICE_FUNCTION)
+    op.execute(_EXPENSE_FUNCTION)
+    for table, (function, columns) in _TRIGGERED.items():
+        changed = " OR ".join(
+            f"OLD.{column} IS DISTINCT FROM NEW.{column}" for column in columns
+        )
+        op.execute(f"""
+            CREATE TRIGGER accounting_rollup_{table}_write
+                AFTER INSERT OR DELETE ON {table}
+                FOR EACH ROW
+                EXECUTE FUNCTION {function}();
+        """)
+        op.execute(f"""
+            CREATE TRIGGER accounting_rollup_{table}_update
+                AFTER UPDATE OF {", ".join(columns)} ON {table}
+                FOR EACH ROW
+                WHEN ({changed})
+                EXECUTE FUNCTION {function}();
+        """)
+
+    op.execute(_BACKFILL)
+
+
+def downgrade() -> None:
+    """Drop the triggers, functions and rollup table."""
+    for table in _TRIGGERED:
+        op.execute(
+            f"DROP TRIGGER IF EXISTS accounting_rollup_{table}_update ON {table};",
+        )
+        op.execute(
+            f"DROP TRIGGER IF EXISTS accounting_rollup_{table}_write ON {table};",
+        )
+    op.execute("DROP FUNCTION IF EXISTS accounting_rollup_on_expense();")
+    op.execute("DROP FUNCTION IF EXISTS accounting_rollup_on_invoice();")
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "accounting_rollup_post(text, date, text, text, numeric, integer);",
+    )
+    op.drop_table("accounting_daily_rollups")
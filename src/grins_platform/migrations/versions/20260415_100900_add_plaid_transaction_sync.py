@@ -0,0 +1,55 @@
+"""Add ``expenses.plaid_transaction_id`` and ``plaid_sync_cursors``.
+
+Bank transactions are imported incrementally through Plaid's
+``/transactions/sync``: the cursor of each item is kept in
+``plaid_sync_cursors`` and expenses are upserted by their Plaid
+transaction id, so a replayed page updates rows instead of duplicating
+them.
+
+Revision ID: 20260415_100900
+Revises: 20260415_100800
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_100900"
+down_revision: str | None = "20260415_100800"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the transaction id column and the cursor table."""
+    op.add_column(
+        "expenses",
+        sa.Column("plaid_transaction_id", sa.String(100), nullable=True),
+    )
+    op.create_index(
+        "uq_expenses_plaid_transaction_id",
+        "expenses",
+        ["plaid_transaction_id"],
+        unique=True,
+    )
+    op.create_table(
+        "plaid_sync_cursors",
+        sa.Column("item_key", sa.String(64), primary_key=True),
+        sa.Column("cursor", sa.Text(), nullable=False),
+        sa.Column(
+            "synced_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the cursor table and the transaction id column."""
+    op.drop_table("plaid_sync_cursors")
+    op.drop_index("uq_expenses_plaid_transaction_id", table_name="expenses")
+    op.drop_column("expenses", "plaid_transaction_id")
@@ -0,0 +1,132 @@
+"""Add the receipt extraction queue and its result cache.
+
+Receipt extraction becomes a background pipeline: an upload records a
+batch and one pending item per receipt, and a scheduled worker extracts
+pending items with bounded concurrency. Results are cached in
+``receipt_extraction_cache`` by the SHA-256 of the receipt bytes, so a
+re-uploaded receipt is not sent to the vision model again.
+
+Revision ID: 20260415_101000
+Revises: 20260415_100900
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_101000"
+down_revision: str | None = "20260415_100900"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the batch, item and cache tables."""
+    op.create_table(
+        "receipt_extraction_batches",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cached", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_by",
+            sa.UUID(),
+            sa.ForeignKey("staff.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column("completed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.create_table(
+        "receipt_extraction_items",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column(
+            "batch_id",
+            sa.UUID(),
+            sa.ForeignKey("receipt_extraction_batches.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("file_key", sa.String(500), nullable=False),
+        sa.Column("file_name", sa.String(255), nullable=False),
+        sa.Column("content_type", sa.String(100), nullable=False),
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column(
+            "cached",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("false"),
+        ),
+        sa.Column("amount", sa.Numeric(10, 2), nullable=True),
+        sa.Column("vendor", sa.String(200), nullable=True),
+        sa.Column("category", sa.String(30), nullable=True),
+        sa.Column("confidence", sa.Float(), nullable=True),
+        sa.Column("error", sa.String(500), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column("processed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_receipt_extraction_items_pending",
+        "receipt_extraction_items",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_receipt_extraction_items_batch_id",
+        "receipt_extraction_items",
+        ["batch_id"],
+    )
+    op.create_table(
+        "receipt_extraction_cache",
+        sa.Column("content_hash", sa.String(64), primary_key=True),
+        sa.Column("amount", sa.Numeric(10, 2), nullable=True),
+        sa.Column("vendor", sa.String(200), nullable=True),
+        sa.Column("category", sa.String(30), nullable=True),
+        sa.Column("confidence", sa.Float(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the cache, item and batch tables."""
+    op.drop_table("receipt_extraction_cache")
+    op.drop_index(
+        "ix_receipt_extraction_items_batch_id",
+        table_name="receipt_extraction_items",
+    )
+    op.drop_index(
+        "ix_receipt_extraction_items_pending",
+        table_name="receipt_extraction_items",
+    )
+    op.drop_table("receipt_extraction_items")
+    op.drop_table("receipt_extraction_batches")
@@ -0,0 +1,56 @@
+"""Add ``notification_dispatches``.
+
+Idempotency ledger for batched notifications: the day-of reminder engine
+claims each reminder by key and commits the claims before sending, so a
+rerun after a crash does not send the same reminder twice.
+
+Revision ID: 20260415_101100
+Revises: 20260415_101000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_101100"
+down_revision: str | None = "20260415_101000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the dispatch ledger."""
+    op.create_table(
+        "notification_dispatches",
+        sa.Column("idempotency_key", sa.String(120), primary_key=True),
+        sa.Column("notification_type", sa.String(50), nullable=False),
+        sa.Column(
+            "appointment_id",
+            sa.UUID(),
+            sa.ForeignKey("appointments.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column(
+            "customer_id",
+            sa.UUID(),
+            sa.ForeignKey("customers.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column("status", sa.String(20), nullable=False, server_default="sending"),
+        sa.Column("error", sa.String(500), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column("completed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the dispatch ledger."""
+    op.drop_table("notification_dispatches")
@@ -0,0 +1,46 @@
+"""Add retry bookkeeping to ``receipt_extraction_items``.
+
+The receipt extraction worker now commits its claim (status
+``processing``) before extracting, and puts items whose extraction failed
+transiently back to ``pending`` with backoff. ``attempts`` bounds the
+retries, ``next_attempt_at`` holds the backoff and ``claimed_at`` lets a
+claim abandoned by a crashed worker be taken over.
+
+Revision ID: 20260415_101200
+Revises: 20260415_101100
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_101200"
+down_revision: str | None = "20260415_101100"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the attempt counter, backoff and claim time columns."""
+    op.add_column(
+        "receipt_extraction_items",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "receipt_extraction_items",
+        sa.Column("next_attempt_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "receipt_extraction_items",
+        sa.Column("claimed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the retry columns."""
+    op.drop_column("receipt_extraction_items", "claimed_at")
+    op.drop_column("receipt_extraction_items", "next_attempt_at")
+    op.drop_column("receipt_extraction_items", "attempts")
@@ -0,0 +1,32 @@
+"""Recount stored agreement metrics snapshots.
+
+Snapshots now count agreements in force at the month's end (active, past
+due, paused or pending renewal), as MRR history did before snapshots
+were introduced, instead of ACTIVE agreements only. Rows written with the
+old definition are deleted; the nightly ``snapshot_agreement_metrics`` job
+recomputes them from the status log, and history reads compute missing
+months in the meantime.
+
+Revision ID: 20260415_101300
+Revises: 20260415_101200
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20260415_101300"
+down_revision: str | None = "20260415_101200"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Delete snapshots computed with the ACTIVE-only definition."""
+    op.execute("DELETE FROM agreement_metrics_snapshots")
+
+
+def downgrade() -> None:
+    """Nothing to restore; the nightly job recomputes the snapshots."""
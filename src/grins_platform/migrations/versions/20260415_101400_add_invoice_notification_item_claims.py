@@ -0,0 +1,45 @@
+"""Record when invoice notification items are claimed for sending.
+
+The invoice notification worker now commits claimed items as ``sending``
+before texting them. ``claimed_at`` dates the claim so items left
+``sending`` by a worker that died are recorded as failed after a lease
+instead of being sent again; a partial index keeps that lookup cheap.
+
+Revision ID: 20260415_101400
+Revises: 20260415_101300
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260415_101400"
+down_revision: str | None = "20260415_101300"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the claim time and the index over sending items."""
+    op.add_column(
+        "invoice_notification_items",
+        sa.Column("claimed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_invoice_notification_items_sending",
+        "invoice_notification_items",
+        ["claimed_at"],
+        postgresql_where=sa.text("status = 'sending'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the index and the claim time."""
+    op.drop_index(
+        "ix_invoice_notification_items_sending",
+        table_name="invoice_notification_items",
+    )
+    op.drop_column("invoice_notification_items", "claimed_at")
@@ -17,13 +17,20 @@ CRM Gap Closure: Communication, CustomerPhoto, LeadAttachment, EstimateTemplate,
     AuditLog, BusinessSetting
 """
 
+from grins_platform.models.accounting_daily_rollup import AccountingDailyRollup
+from grins_platform.models.agreement_metrics_snapshot import AgreementMetricsSnapshot
 from grins_platform.models.agreement_status_log import AgreementStatusLog
 from grins_platform.models.ai_audit_log import AIAuditLog
 from grins_platform.models.ai_usage import AIUsage
 from grins_platform.models.appointment import Appointment
 from grins_platform.models.audit_log import AuditLog
 from grins_platform.models.business_setting import BusinessSetting
-from grins_platform.models.campaign import Campaign, CampaignRecipient
+from grins_platform.models.campaign import (
+    Campaign,
+    CampaignDeliveryCounter,
+    CampaignRecipient,
+    CsvUploadStagedRecipient,
+)
 from grins_platform.models.campaign_response import CampaignResponse
 from grins_platform.models.communication import Communication
 from grins_platform.models.consent_language_version import ConsentLanguageVersion
@@ -36,6 +43,7 @@ from grins_platform.models.customer import Customer
 from grins_platform.models.customer_document import CustomerDocument
 from grins_platform.models.customer_merge_candidate import CustomerMergeCandidate
 from grins_platform.models.customer_photo import CustomerPhoto
+from grins_platform.models.customer_summary import CustomerSummary
 from grins_platform.models.disclosure_record import DisclosureRecord
 from grins_platform.models.email_suppression_list import EmailSuppressionList
 from grins_platform.models.enums import (
@@ -90,6 +98,10 @@ from grins_platform.models.estimate_template import EstimateTemplate
 from grins_platform.models.expense import Expense
 from grins_platform.models.google_sheet_submission import GoogleSheetSubmission
 from grins_platform.models.invoice import Invoice
+from grins_platform.models.invoice_notification_run import (
+    InvoiceNotificationItem,
+    InvoiceNotificationRun,
+)
 from grins_platform.models.job import Job
 from grins_platform.models.job_confirmation import (
     JobConfirmationResponse,
@@ -100,7 +112,15 @@ from grins_platform.models.lead import Lead
 from grins_platform.models.lead_attachment import LeadAttachment
 from grins_platform.models.marketing_budget import MarketingBudget
 from grins_platform.models.media_library import MediaLibraryItem
+from grins_platform.models.notification_dispatch import NotificationDispatch
+from grins_platform.models.outbox_event import OutboxEvent
+from grins_platform.models.plaid_sync_cursor import PlaidSyncCursor
 from grins_platform.models.property import Property
+from grins_platform.models.receipt_extraction import (
+    ReceiptExtractionBatch,
+    ReceiptExtractionCache,
+    ReceiptExtractionItem,
+)
 from grins_platform.models.sales import SalesCalendarEvent, SalesEntry
 from grins_platform.models.schedule_clear_audit import ScheduleClearAudit
 from grins_platform.models.sent_message import SentMessage
@@ -118,8 +138,10 @@ __all__ = [
     "AIAuditLog",
     "AIUsage",
     # CRM Gap Closure
+    "AccountingDailyRollup",
     "ActionTag",
     # Service Package Purchases
+    "AgreementMetricsSnapshot",
     "AgreementPaymentStatus",
     "AgreementStatus",
     "AgreementStatusLog",
@@ -133,6 +155,7 @@ __all__ = [
     "BreakType",
     "BusinessSetting",
     "Campaign",
+    "CampaignDeliveryCounter",
     "CampaignRecipient",
     "CampaignResponse",
     "CampaignStatus",
@@ -146,12 +169,14 @@ __all__ = [
     "ContractRenewalProposal",
     "ContractRenewalProposedJob",
     "ContractTemplate",
+    "CsvUploadStagedRecipient",
     # Phase 1: Customer Management
     "Customer",
     "CustomerDocument",
     "CustomerMergeCandidate",
     "CustomerPhoto",
     "CustomerStatus",
+    "CustomerSummary",
     "DisclosureRecord",
     "DisclosureType",
     "DocumentType",
@@ -169,6 +194,8 @@ __all__ = [
     "IntakeTag",
     # Phase 8: Invoice Management
     "Invoice",
+    "InvoiceNotificationItem",
+    "InvoiceNotificationRun",
     "InvoiceStatus",
     # Phase 2: Field Operations
     "Job",
@@ -189,14 +216,20 @@ __all__ = [
     "MediaType",
     "MergeCandidateStatus",
     "MessageType",
+    "NotificationDispatch",
     "NotificationType",
+    "OutboxEvent",
     "PackageType",
     "PaymentMethod",
+    "PlaidSyncCursor",
     "PricingModel",
     "Property",
     "PropertyType",
     "ProposalStatus",
     "ProposedJobStatus",
+    "ReceiptExtractionBatch",
+    "ReceiptExtractionCache",
+    "ReceiptExtractionItem",
     "RescheduleRequest",
     # Sales Pipeline
     "SalesCalendarEvent",
@@ -0,0 +1,81 @@
+"""Daily accounting rollups.
+
+Ledger-style totals per (source, day, category, state). Database triggers
+on ``invoices`` and ``expenses`` post each insert, delete or relevant update
+as a signed delta (the old row's contribution is reversed, the new row's
+added), so every write path keeps the rollups current and concurrent writes
+to the same day add up. Invoices are posted twice: by ``invoice_date``
+(``source='invoice'``) for revenue and open balances, and by ``due_date``
+(``source='invoice_due'``) for past-due totals. Expenses are posted by
+expense date and category.
+
+Period figures are range sums over these rows, whose count grows with days
+rather than with invoices and expenses.
+
+Validates: CRM Gap Closure Req 52, 53, 59, 61
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Date, DateTime, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from grins_platform.database import Base
+
+ROLLUP_SOURCE_INVOICE = "invoice"
+ROLLUP_SOURCE_INVOICE_DUE = "invoice_due"
+ROLLUP_SOURCE_EXPENSE = "expense"
+
+
+class AccountingDailyRollup(Base):
+    """Signed totals of invoices or expenses for one day.
+
+    Attributes:
+        source: ``invoice``, ``invoice_due`` or ``expense``
+        day: Invoice date, due date or expense date
+        category: Expense category ("" for invoices)
+        state: Invoice status ("" for expenses)
+        amount: Sum of invoice total_amount or expense amount
+        entry_count: Number of invoices or expenses
+        updated_at: Last time a delta was posted
+    """
+
+    __tablename__ = "accounting_daily_rollups"
+
+    source: Mapped[str] = mapped_column(String(20), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    category: Mapped[str] = mapped_column(
+        String(30),
+        primary_key=True,
+        server_default="",
+    )
+    state: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True,
+        server_default="",
+    )
+    amount: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2),
+        nullable=False,
+        server_default="0",
+    )
+    entry_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<AccountingDailyRollup(source='{self.source}', day={self.day}, "
+            f"category='{self.category}', state='{self.state}', "
+            f"amount={self.amount})>"
+        )
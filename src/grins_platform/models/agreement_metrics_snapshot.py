@@ -0,0 +1,88 @@
+"""AgreementMetricsSnapshot model for monthly agreement KPI history.
+
+One row per (month, tier) holding the agreement state at the month's end,
+reconstructed from ``agreement_status_logs``, so MRR and churn history are
+read rather than recomputed and do not drift as agreements change status.
+
+Validates: Requirement 22.3
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from grins_platform.database import Base
+
+
+class AgreementMetricsSnapshot(Base):
+    """Agreement metrics for one tier in one closed month.
+
+    Counts rather than rates are stored so totals across tiers can be
+    recomputed exactly.
+
+    Attributes:
+        id: Unique identifier
+        month: First day of the month (UTC)
+        tier_id: FK to service_agreement_tiers
+        active_count: Agreements in force (active, past due, paused or
+            pending renewal) at the month's end
+        mrr: Sum of annual_price / 12 over those agreements
+        cancelled_count: Transitions to CANCELLED during the month
+        renewed_count: PENDING_RENEWAL -> ACTIVE transitions during the month
+        not_renewed_count: PENDING_RENEWAL -> EXPIRED/CANCELLED transitions
+        computed_at: When the row was (re)computed
+    """
+
+    __tablename__ = "agreement_metrics_snapshots"
+    __table_args__ = (
+        UniqueConstraint(
+            "month",
+            "tier_id",
+            name="uq_agreement_metrics_snapshots_month_tier",
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
+    month: Mapped[date] = mapped_column(Date, nullable=False)
+    tier_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("service_agreement_tiers.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    active_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    mrr: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    cancelled_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    renewed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    not_renewed_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<AgreementMetricsSnapshot(month={self.month}, tier_id={self.tier_id}, "
+            f"active={self.active_count}, mrr={self.mrr})>"
+        )
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import (
     JSONB,
     UUID as PGUUID,
@@ -168,3 +168,87 @@ class CampaignRecipient(Base):
             f"<CampaignRecipient(id={self.id}, campaign_id={self.campaign_id}, "
             f"status='{self.delivery_status}')>"
         )
+
+
+class CampaignDeliveryCounter(Base):
+    """Per-campaign recipient counts by delivery state.
+
+    Maintained in the same transaction as every recipient state change
+    (see ``services.sms.state_machine``) so campaign status derivation
+    and the stats endpoint read one row instead of aggregating over
+    ``campaign_recipients``. A periodic reconciliation job rewrites the
+    counts from the recipient rows to correct any drift.
+    """
+
+    __tablename__ = "campaign_delivery_counters"
+
+    campaign_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("campaigns.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    pending: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    sending: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    sent: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    cancelled: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+    )
+    opted_out: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+    )
+    reconciled_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<CampaignDeliveryCounter(campaign_id={self.campaign_id}, "
+            f"pending={self.pending}, sending={self.sending}, sent={self.sent}, "
+            f"failed={self.failed}, cancelled={self.cancelled})>"
+        )
+
+
+class CsvUploadStagedRecipient(Base):
+    """A normalized recipient staged from a CSV audience upload.
+
+    The upload endpoint streams the file in chunks and writes each chunk
+    here instead of returning every row inline, so large uploads are not
+    held in memory or embedded in ``campaigns.target_audience``. Campaigns
+    reference a staged upload through ``target_audience.ad_hoc.csv_upload_id``.
+    The primary key collapses duplicate phones across chunks.
+    """
+
+    __tablename__ = "csv_upload_staged_recipients"
+
+    upload_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    phone_e164: Mapped[str] = mapped_column(String(20), primary_key=True)
+    first_name: Mapped[str | None] = mapped_column(Text, nullable=True)
+    last_name: Mapped[str | None] = mapped_column(Text, nullable=True)
+    row_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    match_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    __table_args__ = (
+        Index("idx_csv_upload_staged_recipients_created_at", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<CsvUploadStagedRecipient(upload_id={self.upload_id}, "
+            f"row={self.row_number}, match_type='{self.match_type}')>"
+        )
@@ -11,7 +11,17 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import (
     JSON,
     UUID as PGUUID,
@@ -21,6 +31,14 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from grins_platform.database import Base
 from grins_platform.models.enums import CustomerStatus, LeadSource
 
+# Lower-cased name, email and phone digits for trigram search
+# (see repositories/search_repository.py)
+CUSTOMER_SEARCH_TEXT_SQL = (
+    "lower(first_name::text || ' ' || last_name::text || ' ' || "
+    "coalesce(email::text, '') || ' ' || "
+    "regexp_replace(phone::text, '[^0-9]', '', 'g'))"
+)
+
 if TYPE_CHECKING:
     from grins_platform.models.invoice import Invoice
     from grins_platform.models.job import Job
@@ -169,6 +187,13 @@ class Customer(Base):
         nullable=True,
     )
 
+    # Generated search column (GIN trigram index)
+    search_text: Mapped[str] = mapped_column(
+        Text,
+        Computed(CUSTOMER_SEARCH_TEXT_SQL, persisted=True),
+        deferred=True,
+    )
+
     # Soft Delete (Requirement 1.6)
     is_deleted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     deleted_at: Mapped[Optional[datetime]] = mapped_column(
@@ -212,6 +237,16 @@ class Customer(Base):
         lazy="selectin",
     )
 
+    __table_args__ = (
+        Index(
+            "idx_customers_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        Index("idx_customers_email_lower", text("lower(email)")),
+    )
+
     @property
     def full_name(self) -> str:
         """Get the customer's full name."""
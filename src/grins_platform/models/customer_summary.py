@@ -0,0 +1,81 @@
+"""Customer 360 summary projection.
+
+One row per customer holding the aggregates shown on the customer detail
+page. Rows are maintained by database triggers on jobs, invoices, service
+agreements, sent messages and communications, which call
+``refresh_customer_summary(customer_id)`` whenever a job completes, an
+invoice is paid or changes, an agreement changes, or the customer is
+contacted, so every write path (including webhooks and merges) keeps it
+current. Reads are a single primary-key lookup.
+
+Validates: Requirement 7.2
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from grins_platform.database import Base
+
+
+class CustomerSummary(Base):
+    """Denormalized per-customer service, billing and contact totals.
+
+    Validates: Requirement 7.2
+    """
+
+    __tablename__ = "customer_summaries"
+
+    customer_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("customers.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    total_jobs: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+    )
+    last_service_date: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    lifetime_revenue: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        server_default="0",
+    )
+    outstanding_balance: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        server_default="0",
+    )
+    active_agreement_id: Mapped[Optional[UUID]] = mapped_column(
+        PGUUID(as_uuid=True),
+        nullable=True,
+    )
+    active_agreement_tier: Mapped[Optional[str]] = mapped_column(
+        String(100),
+        nullable=True,
+    )
+    last_contact_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<CustomerSummary(customer_id={self.customer_id}, "
+            f"total_jobs={self.total_jobs})>"
+        )
@@ -55,6 +55,11 @@ class Expense(Base):
     )
     lead_source: Mapped[str | None] = mapped_column(String(50), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Bank transaction this expense was imported from (Req 62)
+    plaid_transaction_id: Mapped[str | None] = mapped_column(
+        String(100),
+        nullable=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -75,6 +80,11 @@ class Expense(Base):
         Index("idx_expenses_category", "category"),
         Index("idx_expenses_date", "date"),
         Index("idx_expenses_job_id", "job_id"),
+        Index(
+            "uq_expenses_plaid_transaction_id",
+            "plaid_transaction_id",
+            unique=True,
+        ),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,145 @@
+"""Invoice mass-notification runs and their per-invoice items.
+
+``POST /invoices/mass-notify`` records a run with one item per targeted
+invoice and returns at once; the invoice notification worker sends pending
+items in the background and keeps the run's counters current, so progress
+is readable at any time and an interrupted run resumes from its pending
+items. Items are committed as ``sending`` before their message goes out,
+so one being sent when the worker died is recorded as failed rather than
+sent twice.
+
+Validates: Requirements 29.3, 29.4
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from grins_platform.database import Base
+
+
+class InvoiceNotificationRun(Base):
+    """A mass notification over a set of invoices.
+
+    Attributes:
+        id: Unique identifier
+        notification_type: past_due, due_soon or lien_eligible
+        message_template: Template rendered per invoice
+        status: queued, sending or completed
+        targeted: Invoices matched when the run was created
+        sent: Messages sent (or scheduled by the rate limiter)
+        failed: Sends that errored
+        skipped: Invoices without a reachable, consenting customer
+        created_at: When the run was requested
+        completed_at: When the last item was processed
+    """
+
+    __tablename__ = "invoice_notification_runs"
+
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
+    notification_type: Mapped[str] = mapped_column(String(30), nullable=False)
+    message_template: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        server_default="queued",
+    )
+    targeted: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    sent: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    skipped: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<InvoiceNotificationRun(id={self.id}, "
+            f"type='{self.notification_type}', status='{self.status}')>"
+        )
+
+
+class InvoiceNotificationItem(Base):
+    """One invoice's notification within a run.
+
+    Attributes:
+        id: Unique identifier
+        run_id: FK to invoice_notification_runs
+        invoice_id: FK to invoices
+        status: pending, sending, sent, failed or skipped
+        error: Why the item failed or was skipped
+        claimed_at: When a worker marked the item sending
+        processed_at: When the item reached its final status
+    """
+
+    __tablename__ = "invoice_notification_items"
+    __table_args__ = (
+        Index(
+            "ix_invoice_notification_items_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index(
+            "ix_invoice_notification_items_sending",
+            "claimed_at",
+            postgresql_where=text("status = 'sending'"),
+        ),
+        Index("ix_invoice_notification_items_run_id", "run_id"),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
+    run_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("invoice_notification_runs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    invoice_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("invoices.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        server_default="pending",
+    )
+    error: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<InvoiceNotificationItem(run_id={self.run_id}, "
+            f"invoice_id={self.invoice_id}, status='{self.status}')>"
+        )
@@ -11,7 +11,15 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+)
 from sqlalchemy.dialects.postgresql import (
     JSONB,
     UUID as PGUUID,
@@ -26,6 +34,14 @@ from grins_platform.models.enums import (
     LeadStatus,
 )
 
+# Lower-cased name, email, phone digits and address for trigram search
+# (see repositories/search_repository.py)
+LEAD_SEARCH_TEXT_SQL = (
+    "lower(name::text || ' ' || coalesce(email::text, '') || ' ' || "
+    "regexp_replace(phone::text, '[^0-9]', '', 'g') || ' ' || "
+    "coalesce(address::text, '') || ' ' || coalesce(city::text, ''))"
+)
+
 if TYPE_CHECKING:
     from grins_platform.models.customer import Customer
     from grins_platform.models.staff import Staff
@@ -132,6 +148,13 @@ class Lead(Base):
     state: Mapped[Optional[str]] = mapped_column(String(2), nullable=True)
     address: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
+    # Generated search column (GIN trigram index)
+    search_text: Mapped[str] = mapped_column(
+        Text,
+        Computed(LEAD_SEARCH_TEXT_SQL, persisted=True),
+        deferred=True,
+    )
+
     # Action tags (CRM Gap Closure Req 13.1)
     action_tags: Mapped[Optional[list[str]]] = mapped_column(
         JSONB,
@@ -213,6 +236,12 @@ class Lead(Base):
         Index("idx_leads_lead_source", "lead_source"),
         Index("idx_leads_intake_tag", "intake_tag"),
         Index("idx_leads_email_created_at", "email", "created_at"),
+        Index(
+            "idx_leads_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,73 @@
+"""Idempotency ledger for batched customer notifications.
+
+A batch sender claims each notification by inserting its idempotency key
+(for day-of reminders ``day_of_reminder:<appointment id>:<date>``) and
+commits the claim right before sending it, so a rerun after a crash skips
+every notification already claimed. Claims that ended ``failed`` may be claimed
+again; claims left ``sending`` by an interrupted run are not, since their
+messages may have gone out.
+
+Validates: CRM Gap Closure Req 39.1, 39.7
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from grins_platform.database import Base
+
+
+class NotificationDispatch(Base):
+    """One claimed notification.
+
+    Attributes:
+        idempotency_key: Unique key of the notification
+        notification_type: NotificationType value
+        appointment_id: FK to appointments, when about an appointment
+        customer_id: FK to customers
+        status: sending, sent, skipped or failed
+        error: Why the notification failed or was skipped
+        created_at: When the notification was claimed
+        completed_at: When the notification reached its final status
+    """
+
+    __tablename__ = "notification_dispatches"
+
+    idempotency_key: Mapped[str] = mapped_column(String(120), primary_key=True)
+    notification_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    appointment_id: Mapped[Optional[UUID]] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("appointments.id", ondelete="CASCADE"),
+        nullable=True,
+    )
+    customer_id: Mapped[Optional[UUID]] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("customers.id", ondelete="CASCADE"),
+        nullable=True,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        server_default="sending",
+    )
+    error: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<NotificationDispatch(key='{self.idempotency_key}', "
+            f"status='{self.status}')>"
+        )
@@ -0,0 +1,88 @@
+"""OutboxEvent model for side effects deferred out of a request.
+
+A request writes its outbox rows in the same transaction as the data they
+describe, so a side effect is recorded if and only if the write commits.
+``services/outbox_service.py`` delivers pending rows with retries.
+
+Validates: Requirements 46.7, 55.1-55.3
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import (
+    JSONB,
+    UUID as PGUUID,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from grins_platform.database import Base
+
+
+class OutboxEvent(Base):
+    """A side effect waiting to be delivered.
+
+    Attributes:
+        id: Unique identifier
+        event_type: Handler key (e.g. ``lead.confirmation_sms``)
+        aggregate_id: Record the event is about (e.g. the lead id)
+        payload: Extra handler input
+        status: pending, done or failed (retries exhausted)
+        attempts: Delivery attempts so far
+        next_attempt_at: Earliest time of the next attempt
+        last_error: Error from the latest failed attempt
+        processed_at: When delivery succeeded or was abandoned
+    """
+
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        Index(
+            "ix_outbox_events_due",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index("ix_outbox_events_aggregate_id", "aggregate_id"),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    aggregate_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        server_default=text("'{}'::jsonb"),
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        server_default="pending",
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<OutboxEvent(id={self.id}, type='{self.event_type}', "
+            f"status='{self.status}', attempts={self.attempts})>"
+        )
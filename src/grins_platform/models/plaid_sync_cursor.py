@@ -0,0 +1,41 @@
+"""PlaidSyncCursor model for incremental bank transaction sync.
+
+Holds the ``/transactions/sync`` cursor of each connected Plaid item, so
+each sync fetches only what changed since the last one. The cursor is
+saved in the same transaction as the expenses it produced.
+
+Validates: CRM Gap Closure Req 62.3
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from grins_platform.database import Base
+
+
+class PlaidSyncCursor(Base):
+    """Transactions sync position of one Plaid item.
+
+    Attributes:
+        item_key: SHA-256 of the item's access token (the token itself is
+            never stored)
+        cursor: ``next_cursor`` of the last applied sync
+        synced_at: When the cursor last advanced
+    """
+
+    __tablename__ = "plaid_sync_cursors"
+
+    item_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    cursor: Mapped[str] = mapped_column(Text, nullable=False)
+    synced_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"<PlaidSyncCursor(item_key='{self.item_key[:8]}')>"
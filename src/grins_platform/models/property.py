@@ -14,13 +14,16 @@ from uuid import UUID
 
 from sqlalchemy import (
     Boolean,
+    Computed,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -28,6 +31,12 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from grins_platform.database import Base
 from grins_platform.models.enums import PropertyType, SystemType
 
+# Lower-cased street address, city and ZIP for trigram search
+# (see repositories/search_repository.py)
+PROPERTY_SEARCH_TEXT_SQL = (
+    "lower(address::text || ' ' || city::text || ' ' || coalesce(zip_code::text, ''))"
+)
+
 if TYPE_CHECKING:
     from grins_platform.models.customer import Customer
     from grins_platform.models.job import Job
@@ -114,6 +123,13 @@ class Property(Base):
     has_dogs: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     special_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    # Generated search column (GIN trigram index)
+    search_text: Mapped[str] = mapped_column(
+        Text,
+        Computed(PROPERTY_SEARCH_TEXT_SQL, persisted=True),
+        deferred=True,
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -138,6 +154,17 @@ class Property(Base):
         lazy="selectin",
     )
 
+    __table_args__ = (
+        Index(
+            "idx_properties_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        # Serves the case-insensitive city filter on customer lists
+        Index("idx_properties_city_lower", text("lower(city)")),
+    )
+
     @property
     def system_type_enum(self) -> SystemType:
         """Get the system type as an enum value."""
@@ -0,0 +1,220 @@
+"""Queued receipt extraction: batches, their receipts, and a result cache.
+
+``POST /expenses/receipts/batch`` stores the uploaded receipts, records a
+batch with one item per receipt and returns at once; the receipt
+extraction worker extracts pending items in the background and keeps the
+batch's counters current. Extraction results are cached by the SHA-256 of
+the uploaded bytes, so a receipt uploaded again is answered from the cache
+instead of being sent to the vision model a second time.
+
+Validates: CRM Gap Closure Req 60
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from grins_platform.database import Base
+
+
+class ReceiptExtractionBatch(Base):
+    """A set of receipts uploaded together for extraction.
+
+    Attributes:
+        id: Unique identifier
+        status: queued, processing or completed
+        total: Receipts in the batch
+        completed: Receipts extracted (including cache hits)
+        failed: Receipts whose extraction errored
+        cached: Receipts answered from the result cache
+        created_by: Staff member who uploaded the batch
+        created_at: When the batch was uploaded
+        completed_at: When the last receipt was processed
+    """
+
+    __tablename__ = "receipt_extraction_batches"
+
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        server_default="queued",
+    )
+    total: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    completed: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+    )
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    cached: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    created_by: Mapped[Optional[UUID]] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("staff.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<ReceiptExtractionBatch(id={self.id}, status='{self.status}', "
+            f"total={self.total})>"
+        )
+
+
+class ReceiptExtractionItem(Base):
+    """One uploaded receipt within a batch.
+
+    Attributes:
+        id: Unique identifier
+        batch_id: FK to receipt_extraction_batches
+        file_key: S3 key of the stored receipt
+        file_name: Original file name
+        content_type: Detected MIME type
+        content_hash: SHA-256 hex digest of the uploaded bytes
+        status: pending, processing, completed or failed
+        attempts: Extraction attempts so far
+        next_attempt_at: When a retried item is next due
+        claimed_at: When a worker last claimed the item
+        cached: Whether the result came from the cache
+        amount: Extracted total
+        vendor: Extracted vendor name
+        category: Suggested expense category
+        confidence: Extraction confidence score
+        error: Why the extraction failed
+        processed_at: When the item reached its final status
+    """
+
+    __tablename__ = "receipt_extraction_items"
+    __table_args__ = (
+        Index(
+            "ix_receipt_extraction_items_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index("ix_receipt_extraction_items_batch_id", "batch_id"),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
+    batch_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("receipt_extraction_batches.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    file_key: Mapped[str] = mapped_column(String(500), nullable=False)
+    file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    content_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        server_default="pending",
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+    )
+    next_attempt_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    cached: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        server_default="false",
+    )
+    amount: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    vendor: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    category: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
+    confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<ReceiptExtractionItem(batch_id={self.batch_id}, "
+            f"file_key='{self.file_key}', status='{self.status}')>"
+        )
+
+
+class ReceiptExtractionCache(Base):
+    """Extraction result of a receipt, keyed by its content hash.
+
+    Only confident results are cached, so a receipt that could not be read
+    (or was processed while extraction was unconfigured) is tried again.
+
+    Attributes:
+        content_hash: SHA-256 hex digest of the receipt bytes
+        amount: Extracted total
+        vendor: Extracted vendor name
+        category: Suggested expense category
+        confidence: Extraction confidence score
+        created_at: When the result was cached
+    """
+
+    __tablename__ = "receipt_extraction_cache"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    amount: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    vendor: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    category: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
+    confidence: Mapped[float] = mapped_column(Float, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<ReceiptExtractionCache(content_hash='{self.content_hash}', "
+            f"vendor='{self.vendor}', amount={self.amount})>"
+        )
@@ -0,0 +1,174 @@
+"""
+Redis configuration and connection management.
+
+This module provides a single pooled async Redis connection shared by the
+API, background workers, SMS rate limiting and health checks, mirroring
+``DatabaseManager``. Redis is optional: when ``REDIS_URL`` is unset every
+accessor returns ``None`` and callers fall back to their in-memory paths.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from grins_platform.log_config import LoggerMixin, get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from redis.asyncio import ConnectionPool, Redis
+    from redis.asyncio.client import Pipeline
+
+logger = get_logger(__name__)
+
+
+class RedisSettings(BaseSettings):
+    """Redis configuration settings loaded from environment."""
+
+    redis_url: str | None = None
+
+    # Connection pool settings
+    redis_max_connections: int = 20
+    redis_socket_timeout: float = 5.0
+    redis_socket_connect_timeout: float = 5.0
+    redis_health_check_interval: int = 30
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+class RedisManager(LoggerMixin):
+    """Manages the shared Redis connection pool."""
+
+    DOMAIN = "redis"
+
+    def __init__(self, settings: RedisSettings | None = None) -> None:
+        """Initialize Redis manager with settings.
+
+        Args:
+            settings: Redis settings, loads from environment if not provided
+        """
+        super().__init__()
+        self.settings = settings or RedisSettings()
+        self._pool: ConnectionPool | None = None
+        self._client: Redis | None = None
+
+    @property
+    def is_configured(self) -> bool:
+        """Whether a Redis URL is configured."""
+        return bool(self.settings.redis_url)
+
+    @property
+    def client(self) -> Redis | None:
+        """Get or create the pooled client, or None if Redis is not configured.
+
+        The client is shared; callers must not close it.
+        """
+        if self._client is None and self.is_configured:
+            try:
+                from redis.asyncio import (  # noqa: PLC0415
+                    ConnectionPool as _ConnectionPool,
+                    Redis as _Redis,
+                )
+
+                self._pool = _ConnectionPool.from_url(
+                    str(self.settings.redis_url),
+                    decode_responses=True,
+                    max_connections=self.settings.redis_max_connections,
+                    socket_timeout=self.settings.redis_socket_timeout,
+                    socket_connect_timeout=self.settings.redis_socket_connect_timeout,
+                    health_check_interval=self.settings.redis_health_check_interval,
+                )
+                self._client = _Redis(connection_pool=self._pool)
+            except Exception as e:
+                self.log_failed("pool_create", error=e)
+                return None
+            self.log_completed(
+                "pool_created",
+                max_connections=self.settings.redis_max_connections,
+            )
+        return self._client
+
+    @asynccontextmanager
+    async def pipeline(
+        self,
+        transaction: bool = False,
+    ) -> AsyncIterator[Pipeline | None]:
+        """Yield a pipeline on the shared pool, or None if Redis is unavailable.
+
+        Commands queued on the pipeline are sent in one round trip when the
+        caller awaits ``pipe.execute()``.
+
+        Args:
+            transaction: Wrap the queued commands in MULTI/EXEC
+        """
+        client = self.client
+        if client is None:
+            yield None
+            return
+        async with client.pipeline(transaction=transaction) as pipe:
+            yield pipe
+
+    async def close(self) -> None:
+        """Close the client and disconnect every pooled connection."""
+        if self._client is not None:
+            self.log_started("connection_close")
+            await self._client.aclose()
+            if self._pool is not None:
+                await self._pool.disconnect()
+            self._client = None
+            self._pool = None
+            self.log_completed("connection_close")
+
+    async def health_check(self) -> dict[str, Any]:
+        """Check Redis connectivity.
+
+        Returns:
+            dict with health status information
+        """
+        if not self.is_configured:
+            return {"status": "disabled", "redis": "not_configured"}
+
+        self.log_started("health_check")
+        client = self.client
+        if client is None:
+            return {"status": "unhealthy", "redis": "disconnected"}
+        try:
+            _ = await client.ping()
+        except Exception as e:
+            self.log_failed("health_check", error=e)
+            return {"status": "unhealthy", "redis": "disconnected", "error": str(e)}
+        else:
+            self.log_completed("health_check", status="healthy")
+            return {"status": "healthy", "redis": "connected"}
+
+
+# Global Redis manager instance
+_redis_manager: RedisManager | None = None
+
+
+def get_redis_manager() -> RedisManager:
+    """Get the global Redis manager instance.
+
+    Returns:
+        RedisManager: The global Redis manager
+    """
+    global _redis_manager  # noqa: PLW0603
+    if _redis_manager is None:
+        _redis_manager = RedisManager()
+    return _redis_manager
+
+
+def get_redis() -> Redis | None:
+    """Dependency for getting the shared Redis client in FastAPI.
+
+    Returns:
+        The pooled client, or None if Redis is not configured
+    """
+    return get_redis_manager().client
@@ -36,6 +36,7 @@ from grins_platform.repositories.property_repository import PropertyRepository
 from grins_platform.repositories.schedule_clear_audit_repository import (
     ScheduleClearAuditRepository,
 )
+from grins_platform.repositories.search_repository import SearchRepository
 from grins_platform.repositories.sent_message_repository import SentMessageRepository
 from grins_platform.repositories.service_offering_repository import (
     ServiceOfferingRepository,
@@ -65,6 +66,7 @@ __all__ = [
     "MediaRepository",
     "PropertyRepository",
     "ScheduleClearAuditRepository",
+    "SearchRepository",
     "SentMessageRepository",
     "ServiceOfferingRepository",
     "StaffRepository",
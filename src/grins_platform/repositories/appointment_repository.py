@@ -19,10 +19,16 @@ from grins_platform.log_config import LoggerMixin
 from grins_platform.models.appointment import Appointment
 from grins_platform.models.enums import AppointmentStatus  # noqa: TC001
 from grins_platform.models.job import Job
+from grins_platform.repositories.pagination import (
+    CountMode,
+    KeysetPage,
+    paginate_keyset,
+)
 
 if TYPE_CHECKING:
     from uuid import UUID
 
+    from sqlalchemy import Select
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -256,24 +262,13 @@ class AppointmentRepository(LoggerMixin):
         """
         self.log_started("list_with_filters", page=page, page_size=page_size)
 
-        # Base query
-        base_query = select(Appointment)
-
-        # Apply filters
-        if status is not None:
-            base_query = base_query.where(Appointment.status == status.value)
-
-        if staff_id is not None:
-            base_query = base_query.where(Appointment.staff_id == staff_id)
-
-        if job_id is not None:
-            base_query = base_query.where(Appointment.job_id == job_id)
-
-        if date_from is not None:
-            base_query = base_query.where(Appointment.scheduled_date >= date_from)
-
-        if date_to is not None:
-            base_query = base_query.where(Appointment.scheduled_date <= date_to)
+        base_query = self._filtered_query(
+            status=status,
+            staff_id=staff_id,
+            job_id=job_id,
+            date_from=date_from,
+            date_to=date_to,
+        )
 
         # Get total count
         count_query = select(func.count()).select_from(base_query.subquery())
@@ -303,6 +298,86 @@ class AppointmentRepository(LoggerMixin):
         self.log_completed("list_with_filters", count=len(appointments), total=total)
         return appointments, total
 
+    async def list_keyset(
+        self,
+        *,
+        cursor: str | None,
+        page_size: int = 20,
+        sort_by: str = "scheduled_date",
+        sort_order: str = "asc",
+        count: CountMode = "cached",
+        include_relationships: bool = False,
+        **filters: Any,
+    ) -> KeysetPage[Appointment]:
+        """List appointments a page at a time after *cursor*.
+
+        Args:
+            cursor: ``next_cursor`` of the previous page, or None/"" to start
+            page_size: Number of items per page
+            sort_by: Field to sort by
+            sort_order: Sort order (asc/desc)
+            count: Total count mode
+            include_relationships: Whether to load related entities (job, staff)
+            **filters: Same filters as ``list_with_filters``
+
+        Returns:
+            KeysetPage of appointments
+
+        Raises:
+            ValidationError: If the cursor is invalid for this sort
+        """
+        self.log_started("list_keyset", page_size=page_size, has_cursor=bool(cursor))
+
+        stmt = self._filtered_query(**filters)
+        if include_relationships:
+            stmt = stmt.options(
+                selectinload(Appointment.job).selectinload(Job.customer),
+                selectinload(Appointment.staff),
+            )
+        page = await paginate_keyset(
+            self.session,
+            stmt,
+            sort_column=getattr(Appointment, sort_by, Appointment.scheduled_date),
+            id_column=Appointment.id,
+            descending=sort_order == "desc",
+            cursor=cursor,
+            limit=page_size,
+            count=count,
+        )
+
+        self.log_completed("list_keyset", count=len(page.items), total=page.total)
+        return page
+
+    def _filtered_query(
+        self,
+        status: AppointmentStatus | None = None,
+        staff_id: UUID | None = None,
+        job_id: UUID | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> Select[tuple[Appointment]]:
+        """Build the unordered appointment list query for the given filters."""
+        # Base query
+        base_query = select(Appointment)
+
+        # Apply filters
+        if status is not None:
+            base_query = base_query.where(Appointment.status == status.value)
+
+        if staff_id is not None:
+            base_query = base_query.where(Appointment.staff_id == staff_id)
+
+        if job_id is not None:
+            base_query = base_query.where(Appointment.job_id == job_id)
+
+        if date_from is not None:
+            base_query = base_query.where(Appointment.scheduled_date >= date_from)
+
+        if date_to is not None:
+            base_query = base_query.where(Appointment.scheduled_date <= date_to)
+
+        return base_query
+
     async def get_daily_schedule(
         self,
         schedule_date: date,
@@ -13,7 +13,16 @@ from sqlalchemy import func, select, text, update
 from sqlalchemy.orm import selectinload
 
 from grins_platform.log_config import LoggerMixin
-from grins_platform.models.campaign import Campaign, CampaignRecipient
+from grins_platform.models.campaign import (
+    Campaign,
+    CampaignDeliveryCounter,
+    CampaignRecipient,
+)
+from grins_platform.services.sms.state_machine import (
+    COUNTED_STATES,
+    DeliveryCounterDeltas,
+    adjust_delivery_counters,
+)
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -220,6 +229,11 @@ class CampaignRepository(LoggerMixin):
         self.session.add(recipient)
         await self.session.flush()
         await self.session.refresh(recipient)
+        await adjust_delivery_counters(
+            self.session,
+            recipient.campaign_id,
+            {recipient.delivery_status: 1},
+        )
 
         self.log_completed("add_recipient", recipient_id=str(recipient.id))
         return recipient
@@ -239,14 +253,21 @@ class CampaignRepository(LoggerMixin):
         self.log_started("add_recipients_bulk", count=len(recipients))
 
         created: list[CampaignRecipient] = []
+        deltas = DeliveryCounterDeltas()
         for recipient_data in recipients:
             recipient = CampaignRecipient(**recipient_data)
             self.session.add(recipient)
             created.append(recipient)
+            deltas.record(
+                recipient.campaign_id,
+                None,
+                recipient_data.get("delivery_status", "pending"),
+            )
 
         await self.session.flush()
         for r in created:
             await self.session.refresh(r)
+        await deltas.flush(self.session)
 
         self.log_completed("add_recipients_bulk", count=len(created))
         return created
@@ -339,12 +360,19 @@ class CampaignRepository(LoggerMixin):
             self.log_completed("update_recipient_status", found=False)
             return None
 
+        previous_status = recipient.delivery_status
         recipient.delivery_status = delivery_status
         if error_message is not None:
             recipient.error_message = error_message
 
         await self.session.flush()
         await self.session.refresh(recipient)
+        if previous_status != delivery_status:
+            await adjust_delivery_counters(
+                self.session,
+                recipient.campaign_id,
+                {previous_status: -1, delivery_status: 1},
+            )
 
         self.log_completed(
             "update_recipient_status",
@@ -362,6 +390,9 @@ class CampaignRepository(LoggerMixin):
     ) -> dict[str, int]:
         """Get delivery statistics for a campaign.
 
+        Reads the campaign's delivery counter row; campaigns created before
+        counters existed fall back to aggregating the recipient rows.
+
         Args:
             campaign_id: Campaign UUID
 
@@ -372,17 +403,27 @@ class CampaignRepository(LoggerMixin):
         """
         self.log_started("get_campaign_stats", campaign_id=str(campaign_id))
 
-        stmt = (
-            select(
-                CampaignRecipient.delivery_status,
-                func.count(CampaignRecipient.id),
-            )
-            .where(CampaignRecipient.campaign_id == campaign_id)
-            .group_by(CampaignRecipient.delivery_status)
+        counter_stmt = select(CampaignDeliveryCounter).where(
+            CampaignDeliveryCounter.campaign_id == campaign_id,
         )
-
-        result = await self.session.execute(stmt)
-        status_counts = {str(row[0]): int(row[1]) for row in result.all()}
+        counter_result = await self.session.execute(counter_stmt)
+        counter: CampaignDeliveryCounter | None = counter_result.scalar_one_or_none()
+
+        if counter is not None:
+            status_counts = {
+                state: int(getattr(counter, state)) for state in COUNTED_STATES
+            }
+        else:
+            stmt = (
+                select(
+                    CampaignRecipient.delivery_status,
+                    func.count(CampaignRecipient.id),
+                )
+                .where(CampaignRecipient.campaign_id == campaign_id)
+                .group_by(CampaignRecipient.delivery_status)
+            )
+            result = await self.session.execute(stmt)
+            status_counts = {str(row[0]): int(row[1]) for row in result.all()}
 
         total = sum(status_counts.values())
         stats: dict[str, int] = {
@@ -470,6 +511,11 @@ class CampaignRepository(LoggerMixin):
 
         if created:
             await self.session.flush()
+            await adjust_delivery_counters(
+                self.session,
+                campaign_id,
+                {"pending": created},
+            )
 
         self.log_completed("clone_recipients_as_pending", created=created)
         return created
@@ -525,6 +571,11 @@ class CampaignRepository(LoggerMixin):
         result = await self.session.execute(stmt)
         cancelled: int = result.rowcount  # type: ignore[assignment]
         await self.session.flush()
+        await adjust_delivery_counters(
+            self.session,
+            campaign_id,
+            {"pending": -cancelled, "cancelled": cancelled},
+        )
 
         self.log_completed(
             "cancel_pending_recipients",
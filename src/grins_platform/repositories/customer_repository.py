@@ -17,13 +17,18 @@ from sqlalchemy.orm import selectinload
 
 from grins_platform.log_config import LoggerMixin
 from grins_platform.models.customer import Customer
+from grins_platform.models.customer_summary import CustomerSummary
 from grins_platform.models.property import Property
 from grins_platform.models.service_agreement import ServiceAgreement
+from grins_platform.repositories.pagination import KeysetPage, paginate_keyset
+from grins_platform.repositories.search_repository import search_condition
 from grins_platform.schemas.customer import CustomerListParams, ServiceHistorySummary
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from uuid import UUID
 
+    from sqlalchemy import Select
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -332,7 +337,120 @@ class CustomerRepository(LoggerMixin):
             page_size=params.page_size,
         )
 
-        # Base query
+        base_query = self._filtered_query(params)
+
+        # Get total count
+        count_query = select(func.count()).select_from(base_query.subquery())
+        total_result = await self.session.execute(count_query)
+        total = total_result.scalar() or 0
+
+        # Apply sorting
+        sort_column = getattr(Customer, params.sort_by, Customer.last_name)
+        if params.sort_order == "desc":
+            sort_column = sort_column.desc()
+        else:
+            sort_column = sort_column.asc()
+
+        # Apply pagination
+        offset = (params.page - 1) * params.page_size
+        paginated_query = (
+            base_query.options(selectinload(Customer.properties))
+            .order_by(sort_column)
+            .offset(offset)
+            .limit(params.page_size)
+        )
+
+        result = await self.session.execute(paginated_query)
+        customers = list(result.scalars().all())
+
+        self.log_completed(
+            "list_with_filters",
+            count=len(customers),
+            total=total,
+        )
+        return customers, total
+
+    async def list_keyset(self, params: CustomerListParams) -> KeysetPage[Customer]:
+        """List customers a page at a time after ``params.cursor``.
+
+        Same filters and sort as ``list_with_filters``, but seeks past the
+        previous page's last row instead of using ``OFFSET``.
+
+        Args:
+            params: Query parameters; ``cursor`` and ``count`` control paging
+
+        Returns:
+            KeysetPage of customers
+
+        Raises:
+            ValidationError: If the cursor is invalid for this sort
+        """
+        self.log_started(
+            "list_keyset",
+            page_size=params.page_size,
+            has_cursor=bool(params.cursor),
+        )
+
+        page = await paginate_keyset(
+            self.session,
+            self._filtered_query(params).options(selectinload(Customer.properties)),
+            sort_column=getattr(Customer, params.sort_by, Customer.last_name),
+            id_column=Customer.id,
+            descending=params.sort_order == "desc",
+            cursor=params.cursor,
+            limit=params.page_size,
+            count=params.count,
+        )
+
+        self.log_completed("list_keyset", count=len(page.items), total=page.total)
+        return page
+
+    async def iter_for_export(
+        self,
+        params: CustomerListParams,
+        *,
+        limit: int | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Customer]:
+        """Stream every customer matching the list filters in one query.
+
+        Uses a server-side cursor fetched in partitions of *batch_size*, so
+        memory stays flat however many customers match. Pagination fields
+        on *params* are ignored.
+
+        Args:
+            params: List filters and sort
+            limit: Optional cap on the number of customers
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Customer instances in sort order
+
+        Validates: Requirement 12.1-12.2
+        """
+        self.log_started("iter_for_export", limit=limit)
+
+        sort_column = getattr(Customer, params.sort_by, Customer.last_name)
+        if params.sort_order == "desc":
+            order = (sort_column.desc(), Customer.id.desc())
+        else:
+            order = (sort_column.asc(), Customer.id.asc())
+        stmt = self._filtered_query(params).order_by(*order)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self.session.stream(
+            stmt.execution_options(yield_per=batch_size),
+        )
+        count = 0
+        async for partition in result.partitions():
+            for row in partition:
+                count += 1
+                yield row[0]
+        self.log_completed("iter_for_export", count=count)
+
+    def _filtered_query(self, params: CustomerListParams) -> Select[tuple[Customer]]:
+        """Build the unordered customer query for the list filters."""
         base_query = select(Customer).where(Customer.is_deleted == False)  # noqa: E712
 
         # Apply filters
@@ -353,14 +471,16 @@ class CustomerRepository(LoggerMixin):
         if params.sms_opt_in is not None:
             base_query = base_query.where(Customer.sms_opt_in == params.sms_opt_in)
 
-        # Search by name or email (case-insensitive)
+        # Search name, email, phone digits or property address (trigram index)
         if params.search:
-            search_term = f"%{params.search}%"
             base_query = base_query.where(
                 or_(
-                    func.lower(Customer.first_name).like(func.lower(search_term)),
-                    func.lower(Customer.last_name).like(func.lower(search_term)),
-                    func.lower(Customer.email).like(func.lower(search_term)),
+                    search_condition(Customer.search_text, params.search),
+                    Customer.id.in_(
+                        select(Property.customer_id).where(
+                            search_condition(Property.search_text, params.search),
+                        ),
+                    ),
                 ),
             )
 
@@ -410,36 +530,7 @@ class CustomerRepository(LoggerMixin):
             else:
                 base_query = base_query.where(Customer.id.notin_(sub))
 
-        # Get total count
-        count_query = select(func.count()).select_from(base_query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply sorting
-        sort_column = getattr(Customer, params.sort_by, Customer.last_name)
-        if params.sort_order == "desc":
-            sort_column = sort_column.desc()
-        else:
-            sort_column = sort_column.asc()
-
-        # Apply pagination
-        offset = (params.page - 1) * params.page_size
-        paginated_query = (
-            base_query.options(selectinload(Customer.properties))
-            .order_by(sort_column)
-            .offset(offset)
-            .limit(params.page_size)
-        )
-
-        result = await self.session.execute(paginated_query)
-        customers = list(result.scalars().all())
-
-        self.log_completed(
-            "list_with_filters",
-            count=len(customers),
-            total=total,
-        )
-        return customers, total
+        return base_query
 
     async def update_flags(
         self,
@@ -495,8 +586,10 @@ class CustomerRepository(LoggerMixin):
     async def get_service_summary(self, customer_id: UUID) -> ServiceHistorySummary:
         """Get service history summary for a customer.
 
-        Note: This is a placeholder implementation. Full implementation
-        requires the service_history table which will be added in a future task.
+        Reads the ``customer_summaries`` projection by primary key. The row
+        is maintained by database triggers on jobs, invoices, agreements
+        and messages; a customer with no activity yet has no row and gets
+        an empty summary.
 
         Args:
             customer_id: UUID of the customer
@@ -508,15 +601,33 @@ class CustomerRepository(LoggerMixin):
         """
         self.log_started("get_service_summary", customer_id=str(customer_id))
 
-        # Placeholder implementation - returns empty summary
-        # Full implementation requires service_history table
-        summary = ServiceHistorySummary(
-            total_jobs=0,
-            last_service_date=None,
-            total_revenue=0.0,
+        stmt = select(CustomerSummary).where(
+            CustomerSummary.customer_id == customer_id,
         )
+        result = await self.session.execute(stmt)
+        row: CustomerSummary | None = result.scalar_one_or_none()
 
-        self.log_completed("get_service_summary", customer_id=str(customer_id))
+        if row is None:
+            summary = ServiceHistorySummary(
+                total_jobs=0,
+                last_service_date=None,
+                total_revenue=0.0,
+            )
+        else:
+            summary = ServiceHistorySummary(
+                total_jobs=row.total_jobs,
+                last_service_date=row.last_service_date,
+                total_revenue=float(row.lifetime_revenue),
+                outstanding_balance=float(row.outstanding_balance),
+                active_agreement_tier=row.active_agreement_tier,
+                last_contact_at=row.last_contact_at,
+            )
+
+        self.log_completed(
+            "get_service_summary",
+            customer_id=str(customer_id),
+            found=row is not None,
+        )
         return summary
 
     async def bulk_update_preferences(
@@ -1,6 +1,8 @@
 """Expense repository for database operations.
 
-CRUD + by-category aggregation + by-job filtering.
+CRUD + by-category aggregation + by-job filtering + Plaid transaction
+upserts and sync cursors + queued receipt extraction batches and their
+result cache.
 
 Validates: CRM Gap Closure Req 53.2, 53.3
 """
@@ -11,12 +13,33 @@ from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    String,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import (
+    UUID as PGUUID,
+    insert as pg_insert,
+)
 
 from grins_platform.log_config import LoggerMixin
 from grins_platform.models.expense import Expense
+from grins_platform.models.plaid_sync_cursor import PlaidSyncCursor
+from grins_platform.models.receipt_extraction import (
+    ReceiptExtractionBatch,
+    ReceiptExtractionCache,
+    ReceiptExtractionItem,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from uuid import UUID
 
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -284,3 +307,282 @@ class ExpenseRepository(LoggerMixin):
 
         self.log_completed("get_total_spend", total=str(total))
         return total
+
+    async def upsert_plaid_transactions(
+        self,
+        rows: Sequence[dict[str, Any]],
+        chunk_size: int = 500,
+    ) -> int:
+        """Insert or update expenses keyed by Plaid transaction id.
+
+        A transaction seen again (modified upstream, or a replayed sync
+        page) updates its amount, date, description and vendor; a category
+        changed by hand is kept.
+
+        Args:
+            rows: Expense column values, each with ``plaid_transaction_id``
+            chunk_size: Rows per INSERT statement
+
+        Returns:
+            Number of rows newly inserted
+        """
+        self.log_started("upsert_plaid_transactions", count=len(rows))
+
+        inserted = 0
+        for start in range(0, len(rows), chunk_size):
+            stmt = pg_insert(Expense).values(list(rows[start : start + chunk_size]))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Expense.plaid_transaction_id],
+                set_={
+                    "amount": stmt.excluded.amount,
+                    "date": stmt.excluded.date,
+                    "description": stmt.excluded.description,
+                    "vendor": stmt.excluded.vendor,
+                    "updated_at": func.now(),
+                },
+            ).returning(literal_column("xmax = 0"))
+            result = await self.session.execute(stmt)
+            inserted += sum(1 for is_new in result.scalars() if is_new)
+
+        self.log_completed(
+            "upsert_plaid_transactions",
+            count=len(rows),
+            inserted=inserted,
+        )
+        return inserted
+
+    async def link_legacy_plaid_expenses(
+        self,
+        rows: Sequence[dict[str, Any]],
+    ) -> int:
+        """Attach Plaid transaction ids to expenses imported before the sync.
+
+        Expenses imported by the old ``/transactions/get`` path have no
+        transaction id, so upserting the item's full history on the first
+        sync would insert them again. Each incoming row is matched to at
+        most one such expense with the same date, amount and vendor, which
+        then takes the row's transaction id; the upsert that follows
+        updates it instead of inserting a duplicate.
+
+        Args:
+            rows: Expense column values, each with ``plaid_transaction_id``
+
+        Returns:
+            Number of legacy expenses linked
+        """
+        if not rows:
+            return 0
+        self.log_started("link_legacy_plaid_expenses", count=len(rows))
+
+        cent = Decimal("0.01")
+        candidates = await self.session.execute(
+            select(Expense.id, Expense.expense_date, Expense.amount, Expense.vendor)
+            .where(
+                Expense.plaid_transaction_id.is_(None),
+                Expense.notes.like("Auto-imported from Plaid%"),
+                Expense.expense_date.between(
+                    min(row["date"] for row in rows),
+                    max(row["date"] for row in rows),
+                ),
+            )
+            .order_by(Expense.created_at),
+        )
+        legacy: dict[tuple[Any, ...], list[UUID]] = {}
+        for expense_id, expense_date, amount, vendor in candidates.all():
+            key = (expense_date, amount.quantize(cent), vendor)
+            legacy.setdefault(key, []).append(expense_id)
+
+        links = [
+            (expense_ids.pop(0), row["plaid_transaction_id"])
+            for row in rows
+            if (
+                expense_ids := legacy.get(
+                    (row["date"], row["amount"].quantize(cent), row["vendor"]),
+                )
+            )
+        ]
+        if links:
+            linked = values(
+                column("id", PGUUID(as_uuid=True)),
+                column("plaid_transaction_id", String),
+                name="linked",
+            ).data(links)
+            await self.session.execute(
+                update(Expense)
+                .where(Expense.id == linked.c.id)
+                .values(plaid_transaction_id=linked.c.plaid_transaction_id),
+            )
+
+        self.log_completed("link_legacy_plaid_expenses", linked=len(links))
+        return len(links)
+
+    async def delete_plaid_transactions(self, transaction_ids: Sequence[str]) -> int:
+        """Delete expenses imported from the given Plaid transactions.
+
+        Args:
+            transaction_ids: Plaid transaction ids
+
+        Returns:
+            Number of expenses deleted
+        """
+        if not transaction_ids:
+            return 0
+        self.log_started("delete_plaid_transactions", count=len(transaction_ids))
+
+        result = await self.session.execute(
+            delete(Expense).where(
+                Expense.plaid_transaction_id.in_(list(transaction_ids)),
+            ),
+        )
+        deleted: int = getattr(result, "rowcount", 0) or 0
+
+        self.log_completed("delete_plaid_transactions", deleted=deleted)
+        return deleted
+
+    async def get_plaid_cursor(self, item_key: str) -> str | None:
+        """Get the stored transactions sync cursor of a Plaid item.
+
+        Args:
+            item_key: Item key (hash of the access token)
+
+        Returns:
+            The cursor, or None before the first sync
+        """
+        result = await self.session.execute(
+            select(PlaidSyncCursor.cursor).where(
+                PlaidSyncCursor.item_key == item_key,
+            ),
+        )
+        cursor: str | None = result.scalar_one_or_none()
+        return cursor
+
+    async def save_plaid_cursor(self, item_key: str, cursor: str) -> None:
+        """Store the transactions sync cursor of a Plaid item.
+
+        Args:
+            item_key: Item key (hash of the access token)
+            cursor: ``next_cursor`` of the applied sync
+        """
+        stmt = pg_insert(PlaidSyncCursor).values(item_key=item_key, cursor=cursor)
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[PlaidSyncCursor.item_key],
+                set_={"cursor": stmt.excluded.cursor, "synced_at": func.now()},
+            ),
+        )
+
+    async def get_receipt_extractions(
+        self,
+        content_hashes: Sequence[str],
+    ) -> dict[str, ReceiptExtractionCache]:
+        """Get cached extraction results for receipt content hashes.
+
+        Args:
+            content_hashes: SHA-256 hex digests of receipt bytes
+
+        Returns:
+            Cached results keyed by content hash (misses are absent)
+        """
+        if not content_hashes:
+            return {}
+        result = await self.session.execute(
+            select(ReceiptExtractionCache).where(
+                ReceiptExtractionCache.content_hash.in_(set(content_hashes)),
+            ),
+        )
+        return {row.content_hash: row for row in result.scalars()}
+
+    async def save_receipt_extractions(
+        self,
+        rows: Sequence[dict[str, Any]],
+    ) -> None:
+        """Cache extraction results by content hash.
+
+        A hash cached concurrently by another worker keeps its first result.
+
+        Args:
+            rows: Cache column values, each with ``content_hash``
+        """
+        if not rows:
+            return
+        await self.session.execute(
+            pg_insert(ReceiptExtractionCache)
+            .values(list(rows))
+            .on_conflict_do_nothing(
+                index_elements=[ReceiptExtractionCache.content_hash],
+            ),
+        )
+
+    async def create_receipt_batch(
+        self,
+        items: Sequence[dict[str, Any]],
+        created_by: UUID | None = None,
+    ) -> ReceiptExtractionBatch:
+        """Record a receipt extraction batch with its items.
+
+        Items answered from the cache arrive with ``status='completed'``
+        and ``cached=True`` and count toward the batch's progress at once;
+        the rest are left pending for the extraction worker.
+
+        Args:
+            items: Item column values (file_key, file_name, content_type,
+                content_hash, and the cached result if any)
+            created_by: Staff member who uploaded the receipts
+
+        Returns:
+            The created batch (completed at once when every item was cached)
+        """
+        self.log_started("create_receipt_batch", items=len(items))
+
+        cached = sum(1 for item in items if item.get("cached"))
+        batch = ReceiptExtractionBatch(
+            total=len(items),
+            completed=cached,
+            failed=0,
+            cached=cached,
+            created_by=created_by,
+            status="completed" if cached == len(items) else "queued",
+            completed_at=func.now() if cached == len(items) else None,
+        )
+        self.session.add(batch)
+        await self.session.flush()
+        if items:
+            await self.session.execute(
+                insert(ReceiptExtractionItem).values(
+                    [{**item, "batch_id": batch.id} for item in items],
+                ),
+            )
+        await self.session.refresh(batch)
+
+        self.log_completed(
+            "create_receipt_batch",
+            batch_id=str(batch.id),
+            cached=cached,
+        )
+        return batch
+
+    async def get_receipt_batch(
+        self,
+        batch_id: UUID,
+    ) -> tuple[ReceiptExtractionBatch, list[ReceiptExtractionItem]] | None:
+        """Get a receipt extraction batch and its items.
+
+        Args:
+            batch_id: Batch UUID
+
+        Returns:
+            The batch with its items by upload time and file name, or None
+            if not found
+        """
+        batch = await self.session.get(ReceiptExtractionBatch, batch_id)
+        if batch is None:
+            return None
+        result = await self.session.execute(
+            select(ReceiptExtractionItem)
+            .where(ReceiptExtractionItem.batch_id == batch_id)
+            .order_by(
+                ReceiptExtractionItem.created_at,
+                ReceiptExtractionItem.file_name,
+            ),
+        )
+        return batch, list(result.scalars())
@@ -8,7 +8,7 @@ from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, or_, select, text
+from sqlalchemy import func, insert, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute, joinedload, selectinload
 
@@ -16,6 +16,11 @@ from grins_platform.log_config import LoggerMixin
 from grins_platform.models.customer import Customer
 from grins_platform.models.enums import InvoiceStatus
 from grins_platform.models.invoice import Invoice
+from grins_platform.models.invoice_notification_run import (
+    InvoiceNotificationItem,
+    InvoiceNotificationRun,
+)
+from grins_platform.repositories.pagination import KeysetPage, paginate_keyset
 from grins_platform.schemas.invoice import InvoiceListParams
 
 
@@ -301,6 +306,43 @@ class InvoiceRepository(LoggerMixin):
         self.log_completed("list_with_filters", count=len(invoices), total=total)
         return invoices, total
 
+    async def list_keyset(self, params: InvoiceListParams) -> KeysetPage[Invoice]:
+        """List invoices a page at a time after ``params.cursor``.
+
+        Args:
+            params: Query parameters; ``cursor`` and ``count`` control paging
+
+        Returns:
+            KeysetPage of invoices
+
+        Raises:
+            ValidationError: If the cursor is invalid for this sort
+        """
+        self.log_started(
+            "list_keyset",
+            page_size=params.page_size,
+            has_cursor=bool(params.cursor),
+        )
+
+        stmt = (
+            select(Invoice)
+            .where(*self._build_filters(params))
+            .options(joinedload(Invoice.customer))
+        )
+        page = await paginate_keyset(
+            self.session,
+            stmt,
+            sort_column=getattr(Invoice, params.sort_by, Invoice.created_at),
+            id_column=Invoice.id,
+            descending=params.sort_order == "desc",
+            cursor=params.cursor,
+            limit=params.page_size,
+            count=params.count,
+        )
+
+        self.log_completed("list_keyset", count=len(page.items), total=page.total)
+        return page
+
     async def get_next_sequence(self) -> int:
         """Get the next invoice number sequence value.
 
@@ -317,6 +359,114 @@ class InvoiceRepository(LoggerMixin):
         self.log_completed("get_next_sequence", value=seq_value)
         return int(seq_value)
 
+    async def get_next_sequences(self, count: int) -> list[int]:
+        """Allocate a block of invoice number sequence values in one query.
+
+        Args:
+            count: Number of values to allocate
+
+        Returns:
+            Ascending sequence values
+        """
+        self.log_started("get_next_sequences", count=count)
+
+        result = await self.session.execute(
+            text("SELECT nextval('invoice_number_seq') FROM generate_series(1, :n)"),
+            {"n": count},
+        )
+        values = sorted(int(v) for v in result.scalars().all())
+
+        self.log_completed("get_next_sequences", count=len(values))
+        return values
+
+    async def bulk_create(
+        self,
+        rows: list[dict[str, Any]],
+        chunk_size: int = 500,
+    ) -> list[UUID]:
+        """Insert invoice rows with multi-row INSERTs.
+
+        Args:
+            rows: Column values per invoice (each with its invoice_number)
+            chunk_size: Rows per INSERT statement
+
+        Returns:
+            Ids of the created invoices, in input order
+        """
+        self.log_started("bulk_create", count=len(rows))
+
+        ids_by_number: dict[str, UUID] = {}
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            result = await self.session.execute(
+                insert(Invoice)
+                .values(chunk)
+                .returning(Invoice.invoice_number, Invoice.id),
+            )
+            ids_by_number.update(result.tuples().all())
+        ids = [ids_by_number[row["invoice_number"]] for row in rows]
+
+        self.log_completed("bulk_create", count=len(ids))
+        return ids
+
+    async def create_notification_run(
+        self,
+        notification_type: str,
+        message_template: str,
+        targeted: int,
+        skipped: int,
+        invoice_ids: list[UUID],
+    ) -> InvoiceNotificationRun:
+        """Record a mass-notification run with one pending item per invoice.
+
+        Args:
+            notification_type: past_due, due_soon or lien_eligible
+            message_template: Template rendered per invoice
+            targeted: Invoices matched by the criteria
+            skipped: Matched invoices already known to be unreachable
+            invoice_ids: Invoices to notify
+
+        Returns:
+            The created run (completed at once when nothing is left to send)
+        """
+        self.log_started(
+            "create_notification_run",
+            notification_type=notification_type,
+            items=len(invoice_ids),
+        )
+
+        run = InvoiceNotificationRun(
+            notification_type=notification_type,
+            message_template=message_template,
+            targeted=targeted,
+            sent=0,
+            failed=0,
+            skipped=skipped,
+            status="queued" if invoice_ids else "completed",
+        )
+        self.session.add(run)
+        await self.session.flush()
+        if invoice_ids:
+            await self.session.execute(
+                insert(InvoiceNotificationItem).values(
+                    [
+                        {"run_id": run.id, "invoice_id": invoice_id}
+                        for invoice_id in invoice_ids
+                    ],
+                ),
+            )
+        await self.session.refresh(run)
+
+        self.log_completed("create_notification_run", run_id=str(run.id))
+        return run
+
+    async def get_notification_run(
+        self,
+        run_id: UUID,
+    ) -> InvoiceNotificationRun | None:
+        """Get a mass-notification run by ID."""
+        return await self.session.get(InvoiceNotificationRun, run_id)
+
     async def find_overdue(self) -> list[Invoice]:
         """Find all overdue invoices.
 
@@ -16,19 +16,27 @@ from sqlalchemy import func, select, update
 from sqlalchemy.orm import joinedload, selectinload
 
 from grins_platform.log_config import LoggerMixin
-from grins_platform.models.enums import (  # noqa: TC001
+from grins_platform.models.enums import (
+    InvoiceStatus,
     JobCategory,
     JobStatus,
     PropertyType,
 )
+from grins_platform.models.invoice import Invoice
 from grins_platform.models.job import Job
 from grins_platform.models.job_status_history import JobStatusHistory
 from grins_platform.models.property import Property
 from grins_platform.models.service_agreement import ServiceAgreement
+from grins_platform.repositories.pagination import (
+    CountMode,
+    KeysetPage,
+    paginate_keyset,
+)
 
 if TYPE_CHECKING:
     from uuid import UUID
 
+    from sqlalchemy import Select
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -288,6 +296,69 @@ class JobRepository(LoggerMixin):
         self.log_completed("find_by_status", count=len(jobs))
         return jobs
 
+    async def find_uninvoiced_completed(
+        self,
+        *,
+        completed_from: date | None = None,
+        completed_to: date | None = None,
+        customer_id: UUID | None = None,
+        job_type: str | None = None,
+        limit: int = 500,
+    ) -> list[Job]:
+        """Find completed jobs that still need an invoice, locking them.
+
+        Excludes deleted jobs, jobs paid on site and jobs with an invoice
+        that is not cancelled. Rows are locked ``FOR UPDATE SKIP LOCKED`` so
+        concurrent batch runs never invoice the same job twice.
+
+        Args:
+            completed_from: Earliest completion date (inclusive)
+            completed_to: Latest completion date (inclusive)
+            customer_id: Only this customer's jobs
+            job_type: Only jobs of this type
+            limit: Maximum jobs to return
+
+        Returns:
+            Matching jobs, oldest completion first
+
+        Validates: Requirement 10.1
+        """
+        self.log_started("find_uninvoiced_completed", limit=limit)
+
+        invoiced = (
+            select(Invoice.id)
+            .where(
+                Invoice.job_id == Job.id,
+                Invoice.status != InvoiceStatus.CANCELLED.value,
+            )
+            .exists()
+        )
+        stmt = select(Job).where(
+            Job.status == JobStatus.COMPLETED.value,
+            Job.is_deleted == False,  # noqa: E712
+            Job.payment_collected_on_site == False,  # noqa: E712
+            ~invoiced,
+        )
+        if completed_from is not None:
+            stmt = stmt.where(func.date(Job.completed_at) >= completed_from)
+        if completed_to is not None:
+            stmt = stmt.where(func.date(Job.completed_at) <= completed_to)
+        if customer_id is not None:
+            stmt = stmt.where(Job.customer_id == customer_id)
+        if job_type is not None:
+            stmt = stmt.where(Job.job_type == job_type)
+        stmt = (
+            stmt.order_by(Job.completed_at.asc().nulls_last(), Job.id)
+            .limit(limit)
+            .with_for_update(of=Job, skip_locked=True)
+        )
+
+        result = await self.session.execute(stmt)
+        jobs = list(result.scalars().all())
+
+        self.log_completed("find_uninvoiced_completed", count=len(jobs))
+        return jobs
+
     async def find_by_category(
         self,
         category: JobCategory,
@@ -406,6 +477,109 @@ class JobRepository(LoggerMixin):
             search=search,
         )
 
+        base_query = self._filtered_query(
+            status=status,
+            category=category,
+            customer_id=customer_id,
+            property_id=property_id,
+            service_offering_id=service_offering_id,
+            priority_level=priority_level,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+            has_service_agreement=has_service_agreement,
+            property_type=property_type,
+            is_hoa=is_hoa,
+            is_subscription_property=is_subscription_property,
+            target_date_from=target_date_from,
+            target_date_to=target_date_to,
+            include_deleted=include_deleted,
+        )
+
+        # Get total count
+        count_query = select(func.count()).select_from(base_query.subquery())
+        total_result = await self.session.execute(count_query)
+        total = total_result.scalar() or 0
+
+        # Apply sorting
+        sort_column = getattr(Job, sort_by, Job.created_at)
+        sort_column = sort_column.desc() if sort_order == "desc" else sort_column.asc()
+
+        # Apply pagination
+        offset = (page - 1) * page_size
+        paginated_query = (
+            base_query.order_by(sort_column).offset(offset).limit(page_size)
+        )
+
+        result = await self.session.execute(paginated_query)
+        jobs = list(result.unique().scalars().all())
+
+        self.log_completed("list_with_filters", count=len(jobs), total=total)
+        return jobs, total
+
+    async def list_keyset(
+        self,
+        *,
+        cursor: str | None,
+        page_size: int = 20,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        count: CountMode = "cached",
+        **filters: Any,
+    ) -> KeysetPage[Job]:
+        """List jobs a page at a time after *cursor*.
+
+        Args:
+            cursor: ``next_cursor`` of the previous page, or None/"" to start
+            page_size: Number of items per page
+            sort_by: Field to sort by
+            sort_order: Sort order (asc/desc)
+            count: Total count mode
+            **filters: Same filters as ``list_with_filters``
+
+        Returns:
+            KeysetPage of jobs
+
+        Raises:
+            ValidationError: If the cursor is invalid for this sort
+        """
+        self.log_started("list_keyset", page_size=page_size, has_cursor=bool(cursor))
+
+        page = await paginate_keyset(
+            self.session,
+            self._filtered_query(**filters),
+            sort_column=getattr(Job, sort_by, Job.created_at),
+            id_column=Job.id,
+            descending=sort_order == "desc",
+            cursor=cursor,
+            limit=page_size,
+            count=count,
+        )
+
+        self.log_completed("list_keyset", count=len(page.items), total=page.total)
+        return page
+
+    def _filtered_query(
+        self,
+        *,
+        status: JobStatus | None = None,
+        category: JobCategory | None = None,
+        customer_id: UUID | None = None,
+        property_id: UUID | None = None,
+        service_offering_id: UUID | None = None,
+        priority_level: int | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        search: str | None = None,
+        has_service_agreement: bool | None = None,
+        property_type: PropertyType | None = None,
+        is_hoa: bool | None = None,
+        is_subscription_property: bool | None = None,
+        target_date_from: date | None = None,
+        target_date_to: date | None = None,
+        include_deleted: bool = False,
+    ) -> Select[tuple[Job]]:
+        """Build the unordered job list query for the given filters."""
         # Base query — eager-load customer + property + agreement for list response
         base_query = select(Job).options(
             joinedload(Job.customer),
@@ -500,26 +674,7 @@ class JobRepository(LoggerMixin):
         if target_date_to is not None:
             base_query = base_query.where(Job.target_start_date <= target_date_to)
 
-        # Get total count
-        count_query = select(func.count()).select_from(base_query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply sorting
-        sort_column = getattr(Job, sort_by, Job.created_at)
-        sort_column = sort_column.desc() if sort_order == "desc" else sort_column.asc()
-
-        # Apply pagination
-        offset = (page - 1) * page_size
-        paginated_query = (
-            base_query.order_by(sort_column).offset(offset).limit(page_size)
-        )
-
-        result = await self.session.execute(paginated_query)
-        jobs = list(result.unique().scalars().all())
-
-        self.log_completed("list_with_filters", count=len(jobs), total=total)
-        return jobs, total
+        return base_query
 
     async def add_status_history(
         self,
@@ -23,10 +23,13 @@ from sqlalchemy import (
 from grins_platform.log_config import LoggerMixin
 from grins_platform.models.enums import LeadStatus
 from grins_platform.models.lead import Lead
+from grins_platform.repositories.pagination import KeysetPage, paginate_keyset
+from grins_platform.repositories.search_repository import search_condition
 
 if TYPE_CHECKING:
     from uuid import UUID
 
+    from sqlalchemy import Select
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from grins_platform.schemas.lead import LeadListParams
@@ -207,6 +210,70 @@ class LeadRepository(LoggerMixin):
             page_size=params.page_size,
         )
 
+        base_query = self._filtered_query(params)
+
+        # Get total count
+        count_query = select(func.count()).select_from(base_query.subquery())
+        total_result = await self.session.execute(count_query)
+        total = total_result.scalar() or 0
+
+        # Apply sorting
+        sort_column = getattr(Lead, params.sort_by, Lead.created_at)
+        if params.sort_order == "desc":
+            sort_column = sort_column.desc()
+        else:
+            sort_column = sort_column.asc()
+
+        # Apply pagination
+        offset = (params.page - 1) * params.page_size
+        paginated_query = (
+            base_query.order_by(sort_column).offset(offset).limit(params.page_size)
+        )
+
+        result = await self.session.execute(paginated_query)
+        leads = list(result.scalars().all())
+
+        self.log_completed(
+            "list_with_filters",
+            count=len(leads),
+            total=total,
+        )
+        return leads, total
+
+    async def list_keyset(self, params: LeadListParams) -> KeysetPage[Lead]:
+        """List leads a page at a time after ``params.cursor``.
+
+        Args:
+            params: Query parameters; ``cursor`` and ``count`` control paging
+
+        Returns:
+            KeysetPage of leads
+
+        Raises:
+            ValidationError: If the cursor is invalid for this sort
+        """
+        self.log_started(
+            "list_keyset",
+            page_size=params.page_size,
+            has_cursor=bool(params.cursor),
+        )
+
+        page = await paginate_keyset(
+            self.session,
+            self._filtered_query(params),
+            sort_column=getattr(Lead, params.sort_by, Lead.created_at),
+            id_column=Lead.id,
+            descending=params.sort_order == "desc",
+            cursor=params.cursor,
+            limit=params.page_size,
+            count=params.count,
+        )
+
+        self.log_completed("list_keyset", count=len(page.items), total=page.total)
+        return page
+
+    def _filtered_query(self, params: LeadListParams) -> Select[tuple[Lead]]:
+        """Build the unordered lead query for the list filters."""
         # Base query — exclude moved-out leads (CRM2 Req 9.3)
         base_query = select(Lead).where(Lead.moved_to.is_(None))
 
@@ -234,43 +301,13 @@ class LeadRepository(LoggerMixin):
             else:
                 base_query = base_query.where(Lead.intake_tag == params.intake_tag)
 
-        # Search on name or phone (case-insensitive)
+        # Search name, email, phone digits or address (trigram index)
         if params.search:
-            search_term = f"%{params.search}%"
             base_query = base_query.where(
-                or_(
-                    func.lower(Lead.name).like(func.lower(search_term)),
-                    Lead.phone.like(search_term),
-                ),
+                search_condition(Lead.search_text, params.search),
             )
 
-        # Get total count
-        count_query = select(func.count()).select_from(base_query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply sorting
-        sort_column = getattr(Lead, params.sort_by, Lead.created_at)
-        if params.sort_order == "desc":
-            sort_column = sort_column.desc()
-        else:
-            sort_column = sort_column.asc()
-
-        # Apply pagination
-        offset = (params.page - 1) * params.page_size
-        paginated_query = (
-            base_query.order_by(sort_column).offset(offset).limit(params.page_size)
-        )
-
-        result = await self.session.execute(paginated_query)
-        leads = list(result.scalars().all())
-
-        self.log_completed(
-            "list_with_filters",
-            count=len(leads),
-            total=total,
-        )
-        return leads, total
+        return base_query
 
     async def update(self, lead_id: UUID, update_data: dict[str, Any]) -> Lead | None:
         """Update lead fields and return updated lead.
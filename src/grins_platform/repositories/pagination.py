@@ -0,0 +1,261 @@
+"""
+Keyset (cursor) pagination shared by list repositories.
+
+``paginate_keyset`` pages a filtered ``select`` by ``(sort column, id)``
+instead of ``OFFSET``, so every page costs the same however deep the
+caller scrolls. Cursors are opaque, URL-safe tokens carrying the last row's
+sort value and id plus the sort they were issued for; a cursor replayed
+against a different sort is rejected.
+
+Total counts are optional: ``"exact"`` counts on every request (the offset
+behavior), ``"cached"`` counts the first page and memoizes the result per
+filtered query for ``COUNT_CACHE_TTL_SECONDS``, and ``"none"`` skips it.
+Follow-up pages (with a cursor) never count unless ``"exact"`` is asked for.
+
+Validates: Requirement 4.1, 5.1, 6.1, 13.1
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select, tuple_
+
+from grins_platform.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement, Select
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
+
+T = TypeVar("T")
+
+CountMode = Literal["exact", "cached", "none"]
+
+COUNT_CACHE_TTL_SECONDS = 60.0
+_COUNT_CACHE_MAX_ENTRIES = 512
+_count_cache: dict[str, tuple[float, int]] = {}
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """One page of keyset-paginated results."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+    total: int | None = None
+
+
+# -- Cursor encoding ---------------------------------------------------------
+
+
+def _dump_value(value: Any) -> Any:  # noqa: ANN401
+    # datetime before date: datetime is a date subclass
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, UUID):
+        return {"u": str(value)}
+    if hasattr(value, "value"):  # enum members
+        return value.value
+    return value
+
+
+def _load_value(raw: Any) -> Any:  # noqa: ANN401
+    if isinstance(raw, dict):
+        ((tag, text),) = raw.items()
+        loaders = {
+            "dt": datetime.fromisoformat,
+            "d": date.fromisoformat,
+            "dec": Decimal,
+            "u": UUID,
+        }
+        return loaders[tag](text)
+    return raw
+
+
+def encode_cursor(sort_key: str, value: Any, row_id: UUID) -> str:  # noqa: ANN401
+    """Encode the position after a row as an opaque cursor."""
+    payload = {"s": sort_key, "v": _dump_value(value), "i": str(row_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> tuple[Any, UUID]:
+    """Decode a cursor issued for *sort_key* into ``(sort value, id)``.
+
+    Raises:
+        ValidationError: If the cursor is malformed or for another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        issued_for = payload["s"]
+        value, row_id = _load_value(payload["v"]), UUID(payload["i"])
+    except (
+        ValueError,
+        KeyError,
+        TypeError,
+        AttributeError,
+        binascii.Error,
+    ) as e:
+        raise ValidationError(
+            field="cursor",
+            message="Invalid pagination cursor",
+            details={"reason": str(e)},
+        ) from e
+    if issued_for != sort_key:
+        raise ValidationError(
+            field="cursor",
+            message="Cursor was issued for a different sort order",
+            details={"expected": sort_key, "received": issued_for},
+        )
+    return value, row_id
+
+
+# -- Counting ----------------------------------------------------------------
+
+
+def _count_cache_key(stmt: Select[Any]) -> str:
+    compiled = stmt.compile()
+    return f"{compiled}|{sorted(compiled.params.items(), key=lambda kv: kv[0])!r}"
+
+
+async def count_rows(
+    session: AsyncSession,
+    stmt: Select[Any],
+    mode: CountMode,
+) -> int | None:
+    """Count rows of a filtered (unordered, unpaged) query per *mode*."""
+    if mode == "none":
+        return None
+
+    key = _count_cache_key(stmt) if mode == "cached" else ""
+    if mode == "cached":
+        hit = _count_cache.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+
+    result = await session.execute(
+        select(func.count()).select_from(stmt.order_by(None).subquery()),
+    )
+    total = int(result.scalar() or 0)
+
+    if mode == "cached":
+        if len(_count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for k in [k for k, (exp, _) in _count_cache.items() if exp <= now]:
+                del _count_cache[k]
+            if len(_count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+                _count_cache.clear()
+        _count_cache[key] = (time.monotonic() + COUNT_CACHE_TTL_SECONDS, total)
+    return total
+
+
+# -- Keyset paging -----------------------------------------------------------
+
+
+def _after(
+    sort_column: InstrumentedAttribute[Any],
+    id_column: InstrumentedAttribute[UUID],
+    value: Any,  # noqa: ANN401
+    row_id: UUID,
+    *,
+    descending: bool,
+    nullable: bool,
+) -> ColumnElement[bool]:
+    """Rows strictly after ``(value, row_id)`` in the page order (NULLs last)."""
+    if value is None:
+        later_id = id_column < row_id if descending else id_column > row_id
+        return and_(sort_column.is_(None), later_id)
+    if not nullable:
+        key = tuple_(sort_column, id_column)
+        return key < (value, row_id) if descending else key > (value, row_id)
+    if descending:
+        beyond = or_(
+            sort_column < value,
+            and_(sort_column == value, id_column < row_id),
+        )
+    else:
+        beyond = or_(
+            sort_column > value,
+            and_(sort_column == value, id_column > row_id),
+        )
+    return or_(beyond, sort_column.is_(None))
+
+
+async def paginate_keyset(
+    session: AsyncSession,
+    stmt: Select[Any],
+    *,
+    sort_column: InstrumentedAttribute[Any],
+    id_column: InstrumentedAttribute[UUID],
+    descending: bool,
+    cursor: str | None,
+    limit: int,
+    count: CountMode = "cached",
+) -> KeysetPage[Any]:
+    """Fetch the page of ORM entities from *stmt* following *cursor*.
+
+    Args:
+        session: Database session
+        stmt: Filtered ``select(Entity)`` without ordering or paging
+        sort_column: Mapped column to order by
+        id_column: The entity's primary key (tie-breaker)
+        descending: Order direction
+        cursor: ``next_cursor`` from the previous page, or None/"" to start
+        limit: Page size
+        count: Total count mode (see module docstring)
+
+    Returns:
+        KeysetPage with items, the next cursor (None on the last page) and
+        the total when counted
+    """
+    sort_key = f"{sort_column.key}:{'desc' if descending else 'asc'}"
+    nullable = bool(getattr(sort_column.expression, "nullable", True))
+
+    total: int | None = None
+    if count == "exact" or (not cursor and count == "cached"):
+        total = await count_rows(session, stmt, count)
+
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort_key)
+        stmt = stmt.where(
+            _after(
+                sort_column,
+                id_column,
+                value,
+                row_id,
+                descending=descending,
+                nullable=nullable,
+            ),
+        )
+
+    if descending:
+        order = (sort_column.desc().nulls_last(), id_column.desc())
+    else:
+        order = (sort_column.asc().nulls_last(), id_column.asc())
+    result = await session.execute(stmt.order_by(*order).limit(limit + 1))
+    rows = list(result.unique().scalars().all())
+
+    next_cursor: str | None = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            sort_key,
+            getattr(last, sort_column.key),
+            getattr(last, id_column.key),
+        )
+    return KeysetPage(items=rows, next_cursor=next_cursor, total=total)
@@ -0,0 +1,221 @@
+"""
+Indexed, typo-tolerant text search for customers, leads and properties.
+
+``customers``, ``leads`` and ``properties`` each carry a generated
+``search_text`` column (lower-cased name, email, phone digits and address)
+backed by a ``pg_trgm`` GIN index. ``search_condition`` matches a term as a
+substring, as phone digits, or by trigram word similarity (typos), all of
+which that index serves; ``search_rank`` orders matches best-first. The
+customer and lead list filters and the global search box share them.
+
+Validates: Requirement 4.1-4.7, 5.1-5.5
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from sqlalchemy import ColumnElement, func, literal, or_, select, union_all
+
+from grins_platform.log_config import LoggerMixin
+from grins_platform.models.customer import Customer
+from grins_platform.models.lead import Lead
+from grins_platform.models.property import Property
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
+
+SearchResultType = Literal["customer", "lead"]
+
+# pg_trgm cannot extract trigrams from shorter terms, so the similarity
+# branch is skipped for them (substring matching still applies).
+MIN_TRIGRAM_TERM_LENGTH = 3
+MIN_PHONE_DIGITS = 3
+
+_NON_DIGIT = re.compile(r"\D")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_search_term(term: str) -> str:
+    """Lower-case and collapse whitespace to match ``search_text``."""
+    return _WHITESPACE.sub(" ", term).strip().lower()
+
+
+def _phone_digits(term: str) -> str:
+    """Return the term's digits, dropping a leading US country code."""
+    digits = _NON_DIGIT.sub("", term)
+    if len(digits) == 11 and digits.startswith("1"):
+        digits = digits[1:]
+    return digits
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_condition(
+    column: InstrumentedAttribute[str],
+    term: str,
+) -> ColumnElement[bool]:
+    """Build an index-backed match of *term* against a ``search_text`` column.
+
+    Args:
+        column: A generated ``search_text`` column
+        term: Raw user input
+
+    Returns:
+        Condition true for substring, phone-digit or fuzzy word matches
+    """
+    normalized = normalize_search_term(term)
+    conditions: list[ColumnElement[bool]] = [
+        column.like(f"%{_escape_like(normalized)}%", escape="\\"),
+    ]
+    digits = _phone_digits(term)
+    if len(digits) >= MIN_PHONE_DIGITS and digits != normalized:
+        conditions.append(column.like(f"%{digits}%"))
+    if len(normalized) >= MIN_TRIGRAM_TERM_LENGTH:
+        # word_similarity(term, column) >= pg_trgm.word_similarity_threshold
+        conditions.append(literal(normalized).op("<%")(column))
+    return or_(*conditions)
+
+
+def search_rank(
+    column: InstrumentedAttribute[str],
+    term: str,
+) -> ColumnElement[float]:
+    """Relevance of *column* to *term* in [0, 1], higher is better."""
+    return func.word_similarity(normalize_search_term(term), column)
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A ranked search match."""
+
+    type: SearchResultType
+    id: UUID
+    title: str
+    subtitle: str
+    rank: float
+
+
+class SearchRepository(LoggerMixin):
+    """Repository for ranked search across customers and leads.
+
+    Attributes:
+        session: AsyncSession for database operations
+    """
+
+    DOMAIN = "database"
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with database session.
+
+        Args:
+            session: AsyncSession for database operations
+        """
+        super().__init__()
+        self.session = session
+
+    async def search(
+        self,
+        term: str,
+        *,
+        limit: int = 10,
+        types: Collection[SearchResultType] = ("customer", "lead"),
+    ) -> list[SearchHit]:
+        """Return the best matches for *term*, highest rank first.
+
+        Args:
+            term: Raw user input
+            limit: Maximum number of hits across all types
+            types: Entity types to search
+
+        Returns:
+            Hits ordered by rank, then title
+        """
+        self.log_started("search", types=sorted(types), limit=limit)
+        if not normalize_search_term(term):
+            self.log_completed("search", count=0)
+            return []
+
+        hits: list[SearchHit] = []
+        if "customer" in types:
+            hits.extend(await self._search_customers(term, limit))
+        if "lead" in types:
+            hits.extend(await self._search_leads(term, limit))
+        hits.sort(key=lambda h: (-h.rank, h.title.lower()))
+
+        self.log_completed("search", count=min(len(hits), limit))
+        return hits[:limit]
+
+    async def _search_customers(self, term: str, limit: int) -> list[SearchHit]:
+        """Match customers on their own fields or any property address."""
+        own = select(
+            Customer.id.label("id"),
+            search_rank(Customer.search_text, term).label("rank"),
+        ).where(search_condition(Customer.search_text, term))
+        by_property = select(
+            Property.customer_id.label("id"),
+            search_rank(Property.search_text, term).label("rank"),
+        ).where(search_condition(Property.search_text, term))
+        matches = union_all(own, by_property).subquery()
+        best = (
+            select(matches.c.id, func.max(matches.c.rank).label("rank"))
+            .group_by(matches.c.id)
+            .subquery()
+        )
+        stmt = (
+            select(
+                Customer.id,
+                Customer.first_name,
+                Customer.last_name,
+                Customer.phone,
+                Customer.email,
+                best.c.rank,
+            )
+            .join(best, best.c.id == Customer.id)
+            .where(Customer.is_deleted == False)  # noqa: E712
+            .order_by(best.c.rank.desc(), Customer.last_name, Customer.first_name)
+            .limit(limit)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [
+            SearchHit(
+                type="customer",
+                id=row.id,
+                title=f"{row.first_name} {row.last_name}",
+                subtitle=row.phone if not row.email else f"{row.phone} · {row.email}",
+                rank=float(row.rank or 0.0),
+            )
+            for row in rows
+        ]
+
+    async def _search_leads(self, term: str, limit: int) -> list[SearchHit]:
+        """Match active (not moved-out) leads."""
+        rank = search_rank(Lead.search_text, term).label("rank")
+        stmt = (
+            select(Lead.id, Lead.name, Lead.phone, Lead.status, rank)
+            .where(
+                Lead.moved_to.is_(None),
+                search_condition(Lead.search_text, term),
+            )
+            .order_by(rank.desc(), Lead.created_at.desc())
+            .limit(limit)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [
+            SearchHit(
+                type="lead",
+                id=row.id,
+                title=row.name,
+                subtitle=f"{row.phone} · {row.status}",
+                rank=float(row.rank or 0.0),
+            )
+            for row in rows
+        ]
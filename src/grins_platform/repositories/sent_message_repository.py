@@ -4,13 +4,19 @@ Validates: AI Assistant Requirements 7.8, 7.9, 7.10
 """
 
 from datetime import datetime, timedelta
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import Select, and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from grins_platform.log_config import LoggerMixin
 from grins_platform.models.sent_message import SentMessage
+from grins_platform.repositories.pagination import (
+    CountMode,
+    KeysetPage,
+    paginate_keyset,
+)
 from grins_platform.schemas.ai import DeliveryStatus, MessageType
 
 
@@ -377,38 +383,15 @@ class SentMessageRepository(LoggerMixin):
             page_size=page_size,
         )
 
-        query = select(SentMessage)
-        count_query = select(sa_func.count()).select_from(SentMessage)
-
-        # Apply filters
-        if message_type:
-            query = query.where(SentMessage.message_type == message_type)
-            count_query = count_query.where(
-                SentMessage.message_type == message_type,
-            )
-        if delivery_status:
-            query = query.where(SentMessage.delivery_status == delivery_status)
-            count_query = count_query.where(
-                SentMessage.delivery_status == delivery_status,
-            )
-        if date_from:
-            query = query.where(SentMessage.created_at >= date_from)
-            count_query = count_query.where(SentMessage.created_at >= date_from)
-        if date_to:
-            query = query.where(SentMessage.created_at <= date_to)
-            count_query = count_query.where(SentMessage.created_at <= date_to)
-        if search:
-            query = query.where(
-                SentMessage.message_content.ilike(f"%{search}%"),
-            )
-            count_query = count_query.where(
-                SentMessage.message_content.ilike(f"%{search}%"),
-            )
-        if customer_id:
-            query = query.where(SentMessage.customer_id == customer_id)
-            count_query = count_query.where(
-                SentMessage.customer_id == customer_id,
-            )
+        query = self._filtered_query(
+            message_type=message_type,
+            delivery_status=delivery_status,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+            customer_id=customer_id,
+        )
+        count_query = select(sa_func.count()).select_from(query.subquery())
 
         # Get total count
         count_result = await self.session.execute(count_query)
@@ -428,3 +411,68 @@ class SentMessageRepository(LoggerMixin):
             total=total,
         )
         return messages, total
+
+    async def list_keyset(
+        self,
+        *,
+        cursor: str | None,
+        page_size: int = 20,
+        count: CountMode = "cached",
+        **filters: Any,
+    ) -> KeysetPage[SentMessage]:
+        """List sent messages newest first, a page at a time after *cursor*.
+
+        Args:
+            cursor: ``next_cursor`` of the previous page, or None/"" to start.
+            page_size: Items per page.
+            count: Total count mode.
+            **filters: Same filters as ``list_with_filters``.
+
+        Returns:
+            KeysetPage of messages.
+
+        Raises:
+            ValidationError: If the cursor is invalid.
+        """
+        self.log_started("list_keyset", page_size=page_size, has_cursor=bool(cursor))
+
+        page = await paginate_keyset(
+            self.session,
+            self._filtered_query(**filters),
+            sort_column=SentMessage.created_at,
+            id_column=SentMessage.id,
+            descending=True,
+            cursor=cursor,
+            limit=page_size,
+            count=count,
+        )
+
+        self.log_completed("list_keyset", count=len(page.items), total=page.total)
+        return page
+
+    def _filtered_query(
+        self,
+        message_type: str | None = None,
+        delivery_status: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        search: str | None = None,
+        customer_id: UUID | None = None,
+    ) -> Select[tuple[SentMessage]]:
+        """Build the unordered sent-message query for the list filters."""
+        query = select(SentMessage)
+        if message_type:
+            query = query.where(SentMessage.message_type == message_type)
+        if delivery_status:
+            query = query.where(SentMessage.delivery_status == delivery_status)
+        if date_from:
+            query = query.where(SentMessage.created_at >= date_from)
+        if date_to:
+            query = query.where(SentMessage.created_at <= date_to)
+        if search:
+            query = query.where(
+                SentMessage.message_content.ilike(f"%{search}%"),
+            )
+        if customer_id:
+            query = query.where(SentMessage.customer_id == customer_id)
+        return query
@@ -186,6 +186,34 @@ class MrrHistoryResponse(BaseModel):
     data_points: list[MrrDataPointResponse]
 
 
+class TierMonthlyMetricsResponse(BaseModel):
+    """One tier's agreement metrics for a closed month."""
+
+    tier_id: str
+    tier_name: str
+    active_count: int
+    mrr: Decimal
+    churn_rate: Decimal
+    renewal_rate: Decimal
+
+
+class MonthlyAgreementMetricsResponse(BaseModel):
+    """Agreement metrics for a closed month, in total and per tier."""
+
+    month: str
+    active_count: int
+    mrr: Decimal
+    churn_rate: Decimal
+    renewal_rate: Decimal
+    tiers: list[TierMonthlyMetricsResponse]
+
+
+class AgreementMetricsHistoryResponse(BaseModel):
+    """Monthly agreement metrics snapshots, oldest first."""
+
+    months: list[MonthlyAgreementMetricsResponse]
+
+
 class TierDistributionItemResponse(BaseModel):
     """Active agreement count for a single tier."""
 
@@ -153,10 +153,11 @@ class AppointmentPaginatedResponse(BaseModel):
     """Schema for paginated appointment response."""
 
     items: list[AppointmentResponse]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
 
 
 # =============================================================================
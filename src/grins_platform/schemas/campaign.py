@@ -120,14 +120,17 @@ class AdHocAudienceFilter(BaseModel):
 
     csv_upload_id: UUID | None = Field(
         default=None,
-        description="Staged CSV upload ID (audit reference)",
+        description=(
+            "Staged CSV upload ID. Recipients are read from the upload's "
+            "staged rows when no inline recipients are provided."
+        ),
     )
     recipients: list[AdHocRecipientPayload] | None = Field(
         default=None,
         description=(
             "Inline parsed CSV recipients. Preferred over csv_upload_id; "
             "embedded directly in target_audience so send-time doesn't "
-            "depend on Redis staging."
+            "depend on server-side staging. Only returned for small uploads."
         ),
     )
     staff_attestation_confirmed: bool = Field(
@@ -488,8 +491,10 @@ class CsvRejectedRow(BaseModel):
 class CsvUploadResult(BaseModel):
     """Response from CSV audience upload endpoint.
 
-    Returns the parsed recipients inline so the frontend can embed them
-    directly in the campaign's target_audience. No Redis staging required.
+    Every upload is staged server-side under ``upload_id``. Small uploads
+    also return the parsed recipients inline so the frontend can embed them
+    directly in the campaign's target_audience; larger uploads are
+    referenced by ``target_audience.ad_hoc.csv_upload_id`` only.
 
     Validates: Requirement 35
     """
@@ -501,11 +506,20 @@ class CsvUploadResult(BaseModel):
     will_become_ghost_leads: int = Field(default=0, ge=0)
     rejected: int = Field(default=0, ge=0)
     duplicates_collapsed: int = Field(default=0, ge=0)
-    rejected_rows: list[CsvRejectedRow] = Field(default_factory=list)
+    staged_recipients: int = Field(
+        default=0,
+        ge=0,
+        description="Distinct recipients staged under upload_id",
+    )
+    rejected_rows: list[CsvRejectedRow] = Field(
+        default_factory=list,
+        description="Rejected rows (first 500 only; see rejected for the count)",
+    )
     recipients: list[AdHocRecipientPayload] = Field(
         default_factory=list,
         description=(
-            "Parsed and normalized recipients. Embed these in "
+            "Parsed and normalized recipients, empty when the upload is too "
+            "large to return inline. Embed these in "
             "target_audience.ad_hoc.recipients when creating/updating the "
             "campaign draft."
         ),
@@ -535,3 +549,52 @@ class AudiencePreviewResponse(BaseModel):
         default_factory=list,
         description="First 20 matched recipients",
     )
+
+
+class CampaignEstimateRequest(BaseModel):
+    """Draft SMS campaign to estimate before sending."""
+
+    body: str = Field(..., max_length=10000, description="Message body")
+    target_audience: TargetAudience = Field(..., description="Target audience")
+    poll_options: list[PollOption] | None = Field(
+        default=None,
+        description="Poll options appended to the body, if any",
+    )
+
+
+class CampaignEstimateResponse(BaseModel):
+    """Segment, cost and send-duration estimate for a full audience."""
+
+    recipients: int = Field(..., ge=0, description="Resolved SMS recipients")
+    total_segments: int = Field(..., ge=0, description="Segments across all sends")
+    gsm7_messages: int = Field(default=0, ge=0, description="GSM-7 encoded messages")
+    ucs2_messages: int = Field(default=0, ge=0, description="UCS-2 encoded messages")
+    gsm7_segments: int = Field(default=0, ge=0, description="Segments sent as GSM-7")
+    ucs2_segments: int = Field(default=0, ge=0, description="Segments sent as UCS-2")
+    max_segments_per_message: int = Field(
+        default=0,
+        ge=0,
+        description="Largest per-recipient segment count",
+    )
+    cost_per_segment: float | None = Field(
+        default=None,
+        description="SMS_COST_PER_SEGMENT in dollars, when configured",
+    )
+    projected_cost: float | None = Field(
+        default=None,
+        description="total_segments x cost_per_segment, when configured",
+    )
+    sends_per_hour: float = Field(..., ge=0, description="Effective send rate")
+    send_window_hours: float = Field(..., ge=0, description="Daily send window")
+    estimated_send_hours: float | None = Field(
+        default=None,
+        description="Sending time within the window, excluding off-hours",
+    )
+    estimated_send_days: int | None = Field(
+        default=None,
+        description="Send windows (days) needed to reach every recipient",
+    )
+    rate_limit: RateLimitInfo = Field(
+        default_factory=RateLimitInfo,
+        description="Cached provider rate-limit state used for the projection",
+    )
@@ -10,7 +10,7 @@ Validates: Requirement 1.2, 1.3, 1.4, 3.1-3.4, 4.1-4.7, 7.2, 12.3-12.4
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
@@ -229,6 +229,19 @@ class ServiceHistorySummary(BaseModel):
         ge=0,
         description="Total revenue from customer across all services",
     )
+    outstanding_balance: float = Field(
+        default=0.0,
+        ge=0,
+        description="Unpaid amount on sent, partial and overdue invoices",
+    )
+    active_agreement_tier: str | None = Field(
+        default=None,
+        description="Tier name of the customer's active service agreement",
+    )
+    last_contact_at: datetime | None = Field(
+        default=None,
+        description="Most recent message sent to or received from the customer",
+    )
 
 
 class CustomerResponse(BaseModel):
@@ -382,6 +395,17 @@ class CustomerListParams(BaseModel):
         pattern="^(asc|desc)$",
         description="Sort order (asc or desc)",
     )
+    cursor: str | None = Field(
+        default=None,
+        description=(
+            "Keyset cursor from the previous page's next_cursor; pass an empty "
+            "value to start cursor paging (page is then ignored)"
+        ),
+    )
+    count: Literal["exact", "cached", "none"] = Field(
+        default="cached",
+        description="Total count in cursor mode: exact, cached (first page) or none",
+    )
 
 
 class PaginatedCustomerResponse(BaseModel):
@@ -394,10 +418,10 @@ class PaginatedCustomerResponse(BaseModel):
         ...,
         description="List of customers",
     )
-    total: int = Field(
+    total: int | None = Field(
         ...,
         ge=0,
-        description="Total number of customers matching filters",
+        description="Total number of customers matching filters (null if not counted)",
     )
     page: int = Field(
         ...,
@@ -409,10 +433,14 @@ class PaginatedCustomerResponse(BaseModel):
         ge=1,
         description="Number of items per page",
     )
-    total_pages: int = Field(
+    total_pages: int | None = Field(
         ...,
         ge=0,
-        description="Total number of pages",
+        description="Total number of pages (null if not counted)",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page in cursor mode (null on the last page)",
     )
 
 
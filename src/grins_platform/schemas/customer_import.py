@@ -0,0 +1,49 @@
+"""Pydantic schemas for bulk customer import.
+
+Validates: Requirement 1.2, 1.3, 2.2-2.4
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from grins_platform.schemas.customer import CustomerCreate  # noqa: TC001
+from grins_platform.schemas.property import PropertyCreate  # noqa: TC001
+
+ImportRowStatus = Literal["invalid", "duplicate", "duplicate_in_file"]
+
+
+class CustomerImportRow(BaseModel):
+    """One import row: a customer and optionally their primary property."""
+
+    customer: CustomerCreate
+    property: PropertyCreate | None = None
+
+
+class CustomerImportRowError(BaseModel):
+    """Why a row was not imported."""
+
+    row_number: int = Field(description="1-based file row (the header is row 1)")
+    status: ImportRowStatus
+    field: str | None = Field(default=None, description="Offending column, if any")
+    message: str
+    existing_customer_id: UUID | None = Field(
+        default=None,
+        description="Customer the row duplicates, for duplicate rows",
+    )
+
+
+class CustomerImportResult(BaseModel):
+    """Outcome of a bulk customer import."""
+
+    dry_run: bool
+    total_rows: int = Field(ge=0)
+    imported: int = Field(ge=0, description="Customers created (0 on dry run)")
+    properties_imported: int = Field(ge=0)
+    valid: int = Field(ge=0, description="Rows that passed validation and dedup")
+    duplicates: int = Field(ge=0)
+    invalid: int = Field(ge=0)
+    errors: list[CustomerImportRowError] = Field(default_factory=list)
@@ -4,7 +4,7 @@ Validates: CRM Changes Update 2 Req 5.1, 6.2
 """
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -50,6 +50,53 @@ class MergeExecuteBody(BaseModel):
     field_selections: list[MergeFieldSelection] = Field(default_factory=list)
 
 
+class BatchMergeItem(BaseModel):
+    """One reviewed candidate to merge, keeping ``primary_id``."""
+
+    candidate_id: UUID
+    primary_id: UUID = Field(
+        description="Surviving customer; must be one side of the candidate",
+    )
+    field_selections: list[MergeFieldSelection] = Field(default_factory=list)
+
+
+class BatchMergeRequest(BaseModel):
+    """Request to merge many reviewed candidates in one transaction."""
+
+    merges: list[BatchMergeItem] = Field(min_length=1, max_length=1000)
+    dry_run: bool = Field(
+        default=False,
+        description="Plan and count the merges without writing",
+    )
+
+
+class BatchMergeItemResult(BaseModel):
+    """Outcome of one batch merge item."""
+
+    candidate_id: UUID
+    primary_id: UUID
+    duplicate_id: Optional[UUID] = None
+    survivor_id: Optional[UUID] = Field(
+        default=None,
+        description="Final surviving customer after resolving merge chains",
+    )
+    status: Literal["merged", "planned", "rejected"]
+    reason: Optional[str] = None
+
+
+class BatchMergeResponse(BaseModel):
+    """Result (or dry-run plan) of a batch merge."""
+
+    dry_run: bool
+    merged: int = Field(description="Merges executed (or planned on dry run)")
+    rejected: int
+    reassigned: dict[str, int] = Field(
+        default_factory=dict,
+        description="Rows moved (or to move) per table",
+    )
+    results: list[BatchMergeItemResult]
+
+
 class MergePreviewResponse(BaseModel):
     """Preview of what a merge would produce."""
 
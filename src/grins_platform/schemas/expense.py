@@ -113,3 +113,58 @@ class ReceiptExtractionResponse(BaseModel):
         le=1.0,
         description="Extraction confidence score",
     )
+
+
+class ReceiptBatchItemResponse(BaseModel):
+    """One receipt of a queued extraction batch.
+
+    Validates: CRM Gap Closure Req 60.1
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(..., description="Item UUID")
+    file_key: str = Field(..., description="S3 key of the stored receipt")
+    file_name: str = Field(..., description="Original file name")
+    status: str = Field(
+        ...,
+        description="pending, processing, completed or failed",
+    )
+    cached: bool = Field(
+        default=False,
+        description="Whether the result came from the extraction cache",
+    )
+    amount: Decimal | None = Field(default=None, description="Extracted amount")
+    vendor: str | None = Field(default=None, description="Extracted vendor name")
+    category: str | None = Field(
+        default=None,
+        description="Suggested expense category",
+    )
+    confidence: float | None = Field(
+        default=None,
+        description="Extraction confidence score",
+    )
+    error: str | None = Field(default=None, description="Why extraction failed")
+
+
+class ReceiptBatchResponse(BaseModel):
+    """Progress of a queued receipt extraction batch.
+
+    Validates: CRM Gap Closure Req 60.1
+    """
+
+    batch_id: UUID = Field(..., description="Extraction batch UUID")
+    status: str = Field(..., description="queued, processing or completed")
+    total: int = Field(..., ge=0, description="Receipts in the batch")
+    completed: int = Field(..., ge=0, description="Receipts extracted")
+    failed: int = Field(..., ge=0, description="Receipts whose extraction failed")
+    cached: int = Field(
+        ...,
+        ge=0,
+        description="Receipts answered from the extraction cache",
+    )
+    pending: int = Field(..., ge=0, description="Receipts still waiting")
+    items: list[ReceiptBatchItemResponse] = Field(
+        default_factory=list,
+        description="Per-receipt results",
+    )
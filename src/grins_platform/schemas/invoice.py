@@ -10,6 +10,7 @@ Validates: Schedule Workflow Improvements Requirements 7.1-7.10, 8.1-8.10,
 
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -443,6 +444,17 @@ class InvoiceListParams(BaseModel):
         pattern="^(asc|desc)$",
         description="Sort order (asc or desc)",
     )
+    cursor: str | None = Field(
+        default=None,
+        description=(
+            "Keyset cursor from the previous page's next_cursor; pass an empty "
+            "value to start cursor paging (page is then ignored)"
+        ),
+    )
+    count: Literal["exact", "cached", "none"] = Field(
+        default="cached",
+        description="Total count in cursor mode: exact, cached (first page) or none",
+    )
 
 
 class PaginatedInvoiceResponse(BaseModel):
@@ -455,10 +467,10 @@ class PaginatedInvoiceResponse(BaseModel):
         ...,
         description="List of invoices",
     )
-    total: int = Field(
+    total: int | None = Field(
         ...,
         ge=0,
-        description="Total number of invoices matching filters",
+        description="Total number of invoices matching filters (null if not counted)",
     )
     page: int = Field(
         ...,
@@ -470,10 +482,14 @@ class PaginatedInvoiceResponse(BaseModel):
         ge=1,
         description="Number of items per page",
     )
-    total_pages: int = Field(
+    total_pages: int | None = Field(
         ...,
         ge=0,
-        description="Total number of pages",
+        description="Total number of pages (null if not counted)",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page in cursor mode (null on the last page)",
     )
 
 
@@ -516,8 +532,96 @@ class MassNotifyResponse(BaseModel):
     Validates: Requirement 29.3
     """
 
+    run_id: UUID | None = Field(
+        default=None,
+        description="Background run delivering the notifications",
+    )
+    status: str = Field(
+        default="completed",
+        description="Run status: queued, sending or completed",
+    )
     notification_type: str
     targeted: int = Field(description="Number of invoices matching criteria")
     sent: int = Field(description="Number of notifications sent")
     failed: int = Field(description="Number of send failures")
     skipped: int = Field(description="Number skipped (no phone, consent denied)")
+    pending: int = Field(default=0, description="Number still waiting to send")
+
+
+class InvoicePDFBatchRequest(BaseModel):
+    """Request schema for generating many invoice PDFs at once."""
+
+    invoice_ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Invoices to render",
+    )
+
+
+class InvoicePDFBatchItem(BaseModel):
+    """Outcome of one invoice in a batch PDF generation."""
+
+    invoice_id: UUID
+    document_url: str | None = Field(
+        default=None,
+        description="Pre-signed download URL when the PDF is available",
+    )
+    cached: bool = Field(
+        default=False,
+        description="Whether the stored PDF was reused unchanged",
+    )
+    error: str | None = None
+
+
+class InvoicePDFBatchResponse(BaseModel):
+    """Response schema for batch invoice PDF generation."""
+
+    generated: int = Field(description="PDFs rendered and uploaded")
+    cached: int = Field(description="Stored PDFs reused unchanged")
+    failed: int = Field(description="Invoices missing or failing to render")
+    results: list[InvoicePDFBatchItem]
+
+
+class InvoiceBatchGenerateRequest(BaseModel):
+    """Request schema for invoicing completed jobs in one operation.
+
+    Validates: Requirement 10.1-10.7
+    """
+
+    completed_from: date | None = Field(
+        default=None,
+        description="Earliest job completion date (inclusive)",
+    )
+    completed_to: date | None = Field(
+        default=None,
+        description="Latest job completion date (inclusive)",
+    )
+    customer_id: UUID | None = Field(default=None, description="Only this customer")
+    job_type: str | None = Field(default=None, max_length=50)
+    limit: int = Field(
+        default=500,
+        ge=1,
+        le=2000,
+        description="Maximum jobs to invoice in this run",
+    )
+    render_pdf: bool = Field(
+        default=False,
+        description="Queue PDF rendering for each created invoice",
+    )
+    send: bool = Field(
+        default=False,
+        description="Queue sending each created invoice",
+    )
+
+
+class InvoiceBatchGenerateResponse(BaseModel):
+    """Response schema for batch invoice generation.
+
+    Validates: Requirement 10.1-10.7
+    """
+
+    created: int = Field(description="Number of invoices created")
+    invoice_ids: list[UUID]
+    pdf_queued: int = Field(description="PDF renders queued")
+    send_queued: int = Field(description="Sends queued")
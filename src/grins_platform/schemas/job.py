@@ -642,10 +642,10 @@ class PaginatedJobResponse(BaseModel):
         ...,
         description="List of jobs",
     )
-    total: int = Field(
+    total: int | None = Field(
         ...,
         ge=0,
-        description="Total number of jobs matching filters",
+        description="Total number of jobs matching filters (null if not counted)",
     )
     page: int = Field(
         ...,
@@ -657,10 +657,14 @@ class PaginatedJobResponse(BaseModel):
         ge=1,
         description="Number of items per page",
     )
-    total_pages: int = Field(
+    total_pages: int | None = Field(
         ...,
         ge=0,
-        description="Total number of pages",
+        description="Total number of pages (null if not counted)",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page in cursor mode (null on the last page)",
     )
 
 
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
@@ -351,19 +352,24 @@ class LeadListParams(BaseModel):
     action_tag: str | None = None
     sort_by: str = Field(default="created_at")
     sort_order: str = Field(default="desc", pattern="^(asc|desc)$")
+    cursor: str | None = None
+    count: Literal["exact", "cached", "none"] = "cached"
 
 
 class PaginatedLeadResponse(BaseModel):
     """Paginated lead list response.
 
+    ``total``/``total_pages`` are null when cursor paging skipped the count.
+
     Validates: Requirement 5.1
     """
 
     items: list[LeadResponse]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
 
 
 class FromCallSubmission(BaseModel):
@@ -0,0 +1,31 @@
+"""Pydantic schemas for global CRM search.
+
+Validates: Requirement 4.1-4.7, 5.1-5.5
+"""
+
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SearchResult(BaseModel):
+    """A ranked search match."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    type: Literal["customer", "lead"] = Field(..., description="Entity type")
+    id: UUID = Field(..., description="Entity UUID")
+    title: str = Field(..., description="Display name")
+    subtitle: str = Field(..., description="Secondary line (phone, email, status)")
+    rank: float = Field(..., ge=0, le=1, description="Relevance, higher is better")
+
+
+class SearchResponse(BaseModel):
+    """Ranked matches for a search query."""
+
+    query: str = Field(..., description="The query as received")
+    results: list[SearchResult] = Field(
+        default_factory=list,
+        description="Matches ordered by relevance",
+    )
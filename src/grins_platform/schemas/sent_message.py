@@ -127,10 +127,22 @@ class SentMessageListResponse(BaseModel):
         ...,
         description="List of sent messages",
     )
-    total: int = Field(..., ge=0, description="Total matching records")
+    total: int | None = Field(
+        ...,
+        ge=0,
+        description="Total matching records (null if not counted)",
+    )
     page: int = Field(..., ge=1, description="Current page")
     page_size: int = Field(..., ge=1, description="Items per page")
-    total_pages: int = Field(..., ge=0, description="Total pages")
+    total_pages: int | None = Field(
+        ...,
+        ge=0,
+        description="Total pages (null if not counted)",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page in cursor mode (null on the last page)",
+    )
 
 
 class SentMessageFilters(BaseModel):
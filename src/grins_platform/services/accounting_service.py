@@ -1,23 +1,33 @@
 """Accounting service for financial aggregation, tax reporting, and integrations.
 
 Provides: YTD summary, expense aggregation, per-job financials, tax summary,
-tax estimation, what-if projections, receipt OCR (OpenAI Vision), and
-Plaid transaction sync.
+tax estimation, what-if projections, receipt OCR (OpenAI Vision) with a
+content-hash result cache and queued batch extraction, and Plaid
+transaction sync. Period totals are range sums over the trigger-maintained
+``accounting_daily_rollups``.
 
 Validates: CRM Gap Closure Req 52, 53, 57, 59, 60, 61, 62
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
 import os
-from datetime import date
+from datetime import date, datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import func, select
 
 from grins_platform.log_config import LoggerMixin
+from grins_platform.models.accounting_daily_rollup import (
+    ROLLUP_SOURCE_EXPENSE,
+    ROLLUP_SOURCE_INVOICE,
+    ROLLUP_SOURCE_INVOICE_DUE,
+    AccountingDailyRollup,
+)
 from grins_platform.models.enums import ExpenseCategory
 from grins_platform.models.invoice import Invoice
 from grins_platform.models.job import Job
@@ -31,17 +41,27 @@ from grins_platform.schemas.accounting import (
 )
 from grins_platform.schemas.expense import (
     ExpenseByCategoryResponse,
+    ReceiptBatchItemResponse,
+    ReceiptBatchResponse,
     ReceiptExtractionResponse,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
     from uuid import UUID
 
+    from sqlalchemy import ColumnElement, Select
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from grins_platform.models.receipt_extraction import (
+        ReceiptExtractionBatch,
+        ReceiptExtractionCache,
+        ReceiptExtractionItem,
+    )
     from grins_platform.repositories.expense_repository import (
         ExpenseRepository,
     )
+    from grins_platform.services.photo_service import PhotoService, UploadResult
 
 # Default effective tax rate for small business
 # (~15.3% self-employment + income tax)
@@ -83,6 +103,212 @@ MCC_CATEGORY_MAP: dict[str, ExpenseCategory] = {
 }
 
 
+# Transactions per /transactions/sync page (Plaid's maximum)
+PLAID_SYNC_PAGE_SIZE = 500
+# Restarts of a sync whose pages changed upstream while being read
+PLAID_SYNC_MAX_ATTEMPTS = 3
+_PLAID_MUTATION_DURING_PAGINATION = "TRANSACTIONS_SYNC_MUTATION_DURING_PAGINATION"
+
+# Receipts accepted by one batch upload (about a month of a tech's receipts)
+RECEIPT_BATCH_MAX_FILES = 100
+# Receipts stored to S3 at once while a batch upload is accepted
+RECEIPT_UPLOAD_CONCURRENCY = 4
+
+_PENDING_INVOICE_STATES = ("sent", "viewed")
+_PAST_DUE_INVOICE_STATES = ("sent", "viewed", "overdue")
+
+
+def _rollup_total(*criteria: ColumnElement[bool]) -> ColumnElement[Any]:
+    return func.coalesce(
+        func.sum(AccountingDailyRollup.amount).filter(*criteria),
+        0,
+    )
+
+
+def period_totals_statement(
+    date_from: date,
+    date_to: date,
+    today: date,
+) -> Select[Any]:
+    """Build the one-row period totals over the daily rollups.
+
+    Columns: ``revenue`` (paid invoices dated in the period), ``expenses``
+    (expenses dated in the period), ``pending_total`` (sent or viewed
+    invoices) and ``past_due_total`` (open invoices due before *today*).
+
+    Args:
+        date_from: Start of the period (inclusive)
+        date_to: End of the period (inclusive)
+        today: Reference date for past-due totals
+
+    Returns:
+        SELECT of range sums over ``accounting_daily_rollups``
+    """
+    rollup = AccountingDailyRollup
+    in_period = rollup.day.between(date_from, date_to)
+    return select(
+        _rollup_total(
+            rollup.source == ROLLUP_SOURCE_INVOICE,
+            rollup.state == "paid",
+            in_period,
+        ).label("revenue"),
+        _rollup_total(
+            rollup.source == ROLLUP_SOURCE_EXPENSE,
+            in_period,
+        ).label("expenses"),
+        _rollup_total(
+            rollup.source == ROLLUP_SOURCE_INVOICE,
+            rollup.state.in_(_PENDING_INVOICE_STATES),
+        ).label("pending_total"),
+        _rollup_total(
+            rollup.source == ROLLUP_SOURCE_INVOICE_DUE,
+            rollup.state.in_(_PAST_DUE_INVOICE_STATES),
+            rollup.day < today,
+        ).label("past_due_total"),
+    )
+
+
+def expense_categories_statement(
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> Select[Any]:
+    """Build per-category expense totals over the daily rollups.
+
+    Args:
+        date_from: Start of the period (inclusive), unbounded when None
+        date_to: End of the period (inclusive), unbounded when None
+
+    Returns:
+        SELECT of (category, total, count) sorted by total descending
+    """
+    rollup = AccountingDailyRollup
+    stmt = (
+        select(
+            rollup.category,
+            func.sum(rollup.amount).label("total"),
+            func.sum(rollup.entry_count).label("count"),
+        )
+        .where(rollup.source == ROLLUP_SOURCE_EXPENSE)
+        .group_by(rollup.category)
+        .having(func.sum(rollup.entry_count) > 0)
+        .order_by(func.sum(rollup.amount).desc())
+    )
+    if date_from is not None:
+        stmt = stmt.where(rollup.day >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(rollup.day <= date_to)
+    return stmt
+
+
+def categorize_by_mcc(mcc_codes: Iterable[str]) -> list[ExpenseCategory]:
+    """Map a batch of MCC codes to expense categories.
+
+    Args:
+        mcc_codes: Merchant Category Codes ("" when unknown)
+
+    Returns:
+        One ExpenseCategory per code, OTHER for unmapped codes
+
+    Validates: CRM Gap Closure Req 62.4
+    """
+    lookup = MCC_CATEGORY_MAP.get
+    return [lookup(code, ExpenseCategory.OTHER) for code in mcc_codes]
+
+
+def plaid_expense_rows(transactions: Sequence[Any]) -> list[dict[str, Any]]:
+    """Build expense rows for debit Plaid transactions.
+
+    Credits and refunds (non-positive amounts) produce no row.
+
+    Args:
+        transactions: Plaid ``Transaction`` objects
+
+    Returns:
+        Expense column values keyed for ``upsert_plaid_transactions``
+    """
+    debits = [txn for txn in transactions if txn.amount > 0]
+    mccs = [str(getattr(txn, "merchant_category_code", "") or "") for txn in debits]
+    return [
+        {
+            "plaid_transaction_id": txn.transaction_id,
+            "category": category.value,
+            "description": txn.name or "Plaid transaction",
+            "amount": Decimal(str(txn.amount)),
+            "date": txn.date,
+            "vendor": getattr(txn, "merchant_name", None) or txn.name,
+            "notes": f"Auto-imported from Plaid (MCC: {mcc})",
+        }
+        for txn, mcc, category in zip(
+            debits,
+            mccs,
+            categorize_by_mcc(mccs),
+            strict=True,
+        )
+    ]
+
+
+def receipt_content_hash(data: bytes) -> str:
+    """Return the extraction cache key of a receipt (SHA-256 of its bytes)."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def receipt_cache_row(
+    content_hash: str,
+    extracted: ReceiptExtractionResponse,
+) -> dict[str, Any] | None:
+    """Build the cache row of an extraction result.
+
+    Results with zero confidence (unreadable receipt, unparseable reply, or
+    extraction not configured) are not cached, so they are tried again.
+
+    Returns:
+        Cache column values, or None if the result should not be cached
+    """
+    if extracted.confidence <= 0:
+        return None
+    return {"content_hash": content_hash, **receipt_extraction_values(extracted)}
+
+
+def receipt_extraction_values(
+    extracted: ReceiptExtractionResponse,
+) -> dict[str, Any]:
+    """Column values of an extraction result, clipped to the column sizes."""
+    values = extracted.model_dump()
+    if values["vendor"] is not None:
+        values["vendor"] = values["vendor"][:200]
+    if values["category"] is not None:
+        values["category"] = values["category"][:30]
+    return values
+
+
+def cached_receipt_extraction(
+    cached: ReceiptExtractionCache,
+) -> ReceiptExtractionResponse:
+    """Convert a cache row back into an extraction result."""
+    return ReceiptExtractionResponse(
+        amount=cached.amount,
+        vendor=cached.vendor,
+        category=cached.category,
+        confidence=cached.confidence,
+    )
+
+
+def _receipt_batch_response(
+    batch: ReceiptExtractionBatch,
+    items: Sequence[ReceiptExtractionItem],
+) -> ReceiptBatchResponse:
+    return ReceiptBatchResponse(
+        batch_id=batch.id,
+        status=batch.status,
+        total=batch.total,
+        completed=batch.completed,
+        failed=batch.failed,
+        cached=batch.cached,
+        pending=max(batch.total - batch.completed - batch.failed, 0),
+        items=[ReceiptBatchItemResponse.model_validate(item) for item in items],
+    )
+
+
 class PlaidConnectionError(Exception):
     """Raised when Plaid API communication fails."""
 
@@ -117,16 +343,25 @@ class AccountingService(LoggerMixin):
         self,
         expense_repository: ExpenseRepository,
         effective_tax_rate: float = DEFAULT_EFFECTIVE_TAX_RATE,
+        *,
+        plaid_client: Any | None = None,  # noqa: ANN401
+        photo_service: PhotoService | None = None,
     ) -> None:
         """Initialize AccountingService.
 
         Args:
             expense_repository: Repository for expense DB operations.
             effective_tax_rate: Configurable effective tax rate.
+            plaid_client: ``plaid_api.PlaidApi`` to use (defaults to one
+                built from the PLAID_* environment variables).
+            photo_service: Stores uploaded receipts (defaults to the
+                S3-backed PhotoService).
         """
         super().__init__()
         self.expense_repo = expense_repository
         self.effective_tax_rate = effective_tax_rate
+        self._plaid_client = plaid_client
+        self._photo_service = photo_service
 
     # ------------------------------------------------------------------ #
     # get_summary -- Req 52
@@ -143,6 +378,7 @@ class AccountingService(LoggerMixin):
         Revenue = sum of paid invoice total_amount.
         Expenses = sum of all tracked expenses.
         Profit = revenue - expenses.
+        All figures are range sums over the daily rollups, in one query.
 
         Args:
             db: Async database session.
@@ -164,25 +400,9 @@ class AccountingService(LoggerMixin):
             date_to = date.today()
 
         try:
-            # Revenue: sum of paid invoices in date range
-            revenue_stmt = select(
-                func.coalesce(
-                    func.sum(Invoice.total_amount),
-                    0,
-                ),
-            ).where(
-                Invoice.status == "paid",
-                Invoice.invoice_date >= date_from,
-                Invoice.invoice_date <= date_to,
-            )
-            revenue_result = await db.execute(revenue_stmt)
-            revenue = Decimal(str(revenue_result.scalar() or 0))
-
-            # Expenses: total spend in date range
-            expenses = await self.expense_repo.get_total_spend(
-                date_from=date_from,
-                date_to=date_to,
-            )
+            totals = await self._period_totals(db, date_from, date_to)
+            revenue = totals["revenue"]
+            expenses = totals["expenses"]
 
             # Profit
             profit = revenue - expenses
@@ -190,43 +410,13 @@ class AccountingService(LoggerMixin):
             # Profit margin
             profit_margin = float(profit / revenue * 100) if revenue > 0 else 0.0
 
-            # Pending invoices (SENT or VIEWED)
-            pending_stmt = select(
-                func.coalesce(
-                    func.sum(Invoice.total_amount),
-                    0,
-                ),
-            ).where(
-                Invoice.status.in_(["sent", "viewed"]),
-            )
-            pending_result = await db.execute(pending_stmt)
-            pending_total = Decimal(
-                str(pending_result.scalar() or 0),
-            )
-
-            # Past-due invoices (past due_date, not paid)
-            today = date.today()
-            past_due_stmt = select(
-                func.coalesce(
-                    func.sum(Invoice.total_amount),
-                    0,
-                ),
-            ).where(
-                Invoice.status.in_(["sent", "viewed", "overdue"]),
-                Invoice.due_date < today,
-            )
-            past_due_result = await db.execute(past_due_stmt)
-            past_due_total = Decimal(
-                str(past_due_result.scalar() or 0),
-            )
-
             summary = AccountingSummaryResponse(
                 revenue=revenue,
                 expenses=expenses,
                 profit=profit,
                 profit_margin=round(profit_margin, 2),
-                pending_total=pending_total,
-                past_due_total=past_due_total,
+                pending_total=totals["pending_total"],
+                past_due_total=totals["past_due_total"],
             )
 
         except Exception as e:
@@ -247,14 +437,14 @@ class AccountingService(LoggerMixin):
 
     async def get_expenses_by_category(
         self,
-        db: AsyncSession,  # noqa: ARG002
+        db: AsyncSession,
         date_from: date | None = None,
         date_to: date | None = None,
     ) -> list[ExpenseByCategoryResponse]:
         """Aggregate expenses by category for a date range.
 
         Args:
-            db: Async database session (reserved for future use).
+            db: Async database session.
             date_from: Start of date range (inclusive).
             date_to: End of date range (inclusive).
 
@@ -266,19 +456,7 @@ class AccountingService(LoggerMixin):
         self.log_started("get_expenses_by_category")
 
         try:
-            rows = await self.expense_repo.aggregate_by_category(
-                date_from=date_from,
-                date_to=date_to,
-            )
-
-            result = [
-                ExpenseByCategoryResponse(
-                    category=category,
-                    total=total,
-                    count=count,
-                )
-                for category, total, count in rows
-            ]
+            result = await self._expense_categories(db, date_from, date_to)
 
         except Exception as e:
             self.log_failed("get_expenses_by_category", error=e)
@@ -421,41 +599,20 @@ class AccountingService(LoggerMixin):
             year_start = date(tax_year, 1, 1)
             year_end = date(tax_year, 12, 31)
 
-            # Expense totals by category
-            rows = await self.expense_repo.aggregate_by_category(
-                date_from=year_start,
-                date_to=year_end,
+            expense_categories = await self._expense_categories(
+                db,
+                year_start,
+                year_end,
             )
 
-            expense_categories = [
-                ExpenseByCategoryResponse(
-                    category=category,
-                    total=total,
-                    count=count,
-                )
-                for category, total, count in rows
-            ]
-
             total_deductions = sum(
                 (cat.total for cat in expense_categories),
                 Decimal(0),
             )
 
             # Total revenue for the tax year (paid invoices)
-            revenue_stmt = select(
-                func.coalesce(
-                    func.sum(Invoice.total_amount),
-                    0,
-                ),
-            ).where(
-                Invoice.status == "paid",
-                Invoice.invoice_date >= year_start,
-                Invoice.invoice_date <= year_end,
-            )
-            revenue_result = await db.execute(revenue_stmt)
-            total_revenue = Decimal(
-                str(revenue_result.scalar() or 0),
-            )
+            totals = await self._period_totals(db, year_start, year_end)
+            total_revenue = totals["revenue"]
 
             summary = TaxSummaryResponse(
                 expense_categories=expense_categories,
@@ -506,25 +663,10 @@ class AccountingService(LoggerMixin):
             year_start = date(date.today().year, 1, 1)
             today = date.today()
 
-            # YTD revenue
-            revenue_stmt = select(
-                func.coalesce(
-                    func.sum(Invoice.total_amount),
-                    0,
-                ),
-            ).where(
-                Invoice.status == "paid",
-                Invoice.invoice_date >= year_start,
-                Invoice.invoice_date <= today,
-            )
-            revenue_result = await db.execute(revenue_stmt)
-            revenue = Decimal(str(revenue_result.scalar() or 0))
-
-            # YTD deductions (all expenses)
-            deductions = await self.expense_repo.get_total_spend(
-                date_from=year_start,
-                date_to=today,
-            )
+            # YTD revenue and deductions (all expenses)
+            totals = await self._period_totals(db, year_start, today)
+            revenue = totals["revenue"]
+            deductions = totals["expenses"]
 
             taxable_income = max(revenue - deductions, Decimal(0))
             rate = Decimal(str(self.effective_tax_rate))
@@ -616,6 +758,40 @@ class AccountingService(LoggerMixin):
         )
         return result
 
+    # ------------------------------------------------------------------ #
+    # Rollup reads
+    # ------------------------------------------------------------------ #
+
+    async def _period_totals(
+        self,
+        db: AsyncSession,
+        date_from: date,
+        date_to: date,
+    ) -> dict[str, Decimal]:
+        """Read the period totals of ``period_totals_statement``."""
+        result = await db.execute(
+            period_totals_statement(date_from, date_to, date.today()),
+        )
+        row = result.mappings().one()
+        return {key: Decimal(str(value or 0)) for key, value in row.items()}
+
+    async def _expense_categories(
+        self,
+        db: AsyncSession,
+        date_from: date | None,
+        date_to: date | None,
+    ) -> list[ExpenseByCategoryResponse]:
+        """Read per-category expense totals from the daily rollups."""
+        result = await db.execute(expense_categories_statement(date_from, date_to))
+        return [
+            ExpenseByCategoryResponse(
+                category=str(category),
+                total=Decimal(str(total)),
+                count=int(count),
+            )
+            for category, total, count in result.all()
+        ]
+
     # ------------------------------------------------------------------ #
     # extract_receipt -- Req 60
     # ------------------------------------------------------------------ #
@@ -716,6 +892,190 @@ class AccountingService(LoggerMixin):
         )
         return extracted
 
+    async def extract_receipt_cached(
+        self,
+        image_data: bytes,
+        content_type: str = "image/jpeg",
+    ) -> ReceiptExtractionResponse:
+        """Extract a receipt, answering re-uploads from the result cache.
+
+        Args:
+            image_data: Raw image bytes.
+            content_type: MIME type of the image.
+
+        Returns:
+            ReceiptExtractionResponse with extracted fields.
+
+        Raises:
+            ReceiptExtractionError: If the OpenAI API call fails.
+
+        Validates: CRM Gap Closure Req 60.1, 60.2
+        """
+        content_hash = receipt_content_hash(image_data)
+        cached = await self.expense_repo.get_receipt_extractions([content_hash])
+        if content_hash in cached:
+            self.log_completed("extract_receipt_cached", cache_hit=True)
+            return cached_receipt_extraction(cached[content_hash])
+
+        extracted = await self.extract_receipt(image_data, content_type)
+        row = receipt_cache_row(content_hash, extracted)
+        if row is not None:
+            await self.expense_repo.save_receipt_extractions([row])
+        return extracted
+
+    async def queue_receipt_extractions(
+        self,
+        files: Sequence[tuple[bytes, str]],
+        created_by: UUID | None = None,
+    ) -> ReceiptBatchResponse:
+        """Store a batch of receipts and queue them for extraction.
+
+        Receipts are validated up front, stored to S3 with bounded
+        concurrency, and recorded as one batch; if storing or recording
+        fails, the receipts already stored are deleted. Receipts whose
+        content was extracted before are completed from the cache at once;
+        the rest are extracted by the receipt extraction worker. Poll
+        ``get_receipt_batch`` for progress.
+
+        Args:
+            files: ``(bytes, file name)`` of each uploaded receipt.
+            created_by: Staff member uploading the receipts.
+
+        Returns:
+            ReceiptBatchResponse for the queued batch.
+
+        Raises:
+            ValueError: If the batch is empty, too large, or a file fails
+                receipt upload validation.
+
+        Validates: CRM Gap Closure Req 60.1, 60.5
+        """
+        from grins_platform.services.photo_service import (  # noqa: PLC0415
+            UploadContext,
+        )
+
+        self.log_started("queue_receipt_extractions", count=len(files))
+        if not files or len(files) > RECEIPT_BATCH_MAX_FILES:
+            self.log_rejected(
+                "queue_receipt_extractions",
+                reason="batch_size",
+                count=len(files),
+            )
+            msg = f"Upload between 1 and {RECEIPT_BATCH_MAX_FILES} receipts"
+            raise ValueError(msg)
+
+        photos = self._get_photo_service()
+        for data, file_name in files:
+            _ = photos.validate_file(data, file_name, UploadContext.RECEIPT)
+
+        semaphore = asyncio.Semaphore(RECEIPT_UPLOAD_CONCURRENCY)
+
+        async def store(data: bytes, file_name: str) -> UploadResult:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    photos.upload_file,
+                    data,
+                    file_name,
+                    UploadContext.RECEIPT,
+                )
+
+        results = await asyncio.gather(
+            *(store(data, name) for data, name in files),
+            return_exceptions=True,
+        )
+        uploads = [r for r in results if not isinstance(r, BaseException)]
+        error = next((r for r in results if isinstance(r, BaseException)), None)
+        if error is not None:
+            await self._discard_receipt_uploads(photos, uploads)
+            raise error
+
+        try:
+            hashes = [receipt_content_hash(data) for data, _ in files]
+            cache = await self.expense_repo.get_receipt_extractions(hashes)
+
+            now = datetime.now(timezone.utc)
+            pending = dict.fromkeys(ReceiptExtractionResponse.model_fields)
+            items: list[dict[str, Any]] = []
+            for upload, content_hash in zip(uploads, hashes, strict=True):
+                hit = cache.get(content_hash)
+                result = (
+                    pending
+                    if hit is None
+                    else cached_receipt_extraction(hit).model_dump()
+                )
+                items.append(
+                    {
+                        "file_key": upload.file_key,
+                        "file_name": upload.file_name[:255],
+                        "content_type": upload.content_type,
+                        "content_hash": content_hash,
+                        "status": "pending" if hit is None else "completed",
+                        "cached": hit is not None,
+                        "processed_at": None if hit is None else now,
+                        **result,
+                    },
+                )
+            batch = await self.expense_repo.create_receipt_batch(items, created_by)
+        except Exception:
+            # Nothing references the stored receipts without the batch
+            await self._discard_receipt_uploads(photos, uploads)
+            raise
+
+        _, stored = await self.expense_repo.get_receipt_batch(batch.id) or (batch, [])
+        response = _receipt_batch_response(batch, stored)
+        self.log_completed(
+            "queue_receipt_extractions",
+            batch_id=str(batch.id),
+            total=response.total,
+            cached=response.cached,
+        )
+        return response
+
+    async def _discard_receipt_uploads(
+        self,
+        photos: PhotoService,
+        uploads: Sequence[UploadResult],
+    ) -> None:
+        """Delete receipts stored for a batch that was not recorded."""
+        for upload in uploads:
+            try:
+                await asyncio.to_thread(photos.delete_file, upload.file_key)
+            except Exception as e:  # noqa: PERF203
+                self.logger.warning(
+                    "accounting.receipt_upload.cleanup_failed",
+                    file_key=upload.file_key,
+                    error=str(e),
+                )
+
+    async def get_receipt_batch(
+        self,
+        batch_id: UUID,
+    ) -> ReceiptBatchResponse | None:
+        """Return the progress and per-receipt results of a batch.
+
+        Args:
+            batch_id: Batch ID returned by ``queue_receipt_extractions``.
+
+        Returns:
+            ReceiptBatchResponse, or None if the batch does not exist.
+
+        Validates: CRM Gap Closure Req 60.1
+        """
+        found = await self.expense_repo.get_receipt_batch(batch_id)
+        if found is None:
+            return None
+        return _receipt_batch_response(*found)
+
+    def _get_photo_service(self) -> PhotoService:
+        """Return the receipt store, building the S3-backed one once."""
+        if self._photo_service is None:
+            from grins_platform.services.photo_service import (  # noqa: PLC0415
+                PhotoService,
+            )
+
+            self._photo_service = PhotoService()
+        return self._photo_service
+
     @staticmethod
     def _parse_receipt_response(
         raw_text: str,
@@ -765,10 +1125,15 @@ class AccountingService(LoggerMixin):
         db: AsyncSession,
         access_token: str | None = None,
     ) -> int:
-        """Sync transactions from Plaid and create expense records.
+        """Sync transactions from Plaid into expense records.
 
-        Fetches recent transactions from connected bank accounts,
-        auto-categorizes by MCC code, and creates expense records.
+        Reads the changes since the item's stored cursor through
+        ``/transactions/sync`` (the blocking client runs in a worker
+        thread), upserts debit transactions keyed by transaction id,
+        deletes removed ones, and saves the new cursor in the same
+        transaction, so a retried sync neither skips nor duplicates. The
+        first sync of an item links expenses imported before cursors
+        existed to their transactions rather than importing them again.
 
         Args:
             db: Async database session.
@@ -794,91 +1159,128 @@ class AccountingService(LoggerMixin):
             return 0
 
         try:
-            import plaid  # noqa: PLC0415
-            from plaid.api import plaid_api  # noqa: PLC0415
-            from plaid.model.transactions_get_request import (  # noqa: PLC0415
-                TransactionsGetRequest,
+            client = self._get_plaid_client()
+        except ImportError:
+            self.log_rejected(
+                "sync_transactions",
+                reason="plaid-python package not installed",
             )
-            from plaid.model.transactions_get_request_options import (  # noqa: PLC0415
-                TransactionsGetRequestOptions,
+            return 0
+
+        item_key = hashlib.sha256(token.encode()).hexdigest()
+        try:
+            cursor = await self.expense_repo.get_plaid_cursor(item_key)
+            changes, next_cursor = await self._fetch_transaction_changes(
+                client,
+                token,
+                cursor,
+            )
+
+            current = [txn for txn in changes.values() if txn is not None]
+            gone = [
+                txn_id
+                for txn_id, txn in changes.items()
+                if txn is None or txn.amount <= 0
+            ]
+            rows = plaid_expense_rows(current)
+            if cursor is None:
+                # First sync returns the item's full history
+                await self.expense_repo.link_legacy_plaid_expenses(rows)
+            created_count = (
+                await self.expense_repo.upsert_plaid_transactions(rows) if rows else 0
             )
+            deleted_count = await self.expense_repo.delete_plaid_transactions(gone)
+            await self.expense_repo.save_plaid_cursor(item_key, next_cursor)
+            await db.commit()
+
+        except Exception as e:
+            self.log_failed("sync_transactions", error=e)
+            raise PlaidConnectionError(str(e)) from e
+
+        self.log_completed(
+            "sync_transactions",
+            transactions_changed=len(changes),
+            expenses_created=created_count,
+            expenses_updated=len(rows) - created_count,
+            expenses_deleted=deleted_count,
+        )
+        return created_count
 
-            client_id = os.getenv("PLAID_CLIENT_ID", "")
-            secret = os.getenv("PLAID_SECRET", "")
-            plaid_env = os.getenv("PLAID_ENV", "sandbox")
+    def _get_plaid_client(self) -> Any:  # noqa: ANN401
+        """Return the Plaid client, building it from the environment once.
+
+        Raises:
+            ImportError: If plaid-python is not installed.
+        """
+        if self._plaid_client is None:
+            import plaid  # noqa: PLC0415
+            from plaid.api import plaid_api  # noqa: PLC0415
 
             host = (
                 plaid.Environment.Sandbox
-                if plaid_env == "sandbox"
+                if os.getenv("PLAID_ENV", "sandbox") == "sandbox"
                 else plaid.Environment.Production
             )
             configuration = plaid.Configuration(
                 host=host,
                 api_key={
-                    "clientId": client_id,
-                    "secret": secret,
+                    "clientId": os.getenv("PLAID_CLIENT_ID", ""),
+                    "secret": os.getenv("PLAID_SECRET", ""),
                 },
             )
+            self._plaid_client = plaid_api.PlaidApi(plaid.ApiClient(configuration))
+        return self._plaid_client
 
-            api_client = plaid.ApiClient(configuration)
-            client = plaid_api.PlaidApi(api_client)
-
-            # Fetch last 30 days of transactions
-            end_date = date.today()
-            start_date = date(end_date.year, end_date.month, 1)
-
-            request = TransactionsGetRequest(
-                access_token=token,
-                start_date=start_date,
-                end_date=end_date,
-                options=TransactionsGetRequestOptions(count=500),
-            )
+    async def _fetch_transaction_changes(
+        self,
+        client: Any,  # noqa: ANN401
+        access_token: str,
+        cursor: str | None,
+    ) -> tuple[dict[str, Any | None], str]:
+        """Page through ``/transactions/sync`` from *cursor*.
 
-            response = client.transactions_get(request)
-            transactions = response.transactions
+        Pages are folded in order, so a transaction added and later
+        modified or removed within one sync ends in its final state.
+        When Plaid reports that the data changed mid-pagination, the
+        sync restarts from *cursor* as its documentation requires.
 
-            created_count = 0
-            for txn in transactions:
-                # Skip positive amounts (credits/refunds)
-                if txn.amount <= 0:
-                    continue
+        Returns:
+            (transaction id -> latest Transaction, or None when removed;
+            the cursor to store)
+        """
+        import plaid  # noqa: PLC0415
+        from plaid.model.transactions_sync_request import (  # noqa: PLC0415
+            TransactionsSyncRequest,
+        )
 
-                # Auto-categorize by MCC code
-                mcc = str(
-                    getattr(txn, "merchant_category_code", "") or "",
+        for attempt in range(1, PLAID_SYNC_MAX_ATTEMPTS + 1):
+            changes: dict[str, Any | None] = {}
+            next_cursor = cursor
+            try:
+                while True:
+                    request = TransactionsSyncRequest(
+                        access_token=access_token,
+                        count=PLAID_SYNC_PAGE_SIZE,
+                        **({"cursor": next_cursor} if next_cursor else {}),
+                    )
+                    page = await asyncio.to_thread(client.transactions_sync, request)
+                    for txn in (*page.added, *page.modified):
+                        changes[txn.transaction_id] = txn
+                    for removed in page.removed:
+                        changes[removed.transaction_id] = None
+                    next_cursor = page.next_cursor
+                    if not page.has_more:
+                        return changes, next_cursor
+            except plaid.ApiException as e:
+                if _PLAID_MUTATION_DURING_PAGINATION not in str(e.body):
+                    raise
+                self.logger.warning(
+                    "accounting.sync_transactions.restarted",
+                    attempt=attempt,
                 )
-                category = self._categorize_by_mcc(mcc)
-
-                # Create expense record
-                await self.expense_repo.create(
-                    category=category.value,
-                    description=txn.name or "Plaid transaction",
-                    amount=Decimal(str(abs(txn.amount))),
-                    expense_date=txn.date,
-                    vendor=(getattr(txn, "merchant_name", None) or txn.name),
-                    notes=f"Auto-imported from Plaid (MCC: {mcc})",
-                )
-                created_count += 1
-
-            await db.commit()
-
-        except ImportError:
-            self.log_rejected(
-                "sync_transactions",
-                reason="plaid-python package not installed",
-            )
-            return 0
-
-        except Exception as e:
-            self.log_failed("sync_transactions", error=e)
-            raise PlaidConnectionError(str(e)) from e
 
-        self.log_completed(
-            "sync_transactions",
-            transactions_fetched=len(transactions),
-            expenses_created=created_count,
-        )
-        return created_count
+        msg = "Plaid transactions kept changing during sync pagination"
+        raise PlaidConnectionError(msg)
 
     @staticmethod
     def _categorize_by_mcc(mcc_code: str) -> ExpenseCategory:
@@ -892,4 +1294,4 @@ class AccountingService(LoggerMixin):
 
         Validates: CRM Gap Closure Req 62.4
         """
-        return MCC_CATEGORY_MAP.get(mcc_code, ExpenseCategory.OTHER)
+        return categorize_by_mcc((mcc_code,))[0]
@@ -55,6 +55,7 @@ if TYPE_CHECKING:
     )
     from grins_platform.repositories.invoice_repository import InvoiceRepository
     from grins_platform.repositories.job_repository import JobRepository
+    from grins_platform.repositories.pagination import CountMode, KeysetPage
     from grins_platform.repositories.staff_repository import StaffRepository
     from grins_platform.schemas.appointment import (
         AppointmentCreate,
@@ -662,6 +663,36 @@ class AppointmentService(LoggerMixin):
         self.log_completed("list_appointments", count=len(appointments), total=total)
         return appointments, total
 
+    async def list_appointments_keyset(
+        self,
+        *,
+        cursor: str | None,
+        page_size: int = 20,
+        sort_by: str = "scheduled_date",
+        sort_order: str = "asc",
+        count: CountMode = "cached",
+        include_relationships: bool = True,
+        **filters: Any,
+    ) -> KeysetPage[Appointment]:
+        """List appointments a page at a time after *cursor*.
+
+        Validates: Admin Dashboard Requirement 1.4
+        """
+        self.log_started("list_appointments_keyset", page_size=page_size)
+
+        page = await self.appointment_repository.list_keyset(
+            cursor=cursor,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            count=count,
+            include_relationships=include_relationships,
+            **filters,
+        )
+
+        self.log_completed("list_appointments_keyset", count=len(page.items))
+        return page
+
     async def get_daily_schedule(
         self,
         schedule_date: date,
@@ -8,6 +8,7 @@ Validates: Requirements 10.1-10.7, 15.1-15.4, 16.1-16.4, 21.1-21.5, 28, 32, 37.2
 
 from __future__ import annotations
 
+import json
 import os
 import time as _time_mod
 from datetime import datetime, time, timedelta, timezone
@@ -15,12 +16,16 @@ from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 import stripe
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from grins_platform.database import get_database_manager
 from grins_platform.log_config import LoggerMixin, get_logger
-from grins_platform.models.campaign import Campaign, CampaignRecipient
+from grins_platform.models.campaign import (
+    Campaign,
+    CampaignDeliveryCounter,
+    CampaignRecipient,
+)
 from grins_platform.models.customer import Customer
 from grins_platform.models.enums import (
     AgreementStatus,
@@ -31,22 +36,37 @@ from grins_platform.models.enums import (
 from grins_platform.models.lead import Lead
 from grins_platform.models.service_agreement import ServiceAgreement
 from grins_platform.models.sms_consent_record import SmsConsentRecord
+from grins_platform.redis_manager import get_redis_manager
+from grins_platform.repositories.expense_repository import ExpenseRepository
 from grins_platform.schemas.ai import MessageType
+from grins_platform.services.accounting_service import AccountingService
 from grins_platform.services.campaign_utils import (
     render_poll_block as _render_poll_block,
 )
 from grins_platform.services.compliance_service import ComplianceService
+from grins_platform.services.day_of_reminder_engine import DayOfReminderEngine
 from grins_platform.services.duplicate_detection_service import (
     DuplicateDetectionService,
 )
 from grins_platform.services.email_service import EmailService
+from grins_platform.services.invoice_notification_worker import (
+    InvoiceNotificationWorker,
+)
+from grins_platform.services.metrics_service import MetricsService
 from grins_platform.services.onboarding_reminder_job import OnboardingReminderJob
+from grins_platform.services.outbox_service import OutboxProcessor
+from grins_platform.services.receipt_extraction_worker import (
+    ReceiptExtractionWorker,
+)
 from grins_platform.services.sms.consent import check_sms_consent  # noqa: F401
+from grins_platform.services.sms.csv_upload import purge_staged_uploads
 from grins_platform.services.sms.factory import get_sms_provider
 from grins_platform.services.sms.recipient import Recipient
 from grins_platform.services.sms.state_machine import (
+    DeliveryCounterDeltas,
     RecipientState,
     orphan_recovery_query,
+    reconcile_delivery_counters,
     transition,
 )
 from grins_platform.services.stripe_config import StripeSettings
@@ -339,10 +359,20 @@ _WINDOW_END = time(21, 0)
 
 # Max recipients per tick (~2 to stay under 140/hr with 60s interval)
 _BATCH_SIZE = 2
+_TICK_SECONDS = 60
 
 # Redis key for worker health
 _REDIS_WORKER_KEY = "sms:worker:last_tick"
 
+# Outbox retries; intake's post-commit kick delivers the common case at once
+_OUTBOX_TICK_SECONDS = 30
+
+# Invoice mass notifications; each tick stops claiming after its time budget
+_INVOICE_NOTIFY_TICK_SECONDS = 30
+
+# Queued receipt extraction; each tick stops claiming after its time budget
+_RECEIPT_EXTRACTION_TICK_SECONDS = 30
+
 # Sender prefix / footer defaults
 _DEFAULT_PREFIX = "Grins Irrigation: "
 _DEFAULT_FOOTER = " Reply STOP to opt out."
@@ -355,6 +385,16 @@ def _mask_phone(phone: str) -> str:
     return "***"
 
 
+def campaign_send_capacity() -> tuple[float, float]:
+    """Return ``(recipients_per_hour, window_hours)`` for the campaign worker."""
+    per_hour = _BATCH_SIZE * 3600 / _TICK_SECONDS
+    window = datetime.combine(datetime.min, _WINDOW_END) - datetime.combine(
+        datetime.min,
+        _WINDOW_START,
+    )
+    return per_hour, window.total_seconds() / 3600
+
+
 def _is_within_time_window() -> bool:
     """Return True if current CT time is within 8 AM - 9 PM."""
     now_ct = datetime.now(_CT_TZ)
@@ -427,26 +467,23 @@ class CampaignWorker(LoggerMixin):
             # 4. Process each claimed recipient
             provider = get_sms_provider()
 
-            # L10: Create Redis client once for the whole batch
-            redis_url = os.environ.get("REDIS_URL")
-            redis_client = None
-            if redis_url:
-                try:
-                    from redis.asyncio import Redis  # noqa: PLC0415
-
-                    redis_client = Redis.from_url(redis_url, decode_responses=True)
-                except Exception:
-                    logger.debug("campaign.worker.redis_connect_failed")
-
-            try:
-                for cr in recipients:
-                    await self._process_recipient(session, cr, provider, redis_client)
-                    processed += 1
-            finally:
-                if redis_client:
-                    await redis_client.aclose()
-
-            # 5. Update campaign status if all recipients are terminal
+            # Shared pooled Redis client — owned by the RedisManager, not closed here
+            redis_client = get_redis_manager().client
+
+            counter_deltas = DeliveryCounterDeltas()
+            for cr in recipients:
+                await self._process_recipient(
+                    session,
+                    cr,
+                    provider,
+                    redis_client,
+                    counter_deltas,
+                )
+                processed += 1
+
+            # 5. Apply this tick's counter changes in the same transaction,
+            # then update campaign status if all recipients are terminal
+            await counter_deltas.flush(session)
             campaign_ids = {cr.campaign_id for cr in recipients}
             for cid in campaign_ids:
                 await self._update_campaign_status(session, cid)
@@ -472,8 +509,13 @@ class CampaignWorker(LoggerMixin):
         cr: CampaignRecipient,
         provider: object,
         redis_client: object | None = None,
+        counter_deltas: DeliveryCounterDeltas | None = None,
     ) -> None:
-        """Process a single campaign recipient through the state machine."""
+        """Process a single campaign recipient through the state machine.
+
+        Every status change is recorded in *counter_deltas*; the caller
+        flushes it before deriving campaign status.
+        """
         from grins_platform.services.sms.base import BaseSMSProvider  # noqa: PLC0415
         from grins_platform.services.sms.rate_limit_tracker import (  # noqa: PLC0415
             SMSRateLimitTracker,
@@ -487,29 +529,35 @@ class CampaignWorker(LoggerMixin):
 
         assert isinstance(provider, BaseSMSProvider)
 
+        deltas = counter_deltas or DeliveryCounterDeltas()
+
+        def _set_status(state: RecipientState) -> None:
+            deltas.record(cr.campaign_id, cr.delivery_status, state.value)
+            cr.delivery_status = state.value
+
         # Resolve the actual person (customer or lead)
         recipient = await self._resolve_recipient(session, cr)
         if recipient is None:
-            cr.delivery_status = RecipientState.failed.value
+            _set_status(RecipientState.failed)
             cr.error_message = "no_customer_or_lead_found"
             return
 
         # State machine: pending -> sending
         _ = transition(RecipientState(cr.delivery_status), RecipientState.sending)
-        cr.delivery_status = RecipientState.sending.value
+        _set_status(RecipientState.sending)
         cr.sending_started_at = datetime.now(timezone.utc)
         await session.flush()
 
         # Load campaign body
         campaign = await session.get(Campaign, cr.campaign_id)
         if campaign is None:
-            cr.delivery_status = RecipientState.failed.value
+            _set_status(RecipientState.failed)
             cr.error_message = "campaign_not_found"
             return
 
         # L11: Consent check handled by SMSService.send_message()
 
-        # Rate limit check (Redis client created once per batch — L10)
+        # Rate limit check against the shared pooled Redis client
         tracker = SMSRateLimitTracker(
             provider=provider.provider_name,
             account_id=os.environ.get("CALLRAIL_ACCOUNT_ID", ""),
@@ -519,7 +567,7 @@ class CampaignWorker(LoggerMixin):
         if not rl_result.allowed:
             # Revert to pending - will be retried next tick
             _ = transition(RecipientState.sending, RecipientState.pending)
-            cr.delivery_status = RecipientState.pending.value
+            _set_status(RecipientState.pending)
             cr.sending_started_at = None
             logger.info(
                 "campaign.worker.rate_limited",
@@ -550,20 +598,20 @@ class CampaignWorker(LoggerMixin):
             )
             if result.get("success"):
                 _ = transition(RecipientState.sending, RecipientState.sent)
-                cr.delivery_status = RecipientState.sent.value
+                _set_status(RecipientState.sent)
                 cr.sent_at = datetime.now(timezone.utc)
             else:
                 _ = transition(RecipientState.sending, RecipientState.failed)
-                cr.delivery_status = RecipientState.failed.value
+                _set_status(RecipientState.failed)
                 cr.error_message = result.get("reason", "send_returned_false")
 
         except (SMSConsentDeniedError, SMSRateLimitDeniedError) as e:
             _ = transition(RecipientState.sending, RecipientState.failed)
-            cr.delivery_status = RecipientState.failed.value
+            _set_status(RecipientState.failed)
             cr.error_message = str(e)
         except SMSError as e:
             _ = transition(RecipientState.sending, RecipientState.failed)
-            cr.delivery_status = RecipientState.failed.value
+            _set_status(RecipientState.failed)
             cr.error_message = str(e)
             logger.exception(
                 "campaign.worker.send_failed",
@@ -572,7 +620,7 @@ class CampaignWorker(LoggerMixin):
             )
         except Exception as e:
             _ = transition(RecipientState.sending, RecipientState.failed)
-            cr.delivery_status = RecipientState.failed.value
+            _set_status(RecipientState.failed)
             cr.error_message = str(e)
             logger.exception(
                 "campaign.worker.unexpected_error",
@@ -580,10 +628,10 @@ class CampaignWorker(LoggerMixin):
             )
         finally:
             # Persist the recipient's terminal state before the tick's
-            # aggregate COUNT in _update_campaign_status runs. The session
+            # counter flush and _update_campaign_status run. The session
             # is created with autoflush=False, so without this explicit
-            # flush the COUNT would read the stale "sending" row and the
-            # campaign would be left stuck in SENDING forever.
+            # flush the recipient row would lag behind its counters and a
+            # later reconciliation would undo the transition.
             await session.flush()
 
     async def _resolve_recipient(
@@ -607,7 +655,7 @@ class CampaignWorker(LoggerMixin):
         session: AsyncSession,
         campaign_id: object,
     ) -> None:
-        """Derive campaign status from aggregate recipient states."""
+        """Derive campaign status from the campaign's delivery counters."""
         from uuid import UUID  # noqa: PLC0415
 
         cid = campaign_id if isinstance(campaign_id, UUID) else UUID(str(campaign_id))
@@ -617,29 +665,28 @@ class CampaignWorker(LoggerMixin):
         if campaign is not None and campaign.status == CampaignStatus.CANCELLED.value:
             return
 
-        # Count recipients by status
-        count_stmt = (
-            select(
-                CampaignRecipient.delivery_status,
-                func.count().label("cnt"),
-            )
-            .where(CampaignRecipient.campaign_id == cid)
-            .group_by(CampaignRecipient.delivery_status)
-        )
+        # O(1) read of the counters maintained alongside each transition
+        count_stmt = select(
+            CampaignDeliveryCounter.pending,
+            CampaignDeliveryCounter.sending,
+            CampaignDeliveryCounter.sent,
+            CampaignDeliveryCounter.failed,
+            CampaignDeliveryCounter.cancelled,
+        ).where(CampaignDeliveryCounter.campaign_id == cid)
         result = await session.execute(count_stmt)
-        counts: dict[str, int] = {row[0]: row[1] for row in result.all()}
+        counts = result.one_or_none()
+        if counts is None:
+            # No counter row yet — the reconciliation job will create it
+            # and finalize_stale_campaigns picks the campaign up afterwards.
+            return
 
-        pending = counts.get(RecipientState.pending.value, 0)
-        sending = counts.get(RecipientState.sending.value, 0)
+        pending, sending, sent, failed, cancelled = counts
 
         # If any are still pending or sending, campaign is still sending
         if pending > 0 or sending > 0:
             return
 
         # All terminal — determine final status
-        sent = counts.get(RecipientState.sent.value, 0)
-        failed = counts.get(RecipientState.failed.value, 0)
-        cancelled = counts.get(RecipientState.cancelled.value, 0)
         total = sent + failed + cancelled
 
         if total == 0:
@@ -672,16 +719,11 @@ class CampaignWorker(LoggerMixin):
         orphans_recovered: int,
     ) -> None:
         """Record worker tick metadata in Redis for health endpoint."""
-        redis_url = os.environ.get("REDIS_URL")
-        if not redis_url:
+        redis = get_redis_manager().client
+        if redis is None:
             return
         try:
-            from redis.asyncio import Redis  # noqa: PLC0415
-
-            redis = Redis.from_url(redis_url, decode_responses=True)
             tick_ms = int((_time_mod.monotonic() - tick_start) * 1000)
-            import json  # noqa: PLC0415
-
             payload = json.dumps(
                 {
                     "last_tick_at": datetime.now(timezone.utc).isoformat(),
@@ -691,7 +733,6 @@ class CampaignWorker(LoggerMixin):
                 },
             )
             await redis.set(_REDIS_WORKER_KEY, payload, ex=300)
-            await redis.aclose()
         except Exception:
             logger.debug("campaign.worker.redis_tick_failed")
 
@@ -706,14 +747,89 @@ _campaign_worker = CampaignWorker()
 
 
 async def run_duplicate_detection_sweep_job() -> None:
-    """Entry point for the nightly duplicate detection sweep.
+    """Entry point for the nightly duplicate detection reconciliation.
+
+    Customers are checked on write; this only re-scores customers changed
+    since the previous run (a full sweep the first time).
 
     Validates: CRM Changes Update 2 Req 5.6
     """
     service = DuplicateDetectionService()
     db_manager = get_database_manager()
     async for session in db_manager.get_session():
-        await service.run_nightly_sweep(session)
+        await service.run_reconciliation(session)
+
+
+async def process_outbox_events_job() -> None:
+    """Deliver due outbox events (lead confirmations, invoice follow-ups)."""
+    processor = OutboxProcessor()
+    db_manager = get_database_manager()
+    async for session in db_manager.get_session():
+        await processor.process_due(session)
+
+
+async def process_invoice_notifications_job() -> None:
+    """Send pending invoice mass-notification items."""
+    await InvoiceNotificationWorker().run()
+
+
+async def process_receipt_extractions_job() -> None:
+    """Extract pending queued receipts."""
+    await ReceiptExtractionWorker().run()
+
+
+async def send_day_of_reminders_job() -> None:
+    """Send today's appointment reminders (7AM CT)."""
+    db_manager = get_database_manager()
+    async for session in db_manager.get_session():
+        await DayOfReminderEngine(email_service=EmailService()).run(session)
+
+
+async def sync_bank_transactions_job() -> None:
+    """Import bank transactions changed since the last Plaid sync.
+
+    Skipped when no Plaid access token is configured.
+    """
+    if not os.getenv("PLAID_ACCESS_TOKEN"):
+        return
+    db_manager = get_database_manager()
+    async for session in db_manager.get_session():
+        service = AccountingService(ExpenseRepository(session))
+        await service.sync_transactions(session)
+
+
+async def snapshot_agreement_metrics_job() -> None:
+    """Snapshot agreement metrics for closed months that have none yet.
+
+    The first run backfills the trailing history from the status log.
+    """
+    db_manager = get_database_manager()
+    async for session in db_manager.get_session():
+        await MetricsService(session).ensure_snapshots()
+
+
+async def reconcile_campaign_delivery_counters_job() -> None:
+    """Rewrite campaign delivery counters from recipient rows.
+
+    Corrects drift from writes that bypassed the state machine helpers.
+    Only campaigns still sending or whose counters moved since the last
+    run are recounted.
+    """
+    db_manager = get_database_manager()
+    async for session in db_manager.get_session():
+        reconciled = await reconcile_delivery_counters(session)
+        logger.info(
+            "campaign.counters.reconciled",
+            campaigns_reconciled=reconciled,
+        )
+
+
+async def purge_csv_upload_staging_job() -> None:
+    """Delete staged CSV audience uploads past their retention window."""
+    db_manager = get_database_manager()
+    async for session in db_manager.get_session():
+        purged = await purge_staged_uploads(session)
+        logger.info("campaign.csv_staging.purged", rows_purged=purged)
 
 
 async def escalate_failed_payments_job() -> None:
@@ -800,11 +916,36 @@ def register_scheduled_jobs(scheduler: BackgroundScheduler) -> None:
     scheduler.add_job(
         process_pending_campaign_recipients,
         "interval",
-        seconds=60,
+        seconds=_TICK_SECONDS,
         id="process_pending_campaign_recipients",
         replace_existing=True,
     )
 
+    scheduler.add_job(
+        reconcile_campaign_delivery_counters_job,
+        "interval",
+        minutes=15,
+        id="reconcile_campaign_delivery_counters",
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        purge_csv_upload_staging_job,
+        "cron",
+        hour=3,
+        minute=30,
+        id="purge_csv_upload_staging",
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        process_outbox_events_job,
+        "interval",
+        seconds=_OUTBOX_TICK_SECONDS,
+        id="process_outbox_events",
+        replace_existing=True,
+    )
+
     scheduler.add_job(
         run_duplicate_detection_sweep_job,
         "cron",
@@ -814,6 +955,50 @@ def register_scheduled_jobs(scheduler: BackgroundScheduler) -> None:
         replace_existing=True,
     )
 
+    scheduler.add_job(
+        snapshot_agreement_metrics_job,
+        "cron",
+        hour=1,
+        minute=15,
+        id="snapshot_agreement_metrics",
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        process_invoice_notifications_job,
+        "interval",
+        seconds=_INVOICE_NOTIFY_TICK_SECONDS,
+        id="process_invoice_notifications",
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        process_receipt_extractions_job,
+        "interval",
+        seconds=_RECEIPT_EXTRACTION_TICK_SECONDS,
+        id="process_receipt_extractions",
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        sync_bank_transactions_job,
+        "cron",
+        hour=5,
+        minute=0,
+        id="sync_bank_transactions",
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        send_day_of_reminders_job,
+        "cron",
+        hour=7,
+        minute=0,
+        timezone=_CT_TZ,
+        id="send_day_of_reminders",
+        replace_existing=True,
+    )
+
     logger.info(
         "scheduler.jobs.registered",
         jobs=[
@@ -823,6 +1008,14 @@ def register_scheduled_jobs(scheduler: BackgroundScheduler) -> None:
             "cleanup_orphaned_consent_records",
             "remind_incomplete_onboarding",
             "process_pending_campaign_recipients",
+            "reconcile_campaign_delivery_counters",
+            "purge_csv_upload_staging",
             "duplicate_detection_sweep",
+            "process_outbox_events",
+            "snapshot_agreement_metrics",
+            "process_invoice_notifications",
+            "sync_bank_transactions",
+            "process_receipt_extractions",
+            "send_day_of_reminders",
         ],
     )
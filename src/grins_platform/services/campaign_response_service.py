@@ -258,26 +258,10 @@ class CampaignResponseService(LoggerMixin):
 
         # No campaign found → orphan
         if corr.campaign is None:
-            self.logger.info(
-                "campaign.response.orphan",
-                phone_masked=_mask_phone(inbound.from_phone),
-                thread_id=inbound.thread_id,
-            )
-            row = await self.repo.add(
-                CampaignResponse(
-                    campaign_id=None,
-                    sent_message_id=(
-                        corr.sent_message.id if corr.sent_message else None
-                    ),
-                    phone=inbound.from_phone,
-                    raw_reply_body=inbound.body,
-                    provider_message_id=inbound.provider_sid,
-                    status=CampaignResponseStatus.ORPHAN,
-                    received_at=now,
-                ),
+            return await self.record_orphan(
+                inbound,
+                sent_message_id=corr.sent_message.id if corr.sent_message else None,
             )
-            self.log_completed("record_poll_reply", status="orphan")
-            return row
 
         campaign = corr.campaign
         sent_msg = corr.sent_message
@@ -374,6 +358,34 @@ class CampaignResponseService(LoggerMixin):
         self.log_completed("record_poll_reply", status=status)
         return row
 
+    async def record_orphan(
+        self,
+        inbound: InboundSMS,
+        sent_message_id: UUID | None = None,
+    ) -> CampaignResponse:
+        """Record a reply that correlates to no campaign.
+
+        Validates: Req 7.4
+        """
+        self.logger.info(
+            "campaign.response.orphan",
+            phone_masked=_mask_phone(inbound.from_phone),
+            thread_id=inbound.thread_id,
+        )
+        row = await self.repo.add(
+            CampaignResponse(
+                campaign_id=None,
+                sent_message_id=sent_message_id,
+                phone=inbound.from_phone,
+                raw_reply_body=inbound.body,
+                provider_message_id=inbound.provider_sid,
+                status=CampaignResponseStatus.ORPHAN,
+                received_at=datetime.now(timezone.utc),
+            ),
+        )
+        self.log_completed("record_poll_reply", status="orphan")
+        return row
+
     async def record_opt_out_as_response(
         self,
         inbound: InboundSMS,
@@ -9,7 +9,10 @@ Validates: CRM Gap Closure Req 45.3, 45.4, 45.5, 45.6, 45.7, 45.8, 45.9, 45.10
 from __future__ import annotations
 
 import dataclasses
+import math
+import os
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -39,6 +42,8 @@ from grins_platform.schemas.campaign import (
 from grins_platform.services.campaign_utils import render_poll_block
 from grins_platform.services.sms.phone_normalizer import normalize_to_e164
 from grins_platform.services.sms.recipient import Recipient
+from grins_platform.services.sms.segment_counter import estimate_segments
+from grins_platform.services.sms.state_machine import adjust_delivery_counters
 from grins_platform.services.sms_service import SMSConsentDeniedError
 
 if TYPE_CHECKING:
@@ -48,6 +53,7 @@ if TYPE_CHECKING:
         CampaignRepository,
     )
     from grins_platform.services.email_service import EmailService
+    from grins_platform.services.sms.rate_limit_tracker import RateLimitState
     from grins_platform.services.sms_service import SMSService
 
 
@@ -58,6 +64,18 @@ _UNSUBSCRIBE_TEXT = "\n\nTo unsubscribe, reply STOP or contact us at the address
 _DEFAULT_ADDRESS = "Grin's Irrigations"
 
 
+def _sms_cost_per_segment() -> Decimal | None:
+    """Return ``SMS_COST_PER_SEGMENT`` in dollars, or None if unset/invalid."""
+    raw = os.environ.get("SMS_COST_PER_SEGMENT", "").strip()
+    if not raw:
+        return None
+    try:
+        cost = Decimal(raw)
+    except InvalidOperation:
+        return None
+    return cost if cost.is_finite() and cost >= 0 else None
+
+
 class CampaignAlreadySentError(Exception):
     """Raised when attempting to send an already-sent campaign."""
 
@@ -560,6 +578,11 @@ class CampaignService(LoggerMixin):
         ]
         self.repo.session.add_all(rows)
         await self.repo.session.flush()
+        await adjust_delivery_counters(
+            self.repo.session,
+            campaign_id,
+            {"pending": len(rows)},
+        )
 
         # Transition to SENDING so background worker picks up
         _ = await self.repo.update(
@@ -1166,10 +1189,13 @@ class CampaignService(LoggerMixin):
         # 3. Ad-hoc CSV source
         # ----------------------------------------------------------
         # Recipients are embedded inline in ``target_audience.ad_hoc.recipients``
-        # by the CSV upload endpoint. Preview reads without creating ghost
-        # leads; send creates ghost leads so each recipient can be tracked
-        # via campaign_recipients.lead_id.
+        # by the CSV upload endpoint, or — for uploads too large to embed —
+        # read from the staged upload named by ``ad_hoc.csv_upload_id``.
+        # Preview reads without creating ghost leads; send creates ghost
+        # leads so each recipient can be tracked via campaign_recipients.lead_id.
         adhoc_rows = self._extract_adhoc_rows(adhoc_filters)
+        if not adhoc_rows:
+            adhoc_rows = await self._load_staged_adhoc_rows(db, adhoc_filters)
         if adhoc_rows:
             from grins_platform.services.sms.ghost_lead import (  # noqa: PLC0415
                 create_or_get as create_ghost,
@@ -1246,6 +1272,31 @@ class CampaignService(LoggerMixin):
         ]
         return rows
 
+    @staticmethod
+    async def _load_staged_adhoc_rows(
+        db: AsyncSession,
+        adhoc_filters: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Load ad-hoc recipient rows from a staged CSV upload.
+
+        Used when the audience references ``ad_hoc.csv_upload_id`` without
+        inline recipients. Returns an empty list when no upload ID is set
+        or it is malformed.
+        """
+        raw_id = adhoc_filters.get("csv_upload_id") if adhoc_filters else None
+        if not raw_id:
+            return []
+        try:
+            upload_id = UUID(str(raw_id))
+        except ValueError:
+            return []
+
+        from grins_platform.services.sms.csv_upload import (  # noqa: PLC0415
+            load_staged_recipients,
+        )
+
+        return await load_staged_recipients(db, upload_id)
+
     async def preview_audience(
         self,
         db: AsyncSession,
@@ -1304,6 +1355,110 @@ class CampaignService(LoggerMixin):
             "matches": matches,
         }
 
+    async def estimate_campaign(
+        self,
+        db: AsyncSession,
+        body: str,
+        target_audience: dict[str, Any],
+        poll_options: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Estimate segments, cost and send duration for a draft SMS campaign.
+
+        Resolves the full audience the same way ``preview_audience`` does,
+        sizes every recipient's rendered message in bulk, and projects
+        duration from the worker's send rate and the cached CallRail limits.
+        """
+        self.log_started("estimate_campaign")
+
+        class _FakeAudience:
+            def __init__(self, ta: dict[str, Any]) -> None:
+                self.target_audience = ta
+
+        recipients = await self._filter_recipients(
+            db,
+            _FakeAudience(target_audience),  # type: ignore[arg-type]
+            create_ghost_leads=False,
+        )
+
+        estimate = estimate_segments(
+            body + render_poll_block(poll_options),
+            (
+                {"first_name": r.first_name, "last_name": r.last_name}
+                for r in recipients
+            ),
+        )
+
+        cost_per_segment = _sms_cost_per_segment()
+        projected_cost = (
+            float(cost_per_segment * estimate.total_segments)
+            if cost_per_segment is not None
+            else None
+        )
+
+        rate_limit = await self._read_sms_rate_limit()
+        from grins_platform.services.background_jobs import (  # noqa: PLC0415
+            campaign_send_capacity,
+        )
+
+        per_hour, window_hours = campaign_send_capacity()
+        if rate_limit.hourly_allowed:
+            per_hour = min(per_hour, rate_limit.hourly_allowed)
+        per_day = per_hour * window_hours
+        if rate_limit.daily_allowed:
+            per_day = min(per_day, rate_limit.daily_allowed)
+
+        messages = estimate.messages
+        send_hours = messages / per_hour if per_hour else None
+        send_days = math.ceil(messages / per_day) if per_day else None
+
+        self.log_completed(
+            "estimate_campaign",
+            recipients=messages,
+            total_segments=estimate.total_segments,
+        )
+        return {
+            **dataclasses.asdict(estimate),
+            "recipients": messages,
+            "cost_per_segment": (
+                float(cost_per_segment) if cost_per_segment is not None else None
+            ),
+            "projected_cost": projected_cost,
+            "sends_per_hour": per_hour,
+            "send_window_hours": window_hours,
+            "estimated_send_hours": send_hours,
+            "estimated_send_days": send_days,
+            "rate_limit": {
+                "hourly_allowed": rate_limit.hourly_allowed,
+                "hourly_used": rate_limit.hourly_used,
+                "hourly_remaining": rate_limit.hourly_remaining,
+                "daily_allowed": rate_limit.daily_allowed,
+                "daily_used": rate_limit.daily_used,
+                "daily_remaining": rate_limit.daily_remaining,
+            },
+        }
+
+    async def _read_sms_rate_limit(self) -> RateLimitState:
+        """Return the cached CallRail rate-limit state (empty when unknown)."""
+        from grins_platform.redis_manager import get_redis_manager  # noqa: PLC0415
+        from grins_platform.services.sms.rate_limit_tracker import (  # noqa: PLC0415
+            RateLimitState,
+            SMSRateLimitTracker,
+        )
+
+        redis_client = get_redis_manager().client
+        if redis_client is None:
+            return RateLimitState()
+        tracker = SMSRateLimitTracker(
+            provider=os.environ.get("SMS_PROVIDER", "callrail"),
+            account_id=os.environ.get("CALLRAIL_ACCOUNT_ID", ""),
+            redis_client=redis_client,
+        )
+        try:
+            return (await tracker.check()).state
+        except Exception as e:
+            self.log_failed("read_sms_rate_limit", error=e)
+            return RateLimitState()
+
     @staticmethod
     def _resolve_channels(
         campaign: Campaign,
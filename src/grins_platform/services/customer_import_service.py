@@ -0,0 +1,449 @@
+"""Bulk customer import from CSV or XLSX.
+
+Rows are read in chunks of ``IMPORT_CHUNK_ROWS``. Each chunk is validated
+in one call against ``CustomerImportRow`` (the same ``CustomerCreate`` and
+``PropertyCreate`` schemas the API uses, so phones are normalized the same
+way), deduplicated within the file by phone and email, checked against
+existing customers with a single set-based query, and written with one
+multi-row insert for customers and one for their properties. Rows that are
+not imported are returned with their row number and reason.
+
+Imported customers skip the per-write fuzzy duplicate check; the nightly
+reconciliation picks them up through their ``updated_at``.
+
+Validates: Requirement 1.2, 1.3, 2.2-2.4
+"""
+
+from __future__ import annotations
+
+import re
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from pydantic import (
+    TypeAdapter,
+    ValidationError as PydanticValidationError,
+)
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from grins_platform.exceptions import ValidationError
+from grins_platform.log_config import LoggerMixin
+from grins_platform.models.customer import Customer
+from grins_platform.models.property import Property
+from grins_platform.schemas.customer_import import (
+    CustomerImportResult,
+    CustomerImportRow,
+    CustomerImportRowError,
+)
+from grins_platform.utils.tabular_import import iter_rows
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from grins_platform.utils.tabular_import import ImportFormat
+
+MAX_IMPORT_FILE_SIZE = 25 * 1024 * 1024
+MAX_IMPORT_ROWS = 20_000
+IMPORT_CHUNK_ROWS = 500
+
+CUSTOMER_COLUMNS = (
+    "first_name",
+    "last_name",
+    "phone",
+    "email",
+    "lead_source",
+    "sms_opt_in",
+    "email_opt_in",
+)
+PROPERTY_COLUMNS = (
+    "address",
+    "city",
+    "state",
+    "zip_code",
+    "zone_count",
+    "system_type",
+    "property_type",
+    "is_hoa",
+    "access_instructions",
+    "gate_code",
+    "has_dogs",
+    "special_notes",
+)
+REQUIRED_COLUMNS = ("first_name", "last_name", "phone")
+
+# Common spreadsheet headings -> schema field
+HEADER_ALIASES = {
+    "first": "first_name",
+    "firstname": "first_name",
+    "last": "last_name",
+    "lastname": "last_name",
+    "surname": "last_name",
+    "phone_number": "phone",
+    "mobile": "phone",
+    "cell": "phone",
+    "cell_phone": "phone",
+    "email_address": "email",
+    "e_mail": "email",
+    "source": "lead_source",
+    "street": "address",
+    "street_address": "address",
+    "address_1": "address",
+    "address1": "address",
+    "zip": "zip_code",
+    "zipcode": "zip_code",
+    "postal_code": "zip_code",
+    "zones": "zone_count",
+    "notes": "special_notes",
+}
+
+# Enum-valued cells are matched case-insensitively
+_LOWERCASE_COLUMNS = frozenset({"lead_source", "system_type", "property_type"})
+_WHITESPACE = re.compile(r"\s+")
+_HEADER_SEPARATORS = re.compile(r"[\s\-.]+")
+
+_ROWS_ADAPTER: TypeAdapter[list[CustomerImportRow]] = TypeAdapter(
+    list[CustomerImportRow],
+)
+
+
+def normalize_header(header: str) -> str:
+    """Map a column heading to its schema field name (or a snake_case key)."""
+    key = _HEADER_SEPARATORS.sub("_", header.strip().lower()).strip("_")
+    return HEADER_ALIASES.get(key, key)
+
+
+def _row_payload(
+    columns: list[str | None],
+    cells: list[str],
+) -> dict[str, Any]:
+    """Build the ``CustomerImportRow`` input for one data row."""
+    values: dict[str, str] = {}
+    for column, cell in zip(columns, cells):
+        if column is None:
+            continue
+        value = _WHITESPACE.sub(" ", cell).strip()
+        if value:
+            values[column] = value.lower() if column in _LOWERCASE_COLUMNS else value
+    payload: dict[str, Any] = {
+        "customer": {c: values[c] for c in CUSTOMER_COLUMNS if c in values},
+    }
+    property_values = {c: values[c] for c in PROPERTY_COLUMNS if c in values}
+    if property_values:
+        payload["property"] = {**property_values, "is_primary": True}
+    return payload
+
+
+def _error_field(loc: tuple[int | str, ...]) -> str | None:
+    names = [part for part in loc if isinstance(part, str)]
+    return names[-1] if names else None
+
+
+class CustomerImportService(LoggerMixin):
+    """Validates and bulk-inserts customers and properties from a file."""
+
+    DOMAIN = "customer"
+
+    async def import_customers(
+        self,
+        db: AsyncSession,
+        data: bytes,
+        import_format: ImportFormat,
+        *,
+        dry_run: bool = False,
+    ) -> CustomerImportResult:
+        """Import customers (and a primary property each) from a file.
+
+        Args:
+            db: Async database session
+            data: Uploaded file content
+            import_format: csv or xlsx
+            dry_run: Validate and deduplicate without writing
+
+        Returns:
+            Counts and the per-row error report
+
+        Raises:
+            ValidationError: If the file itself cannot be imported (too large,
+                unreadable, missing required columns or too many rows)
+        """
+        self.log_started(
+            "import_customers",
+            import_format=import_format,
+            size=len(data),
+            dry_run=dry_run,
+        )
+        if len(data) > MAX_IMPORT_FILE_SIZE:
+            self.log_rejected("import_customers", reason="file_too_large")
+            msg = f"File exceeds {MAX_IMPORT_FILE_SIZE // (1024 * 1024)}MB"
+            raise ValidationError(field="file", message=msg)
+
+        try:
+            rows = iter_rows(data, import_format)
+            header = next(rows, None)
+            if header is None:
+                self.log_rejected("import_customers", reason="empty_file")
+                msg = "File is empty"
+                raise ValidationError(field="file", message=msg)
+            columns = self._map_columns(header[1])
+
+            result = CustomerImportResult(
+                dry_run=dry_run,
+                total_rows=0,
+                imported=0,
+                properties_imported=0,
+                valid=0,
+                duplicates=0,
+                invalid=0,
+            )
+            seen_phones: set[str] = set()
+            seen_emails: set[str] = set()
+            for chunk in self._chunks(rows):
+                result.total_rows += len(chunk)
+                if result.total_rows > MAX_IMPORT_ROWS:
+                    self.log_rejected("import_customers", reason="too_many_rows")
+                    msg = f"File has more than {MAX_IMPORT_ROWS} rows"
+                    raise ValidationError(field="file", message=msg)
+                payloads = [(n, _row_payload(columns, cells)) for n, cells in chunk]
+                valid = self._validate(payloads, result)
+                valid = self._drop_in_file_duplicates(
+                    valid,
+                    seen_phones,
+                    seen_emails,
+                    result,
+                )
+                valid = await self._drop_existing(db, valid, result)
+                result.valid += len(valid)
+                if valid and not dry_run:
+                    await self._insert(db, valid, result)
+        except ValueError as e:
+            # Unreadable CSV/XLSX content from the tabular readers
+            self.log_rejected("import_customers", reason="unreadable_file")
+            raise ValidationError(field="file", message=str(e)) from e
+
+        self.log_completed(
+            "import_customers",
+            total_rows=result.total_rows,
+            imported=result.imported,
+            duplicates=result.duplicates,
+            invalid=result.invalid,
+            dry_run=dry_run,
+        )
+        return result
+
+    def _map_columns(self, header: list[str]) -> list[str | None]:
+        """Schema field for each file column (None for unknown columns)."""
+        known = set(CUSTOMER_COLUMNS) | set(PROPERTY_COLUMNS)
+        columns: list[str | None] = []
+        for heading in header:
+            column = normalize_header(heading)
+            # The first column with a given field wins
+            columns.append(
+                column if column in known and column not in columns else None
+            )
+        missing = [c for c in REQUIRED_COLUMNS if c not in columns]
+        if missing:
+            self.log_rejected("import_customers", reason="missing_columns")
+            msg = f"Missing required columns: {', '.join(missing)}"
+            raise ValidationError(
+                field="file",
+                message=msg,
+                details={"missing_columns": missing},
+            )
+        return columns
+
+    @staticmethod
+    def _chunks(
+        rows: Iterator[tuple[int, list[str]]],
+    ) -> Iterator[list[tuple[int, list[str]]]]:
+        """Non-blank data rows with their 1-based file row number, in chunks."""
+        numbered = (
+            (n, cells) for n, cells in rows if any(cell.strip() for cell in cells)
+        )
+        while chunk := list(islice(numbered, IMPORT_CHUNK_ROWS)):
+            yield chunk
+
+    @staticmethod
+    def _validate(
+        payloads: list[tuple[int, dict[str, Any]]],
+        result: CustomerImportResult,
+    ) -> list[tuple[int, CustomerImportRow]]:
+        """Validate a chunk in one pass; record the first error of each bad row."""
+        try:
+            parsed = _ROWS_ADAPTER.validate_python([p for _, p in payloads])
+        except PydanticValidationError as e:
+            failed: dict[int, CustomerImportRowError] = {}
+            for error in e.errors():
+                index = error["loc"][0]
+                if not isinstance(index, int) or index in failed:
+                    continue
+                failed[index] = CustomerImportRowError(
+                    row_number=payloads[index][0],
+                    status="invalid",
+                    field=_error_field(error["loc"]),
+                    message=error["msg"],
+                )
+            result.invalid += len(failed)
+            result.errors.extend(failed[i] for i in sorted(failed))
+            payloads = [p for i, p in enumerate(payloads) if i not in failed]
+            parsed = _ROWS_ADAPTER.validate_python([p for _, p in payloads])
+        return [(n, row) for (n, _), row in zip(payloads, parsed)]
+
+    @staticmethod
+    def _drop_in_file_duplicates(
+        rows: list[tuple[int, CustomerImportRow]],
+        seen_phones: set[str],
+        seen_emails: set[str],
+        result: CustomerImportResult,
+    ) -> list[tuple[int, CustomerImportRow]]:
+        """Keep the first row for each phone and email in the file."""
+        kept: list[tuple[int, CustomerImportRow]] = []
+        for row_number, row in rows:
+            phone = row.customer.phone
+            email = row.customer.email.lower() if row.customer.email else None
+            if phone in seen_phones or (email is not None and email in seen_emails):
+                result.duplicates += 1
+                result.errors.append(
+                    CustomerImportRowError(
+                        row_number=row_number,
+                        status="duplicate_in_file",
+                        field="phone" if phone in seen_phones else "email",
+                        message="Same phone or email as an earlier row in the file",
+                    ),
+                )
+                continue
+            seen_phones.add(phone)
+            if email is not None:
+                seen_emails.add(email)
+            kept.append((row_number, row))
+        return kept
+
+    @staticmethod
+    async def _drop_existing(
+        db: AsyncSession,
+        rows: list[tuple[int, CustomerImportRow]],
+        result: CustomerImportResult,
+    ) -> list[tuple[int, CustomerImportRow]]:
+        """Drop rows matching an existing customer, with one query per chunk."""
+        if not rows:
+            return rows
+        phones = [row.customer.phone for _, row in rows]
+        emails = [row.customer.email.lower() for _, row in rows if row.customer.email]
+        email_lower = func.lower(Customer.email)
+        condition = Customer.phone.in_(phones)
+        if emails:
+            condition = or_(
+                condition,
+                and_(
+                    email_lower.in_(emails),
+                    Customer.is_deleted == False,  # noqa: E712
+                ),
+            )
+        matches = await db.execute(
+            select(Customer.id, Customer.phone, email_lower).where(condition),
+        )
+        by_phone: dict[str, UUID] = {}
+        by_email: dict[str, UUID] = {}
+        for customer_id, phone, email in matches.all():
+            by_phone[phone] = customer_id
+            if email:
+                by_email.setdefault(email, customer_id)
+
+        kept: list[tuple[int, CustomerImportRow]] = []
+        for row_number, row in rows:
+            email = row.customer.email.lower() if row.customer.email else None
+            existing_id = by_phone.get(row.customer.phone)
+            field = "phone"
+            if existing_id is None and email is not None:
+                existing_id = by_email.get(email)
+                field = "email"
+            if existing_id is None:
+                kept.append((row_number, row))
+                continue
+            result.duplicates += 1
+            result.errors.append(
+                CustomerImportRowError(
+                    row_number=row_number,
+                    status="duplicate",
+                    field=field,
+                    message=f"A customer with this {field} already exists",
+                    existing_customer_id=existing_id,
+                ),
+            )
+        return kept
+
+    @staticmethod
+    async def _insert(
+        db: AsyncSession,
+        rows: list[tuple[int, CustomerImportRow]],
+        result: CustomerImportResult,
+    ) -> None:
+        """Insert a chunk of customers, then their properties, in two statements."""
+        customer_values = [
+            {
+                "first_name": row.customer.first_name,
+                "last_name": row.customer.last_name,
+                "phone": row.customer.phone,
+                "email": row.customer.email,
+                "lead_source": (
+                    row.customer.lead_source.value if row.customer.lead_source else None
+                ),
+                "sms_opt_in": row.customer.sms_opt_in,
+                "email_opt_in": row.customer.email_opt_in,
+            }
+            for _, row in rows
+        ]
+        inserted = await db.execute(
+            pg_insert(Customer)
+            .values(customer_values)
+            .on_conflict_do_nothing(index_elements=[Customer.phone])
+            .returning(Customer.id, Customer.phone),
+        )
+        ids_by_phone: dict[str, UUID] = {phone: cid for cid, phone in inserted.all()}
+        result.imported += len(ids_by_phone)
+
+        property_values: list[dict[str, Any]] = []
+        for row_number, row in rows:
+            customer_id = ids_by_phone.get(row.customer.phone)
+            if customer_id is None:
+                # Created concurrently between the duplicate check and the insert
+                result.valid -= 1
+                result.duplicates += 1
+                result.errors.append(
+                    CustomerImportRowError(
+                        row_number=row_number,
+                        status="duplicate",
+                        field="phone",
+                        message="A customer with this phone already exists",
+                    ),
+                )
+                continue
+            if row.property is None:
+                continue
+            prop = row.property
+            property_values.append(
+                {
+                    "customer_id": customer_id,
+                    "address": prop.address,
+                    "city": prop.city,
+                    "state": prop.state,
+                    "zip_code": prop.zip_code,
+                    "zone_count": prop.zone_count,
+                    "system_type": prop.system_type.value,
+                    "property_type": prop.property_type.value,
+                    "is_primary": True,
+                    "is_hoa": prop.is_hoa,
+                    "access_instructions": prop.access_instructions,
+                    "gate_code": prop.gate_code,
+                    "has_dogs": prop.has_dogs,
+                    "special_notes": prop.special_notes,
+                    "latitude": prop.latitude,
+                    "longitude": prop.longitude,
+                },
+            )
+        if property_values:
+            await db.execute(pg_insert(Property).values(property_values))
+            result.properties_imported += len(property_values)
@@ -8,7 +8,17 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import TextClause, func, select, text, update
+from sqlalchemy import (
+    TextClause,
+    Uuid,
+    column,
+    func,
+    select,
+    table as table_clause,
+    text,
+    update,
+    values,
+)
 
 from grins_platform.exceptions import (
     CustomerNotFoundError,
@@ -20,6 +30,9 @@ from grins_platform.models.customer import Customer
 from grins_platform.models.customer_merge_candidate import CustomerMergeCandidate
 from grins_platform.models.service_agreement import ServiceAgreement
 from grins_platform.schemas.customer_merge import (
+    BatchMergeItem,
+    BatchMergeItemResult,
+    BatchMergeResponse,
     MergeFieldSelection,
     MergePreviewResponse,
 )
@@ -27,6 +40,7 @@ from grins_platform.schemas.customer_merge import (
 if TYPE_CHECKING:
     from uuid import UUID
 
+    from sqlalchemy import TableClause, Update, Values
     from sqlalchemy.ext.asyncio import AsyncSession
 
 # Tables with customer_id FK to reassign during merge
@@ -72,6 +86,28 @@ def _reassign_stmt(
     ).bindparams(to_id=to_id, from_id=from_id)
 
 
+def _customer_fk_table(table_name: str) -> TableClause:
+    """Lightweight clause for a reassigned table's ``customer_id`` column."""
+    return table_clause(table_name, column("customer_id", Uuid))
+
+
+def _batch_reassign_stmt(table_name: str, mapping: Values) -> Update:
+    """Build one UPDATE ... FROM (VALUES ...) moving every duplicate's rows."""
+    target = _customer_fk_table(table_name)
+    return (
+        update(target)
+        .where(target.c.customer_id == mapping.c.duplicate_id)
+        .values(customer_id=mapping.c.survivor_id)
+    )
+
+
+def _survivor(parents: dict[UUID, UUID], customer_id: UUID) -> UUID:
+    """Follow planned merges from *customer_id* to the final survivor."""
+    while customer_id in parents:
+        customer_id = parents[customer_id]
+    return customer_id
+
+
 class CustomerMergeService(LoggerMixin):
     """Merges duplicate customer records with data conservation.
 
@@ -274,6 +310,241 @@ class CustomerMergeService(LoggerMixin):
             duplicate_id=str(duplicate_id),
         )
 
+    async def execute_batch_merge(
+        self,
+        db: AsyncSession,
+        merges: list[BatchMergeItem],
+        *,
+        dry_run: bool = False,
+        admin_id: UUID | None = None,
+    ) -> BatchMergeResponse:
+        """Merge many reviewed candidates at once.
+
+        Chains (A into B, B into C) are resolved so every duplicate's rows
+        move straight to the final survivor, with one
+        ``UPDATE ... FROM (VALUES ...)`` per related table. Items that cannot
+        be merged (resolved candidate, cycle, blocker) are rejected
+        individually; the rest are applied in the caller's transaction.
+        Field selections are applied along each chain, leaves first.
+
+        Validates: Req 6.4, 6.5, 6.6, 6.7, 6.8, 6.9, 6.10, 6.11
+        """
+        self.log_started("execute_batch_merge", count=len(merges), dry_run=dry_run)
+
+        candidate_rows = await db.execute(
+            select(CustomerMergeCandidate).where(
+                CustomerMergeCandidate.id.in_({m.candidate_id for m in merges}),
+            ),
+        )
+        candidates = {c.id: c for c in candidate_rows.scalars().all()}
+        customer_ids = {
+            customer_id
+            for c in candidates.values()
+            for customer_id in (c.customer_a_id, c.customer_b_id)
+        }
+        customer_stmt = (
+            select(Customer)
+            .where(Customer.id.in_(customer_ids), Customer.is_deleted.is_(False))
+            .order_by(Customer.id)
+        )
+        if not dry_run:
+            # Lock in id order so concurrent batches cannot deadlock
+            customer_stmt = customer_stmt.with_for_update()
+        customers = {c.id: c for c in (await db.execute(customer_stmt)).scalars()}
+
+        results = [
+            BatchMergeItemResult(
+                candidate_id=m.candidate_id,
+                primary_id=m.primary_id,
+                status="rejected",
+            )
+            for m in merges
+        ]
+        # duplicate -> primary for every accepted item, and that item's index
+        parents: dict[UUID, UUID] = {}
+        accepted: dict[UUID, int] = {}
+        for index, item in enumerate(merges):
+            result = results[index]
+            candidate = candidates.get(item.candidate_id)
+            if candidate is None or candidate.status != "pending":
+                result.reason = "Candidate not found or already resolved"
+                continue
+            pair = (candidate.customer_a_id, candidate.customer_b_id)
+            if item.primary_id not in pair:
+                result.reason = "primary_id is not part of the candidate pair"
+                continue
+            duplicate_id = pair[1] if item.primary_id == pair[0] else pair[0]
+            result.duplicate_id = duplicate_id
+            if item.primary_id not in customers or duplicate_id not in customers:
+                result.reason = "Customer not found or already merged"
+            elif duplicate_id in parents:
+                result.reason = "Duplicate is already merged by another item"
+            elif _survivor(parents, item.primary_id) == duplicate_id:
+                result.reason = "Merge would create a cycle"
+            else:
+                parents[duplicate_id] = item.primary_id
+                accepted[duplicate_id] = index
+
+        await self._reject_blocked_groups(db, parents, accepted, results)
+
+        survivors = {d: _survivor(parents, d) for d in parents}
+        for duplicate_id, index in accepted.items():
+            results[index].survivor_id = survivors[duplicate_id]
+            results[index].status = "planned" if dry_run else "merged"
+
+        reassigned = (
+            await self._count_batch_related(db, list(parents))
+            if dry_run
+            else await self._apply_batch_merge(
+                db,
+                merges,
+                parents,
+                accepted,
+                survivors,
+                customers,
+                admin_id,
+            )
+        )
+
+        self.log_completed(
+            "execute_batch_merge",
+            merged=len(accepted),
+            rejected=len(merges) - len(accepted),
+            dry_run=dry_run,
+        )
+        return BatchMergeResponse(
+            dry_run=dry_run,
+            merged=len(accepted),
+            rejected=len(merges) - len(accepted),
+            reassigned=reassigned,
+            results=results,
+        )
+
+    async def _apply_batch_merge(
+        self,
+        db: AsyncSession,
+        merges: list[BatchMergeItem],
+        parents: dict[UUID, UUID],
+        accepted: dict[UUID, int],
+        survivors: dict[UUID, UUID],
+        customers: dict[UUID, Customer],
+        admin_id: UUID | None,
+    ) -> dict[str, int]:
+        """Write a planned batch: fields, child rows, soft deletes, audit."""
+        if not parents:
+            return {}
+
+        def depth(customer_id: UUID) -> int:
+            steps = 0
+            while customer_id in parents:
+                customer_id = parents[customer_id]
+                steps += 1
+            return steps
+
+        # Leaves first, so each primary already holds its own merged values
+        for duplicate_id in sorted(parents, key=depth, reverse=True):
+            primary = customers[parents[duplicate_id]]
+            selections = merges[accepted[duplicate_id]].field_selections
+            merged_fields = self._compute_merged_fields(
+                primary,
+                customers[duplicate_id],
+                selections,
+            )
+            for field, value in merged_fields.items():
+                setattr(primary, field, value)
+
+        mapping = values(
+            column("duplicate_id", Uuid),
+            column("survivor_id", Uuid),
+            name="merge_map",
+        ).data(list(survivors.items()))
+        reassigned: dict[str, int] = {}
+        for table_name in _REASSIGN_TABLES:
+            result = await db.execute(_batch_reassign_stmt(table_name, mapping))
+            reassigned[table_name] = result.rowcount  # type: ignore[attr-defined]
+
+        deleted_at = datetime.now()
+        for duplicate_id, survivor_id in survivors.items():
+            duplicate = customers[duplicate_id]
+            duplicate.merged_into_customer_id = survivor_id
+            duplicate.is_deleted = True
+            duplicate.deleted_at = deleted_at
+
+        await db.execute(
+            update(CustomerMergeCandidate)
+            .where(
+                CustomerMergeCandidate.id.in_(
+                    [merges[i].candidate_id for i in accepted.values()],
+                ),
+            )
+            .values(status="merged", resolved_at=func.now(), resolution="merged"),
+        )
+
+        db.add_all(
+            [
+                AuditLog(
+                    actor_id=admin_id,
+                    action="customer_merge",
+                    resource_type="customer",
+                    resource_id=parents[duplicate_id],
+                    details={
+                        "primary_id": str(parents[duplicate_id]),
+                        "duplicate_id": str(duplicate_id),
+                        "survivor_id": str(survivors[duplicate_id]),
+                        "candidate_id": str(merges[index].candidate_id),
+                        "batch": True,
+                        "field_selections": [
+                            {"field": fs.field_name, "source": fs.source}
+                            for fs in merges[index].field_selections
+                        ],
+                    },
+                )
+                for duplicate_id, index in accepted.items()
+            ],
+        )
+
+        await db.flush()
+        return reassigned
+
+    async def _reject_blocked_groups(
+        self,
+        db: AsyncSession,
+        parents: dict[UUID, UUID],
+        accepted: dict[UUID, int],
+        results: list[BatchMergeItemResult],
+    ) -> None:
+        """Reject every merge into a survivor group with two Stripe subscriptions.
+
+        Validates: Req 6.7
+        """
+        if not parents:
+            return
+        members = set(parents) | set(parents.values())
+        subscribed = await db.execute(
+            select(ServiceAgreement.customer_id)
+            .where(
+                ServiceAgreement.customer_id.in_(members),
+                ServiceAgreement.stripe_subscription_id.isnot(None),
+                ServiceAgreement.status.in_(["active", "pending"]),
+            )
+            .distinct(),
+        )
+        groups: dict[UUID, int] = {}
+        for customer_id in subscribed.scalars():
+            root = _survivor(parents, customer_id)
+            groups[root] = groups.get(root, 0) + 1
+        blocked = {root for root, count in groups.items() if count >= 2}
+        if not blocked:
+            return
+        blocked_duplicates = [d for d in parents if _survivor(parents, d) in blocked]
+        for duplicate_id in blocked_duplicates:
+            del parents[duplicate_id]
+            results[accepted.pop(duplicate_id)].reason = (
+                "More than one customer in this merge group has an active "
+                "Stripe subscription. Cancel all but one before merging."
+            )
+        self.log_rejected("execute_batch_merge", reason="stripe_subscriptions")
+
     # -- Private helpers ------------------------------------------------
 
     @staticmethod
@@ -343,3 +614,22 @@ class CustomerMergeService(LoggerMixin):
             counts[key] = result.scalar() or 0
 
         return counts
+
+    @staticmethod
+    async def _count_batch_related(
+        db: AsyncSession,
+        duplicate_ids: list[UUID],
+    ) -> dict[str, int]:
+        """Count rows a batch would reassign, per table."""
+        if not duplicate_ids:
+            return {}
+        counts: dict[str, int] = {}
+        for table_name in _REASSIGN_TABLES:
+            target = _customer_fk_table(table_name)
+            result = await db.execute(
+                select(func.count())
+                .select_from(target)
+                .where(target.c.customer_id.in_(duplicate_ids)),
+            )
+            counts[table_name] = result.scalar() or 0
+        return counts
@@ -11,8 +11,6 @@ CRM Gap Closure: 7.1, 7.2, 7.4, 8.4, 10.1, 10.2, 11.3, 56.1, 56.2, 56.3, 56.5, 5
 
 from __future__ import annotations
 
-import csv
-import io
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -49,18 +47,42 @@ from grins_platform.schemas.customer import (
     normalize_phone,
 )
 from grins_platform.services.stripe_config import StripeSettings
+from grins_platform.utils.tabular_export import encode_rows
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from uuid import UUID
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from grins_platform.repositories.customer_repository import CustomerRepository
+    from grins_platform.services.duplicate_detection_service import (
+        DuplicateDetectionService,
+    )
+    from grins_platform.utils.tabular_export import ExportFormat
 
 
 # Maximum records allowed for bulk operations
 MAX_BULK_RECORDS = 1000
 
+# Column order of customer exports (all formats)
+CUSTOMER_EXPORT_COLUMNS = (
+    "id",
+    "first_name",
+    "last_name",
+    "phone",
+    "email",
+    "status",
+    "is_priority",
+    "is_red_flag",
+    "is_slow_payer",
+    "is_new_customer",
+    "sms_opt_in",
+    "email_opt_in",
+    "lead_source",
+    "created_at",
+)
+
 
 class CustomerService(LoggerMixin):
     """Service for customer management operations.
@@ -70,20 +92,31 @@ class CustomerService(LoggerMixin):
 
     Attributes:
         repository: CustomerRepository for database operations
+        duplicate_detector: Re-scores duplicate candidates on write, if set
 
     Validates: Requirement 1.1-1.6, 8.1-8.4
     """
 
     DOMAIN = "customer"
 
-    def __init__(self, repository: CustomerRepository) -> None:
+    # Fields that feed the duplicate score (Req 5.1)
+    DUPLICATE_SIGNAL_FIELDS = frozenset({"first_name", "last_name", "phone", "email"})
+
+    def __init__(
+        self,
+        repository: CustomerRepository,
+        duplicate_detector: DuplicateDetectionService | None = None,
+    ) -> None:
         """Initialize service with repository.
 
         Args:
             repository: CustomerRepository for database operations
+            duplicate_detector: Optional detector run after creates and
+                edits to name, phone or email
         """
         super().__init__()
         self.repository = repository
+        self.duplicate_detector = duplicate_detector
 
     # =========================================================================
     # Task 5.1: CRUD Operations
@@ -127,6 +160,12 @@ class CustomerService(LoggerMixin):
             email_opt_in=data.email_opt_in,
         )
 
+        if self.duplicate_detector is not None:
+            await self.duplicate_detector.check_customer_on_write(
+                self.repository.session,
+                customer.id,
+            )
+
         self.log_completed("create_customer", customer_id=str(customer.id))
         response: CustomerResponse = CustomerResponse.model_validate(customer)
         return response
@@ -250,6 +289,15 @@ class CustomerService(LoggerMixin):
             self.log_rejected("update_customer", reason="update_failed")
             raise CustomerNotFoundError(customer_id)
 
+        if (
+            self.duplicate_detector is not None
+            and self.DUPLICATE_SIGNAL_FIELDS & update_data.keys()
+        ):
+            await self.duplicate_detector.check_customer_on_write(
+                self.repository.session,
+                customer_id,
+            )
+
         self.log_completed("update_customer", customer_id=str(customer_id))
         response: CustomerResponse = CustomerResponse.model_validate(updated)
         return response
@@ -313,10 +361,20 @@ class CustomerService(LoggerMixin):
             },
         )
 
-        customers, total = await self.repository.list_with_filters(params)
+        next_cursor: str | None = None
+        total: int | None
+        if params.cursor is not None:
+            page = await self.repository.list_keyset(params)
+            customers, total, next_cursor = page.items, page.total, page.next_cursor
+        else:
+            customers, total = await self.repository.list_with_filters(params)
 
         # Calculate total pages
-        total_pages = (total + params.page_size - 1) // params.page_size
+        total_pages = (
+            None
+            if total is None
+            else (total + params.page_size - 1) // params.page_size
+        )
 
         # Convert to response schemas
         customer_responses = [CustomerResponse.model_validate(c) for c in customers]
@@ -334,6 +392,7 @@ class CustomerService(LoggerMixin):
             page=params.page,
             page_size=params.page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
 
     async def lookup_by_phone(
@@ -622,122 +681,67 @@ class CustomerService(LoggerMixin):
             "errors": errors,
         }
 
-    async def export_customers_csv(
+    def export_customers(
         self,
-        city: str | None = None,
-        limit: int = MAX_BULK_RECORDS,
-    ) -> str:
-        """Export customers to CSV format.
+        params: CustomerListParams,
+        *,
+        export_format: ExportFormat = "csv",
+        limit: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream customers matching the list filters as CSV, gzip or XLSX.
+
+        Rows are read through a single server-side cursor and encoded as they
+        arrive, so the whole customer base can be exported without paging or
+        holding it in memory.
 
         Args:
-            city: Optional city filter
-            limit: Maximum records to export (default 1000)
+            params: Same filters and sort as ``list_customers``
+            export_format: ``csv``, ``csv.gz`` or ``xlsx``
+            limit: Optional cap on exported records (default: all)
 
         Returns:
-            CSV string with customer data
-
-        Raises:
-            BulkOperationError: If limit exceeds maximum
+            Async iterator of encoded chunks
 
         Validates: Requirement 12.1-12.2, 12.4, 8.1-8.4
         """
-        self.log_started("export_customers_csv", city=city, limit=limit)
-
-        # Validate limit
-        if limit > MAX_BULK_RECORDS:
-            self.log_rejected(
-                "export_customers_csv",
-                reason="exceeds_limit",
-                limit=limit,
-                max_allowed=MAX_BULK_RECORDS,
-            )
-            msg = f"Export limited to {MAX_BULK_RECORDS} records"
-            raise BulkOperationError(
-                msg,
-                record_count=limit,
-                max_allowed=MAX_BULK_RECORDS,
-            )
-
-        # Collect all customers using pagination (page_size max is 100)
-        all_customers: list[Any] = []
-        page = 1
-        page_size = 100  # Max allowed by CustomerListParams
-
-        while len(all_customers) < limit:
-            params = CustomerListParams(
-                page=page,
-                page_size=min(page_size, limit - len(all_customers)),
-                city=city,
-                sort_by="last_name",
-                sort_order="asc",
-            )
-
-            customers, total = await self.repository.list_with_filters(params)
-
-            if not customers:
-                break
-
-            all_customers.extend(customers)
-            page += 1
-
-            # Stop if we've fetched all available records
-            if len(all_customers) >= total:
-                break
-
-        # Generate CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(
-            [
-                "id",
-                "first_name",
-                "last_name",
-                "phone",
-                "email",
-                "status",
-                "is_priority",
-                "is_red_flag",
-                "is_slow_payer",
-                "is_new_customer",
-                "sms_opt_in",
-                "email_opt_in",
-                "lead_source",
-                "created_at",
-            ],
+        self.log_started(
+            "export_customers",
+            export_format=export_format,
+            limit=limit,
+            city=params.city,
         )
-
-        # Write data rows
-        for customer in all_customers:
-            writer.writerow(
-                [
-                    str(customer.id),
-                    customer.first_name,
-                    customer.last_name,
-                    customer.phone,
-                    customer.email or "",
-                    customer.status,
-                    customer.is_priority,
-                    customer.is_red_flag,
-                    customer.is_slow_payer,
-                    customer.is_new_customer,
-                    customer.sms_opt_in,
-                    customer.email_opt_in,
-                    customer.lead_source or "",
-                    customer.created_at.isoformat() if customer.created_at else "",
-                ],
-            )
-
-        csv_content = output.getvalue()
-        output.close()
-
-        self.log_completed(
-            "export_customers_csv",
-            exported_count=len(all_customers),
+        return encode_rows(
+            export_format,
+            CUSTOMER_EXPORT_COLUMNS,
+            self._export_rows(params, limit),
+            sheet_name="Customers",
         )
 
-        return csv_content
+    async def _export_rows(
+        self,
+        params: CustomerListParams,
+        limit: int | None,
+    ) -> AsyncIterator[list[object]]:
+        count = 0
+        async for customer in self.repository.iter_for_export(params, limit=limit):
+            count += 1
+            yield [
+                str(customer.id),
+                customer.first_name,
+                customer.last_name,
+                customer.phone,
+                customer.email or "",
+                customer.status,
+                customer.is_priority,
+                customer.is_red_flag,
+                customer.is_slow_payer,
+                customer.is_new_customer,
+                customer.sms_opt_in,
+                customer.email_opt_in,
+                customer.lead_source or "",
+                customer.created_at.isoformat() if customer.created_at else "",
+            ]
+        self.log_completed("export_customers", exported_count=count)
 
     # =========================================================================
     # CRM Gap Closure: Duplicate Detection & Merge (Req 7)
@@ -0,0 +1,286 @@
+"""Projection-only evaluation of dashboard alert rules.
+
+Each ``AlertRule`` is a query selecting the matching record ids (and, where
+the alert names a customer, the customer's name) in display order. The
+engine adds a ``count(*) OVER ()`` column and a ``LIMIT``, so a rule costs
+one round trip returning at most ``ALERT_MAX_RECORD_IDS`` narrow rows no
+matter how many records match. Rules run concurrently, each in its own
+pooled session, at most ``ALERT_MAX_CONCURRENCY`` at a time.
+
+Validates: CRM Changes Update 2 Req 3.1, 3.2, 3.4
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import func, select
+
+from grins_platform.log_config import LoggerMixin
+from grins_platform.models.contract_renewal import ContractRenewalProposal
+from grins_platform.models.customer import Customer
+from grins_platform.models.enums import (
+    InvoiceStatus,
+    JobStatus,
+    LeadStatus,
+    ProposalStatus,
+    SalesEntryStatus,
+)
+from grins_platform.models.invoice import Invoice
+from grins_platform.models.job import Job
+from grins_platform.models.job_confirmation import RescheduleRequest
+from grins_platform.models.lead import Lead
+from grins_platform.models.sales import SalesEntry
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+ALERT_MAX_RECORD_IDS = 25
+ALERT_MAX_CONCURRENCY = 3
+LIEN_WARNING_DAYS = 45
+
+_OPEN_INVOICE_STATUSES = (
+    InvoiceStatus.SENT.value,
+    InvoiceStatus.VIEWED.value,
+    InvoiceStatus.PARTIAL.value,
+)
+_OPEN_RESCHEDULE_STATUSES = ("open", "awaiting_alternatives", "awaiting_admin_action")
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    """A dashboard alert condition.
+
+    Attributes:
+        id: Alert identifier (``DashboardAlert.id``)
+        statement: Builds the projection for a given day; the first column
+            is the record id, optionally followed by customer first and last
+            name, ordered so the record to highlight comes first
+        tables: Tables whose writes change the result
+    """
+
+    id: str
+    statement: Callable[[date], Select[Any]]
+    tables: frozenset[str]
+
+
+@dataclass(frozen=True)
+class AlertSnapshot:
+    """What an alert rule matched.
+
+    Attributes:
+        count: Total matching records
+        record_ids: Ids of the first matches, capped
+        customer_name: Customer of the first match, for rules that name one
+    """
+
+    count: int
+    record_ids: list[str] = field(default_factory=list)
+    customer_name: str | None = None
+
+
+def _with_customer(model: Any, *criteria: Any) -> Select[Any]:  # noqa: ANN401
+    return (
+        select(model.id, Customer.first_name, Customer.last_name)
+        .outerjoin(Customer, Customer.id == model.customer_id)
+        .where(*criteria)
+        .order_by(model.created_at, model.id)
+    )
+
+
+def _overdue_invoices(today: date) -> Select[Any]:
+    return (
+        select(Invoice.id)
+        .where(
+            Invoice.due_date < today,
+            Invoice.status.in_(_OPEN_INVOICE_STATUSES),
+        )
+        .order_by(Invoice.due_date, Invoice.id)
+    )
+
+
+def _lien_warnings(today: date) -> Select[Any]:
+    return (
+        select(Invoice.id)
+        .where(
+            Invoice.lien_eligible.is_(True),
+            Invoice.invoice_date <= today - timedelta(days=LIEN_WARNING_DAYS),
+            Invoice.lien_warning_sent.is_(None),
+            Invoice.status.in_(
+                (*_OPEN_INVOICE_STATUSES, InvoiceStatus.OVERDUE.value),
+            ),
+        )
+        .order_by(Invoice.invoice_date, Invoice.id)
+    )
+
+
+def _uncontacted_leads(_today: date) -> Select[Any]:
+    return (
+        select(Lead.id)
+        .where(Lead.status == LeadStatus.NEW.value)
+        .order_by(Lead.created_at, Lead.id)
+    )
+
+
+def _jobs_to_schedule(_today: date) -> Select[Any]:
+    return (
+        select(Job.id)
+        .where(
+            Job.status == JobStatus.TO_BE_SCHEDULED.value,
+            Job.is_deleted == False,  # noqa: E712
+        )
+        .order_by(Job.created_at, Job.id)
+    )
+
+
+def _sales_needing_action(_today: date) -> Select[Any]:
+    return _with_customer(
+        SalesEntry,
+        SalesEntry.status == SalesEntryStatus.SCHEDULE_ESTIMATE.value,
+    )
+
+
+def _reschedule_requests(_today: date) -> Select[Any]:
+    return _with_customer(
+        RescheduleRequest,
+        RescheduleRequest.status.in_(_OPEN_RESCHEDULE_STATUSES),
+    )
+
+
+def _pending_renewals(_today: date) -> Select[Any]:
+    return _with_customer(
+        ContractRenewalProposal,
+        ContractRenewalProposal.status == ProposalStatus.PENDING.value,
+    )
+
+
+def _tables(*models: Any) -> frozenset[str]:
+    return frozenset(model.__tablename__ for model in models)
+
+
+ALERT_RULES: tuple[AlertRule, ...] = (
+    AlertRule("overdue_invoices", _overdue_invoices, _tables(Invoice)),
+    AlertRule("lien_warnings", _lien_warnings, _tables(Invoice)),
+    AlertRule("uncontacted_leads", _uncontacted_leads, _tables(Lead)),
+    AlertRule("jobs_to_schedule", _jobs_to_schedule, _tables(Job)),
+    AlertRule(
+        "sales_needing_action",
+        _sales_needing_action,
+        _tables(SalesEntry, Customer),
+    ),
+    AlertRule(
+        "reschedule_requests",
+        _reschedule_requests,
+        _tables(RescheduleRequest, Customer),
+    ),
+    AlertRule(
+        "pending_renewals",
+        _pending_renewals,
+        _tables(ContractRenewalProposal, Customer),
+    ),
+)
+
+
+async def evaluate_alert_rule(
+    session: AsyncSession,
+    rule: AlertRule,
+    today: date,
+    max_record_ids: int = ALERT_MAX_RECORD_IDS,
+) -> AlertSnapshot:
+    """Run one rule's capped projection.
+
+    Args:
+        session: Database session
+        rule: Rule to evaluate
+        today: Reference date for date-relative rules
+        max_record_ids: Most record ids to return
+
+    Returns:
+        AlertSnapshot with the total count and the first record ids
+    """
+    stmt = (
+        rule.statement(today)
+        .add_columns(func.count().over().label("total"))
+        .limit(max_record_ids)
+    )
+    rows = (await session.execute(stmt)).all()
+    if not rows:
+        return AlertSnapshot(count=0)
+    first = rows[0]
+    customer_name = None
+    if len(first) == 4:
+        customer_name = f"{first[1]} {first[2]}" if first[1] is not None else "Unknown"
+    return AlertSnapshot(
+        count=int(first[-1]),
+        record_ids=[str(row[0]) for row in rows],
+        customer_name=customer_name,
+    )
+
+
+class DashboardAlertEngine(LoggerMixin):
+    """Evaluates alert rules concurrently across pooled sessions."""
+
+    DOMAIN = "dashboard"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        rules: Sequence[AlertRule] = ALERT_RULES,
+        *,
+        max_record_ids: int = ALERT_MAX_RECORD_IDS,
+        max_concurrency: int = ALERT_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            session_factory: Opens a session per rule (defaults to the
+                application's session factory)
+            rules: Rules to evaluate
+            max_record_ids: Most record ids kept per alert
+            max_concurrency: Most rules running at once
+        """
+        super().__init__()
+        self._session_factory = session_factory
+        self.rules = tuple(rules)
+        self.tables: frozenset[str] = frozenset().union(
+            *(rule.tables for rule in self.rules),
+        )
+        self.max_record_ids = max_record_ids
+        self.max_concurrency = max_concurrency
+
+    async def evaluate(self) -> dict[str, AlertSnapshot]:
+        """Evaluate every rule.
+
+        Returns:
+            Mapping of rule id to what it matched
+        """
+        self.log_started("evaluate", rules=len(self.rules))
+        factory = self._session_factory
+        if factory is None:
+            from grins_platform.database import get_database_manager  # noqa: PLC0415
+
+            factory = get_database_manager().session_factory
+        today = date.today()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(rule: AlertRule) -> tuple[str, AlertSnapshot]:
+            async with semaphore, factory() as session:
+                snapshot = await evaluate_alert_rule(
+                    session,
+                    rule,
+                    today,
+                    self.max_record_ids,
+                )
+            return rule.id, snapshot
+
+        snapshots = dict(await asyncio.gather(*(run(rule) for rule in self.rules)))
+        self.log_completed(
+            "evaluate",
+            matched=sum(1 for s in snapshots.values() if s.count),
+        )
+        return snapshots
@@ -0,0 +1,223 @@
+"""Single-round-trip dashboard aggregates behind a process-wide TTL cache.
+
+``overview_counts_statement`` folds the overview counters (customers, jobs by
+status, today's appointments, staff, leads) into one statement of single-row
+aggregate CTEs. ``dashboard_metrics_cache`` holds computed dashboard payloads
+for ``DASHBOARD_CACHE_TTL_SECONDS`` and collapses concurrent misses for the
+same key into one load.
+
+Each entry names the tables it was computed from, and a committed write to
+one of them evicts it. The hooks listen on every ORM session: flushed
+objects and bulk ``insert``/``update``/``delete`` statements record their
+table on the session, and ``after_commit`` invalidates entries depending on
+those tables. Other processes see the change within the TTL.
+
+Validates: Admin Dashboard Requirement 1.6
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable, Set
+from datetime import date, datetime, timezone
+from itertools import chain
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from grins_platform.models.appointment import Appointment
+from grins_platform.models.customer import Customer
+from grins_platform.models.enums import JobStatus, LeadStatus
+from grins_platform.models.job import Job
+from grins_platform.models.lead import Lead
+from grins_platform.models.staff import Staff
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+    from sqlalchemy.orm import ORMExecuteState, UOWTransaction
+
+T = TypeVar("T")
+
+DASHBOARD_CACHE_TTL_SECONDS = 30.0
+OVERVIEW_TABLES = frozenset(
+    {
+        Customer.__tablename__,
+        Job.__tablename__,
+        Appointment.__tablename__,
+        Staff.__tablename__,
+        Lead.__tablename__,
+    },
+)
+REQUEST_VOLUME_TABLES = frozenset({Job.__tablename__})
+TODAY_SCHEDULE_TABLES = frozenset({Appointment.__tablename__})
+_DIRTY_KEY = "dashboard_metrics_dirty_tables"
+
+
+class DashboardMetricsCache:
+    """In-process TTL cache for dashboard payloads.
+
+    A value loaded while any invalidation happened is returned to its
+    caller but not stored, so a commit racing a load cannot pin stale
+    numbers for a full TTL.
+    """
+
+    def __init__(self, ttl_seconds: float = DASHBOARD_CACHE_TTL_SECONDS) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: How long a loaded value is served
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[float, Any, Set[str]]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._generation = 0
+
+    def _fresh(self, key: str) -> tuple[bool, Any]:
+        hit = self._entries.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return True, hit[1]
+        return False, None
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        depends_on: Set[str],
+    ) -> T:
+        """Return the cached value for *key*, loading it on a miss.
+
+        Args:
+            key: Cache key (include any date the value depends on)
+            loader: Coroutine factory computing the value
+            depends_on: Tables whose committed writes evict the value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        found, value = self._fresh(key)
+        if found:
+            return value  # type: ignore[no-any-return]
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            found, value = self._fresh(key)
+            if found:
+                return value  # type: ignore[no-any-return]
+            generation = self._generation
+            loaded = await loader()
+            if generation == self._generation:
+                expires = time.monotonic() + self.ttl_seconds
+                self._entries[key] = (expires, loaded, depends_on)
+            return loaded
+
+    def invalidate(self, tables: Iterable[str] | None = None) -> None:
+        """Drop cached values depending on *tables* (all when omitted)."""
+        self._generation += 1
+        if tables is None:
+            self._entries.clear()
+            return
+        written = set(tables)
+        for key in [k for k, entry in self._entries.items() if entry[2] & written]:
+            del self._entries[key]
+
+
+dashboard_metrics_cache = DashboardMetricsCache()
+
+
+def invalidate_dashboard_metrics(tables: Iterable[str] | None = None) -> None:
+    """Drop cached dashboard values depending on *tables* in this process."""
+    dashboard_metrics_cache.invalidate(tables)
+
+
+def overview_counts_statement(today: date) -> Select[Any]:
+    """Build the one-row overview aggregate.
+
+    Columns: ``total_customers``, ``today_appointments``, ``total_staff``,
+    ``available_staff``, ``new_leads_today``, ``uncontacted_leads`` and one
+    column per ``JobStatus`` value.
+
+    Args:
+        today: Date for the appointment and new-lead counters
+
+    Returns:
+        SELECT over single-row aggregate CTEs
+    """
+    today_start = datetime.combine(today, datetime.min.time(), tzinfo=timezone.utc)
+    customers = (
+        select(func.count().label("total_customers"))
+        .select_from(Customer)
+        .where(Customer.is_deleted == False)  # noqa: E712
+        .cte("customer_counts")
+    )
+    jobs = (
+        select(
+            *(
+                func.count().filter(Job.status == status.value).label(status.value)
+                for status in JobStatus
+            ),
+        )
+        .where(Job.is_deleted == False)  # noqa: E712
+        .cte("job_counts")
+    )
+    appointments = (
+        select(func.count().label("today_appointments"))
+        .where(Appointment.scheduled_date == today)
+        .cte("appointment_counts")
+    )
+    staff = (
+        select(
+            func.count().label("total_staff"),
+            func.count().filter(Staff.is_available == True).label("available_staff"),  # noqa: E712
+        )
+        .where(Staff.is_active == True)  # noqa: E712
+        .cte("staff_counts")
+    )
+    leads = (
+        select(
+            func.count()
+            .filter(Lead.created_at >= today_start)
+            .label("new_leads_today"),
+            func.count().label("uncontacted_leads"),
+        )
+        .where(Lead.status == LeadStatus.NEW.value)
+        .cte("lead_counts")
+    )
+    return select(customers, appointments, staff, leads, jobs)
+
+
+def _record_written(session: Session, tables: Iterable[str | None]) -> None:
+    names = {name for name in tables if name}
+    if names:
+        session.info.setdefault(_DIRTY_KEY, set()).update(names)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, _flush_context: UOWTransaction) -> None:
+    _record_written(
+        session,
+        (
+            getattr(obj, "__tablename__", None)
+            for obj in chain(session.new, session.dirty, session.deleted)
+        ),
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_bulk_write(state: ORMExecuteState) -> None:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    table = getattr(state.statement, "table", None)
+    _record_written(state.session, [getattr(table, "name", None)])
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    written = session.info.pop(_DIRTY_KEY, None)
+    if written:
+        invalidate_dashboard_metrics(written)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_on_rollback(session: Session) -> None:
+    session.info.pop(_DIRTY_KEY, None)
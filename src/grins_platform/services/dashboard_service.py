@@ -11,7 +11,7 @@ Validates: Admin Dashboard Requirements 1.6
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 from grins_platform.log_config import LoggerMixin
 from grins_platform.models.enums import AppointmentStatus, JobStatus
@@ -25,8 +25,20 @@ from grins_platform.schemas.dashboard import (
     ScheduleOverview,
     TodayScheduleResponse,
 )
+from grins_platform.services.dashboard_alerts import (
+    AlertSnapshot,
+    DashboardAlertEngine,
+)
+from grins_platform.services.dashboard_metrics import (
+    OVERVIEW_TABLES,
+    REQUEST_VOLUME_TABLES,
+    TODAY_SCHEDULE_TABLES,
+    overview_counts_statement,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Set
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from grins_platform.repositories.appointment_repository import (
@@ -37,6 +49,9 @@ if TYPE_CHECKING:
     from grins_platform.repositories.job_repository import JobRepository
     from grins_platform.repositories.lead_repository import LeadRepository
     from grins_platform.repositories.staff_repository import StaffRepository
+    from grins_platform.services.dashboard_metrics import DashboardMetricsCache
+
+T = TypeVar("T")
 
 
 class DashboardService(LoggerMixin):
@@ -66,6 +81,9 @@ class DashboardService(LoggerMixin):
         lead_repository: LeadRepository | None = None,
         invoice_repository: InvoiceRepository | None = None,
         session: AsyncSession | None = None,
+        *,
+        metrics_cache: DashboardMetricsCache | None = None,
+        alert_engine: DashboardAlertEngine | None = None,
     ) -> None:
         """Initialize service with repositories.
 
@@ -77,6 +95,8 @@ class DashboardService(LoggerMixin):
             lead_repository: LeadRepository for lead data (optional)
             invoice_repository: InvoiceRepository for invoice data (optional)
             session: Database session for direct queries (optional)
+            metrics_cache: Shared cache for computed metrics (optional)
+            alert_engine: Evaluates alert rules (defaults to every rule)
         """
         super().__init__()
         self.customer_repository = customer_repository
@@ -86,10 +106,26 @@ class DashboardService(LoggerMixin):
         self.lead_repository = lead_repository
         self.invoice_repository = invoice_repository
         self._session = session
+        self.metrics_cache = metrics_cache
+        self.alert_engine = alert_engine or DashboardAlertEngine()
+
+    async def _cached(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        depends_on: Set[str],
+    ) -> T:
+        """Serve *key* from the metrics cache when one is configured."""
+        if self.metrics_cache is None:
+            return await loader()
+        return await self.metrics_cache.get_or_load(key, loader, depends_on)
 
     async def get_overview_metrics(self) -> DashboardMetrics:
         """Get overall dashboard metrics.
 
+        With a session the counters come from one aggregate statement;
+        otherwise each repository is asked in turn.
+
         Returns:
             DashboardMetrics with customer counts, job status, appointments, staff
 
@@ -97,12 +133,59 @@ class DashboardService(LoggerMixin):
         """
         self.log_started("get_overview_metrics")
 
+        today = date.today()
+        metrics = await self._cached(
+            f"overview:{today.isoformat()}",
+            self._load_overview_metrics,
+            OVERVIEW_TABLES,
+        )
+
+        self.log_completed(
+            "get_overview_metrics",
+            total_customers=metrics.total_customers,
+            today_appointments=metrics.today_appointments,
+        )
+        return metrics
+
+    async def _load_overview_metrics(self) -> DashboardMetrics:
+        """Compute overview metrics in a single round trip when possible."""
+        if self._session is None:
+            return await self._load_overview_metrics_from_repositories()
+
+        row = (
+            (await self._session.execute(overview_counts_statement(date.today())))
+            .mappings()
+            .one()
+        )
+        new_leads_today = 0
+        uncontacted_leads = 0
+        if self.lead_repository is not None:
+            new_leads_today = row["new_leads_today"]
+            uncontacted_leads = row["uncontacted_leads"]
+        return DashboardMetrics(
+            total_customers=row["total_customers"],
+            # For now, active = not deleted (mirrors CustomerRepository)
+            active_customers=row["total_customers"],
+            jobs_by_status={
+                status.value: row[status.value]
+                for status in JobStatus
+                if row[status.value]
+            },
+            today_appointments=row["today_appointments"],
+            available_staff=row["available_staff"],
+            total_staff=row["total_staff"],
+            new_leads_today=new_leads_today,
+            uncontacted_leads=uncontacted_leads,
+        )
+
+    async def _load_overview_metrics_from_repositories(self) -> DashboardMetrics:
+        """Compute overview metrics with one repository call per counter."""
         # Get customer counts
         total_customers = await self.customer_repository.count_all()
         active_customers = await self.customer_repository.count_active()
 
         # Get jobs by status
-        jobs_by_status = await self._get_jobs_by_status_dict()
+        jobs_by_status = await self.job_repository.count_by_status()
 
         # Get today's appointments count
         today = date.today()
@@ -119,7 +202,7 @@ class DashboardService(LoggerMixin):
             new_leads_today = await self.lead_repository.count_new_today()
             uncontacted_leads = await self.lead_repository.count_uncontacted()
 
-        metrics = DashboardMetrics(
+        return DashboardMetrics(
             total_customers=total_customers,
             active_customers=active_customers,
             jobs_by_status=jobs_by_status,
@@ -130,13 +213,6 @@ class DashboardService(LoggerMixin):
             uncontacted_leads=uncontacted_leads,
         )
 
-        self.log_completed(
-            "get_overview_metrics",
-            total_customers=total_customers,
-            today_appointments=today_appointments,
-        )
-        return metrics
-
     async def get_request_volume(
         self,
         period_days: int = 30,
@@ -153,6 +229,21 @@ class DashboardService(LoggerMixin):
         """
         self.log_started("get_request_volume", period_days=period_days)
 
+        metrics = await self._cached(
+            f"request_volume:{period_days}:{date.today().isoformat()}",
+            lambda: self._load_request_volume(period_days),
+            REQUEST_VOLUME_TABLES,
+        )
+
+        self.log_completed(
+            "get_request_volume",
+            total_requests=metrics.total_requests,
+            average_daily=metrics.average_daily_requests,
+        )
+        return metrics
+
+    async def _load_request_volume(self, period_days: int) -> RequestVolumeMetrics:
+        """Compute request volume metrics for the last *period_days* days."""
         period_end = date.today()
         period_start = period_end - timedelta(days=period_days)
 
@@ -182,7 +273,7 @@ class DashboardService(LoggerMixin):
         total_requests = sum(requests_by_day.values())
         average_daily = total_requests / period_days if period_days > 0 else 0.0
 
-        metrics = RequestVolumeMetrics(
+        return RequestVolumeMetrics(
             period_start=period_start,
             period_end=period_end,
             total_requests=total_requests,
@@ -192,13 +283,6 @@ class DashboardService(LoggerMixin):
             average_daily_requests=round(average_daily, 2),
         )
 
-        self.log_completed(
-            "get_request_volume",
-            total_requests=total_requests,
-            average_daily=average_daily,
-        )
-        return metrics
-
     async def get_schedule_overview(
         self,
         schedule_date: date | None = None,
@@ -303,7 +387,16 @@ class DashboardService(LoggerMixin):
         """
         self.log_started("get_jobs_by_status")
 
-        jobs_dict = await self._get_jobs_by_status_dict()
+        # With a session, reuse the (cached) overview aggregate
+        if self._session is None:
+            jobs_dict = await self._get_jobs_by_status_dict()
+        else:
+            overview = await self._cached(
+                f"overview:{date.today().isoformat()}",
+                self._load_overview_metrics,
+                OVERVIEW_TABLES,
+            )
+            jobs_dict = overview.jobs_by_status
 
         response = JobsByStatusResponse(
             to_be_scheduled=jobs_dict.get(JobStatus.TO_BE_SCHEDULED.value, 0),
@@ -325,6 +418,22 @@ class DashboardService(LoggerMixin):
         """
         self.log_started("get_today_schedule")
 
+        response = await self._cached(
+            f"today_schedule:{date.today().isoformat()}",
+            self._load_today_schedule,
+            TODAY_SCHEDULE_TABLES,
+        )
+
+        self.log_completed(
+            "get_today_schedule",
+            total=response.total_appointments,
+            completed=response.completed_appointments,
+            upcoming=response.upcoming_appointments,
+        )
+        return response
+
+    async def _load_today_schedule(self) -> TodayScheduleResponse:
+        """Count today's appointments by status."""
         today = date.today()
         appointments = await self.appointment_repository.get_daily_schedule(today)
 
@@ -345,7 +454,7 @@ class DashboardService(LoggerMixin):
                 # scheduled, confirmed count as upcoming
                 upcoming += 1
 
-        response = TodayScheduleResponse(
+        return TodayScheduleResponse(
             schedule_date=today,
             total_appointments=len(appointments),
             completed_appointments=completed,
@@ -354,14 +463,6 @@ class DashboardService(LoggerMixin):
             cancelled_appointments=cancelled,
         )
 
-        self.log_completed(
-            "get_today_schedule",
-            total=len(appointments),
-            completed=completed,
-            upcoming=upcoming,
-        )
-        return response
-
     async def _get_jobs_by_status_dict(self) -> dict[str, int]:
         """Get jobs count by status as a dictionary.
 
@@ -374,7 +475,10 @@ class DashboardService(LoggerMixin):
         """Get active dashboard alerts with navigation target URLs.
 
         Aggregates alerts from overdue invoices, lien deadlines,
-        uncontacted leads, and jobs needing scheduling.
+        uncontacted leads, jobs needing scheduling, sales entries awaiting
+        an estimate, open reschedule requests and pending contract renewals.
+        Each rule is a capped projection query (see ``dashboard_alerts``);
+        results are served from the metrics cache when one is configured.
 
         Single-record alerts link to the detail page.
         Multi-record alerts link to filtered list with ?highlight=<id>.
@@ -385,226 +489,18 @@ class DashboardService(LoggerMixin):
         Validates: CRM Changes Update 2 Req 3.1, 3.2, 3.4
         """
         self.log_started("get_alerts")
-        now = datetime.now(tz=timezone.utc)
-        alerts: list[DashboardAlert] = []
 
-        def _plural(n: int, word: str) -> str:
-            return f"{n} {word}{'s' if n != 1 else ''}"
-
-        # Overdue invoices alert
-        if self.invoice_repository is not None:
-            overdue = await self.invoice_repository.find_overdue()
-            if overdue:
-                ids = [str(inv.id) for inv in overdue]
-                if len(overdue) == 1:
-                    target_url = f"/invoices/{ids[0]}"
-                else:
-                    target_url = f"/invoices?status=overdue&highlight={ids[0]}"
-                desc = f"{_plural(len(overdue), 'invoice')} past due"
-                alerts.append(
-                    DashboardAlert(
-                        id="overdue_invoices",
-                        title="Overdue Invoices",
-                        description=desc,
-                        severity="critical",
-                        count=len(overdue),
-                        target_url=target_url,
-                        record_ids=ids,
-                        created_at=now,
-                    ),
-                )
-
-            # Lien warning alerts
-            lien_warning = await self.invoice_repository.find_lien_warning_due()
-            if lien_warning:
-                ids = [str(inv.id) for inv in lien_warning]
-                if len(lien_warning) == 1:
-                    target_url = f"/invoices/{ids[0]}"
-                else:
-                    target_url = f"/invoices?lien_warning=true&highlight={ids[0]}"
-                n = len(lien_warning)
-                desc = f"{_plural(n, 'invoice')} approaching 45-day lien deadline"
-                alerts.append(
-                    DashboardAlert(
-                        id="lien_warnings",
-                        title="Lien Warning Due",
-                        description=desc,
-                        severity="critical",
-                        count=n,
-                        target_url=target_url,
-                        record_ids=ids,
-                        created_at=now,
-                    ),
-                )
-
-        # Uncontacted leads alert
-        if self.lead_repository is not None:
-            uncontacted_count = await self.lead_repository.count_uncontacted()
-            if uncontacted_count > 0:
-                desc = f"{_plural(uncontacted_count, 'lead')} awaiting contact"
-                alerts.append(
-                    DashboardAlert(
-                        id="uncontacted_leads",
-                        title="Uncontacted Leads",
-                        description=desc,
-                        severity="warning",
-                        count=uncontacted_count,
-                        target_url="/leads?status=new",
-                        record_ids=[],
-                        created_at=now,
-                    ),
-                )
-
-        # Jobs needing scheduling alert
-        jobs_by_status = await self._get_jobs_by_status_dict()
-        to_schedule = jobs_by_status.get(
-            JobStatus.TO_BE_SCHEDULED.value,
-            0,
+        snapshots = await self._cached(
+            f"alerts:{date.today().isoformat()}",
+            self.alert_engine.evaluate,
+            self.alert_engine.tables,
         )
-        if to_schedule > 0:
-            desc = f"{_plural(to_schedule, 'job')} awaiting scheduling"
-            sev = "warning" if to_schedule <= 5 else "critical"
-            alerts.append(
-                DashboardAlert(
-                    id="jobs_to_schedule",
-                    title="Jobs To Be Scheduled",
-                    description=desc,
-                    severity=sev,
-                    count=to_schedule,
-                    target_url="/jobs?status=to_be_scheduled",
-                    record_ids=[],
-                    created_at=now,
-                ),
-            )
-
-        # Sales pipeline alerts — entries needing attention (Req 3.1, 3.2)
-        if self._session is not None:
-            from sqlalchemy import select  # noqa: PLC0415
-
-            from grins_platform.models.enums import SalesEntryStatus  # noqa: PLC0415
-            from grins_platform.models.sales import SalesEntry  # noqa: PLC0415
-
-            # New sales entries at "schedule_estimate" that need action
-            sales_stmt = select(SalesEntry).where(
-                SalesEntry.status == SalesEntryStatus.SCHEDULE_ESTIMATE.value,
-            )
-            sales_result = await self._session.execute(sales_stmt)
-            new_sales = list(sales_result.scalars().all())
-            if new_sales:
-                ids = [str(s.id) for s in new_sales]
-                if len(new_sales) == 1:
-                    entry = new_sales[0]
-                    cust = entry.customer
-                    name = (
-                        f"{cust.first_name} {cust.last_name}" if cust else "Unknown"
-                    )
-                    desc = f"New sales entry needs estimate scheduling: {name}"
-                    target_url = f"/sales/{ids[0]}"
-                else:
-                    n = len(new_sales)
-                    desc = (
-                        f"{n} sales entries awaiting estimate scheduling"
-                    )
-                    target_url = (
-                        f"/sales?status=schedule_estimate&highlight={ids[0]}"
-                    )
-                alerts.append(
-                    DashboardAlert(
-                        id="sales_needing_action",
-                        title="Sales Pipeline — Action Needed",
-                        description=desc,
-                        severity="info",
-                        count=len(new_sales),
-                        target_url=target_url,
-                        record_ids=ids,
-                        created_at=now,
-                    ),
-                )
-
-        # Reschedule request alerts — customers requesting reschedule (Req 3.1, 3.2)
-        if self._session is not None:
-            from grins_platform.models.job_confirmation import (  # noqa: PLC0415
-                RescheduleRequest,
-            )
-
-            resched_stmt = select(RescheduleRequest).where(
-                RescheduleRequest.status.in_(
-                    ["open", "awaiting_alternatives", "awaiting_admin_action"]
-                ),
-            )
-            resched_result = await self._session.execute(resched_stmt)
-            open_reschedules = list(resched_result.scalars().all())
-            if open_reschedules:
-                ids = [str(r.id) for r in open_reschedules]
-                if len(open_reschedules) == 1:
-                    req = open_reschedules[0]
-                    cust = req.customer
-                    name = (
-                        f"{cust.first_name} {cust.last_name}" if cust else "Unknown"
-                    )
-                    desc = f"Customer requested reschedule: {name}"
-                    target_url = (
-                        f"/schedule/reschedule-requests?highlight={ids[0]}"
-                    )
-                else:
-                    n = len(open_reschedules)
-                    desc = f"{n} reschedule requests awaiting action"
-                    target_url = (
-                        f"/schedule/reschedule-requests?highlight={ids[0]}"
-                    )
-                alerts.append(
-                    DashboardAlert(
-                        id="reschedule_requests",
-                        title="Reschedule Requests",
-                        description=desc,
-                        severity="warning",
-                        count=len(open_reschedules),
-                        target_url=target_url,
-                        record_ids=ids,
-                        created_at=now,
-                    ),
-                )
-
-        # Contract renewal proposals pending review (Req 31.4)
-        if self._session is not None:
-            from sqlalchemy import select  # noqa: PLC0415
-
-            from grins_platform.models.contract_renewal import (  # noqa: PLC0415
-                ContractRenewalProposal,
-            )
-            from grins_platform.models.enums import ProposalStatus  # noqa: PLC0415
-
-            stmt = select(ContractRenewalProposal).where(
-                ContractRenewalProposal.status == ProposalStatus.PENDING.value,
-            )
-            result = await self._session.execute(stmt)
-            pending_proposals = list(result.scalars().all())
-            if pending_proposals:
-                ids = [str(p.id) for p in pending_proposals]
-                descriptions: list[str] = []
-                for p in pending_proposals:
-                    cust = p.customer
-                    name = f"{cust.first_name} {cust.last_name}" if cust else "Unknown"
-                    descriptions.append(name)
-                if len(pending_proposals) == 1:
-                    desc = f"1 contract renewal ready for review: {descriptions[0]}"
-                    target_url = f"/contract-renewals/{ids[0]}"
-                else:
-                    n = len(pending_proposals)
-                    desc = f"{n} contract renewals ready for review"
-                    target_url = f"/contract-renewals?highlight={ids[0]}"
-                alerts.append(
-                    DashboardAlert(
-                        id="pending_renewals",
-                        title="Contract Renewals Pending",
-                        description=desc,
-                        severity="warning",
-                        count=len(pending_proposals),
-                        target_url=target_url,
-                        record_ids=ids,
-                        created_at=now,
-                    ),
-                )
+        now = datetime.now(tz=timezone.utc)
+        alerts: list[DashboardAlert] = []
+        for rule in self.alert_engine.rules:
+            snapshot = snapshots.get(rule.id)
+            if snapshot is not None and snapshot.count > 0:
+                alerts.append(_build_alert(rule.id, snapshot, now))
 
         response = DashboardAlertsResponse(
             alerts=alerts,
@@ -613,3 +509,114 @@ class DashboardService(LoggerMixin):
 
         self.log_completed("get_alerts", total_alerts=len(alerts))
         return response
+
+
+def _plural(n: int, word: str) -> str:
+    return f"{n} {word}{'s' if n != 1 else ''}"
+
+
+def _build_alert(  # noqa: PLR0911
+    rule_id: str,
+    snapshot: AlertSnapshot,
+    now: datetime,
+) -> DashboardAlert:
+    """Render a matched alert rule for the dashboard bell."""
+    n = snapshot.count
+    ids = snapshot.record_ids
+    name = snapshot.customer_name or "Unknown"
+
+    def alert(
+        title: str,
+        description: str,
+        severity: str,
+        target_url: str,
+        record_ids: list[str],
+    ) -> DashboardAlert:
+        return DashboardAlert(
+            id=rule_id,
+            title=title,
+            description=description,
+            severity=severity,
+            count=n,
+            target_url=target_url,
+            record_ids=record_ids,
+            created_at=now,
+        )
+
+    if rule_id == "overdue_invoices":
+        return alert(
+            "Overdue Invoices",
+            f"{_plural(n, 'invoice')} past due",
+            "critical",
+            f"/invoices/{ids[0]}"
+            if n == 1
+            else f"/invoices?status=overdue&highlight={ids[0]}",
+            ids,
+        )
+    if rule_id == "lien_warnings":
+        return alert(
+            "Lien Warning Due",
+            f"{_plural(n, 'invoice')} approaching 45-day lien deadline",
+            "critical",
+            f"/invoices/{ids[0]}"
+            if n == 1
+            else f"/invoices?lien_warning=true&highlight={ids[0]}",
+            ids,
+        )
+    if rule_id == "uncontacted_leads":
+        return alert(
+            "Uncontacted Leads",
+            f"{_plural(n, 'lead')} awaiting contact",
+            "warning",
+            "/leads?status=new",
+            [],
+        )
+    if rule_id == "jobs_to_schedule":
+        return alert(
+            "Jobs To Be Scheduled",
+            f"{_plural(n, 'job')} awaiting scheduling",
+            "warning" if n <= 5 else "critical",
+            "/jobs?status=to_be_scheduled",
+            [],
+        )
+    if rule_id == "sales_needing_action":
+        if n == 1:
+            return alert(
+                "Sales Pipeline — Action Needed",
+                f"New sales entry needs estimate scheduling: {name}",
+                "info",
+                f"/sales/{ids[0]}",
+                ids,
+            )
+        return alert(
+            "Sales Pipeline — Action Needed",
+            f"{n} sales entries awaiting estimate scheduling",
+            "info",
+            f"/sales?status=schedule_estimate&highlight={ids[0]}",
+            ids,
+        )
+    if rule_id == "reschedule_requests":
+        return alert(
+            "Reschedule Requests",
+            f"Customer requested reschedule: {name}"
+            if n == 1
+            else f"{n} reschedule requests awaiting action",
+            "warning",
+            f"/schedule/reschedule-requests?highlight={ids[0]}",
+            ids,
+        )
+    if n == 1:
+        return alert(
+            "Contract Renewals Pending",
+            f"1 contract renewal ready for review: {name}",
+            "warning",
+            f"/contract-renewals/{ids[0]}",
+            ids,
+        )
+    return alert(
+        "Contract Renewals Pending",
+        f"{n} contract renewals ready for review",
+        "warning",
+        f"/contract-renewals?highlight={ids[0]}",
+        ids,
+    )
@@ -0,0 +1,388 @@
+"""Batched day-of appointment reminders.
+
+The 7AM CT reminder run has to finish before crews arrive, so it is
+set-based instead of per appointment: today's appointments are loaded
+with their customer and technician in one query, SMS consent for every
+recipient is resolved in one lookup, and every message is rendered before
+anything is sent. Reminders are then sent with bounded concurrency, one
+session per customer (``SMSService`` defers sends over the provider rate
+limit). Right before sending, a customer's reminders are claimed in the
+``notification_dispatches`` ledger under the idempotency key
+``day_of_reminder:<appointment id>:<date>`` and the claim is committed,
+so a rerun after a crash skips reminders that may already have gone out
+while customers the crashed run never reached are still reminded. The
+customer's outcomes are written with one statement per status.
+
+Validates: CRM Gap Closure Req 39.1, 39.7, 39.8
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import and_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Load
+
+from grins_platform.log_config import LoggerMixin
+from grins_platform.models.appointment import Appointment
+from grins_platform.models.customer import Customer
+from grins_platform.models.enums import AppointmentStatus, NotificationType
+from grins_platform.models.job import Job
+from grins_platform.models.notification_dispatch import NotificationDispatch
+from grins_platform.models.staff import Staff
+from grins_platform.schemas.ai import MessageType
+from grins_platform.services.notification_service import CT_TZ, NotificationService
+from grins_platform.services.sms.consent import find_hard_stopped_phones
+from grins_platform.services.sms.formatters import format_sms_time_12h
+from grins_platform.services.sms_service import SMSService
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from grins_platform.services.email_service import EmailService
+    from grins_platform.services.sms.base import BaseSMSProvider
+    from grins_platform.services.sms.rate_limit_tracker import SMSRateLimitTracker
+
+DAY_OF_REMINDER_CONCURRENCY = 8
+DAY_OF_REMINDER_SUBJECT = "Appointment Reminder — Grins Irrigation"
+
+
+@dataclass
+class DayOfReminderSummary:
+    """Counts from one reminder run."""
+
+    appointments: int = 0
+    sent: int = 0
+    skipped: int = 0
+    failed: int = 0
+    already_claimed: int = 0
+
+
+@dataclass(frozen=True)
+class _Reminder:
+    """A rendered reminder waiting to be claimed and sent."""
+
+    key: str
+    appointment_id: UUID
+    job_id: UUID
+    customer: Customer
+    sms_body: str
+    email_body: str
+    sms_blocked: bool
+
+
+def day_of_reminder_key(appointment_id: UUID, day: date) -> str:
+    """Return the idempotency key of an appointment's reminder for *day*."""
+    return f"day_of_reminder:{appointment_id}:{day.isoformat()}"
+
+
+def render_day_of_reminder(
+    appointment: Appointment,
+    staff: Staff | None,
+) -> tuple[str, str]:
+    """Render the SMS and email bodies of a day-of reminder.
+
+    Returns:
+        Tuple of (sms_body, email_body)
+    """
+    staff_name = getattr(staff, "name", "your technician") if staff else ""
+    window_start = format_sms_time_12h(appointment.time_window_start)
+    window_end = format_sms_time_12h(appointment.time_window_end)
+    sms_body = (
+        f"Reminder: You have an appointment today with "
+        f"Grins Irrigation between {window_start} and "
+        f"{window_end}. {staff_name} will be your technician."
+    )
+    email_body = (
+        f"<p>This is a reminder that you have an appointment "
+        f"scheduled today with Grins Irrigation.</p>"
+        f"<p><strong>Time window:</strong> {window_start} - "
+        f"{window_end}</p>"
+        f"<p><strong>Technician:</strong> {staff_name}</p>"
+    )
+    return sms_body, email_body
+
+
+class DayOfReminderEngine(LoggerMixin):
+    """Sends today's appointment reminders in one batched, idempotent run."""
+
+    DOMAIN = "notification"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        *,
+        provider: BaseSMSProvider | None = None,
+        rate_limit_tracker: SMSRateLimitTracker | None = None,
+        email_service: EmailService | None = None,
+        concurrency: int = DAY_OF_REMINDER_CONCURRENCY,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            session_factory: Opens send sessions (defaults to the application's)
+            provider: SMS provider (defaults to the configured one)
+            rate_limit_tracker: Provider rate limit tracker (defaults to the
+                Redis-backed tracker)
+            email_service: EmailService for the email copy of each reminder
+            concurrency: Customers sent to at once
+        """
+        super().__init__()
+        self._session_factory = session_factory
+        self._provider = provider
+        self._tracker = rate_limit_tracker
+        self.email_service = email_service
+        self.concurrency = concurrency
+
+    def _factory(self) -> Callable[[], AsyncSession]:
+        if self._session_factory is None:
+            from grins_platform.database import get_database_manager  # noqa: PLC0415
+
+            self._session_factory = get_database_manager().session_factory
+        return self._session_factory
+
+    def _sms_dependencies(self) -> tuple[BaseSMSProvider, SMSRateLimitTracker]:
+        if self._provider is None:
+            from grins_platform.services.sms.factory import (  # noqa: PLC0415
+                get_sms_provider,
+            )
+
+            self._provider = get_sms_provider()
+        if self._tracker is None:
+            from grins_platform.redis_manager import (  # noqa: PLC0415
+                get_redis_manager,
+            )
+            from grins_platform.services.sms.rate_limit_tracker import (  # noqa: PLC0415
+                SMSRateLimitTracker,
+            )
+
+            self._tracker = SMSRateLimitTracker(
+                provider=self._provider.provider_name,
+                account_id=os.environ.get("CALLRAIL_ACCOUNT_ID", ""),
+                redis_client=get_redis_manager().client,
+            )
+        return self._provider, self._tracker
+
+    async def run(
+        self,
+        db: AsyncSession,
+        today: date | None = None,
+    ) -> DayOfReminderSummary:
+        """Send reminders for *today*'s scheduled and confirmed appointments.
+
+        Args:
+            db: Session used to load reminders
+            today: Day to remind for (defaults to today in Central Time)
+
+        Returns:
+            Counts of the run
+        """
+        today = today or datetime.now(CT_TZ).date()
+        self.log_started("run", day=today.isoformat())
+        summary = DayOfReminderSummary()
+
+        reminders = await self._load(db, today, summary)
+        await self._dispatch(reminders, summary)
+
+        self.log_completed(
+            "run",
+            appointments=summary.appointments,
+            sent=summary.sent,
+            skipped=summary.skipped,
+            failed=summary.failed,
+            already_claimed=summary.already_claimed,
+        )
+        return summary
+
+    async def _load(
+        self,
+        db: AsyncSession,
+        today: date,
+        summary: DayOfReminderSummary,
+    ) -> list[_Reminder]:
+        """Load today's appointments and render their reminders."""
+        stmt = (
+            select(Appointment, Customer, Staff)
+            .outerjoin(Job, Job.id == Appointment.job_id)
+            .outerjoin(Customer, Customer.id == Job.customer_id)
+            .outerjoin(Staff, Staff.id == Appointment.staff_id)
+            .options(
+                Load(Appointment).lazyload("*"),
+                Load(Customer).lazyload("*"),
+                Load(Staff).lazyload("*"),
+            )
+            .where(
+                and_(
+                    Appointment.scheduled_date == today,
+                    Appointment.status.in_(
+                        [
+                            AppointmentStatus.SCHEDULED.value,
+                            AppointmentStatus.CONFIRMED.value,
+                        ],
+                    ),
+                ),
+            )
+            .order_by(Appointment.time_window_start)
+        )
+        rows = (await db.execute(stmt)).all()
+        summary.appointments = len(rows)
+
+        hard_stopped = await find_hard_stopped_phones(
+            db,
+            [
+                customer.phone
+                for _, customer, _ in rows
+                if customer is not None and customer.sms_opt_in and customer.phone
+            ],
+        )
+
+        reminders: list[_Reminder] = []
+        for appt, customer, staff in rows:
+            if customer is None:
+                self.log_rejected(
+                    "run",
+                    reason="customer_not_found",
+                    appointment_id=str(appt.id),
+                )
+                summary.skipped += 1
+                continue
+            sms_body, email_body = render_day_of_reminder(appt, staff)
+            reminders.append(
+                _Reminder(
+                    key=day_of_reminder_key(appt.id, today),
+                    appointment_id=appt.id,
+                    job_id=appt.job_id,
+                    customer=customer,
+                    sms_body=sms_body,
+                    email_body=email_body,
+                    sms_blocked=customer.phone in hard_stopped,
+                ),
+            )
+        return reminders
+
+    async def _claim(
+        self,
+        session: AsyncSession,
+        reminders: list[_Reminder],
+    ) -> list[_Reminder]:
+        """Claim reminders in the dispatch ledger and commit the claims.
+
+        Reminders claimed by an earlier run are dropped, unless that run
+        recorded them as failed.
+        """
+        stmt = pg_insert(NotificationDispatch).values(
+            [
+                {
+                    "idempotency_key": reminder.key,
+                    "notification_type": NotificationType.DAY_OF_REMINDER.value,
+                    "appointment_id": reminder.appointment_id,
+                    "customer_id": reminder.customer.id,
+                    "status": "sending",
+                }
+                for reminder in reminders
+            ],
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[NotificationDispatch.idempotency_key],
+            set_={"status": "sending", "error": None, "completed_at": None},
+            where=NotificationDispatch.status == "failed",
+        ).returning(NotificationDispatch.idempotency_key)
+        keys = set((await session.execute(stmt)).scalars())
+        await session.commit()
+        return [reminder for reminder in reminders if reminder.key in keys]
+
+    async def _dispatch(
+        self,
+        reminders: list[_Reminder],
+        summary: DayOfReminderSummary,
+    ) -> None:
+        """Claim and send reminders, one session per customer, several at once."""
+        if not reminders:
+            return
+        provider, tracker = self._sms_dependencies()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        by_customer: defaultdict[UUID, list[_Reminder]] = defaultdict(list)
+        for reminder in reminders:
+            by_customer[reminder.customer.id].append(reminder)
+
+        async def send_group(group: list[_Reminder]) -> None:
+            async with semaphore, self._factory()() as send_session:
+                claimed = await self._claim(send_session, group)
+                summary.already_claimed += len(group) - len(claimed)
+                if not claimed:
+                    return
+                notifier = NotificationService(
+                    sms_service=SMSService(
+                        send_session,
+                        provider=provider,
+                        rate_limit_tracker=tracker,
+                    ),
+                    email_service=self.email_service,
+                )
+                outcomes: dict[str, tuple[str, str | None]] = {}
+                for reminder in claimed:
+                    try:
+                        result = await notifier._send_notification(  # noqa: SLF001
+                            send_session,
+                            customer=reminder.customer,
+                            notification_type=NotificationType.DAY_OF_REMINDER,
+                            message_type=MessageType.APPOINTMENT_REMINDER,
+                            subject=DAY_OF_REMINDER_SUBJECT,
+                            sms_body=reminder.sms_body,
+                            email_body=reminder.email_body,
+                            appointment_id=reminder.appointment_id,
+                            job_id=reminder.job_id,
+                            sms_blocked=reminder.sms_blocked,
+                        )
+                        await send_session.commit()
+                    except Exception as e:
+                        await send_session.rollback()
+                        self.log_failed(
+                            "send_reminder",
+                            error=e,
+                            appointment_id=str(reminder.appointment_id),
+                        )
+                        outcomes[reminder.key] = ("failed", str(e)[:500])
+                        continue
+                    if result.sms_sent or result.email_sent:
+                        outcomes[reminder.key] = ("sent", None)
+                    elif result.error:
+                        outcomes[reminder.key] = ("failed", result.error[:500])
+                    else:
+                        outcomes[reminder.key] = ("skipped", "no_channel")
+                await self._record(send_session, outcomes, summary)
+
+        await asyncio.gather(*(send_group(group) for group in by_customer.values()))
+
+    async def _record(
+        self,
+        session: AsyncSession,
+        outcomes: dict[str, tuple[str, str | None]],
+        summary: DayOfReminderSummary,
+    ) -> None:
+        """Write final dispatch statuses, one statement per outcome."""
+        grouped: defaultdict[tuple[str, str | None], list[str]] = defaultdict(list)
+        for key, outcome in outcomes.items():
+            grouped[outcome].append(key)
+        now = datetime.now(timezone.utc)
+        for (status, error), keys in grouped.items():
+            await session.execute(
+                update(NotificationDispatch)
+                .where(NotificationDispatch.idempotency_key.in_(keys))
+                .values(status=status, error=error, completed_at=now),
+            )
+            if status == "sent":
+                summary.sent += len(keys)
+            elif status == "failed":
+                summary.failed += len(keys)
+            else:
+                summary.skipped += len(keys)
+        await session.commit()
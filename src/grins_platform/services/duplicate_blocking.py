@@ -0,0 +1,340 @@
+"""Candidate-pair blocking for customer duplicate detection.
+
+Scoring every pair of customers is quadratic, and so is scoring every pair
+inside a block keyed on last name once a surname like Johnson or Anderson
+covers hundreds of customers. ``candidate_pairs`` keeps the number of
+pairs near-linear by combining several cheap blocking keys:
+
+- exact normalized phone and email;
+- a phonetic key (Soundex of the last name) scoped to the ZIP code, or to
+  the first initial when there is no ZIP;
+- MinHash/LSH bands over first/last-name character trigrams and street
+  address tokens, which groups typo variants that share no exact key;
+- a sorted-neighbourhood pass over (last, first) name order.
+
+Blocks up to ``MAX_BLOCK_SIZE`` records are expanded to all pairs. Larger
+blocks are sorted by name and only records within ``NEIGHBOURHOOD_WINDOW``
+positions of each other are paired, so no key can produce a quadratic
+number of pairs. ``BlockSorter`` sorts block memberships by key in runs
+spilled to temporary files and expands pairs one block at a time from the
+merged runs, so memory stays bounded by a run and a block whatever the
+number of customers, and a sweep can resume after any block.
+
+Validates: CRM Changes Update 2 Req 5.6, 5.7
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import pickle
+import random
+import tempfile
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from typing import IO, TYPE_CHECKING, Any
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from types import TracebackType
+
+MAX_BLOCK_SIZE = 50
+NEIGHBOURHOOD_WINDOW = 5
+# Pseudo-block of every named record, always windowed in name order
+NAME_WINDOW_KEY = "name"
+# Block memberships sorted in memory before a run is spilled to disk
+SORT_RUN_SIZE = 100_000
+
+# 10 bands x 4 rows: pairs with ~0.55+ shingle Jaccard collide in a band.
+LSH_BANDS = 10
+LSH_ROWS = 4
+_MINHASH_PRIME = (1 << 61) - 1
+_rng = random.Random(5_081_961)  # noqa: S311 - fixed seed keeps signatures stable
+_MINHASH_PARAMS = tuple(
+    (_rng.randrange(1, _MINHASH_PRIME), _rng.randrange(0, _MINHASH_PRIME))
+    for _ in range(LSH_BANDS * LSH_ROWS)
+)
+
+# Street suffixes/directions are too common to say anything about identity.
+_ADDRESS_STOPWORDS = frozenset(
+    {
+        "st",
+        "ave",
+        "blvd",
+        "dr",
+        "ln",
+        "rd",
+        "ct",
+        "pl",
+        "cir",
+        "way",
+        "trl",
+        "n",
+        "s",
+        "e",
+        "w",
+        "ne",
+        "nw",
+        "se",
+        "sw",
+        "apt",
+        "unit",
+    },
+)
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BlockingRecord:
+    """Normalized fields of one customer used for blocking and scoring.
+
+    All strings are already normalized (see duplicate_detection_service);
+    empty values are ``None``.
+    """
+
+    id: UUID
+    phone: str | None
+    email: str | None
+    first_name: str | None
+    last_name: str | None
+    full_name: str | None
+    address: str | None
+    zip_code: str | None
+
+    @property
+    def sort_key(self) -> tuple[str, str]:
+        """Name order used by sorted-neighbourhood windows."""
+        return (self.last_name or "", self.first_name or "")
+
+
+@lru_cache(maxsize=16_384)
+def soundex(word: str) -> str:
+    """American Soundex code of *word* (e.g. ``"Anderson"`` -> ``"A536"``)."""
+    letters = [c for c in word.lower() if "a" <= c <= "z"]
+    if not letters:
+        return ""
+    first = letters[0]
+    code = first.upper()
+    previous = _SOUNDEX_CODES.get(first, "")
+    for c in letters[1:]:
+        digit = _SOUNDEX_CODES.get(c, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        # h and w do not separate letters with the same code; vowels do
+        if c not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def _shingles(record: BlockingRecord) -> set[str]:
+    shingles: set[str] = set()
+    for part in (record.first_name, record.last_name):
+        if part:
+            padded = f" {part} "
+            shingles.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    if record.address:
+        shingles.update(
+            f"@{token}"
+            for token in record.address.split()
+            if token not in _ADDRESS_STOPWORDS
+        )
+    return shingles
+
+
+def minhash_signature(shingles: Iterable[str]) -> tuple[int, ...]:
+    """MinHash signature of a shingle set (``LSH_BANDS * LSH_ROWS`` values)."""
+    hashes = [zlib.crc32(s.encode()) for s in shingles]
+    if not hashes:
+        return ()
+    return tuple(
+        min((a * h + b) % _MINHASH_PRIME for h in hashes) for a, b in _MINHASH_PARAMS
+    )
+
+
+def blocking_keys(record: BlockingRecord) -> list[str]:
+    """Every block *record* belongs to."""
+    keys: list[str] = []
+    if record.phone:
+        keys.append(f"phone:{record.phone}")
+    if record.email:
+        keys.append(f"email:{record.email}")
+    if record.last_name:
+        code = soundex(record.last_name)
+        if record.zip_code:
+            keys.append(f"sdx:{code}:{record.zip_code}")
+        elif record.first_name:
+            keys.append(f"sdx:{code}:{record.first_name[0]}")
+    signature = minhash_signature(_shingles(record))
+    for band in range(len(signature) // LSH_ROWS):
+        rows = signature[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+        keys.append(f"lsh{band}:{zlib.crc32(repr(rows).encode())}")
+    return keys
+
+
+# (block key, last name, first name, id, record fields): sorts a block's
+# members into name order
+_BlockRow = tuple[str, str, str, UUID, tuple[Any, ...]]
+
+
+def _ordered(
+    a: BlockingRecord,
+    b: BlockingRecord,
+) -> tuple[BlockingRecord, BlockingRecord]:
+    return (a, b) if a.id < b.id else (b, a)
+
+
+def _block_pairs(
+    key: str,
+    members: Iterable[BlockingRecord],
+) -> Iterator[tuple[BlockingRecord, BlockingRecord]]:
+    """Pairs of one block whose *members* arrive in name order.
+
+    Members are buffered until the block proves larger than
+    ``MAX_BLOCK_SIZE``; from then on only a ``NEIGHBOURHOOD_WINDOW`` tail
+    is kept.
+    """
+    windowed = key == NAME_WINDOW_KEY
+    buffer: list[BlockingRecord] = []
+    for record in members:
+        if not windowed:
+            buffer.append(record)
+            if len(buffer) <= MAX_BLOCK_SIZE:
+                continue
+            windowed = True
+            for pos, member in enumerate(buffer):
+                for other in buffer[max(pos - NEIGHBOURHOOD_WINDOW, 0) : pos]:
+                    yield _ordered(other, member)
+        else:
+            for other in buffer:
+                yield _ordered(other, record)
+            buffer.append(record)
+        del buffer[:-NEIGHBOURHOOD_WINDOW]
+    if not windowed:
+        for pos, member in enumerate(buffer):
+            for other in buffer[pos + 1 :]:
+                yield _ordered(member, other)
+
+
+def _read_run(run: IO[bytes]) -> Iterator[_BlockRow]:
+    run.seek(0)
+    while True:
+        try:
+            yield pickle.load(run)  # noqa: S301 - our own temporary file
+        except EOFError:  # noqa: PERF203
+            return
+
+
+class BlockSorter:
+    """Block memberships sorted by key with bounded memory.
+
+    Each added record contributes one row per blocking key plus the name
+    window pseudo-block. Rows are sorted in runs of ``run_size`` spilled
+    to temporary files and merged on read, so only one run is held in
+    memory. ``pairs`` walks the blocks in key order; a pair sharing
+    several blocks is produced once per block.
+    """
+
+    def __init__(self, run_size: int = SORT_RUN_SIZE) -> None:
+        self.run_size = run_size
+        self.records = 0
+        self._run: list[_BlockRow] = []
+        self._spilled: list[IO[bytes]] = []
+
+    def __enter__(self) -> BlockSorter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def add(self, record: BlockingRecord) -> None:
+        """Add *record* to each of its blocks."""
+        self.records += 1
+        fields = (
+            record.id,
+            record.phone,
+            record.email,
+            record.first_name,
+            record.last_name,
+            record.full_name,
+            record.address,
+            record.zip_code,
+        )
+        last, first = record.sort_key
+        keys = blocking_keys(record)
+        if record.last_name:
+            keys.append(NAME_WINDOW_KEY)
+        self._run.extend((key, last, first, record.id, fields) for key in keys)
+        if len(self._run) >= self.run_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        self._run.sort(key=itemgetter(0, 1, 2, 3))
+        run = tempfile.TemporaryFile()  # noqa: SIM115 - closed by close()
+        for row in self._run:
+            pickle.dump(row, run, pickle.HIGHEST_PROTOCOL)
+        self._spilled.append(run)
+        self._run = []
+
+    def pairs(
+        self,
+        after_key: str | None = None,
+    ) -> Iterator[tuple[str, BlockingRecord, BlockingRecord]]:
+        """``(block key, smaller-id record, larger-id record)`` in key order.
+
+        Args:
+            after_key: Skip blocks whose key sorts at or before this one
+        """
+        self._run.sort(key=itemgetter(0, 1, 2, 3))
+        rows = heapq.merge(
+            *(_read_run(run) for run in self._spilled),
+            self._run,
+            key=itemgetter(0, 1, 2, 3),
+        )
+        if after_key is not None:
+            rows = itertools.dropwhile(lambda row: row[0] <= after_key, rows)
+        for key, members in itertools.groupby(rows, key=itemgetter(0)):
+            for a, b in _block_pairs(
+                key,
+                (BlockingRecord(*row[4]) for row in members),
+            ):
+                yield key, a, b
+
+    def close(self) -> None:
+        """Delete the spilled runs."""
+        for run in self._spilled:
+            run.close()
+        self._spilled = []
+        self._run = []
+
+
+def candidate_pairs(records: Iterable[BlockingRecord]) -> set[tuple[UUID, UUID]]:
+    """Unique ``(smaller id, larger id)`` pairs worth scoring.
+
+    Args:
+        records: Normalized customer records
+
+    Returns:
+        Candidate pairs from all blocking keys and the global name window
+    """
+    with BlockSorter() as sorter:
+        for record in records:
+            sorter.add(record)
+        return {(a.id, b.id) for _, a, b in sorter.pairs()}
@@ -1,9 +1,14 @@
 """Customer duplicate detection service with weighted scoring.
 
 Computes a 0-100 confidence score for customer pairs using phone, email,
-name similarity, address, and ZIP+last-name signals. A nightly sweep
-batch-processes all active customers and upserts results into
-customer_merge_candidates.
+name similarity, address, and ZIP+last-name signals. Candidates are kept
+current on write: ``check_customer`` scores a created or edited customer
+against its indexed neighbours (same phone or email, similar name or
+address). The nightly job only reconciles customers changed since its
+last watermark, falling back to a full blocked sweep on the first run.
+The full sweep streams a column projection, scores pairs in bounded
+batches and commits a checkpoint after each, so it resumes after a
+failure. Results are upserted into customer_merge_candidates in batches.
 
 Validates: CRM Changes Update 2 Req 5.1-5.8
 """
@@ -11,23 +16,38 @@ Validates: CRM Changes Update 2 Req 5.1-5.8
 from __future__ import annotations
 
 import re
+import time
 import unicodedata
 from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, literal, or_, select, true
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
 
 from grins_platform.log_config import LoggerMixin
+from grins_platform.models.business_setting import BusinessSetting
 from grins_platform.models.customer import Customer
 from grins_platform.models.customer_merge_candidate import CustomerMergeCandidate
+from grins_platform.models.property import Property
+from grins_platform.repositories.search_repository import (
+    MIN_TRIGRAM_TERM_LENGTH,
+    normalize_search_term,
+)
+from grins_platform.services.duplicate_blocking import (
+    BlockingRecord,
+    BlockSorter,
+)
 from grins_platform.services.sms.phone_normalizer import (
     PhoneNormalizationError,
     normalize_to_e164,
 )
 
 if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement
     from sqlalchemy.ext.asyncio import AsyncSession
 
 # -- Signal weights (Req 5.1) ------------------------------------------
@@ -38,6 +58,26 @@ WEIGHT_ADDRESS = 20
 WEIGHT_ZIP_LAST = 10
 MAX_SCORE = 100
 NAME_SIMILARITY_THRESHOLD = 0.92
+CANDIDATE_MIN_SCORE = 50
+
+# -- Incremental detection ----------------------------------------------
+# Neighbours scored per changed customer; the indexed lookups are ordered
+# by nothing, so this only bounds pathological matches (e.g. a shared
+# office phone).
+MAX_NEIGHBOURS = 200
+# Rows per multi-row upsert (5 bind params each, well under asyncpg's 32k).
+UPSERT_BATCH_SIZE = 1_000
+WATERMARK_SETTING_KEY = "duplicate_detection_watermark"
+
+# -- Full sweep ----------------------------------------------------------
+SWEEP_FETCH_SIZE = 2_000
+# Pairs scored between checkpoints (taken at the next block boundary).
+SWEEP_CHECKPOINT_EVERY = 50_000
+SWEEP_CHECKPOINT_KEY = "duplicate_sweep_checkpoint"
+# A checkpoint older than this is from an abandoned sweep; start over.
+SWEEP_CHECKPOINT_MAX_AGE = timedelta(days=3)
+
+ScoredPairs = dict[tuple[UUID, UUID], tuple[int, dict[str, Any]]]
 
 
 # -- Jaro-Winkler implementation ---------------------------------------
@@ -101,10 +141,30 @@ def jaro_winkler_similarity(
     return jaro + prefix_len * prefix_weight * (1 - jaro)
 
 
+@lru_cache(maxsize=65_536)
+def _name_similarity(name_a: str, name_b: str) -> float | None:
+    """Jaro-Winkler similarity if it can reach the threshold, else None.
+
+    Jaro is at most ``(m/len_a + m/len_b + 1) / 3`` with ``m`` the shorter
+    length, and the Winkler boost at most ``0.4 * (1 - jaro)``; pairs whose
+    lengths alone rule out a match skip the O(len^2) computation. Cached
+    because the sweep compares the same normalized names repeatedly.
+    """
+    shorter, longer = sorted((len(name_a), len(name_b)))
+    if shorter == 0:
+        return None
+    jaro_bound = (1 + shorter / longer + 1) / 3
+    if jaro_bound + 0.4 * (1 - jaro_bound) < NAME_SIMILARITY_THRESHOLD - 1e-9:
+        return None
+    sim = jaro_winkler_similarity(name_a, name_b)
+    return sim if sim >= NAME_SIMILARITY_THRESHOLD else None
+
+
 # -- Normalization helpers ----------------------------------------------
 _NON_ALNUM = re.compile(r"[^a-z0-9 ]")
 
 
+@lru_cache(maxsize=65_536)
 def _normalize_name(name: str) -> str:
     """Lowercase, strip accents, collapse whitespace."""
     nfkd = unicodedata.normalize("NFKD", name)
@@ -147,6 +207,79 @@ def _normalize_address(address: str | None) -> str | None:
     return re.sub(r"\s+", " ", addr).strip()
 
 
+# -- Scoring ------------------------------------------------------------
+def score_records(
+    record_a: BlockingRecord,
+    record_b: BlockingRecord,
+) -> tuple[int, dict[str, Any]]:
+    """Weighted duplicate score for two normalized customer records.
+
+    Returns:
+        Tuple of (score 0-100, match_signals dict).
+
+    Validates: Req 5.1
+    """
+    score = 0
+    signals: dict[str, Any] = {}
+
+    # Phone match (+60)
+    if record_a.phone and record_a.phone == record_b.phone:
+        score += WEIGHT_PHONE
+        signals["phone"] = True
+
+    # Email match (+50)
+    if record_a.email and record_a.email == record_b.email:
+        score += WEIGHT_EMAIL
+        signals["email"] = True
+
+    # Name similarity (+25)
+    if record_a.full_name and record_b.full_name:
+        sim = _name_similarity(record_a.full_name, record_b.full_name)
+        if sim is not None:
+            score += WEIGHT_NAME
+            signals["name_similarity"] = round(sim, 4)
+
+    # Address match (+20)
+    if record_a.address and record_a.address == record_b.address:
+        score += WEIGHT_ADDRESS
+        signals["address"] = True
+
+    # ZIP + last name match (+10)
+    if (
+        record_a.zip_code
+        and record_a.zip_code == record_b.zip_code
+        and record_a.last_name
+        and record_a.last_name == record_b.last_name
+    ):
+        score += WEIGHT_ZIP_LAST
+        signals["zip_last_name"] = True
+
+    return min(score, MAX_SCORE), signals
+
+
+def _blocking_record(
+    customer_id: UUID,
+    *,
+    first_name: str | None,
+    last_name: str | None,
+    phone: str | None,
+    email: str | None,
+    address: str | None,
+    zip_code: str | None,
+) -> BlockingRecord:
+    """Build a record from raw customer fields (address already normalized)."""
+    return BlockingRecord(
+        id=customer_id,
+        phone=_normalize_phone(phone),
+        email=_normalize_email(email),
+        first_name=_normalize_name(first_name or "") or None,
+        last_name=_normalize_name(last_name or "") or None,
+        full_name=_normalize_name(f"{first_name} {last_name}") or None,
+        address=address,
+        zip_code=(zip_code.strip() or None) if zip_code else None,
+    )
+
+
 # -- Service ------------------------------------------------------------
 class DuplicateDetectionService(LoggerMixin):
     """Detects potential duplicate customer records via weighted scoring.
@@ -174,161 +307,241 @@ class DuplicateDetectionService(LoggerMixin):
 
         Validates: Req 5.1
         """
-        score = 0
-        signals: dict[str, Any] = {}
-
-        # Phone match (+60)
-        phone_a = _normalize_phone(customer_a.phone)
-        phone_b = _normalize_phone(customer_b.phone)
-        if phone_a and phone_b and phone_a == phone_b:
-            score += WEIGHT_PHONE
-            signals["phone"] = True
-
-        # Email match (+50)
-        email_a = _normalize_email(customer_a.email)
-        email_b = _normalize_email(customer_b.email)
-        if email_a and email_b and email_a == email_b:
-            score += WEIGHT_EMAIL
-            signals["email"] = True
-
-        # Name similarity (+25)
-        name_a = _normalize_name(
-            f"{customer_a.first_name} {customer_a.last_name}",
-        )
-        name_b = _normalize_name(
-            f"{customer_b.first_name} {customer_b.last_name}",
+        return score_records(
+            self.blocking_record(customer_a),
+            self.blocking_record(customer_b),
         )
-        if name_a and name_b:
-            sim = jaro_winkler_similarity(name_a, name_b)
-            if sim >= NAME_SIMILARITY_THRESHOLD:
-                score += WEIGHT_NAME
-                signals["name_similarity"] = round(sim, 4)
-
-        # Address match (+20)
-        addr_a = self._get_primary_address(customer_a)
-        addr_b = self._get_primary_address(customer_b)
-        if addr_a and addr_b and addr_a == addr_b:
-            score += WEIGHT_ADDRESS
-            signals["address"] = True
-
-        # ZIP + last name match (+10)
-        zip_a = self._get_primary_zip(customer_a)
-        zip_b = self._get_primary_zip(customer_b)
-        last_a = _normalize_name(customer_a.last_name)
-        last_b = _normalize_name(customer_b.last_name)
-        zip_last_match = (
-            zip_a
-            and zip_b
-            and zip_a == zip_b
-            and last_a
-            and last_b
-            and last_a == last_b
-        )
-        if zip_last_match:
-            score += WEIGHT_ZIP_LAST
-            signals["zip_last_name"] = True
 
-        score = min(score, MAX_SCORE)
-        return score, signals
+    @classmethod
+    def blocking_record(cls, customer: Customer) -> BlockingRecord:
+        """Normalize the fields of *customer* used for blocking and scoring."""
+        return _blocking_record(
+            customer.id,
+            first_name=customer.first_name,
+            last_name=customer.last_name,
+            phone=customer.phone,
+            email=customer.email,
+            address=cls._get_primary_address(customer),
+            zip_code=cls._get_primary_zip(customer),
+        )
 
-    async def run_nightly_sweep(self, db: AsyncSession) -> int:
-        """Batch-compute scores for pre-filtered candidate pairs.
+    async def check_customer(self, db: AsyncSession, customer_id: UUID) -> int:
+        """Score one customer against its neighbours and upsert candidates.
 
-        Pre-filters on shared phone, email, or last name to avoid
-        O(n^2) full cross-join. Upserts into customer_merge_candidates.
+        Called when a customer is created or its phone, email, name or
+        primary address changes, so the review queue reflects the edit
+        without waiting for the nightly job.
 
         Args:
             db: Async database session.
+            customer_id: Customer that was created or edited.
 
         Returns:
             Number of candidates upserted.
 
         Validates: Req 5.6, 5.7
         """
-        self.log_started("nightly_sweep")
-
+        self.log_started("check_customer", customer_id=str(customer_id))
         stmt = (
             select(Customer)
             .where(
+                Customer.id == customer_id,
                 Customer.is_deleted.is_(False),
                 Customer.merged_into_customer_id.is_(None),
             )
-            .order_by(Customer.id)
+            .execution_options(populate_existing=True)
         )
-        result = await db.execute(stmt)
-        customers = list(result.scalars().all())
+        customer = (await db.execute(stmt)).scalar_one_or_none()
+        if customer is None:
+            self.log_rejected("check_customer", reason="not_active")
+            return 0
 
-        self.logger.info(
-            "customer.duplicatedetectionservice.sweep_candidates",
-            total_customers=len(customers),
+        scored = await self._score_against_neighbours(db, customer)
+        upserted = await self._upsert_candidates(db, scored)
+        self.log_completed(
+            "check_customer",
+            customer_id=str(customer_id),
+            upserted=upserted,
         )
+        return upserted
 
-        # Build lookup indexes for pre-filtering
-        by_phone: dict[str, list[Customer]] = {}
-        by_email: dict[str, list[Customer]] = {}
-        by_last_name: dict[str, list[Customer]] = {}
-
-        for c in customers:
-            phone = _normalize_phone(c.phone)
-            if phone:
-                by_phone.setdefault(phone, []).append(c)
-            email = _normalize_email(c.email)
-            if email:
-                by_email.setdefault(email, []).append(c)
-            last = _normalize_name(c.last_name)
-            if last:
-                by_last_name.setdefault(last, []).append(c)
-
-        # Collect unique candidate pairs from shared signals
-        seen_pairs: set[tuple[UUID, UUID]] = set()
-        candidate_pairs: list[tuple[Customer, Customer]] = []
-
-        for group in [
-            *by_phone.values(),
-            *by_email.values(),
-            *by_last_name.values(),
-        ]:
-            if len(group) < 2:
-                continue
-            for i in range(len(group)):
-                for j in range(i + 1, len(group)):
-                    a, b = group[i], group[j]
-                    pair_key = (min(a.id, b.id), max(a.id, b.id))
-                    if pair_key not in seen_pairs:
-                        seen_pairs.add(pair_key)
-                        candidate_pairs.append((a, b))
-
-        # Score and upsert
-        upserted = 0
-        for a, b in candidate_pairs:
-            score, signals = self.compute_score(a, b)
-            if score < 50:
-                continue
+    async def check_customer_on_write(
+        self,
+        db: AsyncSession,
+        customer_id: UUID,
+    ) -> None:
+        """Run ``check_customer`` in a savepoint, never failing the caller.
 
-            ca_id, cb_id = (a.id, b.id) if a.id < b.id else (b.id, a.id)
+        Used by customer and property writes: a failed duplicate check is
+        logged and left for the nightly reconciliation instead of rolling
+        back the edit.
+        """
+        try:
+            async with db.begin_nested():
+                _ = await self.check_customer(db, customer_id)
+        except SQLAlchemyError as e:
+            self.log_failed("check_customer", error=e, customer_id=str(customer_id))
+
+    async def run_reconciliation(self, db: AsyncSession) -> int:
+        """Re-check customers changed since the last run.
+
+        Catches writes that bypassed ``check_customer`` (imports, webhook
+        intake, direct SQL). Customers whose own row or any property row
+        changed after the stored watermark are re-scored against their
+        neighbours; the first run has no watermark and does a full sweep.
+        The watermark is the transaction start time, so rows committed
+        while the job runs are picked up next time.
+
+        Args:
+            db: Async database session.
+
+        Returns:
+            Number of candidates upserted.
+
+        Validates: Req 5.6, 5.7
+        """
+        self.log_started("reconciliation")
+        started_at: datetime = (await db.execute(select(func.now()))).scalar_one()
+        state = await self._get_state(db, WATERMARK_SETTING_KEY)
+        watermark = (
+            datetime.fromisoformat(state["changed_since"])
+            if state and state.get("changed_since")
+            else None
+        )
 
-            upsert_stmt = pg_insert(
-                CustomerMergeCandidate,
-            ).values(
-                customer_a_id=ca_id,
-                customer_b_id=cb_id,
-                score=score,
-                match_signals=signals,
-                status="pending",
+        if watermark is None:
+            upserted = await self.run_nightly_sweep(db)
+        else:
+            changed_properties = select(Property.customer_id).where(
+                Property.updated_at > watermark,
             )
-            upsert_stmt = upsert_stmt.on_conflict_do_update(
-                constraint="uq_merge_candidates_pair",
-                set_={
-                    "score": score,
-                    "match_signals": signals,
-                    "status": "pending",
-                },
+            stmt = (
+                select(Customer)
+                .where(
+                    Customer.is_deleted.is_(False),
+                    Customer.merged_into_customer_id.is_(None),
+                    or_(
+                        Customer.updated_at > watermark,
+                        Customer.id.in_(changed_properties),
+                    ),
+                )
+                .order_by(Customer.id)
+            )
+            changed = list((await db.execute(stmt)).scalars().all())
+            scored: ScoredPairs = {}
+            for customer in changed:
+                scored.update(await self._score_against_neighbours(db, customer))
+            upserted = await self._upsert_candidates(db, scored)
+            self.logger.info(
+                "customer.duplicatedetectionservice.reconciled_customers",
+                changed_customers=len(changed),
+                since=watermark.isoformat(),
             )
-            await db.execute(upsert_stmt)
-            upserted += 1
 
+        await self._set_state(
+            db,
+            WATERMARK_SETTING_KEY,
+            {"changed_since": started_at.isoformat()},
+        )
+        self.log_completed("reconciliation", upserted=upserted)
+        return upserted
+
+    async def run_nightly_sweep(self, db: AsyncSession) -> int:
+        """Batch-compute scores for blocked candidate pairs.
+
+        Customers are streamed as a column projection with their primary
+        property's address and ZIP pre-joined, normalized once, and their
+        block memberships sorted by blocking key in runs spilled to disk
+        (``BlockSorter``), so memory stays bounded however many customers
+        there are. Pairs are scored block by block in key order; once
+        ``SWEEP_CHECKPOINT_EVERY`` pairs (or ``UPSERT_BATCH_SIZE`` scored
+        candidates) have accumulated, the batch is upserted and the last
+        finished block is committed as the checkpoint, so a failed sweep
+        resumes after it. A pair sharing several blocks is scored in each;
+        the upsert makes the repeats idempotent.
+
+        Args:
+            db: Async database session.
+
+        Returns:
+            Number of candidate rows upserted (including before a resume);
+            a pair found in several blocks may count more than once.
+
+        Validates: Req 5.6, 5.7
+        """
+        self.log_started("nightly_sweep")
+        checkpoint = await self._get_state(db, SWEEP_CHECKPOINT_KEY)
+        after_key: str | None = None
+        upserted = 0
+        started_at = datetime.now(timezone.utc)
+        if checkpoint is not None and "after_key" in checkpoint:
+            checkpoint_started = datetime.fromisoformat(checkpoint["started_at"])
+            if started_at - checkpoint_started < SWEEP_CHECKPOINT_MAX_AGE:
+                after_key = str(checkpoint["after_key"])
+                upserted = int(checkpoint["upserted"])
+                started_at = checkpoint_started
+                self.logger.info(
+                    "customer.duplicatedetectionservice.sweep_resumed",
+                    after_key=after_key,
+                )
+
+        clock = time.monotonic()
+        pairs_scored = since_checkpoint = 0
+        batch: ScoredPairs = {}
+        with BlockSorter() as sorter:
+            await self._load_sweep_records(db, sorter)
+            self.logger.info(
+                "customer.duplicatedetectionservice.sweep_candidates",
+                total_customers=sorter.records,
+            )
+
+            block: str | None = None
+            for key, record, other in sorter.pairs(after_key):
+                if key != block:
+                    if block is not None and (
+                        since_checkpoint >= SWEEP_CHECKPOINT_EVERY
+                        or len(batch) >= UPSERT_BATCH_SIZE
+                    ):
+                        upserted += await self._upsert_candidates(db, batch)
+                        batch, since_checkpoint = {}, 0
+                        await self._set_state(
+                            db,
+                            SWEEP_CHECKPOINT_KEY,
+                            {
+                                "after_key": block,
+                                "upserted": upserted,
+                                "started_at": started_at.isoformat(),
+                            },
+                        )
+                        await db.commit()
+                        self.logger.info(
+                            "customer.duplicatedetectionservice.sweep_progress",
+                            after_key=block,
+                            pairs_scored=pairs_scored,
+                            upserted=upserted,
+                            elapsed_seconds=round(time.monotonic() - clock, 1),
+                        )
+                    block = key
+
+                score, signals = score_records(record, other)
+                pairs_scored += 1
+                since_checkpoint += 1
+                if score >= CANDIDATE_MIN_SCORE:
+                    batch[(record.id, other.id)] = (score, signals)
+                    if len(batch) >= 2 * UPSERT_BATCH_SIZE:
+                        # A large block: write now, checkpoint at its end.
+                        upserted += await self._upsert_candidates(db, batch)
+                        batch = {}
+
+        upserted += await self._upsert_candidates(db, batch)
+        await self._set_state(db, SWEEP_CHECKPOINT_KEY, None)
         await db.flush()
-        self.log_completed("nightly_sweep", upserted=upserted)
+        self.log_completed(
+            "nightly_sweep",
+            upserted=upserted,
+            pairs_scored=pairs_scored,
+            elapsed_seconds=round(time.monotonic() - clock, 1),
+        )
         return upserted
 
     async def get_review_queue(
@@ -377,6 +590,167 @@ class DuplicateDetectionService(LoggerMixin):
 
     # -- Private helpers ------------------------------------------------
 
+    @staticmethod
+    def _neighbour_condition(customer: Customer) -> ColumnElement[bool]:
+        """Index-backed match for customers that could duplicate *customer*."""
+        conditions: list[ColumnElement[bool]] = [Customer.phone == customer.phone]
+        if customer.email:
+            conditions.append(
+                func.lower(Customer.email) == customer.email.strip().lower(),
+            )
+        name = normalize_search_term(f"{customer.first_name} {customer.last_name}")
+        if len(name) >= MIN_TRIGRAM_TERM_LENGTH:
+            conditions.append(literal(name).op("<%")(Customer.search_text))
+        if customer.properties:
+            primary = next(
+                (p for p in customer.properties if p.is_primary),
+                customer.properties[0],
+            )
+            address = normalize_search_term(primary.address or "")
+            if len(address) >= MIN_TRIGRAM_TERM_LENGTH:
+                conditions.append(
+                    Customer.id.in_(
+                        select(Property.customer_id).where(
+                            literal(address).op("<%")(Property.search_text),
+                        ),
+                    ),
+                )
+        return or_(*conditions)
+
+    async def _score_against_neighbours(
+        self,
+        db: AsyncSession,
+        customer: Customer,
+    ) -> ScoredPairs:
+        """Score *customer* against up to ``MAX_NEIGHBOURS`` neighbours."""
+        stmt = (
+            select(Customer)
+            .where(
+                self._neighbour_condition(customer),
+                Customer.id != customer.id,
+                Customer.is_deleted.is_(False),
+                Customer.merged_into_customer_id.is_(None),
+            )
+            .limit(MAX_NEIGHBOURS)
+        )
+        neighbours = (await db.execute(stmt)).scalars().all()
+
+        record = self.blocking_record(customer)
+        scored: ScoredPairs = {}
+        for neighbour in neighbours:
+            score, signals = score_records(record, self.blocking_record(neighbour))
+            if score >= CANDIDATE_MIN_SCORE:
+                pair = (
+                    (customer.id, neighbour.id)
+                    if customer.id < neighbour.id
+                    else (neighbour.id, customer.id)
+                )
+                scored[pair] = (score, signals)
+        return scored
+
+    async def _upsert_candidates(self, db: AsyncSession, scored: ScoredPairs) -> int:
+        """Upsert scored pairs, ``UPSERT_BATCH_SIZE`` rows per statement.
+
+        New pairs are queued as pending; existing pairs are rescored only
+        while still pending, so a pair staff reviewed or dismissed stays
+        out of the queue when either customer is edited again.
+        """
+        rows = [
+            {
+                "customer_a_id": a_id,
+                "customer_b_id": b_id,
+                "score": score,
+                "match_signals": signals,
+                "status": "pending",
+            }
+            for (a_id, b_id), (score, signals) in sorted(scored.items())
+        ]
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = pg_insert(CustomerMergeCandidate).values(
+                rows[start : start + UPSERT_BATCH_SIZE],
+            )
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_merge_candidates_pair",
+                set_={
+                    "score": stmt.excluded.score,
+                    "match_signals": stmt.excluded.match_signals,
+                },
+                where=CustomerMergeCandidate.status == "pending",
+            )
+            await db.execute(stmt)
+        return len(rows)
+
+    async def _load_sweep_records(
+        self,
+        db: AsyncSession,
+        sorter: BlockSorter,
+    ) -> None:
+        """Stream active customers into *sorter*, without ORM objects."""
+        primary = (
+            select(Property.address, Property.zip_code)
+            .where(Property.customer_id == Customer.id)
+            .order_by(Property.is_primary.desc(), Property.created_at)
+            .limit(1)
+            .lateral("primary_property")
+        )
+        stmt = (
+            select(
+                Customer.id,
+                Customer.first_name,
+                Customer.last_name,
+                Customer.phone,
+                Customer.email,
+                primary.c.address,
+                primary.c.zip_code,
+            )
+            .outerjoin(primary, true())
+            .where(
+                Customer.is_deleted.is_(False),
+                Customer.merged_into_customer_id.is_(None),
+            )
+            .execution_options(yield_per=SWEEP_FETCH_SIZE)
+        )
+        result = await db.stream(stmt)
+        async for row in result:
+            sorter.add(
+                _blocking_record(
+                    row.id,
+                    first_name=row.first_name,
+                    last_name=row.last_name,
+                    phone=row.phone,
+                    email=row.email,
+                    address=_normalize_address(row.address),
+                    zip_code=row.zip_code,
+                ),
+            )
+
+    @staticmethod
+    async def _get_state(db: AsyncSession, key: str) -> dict[str, Any] | None:
+        stmt = select(BusinessSetting.setting_value).where(
+            BusinessSetting.setting_key == key,
+        )
+        value: dict[str, Any] | None = (await db.execute(stmt)).scalar_one_or_none()
+        return value or None
+
+    @staticmethod
+    async def _set_state(
+        db: AsyncSession,
+        key: str,
+        value: dict[str, Any] | None,
+    ) -> None:
+        """Store job state under *key* in business_settings (None deletes)."""
+        if value is None:
+            _ = await db.execute(
+                delete(BusinessSetting).where(BusinessSetting.setting_key == key),
+            )
+            return
+        stmt = pg_insert(BusinessSetting).values(setting_key=key, setting_value=value)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BusinessSetting.setting_key],
+            set_={"setting_value": value, "updated_at": func.now()},
+        )
+        _ = await db.execute(stmt)
+
     @staticmethod
     def _get_primary_address(customer: Customer) -> str | None:
         """Get normalized primary property address."""
@@ -0,0 +1,404 @@
+"""Background delivery of invoice mass notifications.
+
+``InvoiceService.mass_notify`` records a run with one pending item per
+reachable invoice. Each tick of this worker claims pending items with
+``FOR UPDATE SKIP LOCKED`` in batches and commits them as ``sending``
+before any message goes out, resolves hard-STOP consent for the whole
+batch in one query, and sends with bounded concurrency (one pooled session
+per customer group) while the SMS rate-limit tracker allows. Item
+statuses, reminder counts and run counters are written with one statement
+per group, and the batch commits before the next is claimed. Items left
+unsent by a rate-limit pause go back to ``pending`` for a later tick.
+
+An item still ``sending`` after ``MASS_NOTIFY_SEND_LEASE`` belongs to a
+process that died mid-batch and may already have been texted, so it is
+recorded as failed (``interrupted``) rather than sent again.
+
+Validates: Requirements 29.3, 29.4
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import select, update
+
+from grins_platform.log_config import LoggerMixin
+from grins_platform.models.customer import Customer
+from grins_platform.models.invoice import Invoice
+from grins_platform.models.invoice_notification_run import (
+    InvoiceNotificationItem,
+    InvoiceNotificationRun,
+)
+from grins_platform.services.sms.consent import find_hard_stopped_phones
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from grins_platform.services.sms.base import BaseSMSProvider
+    from grins_platform.services.sms.rate_limit_tracker import SMSRateLimitTracker
+
+MASS_NOTIFY_BATCH_SIZE = 50
+MASS_NOTIFY_CONCURRENCY = 4
+# Stop claiming new batches after this long so ticks do not overlap
+MASS_NOTIFY_TICK_BUDGET_SECONDS = 20.0
+# A batch still sending after this long was abandoned by its worker
+MASS_NOTIFY_SEND_LEASE = timedelta(minutes=10)
+
+_Outcome = tuple[str, str | None]
+_Send = tuple[UUID, Invoice, Customer, str]
+
+
+def render_mass_notify_message(
+    template: str,
+    invoice: Invoice,
+    customer: Customer,
+) -> str:
+    """Fill a mass-notification template from an invoice and its customer."""
+    return template.format(
+        first_name=customer.first_name,
+        last_name=customer.last_name,
+        invoice_number=invoice.invoice_number,
+        amount=f"{invoice.total_amount:.2f}",
+        due_date=invoice.due_date.isoformat() if invoice.due_date else "",
+    )
+
+
+class InvoiceNotificationWorker(LoggerMixin):
+    """Sends pending invoice mass-notification items."""
+
+    DOMAIN = "invoice"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        *,
+        provider: BaseSMSProvider | None = None,
+        rate_limit_tracker: SMSRateLimitTracker | None = None,
+        batch_size: int = MASS_NOTIFY_BATCH_SIZE,
+        concurrency: int = MASS_NOTIFY_CONCURRENCY,
+        tick_budget_seconds: float = MASS_NOTIFY_TICK_BUDGET_SECONDS,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            session_factory: Opens sessions (defaults to the application's)
+            provider: SMS provider (defaults to the configured one)
+            rate_limit_tracker: Gate consulted before each send (defaults to
+                the provider's shared tracker)
+            batch_size: Items claimed per batch
+            concurrency: Customers messaged at once
+            tick_budget_seconds: Time after which no new batch is claimed
+        """
+        super().__init__()
+        self._session_factory = session_factory
+        self._provider = provider
+        self._tracker = rate_limit_tracker
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.tick_budget_seconds = tick_budget_seconds
+
+    def _factory(self) -> Callable[[], AsyncSession]:
+        if self._session_factory is None:
+            from grins_platform.database import get_database_manager  # noqa: PLC0415
+
+            self._session_factory = get_database_manager().session_factory
+        return self._session_factory
+
+    def _sms_dependencies(self) -> tuple[BaseSMSProvider, SMSRateLimitTracker]:
+        if self._provider is None:
+            from grins_platform.services.sms.factory import (  # noqa: PLC0415
+                get_sms_provider,
+            )
+
+            self._provider = get_sms_provider()
+        if self._tracker is None:
+            from grins_platform.redis_manager import (  # noqa: PLC0415
+                get_redis_manager,
+            )
+            from grins_platform.services.sms.rate_limit_tracker import (  # noqa: PLC0415
+                SMSRateLimitTracker,
+            )
+
+            self._tracker = SMSRateLimitTracker(
+                provider=self._provider.provider_name,
+                account_id=os.environ.get("CALLRAIL_ACCOUNT_ID", ""),
+                redis_client=get_redis_manager().client,
+            )
+        return self._provider, self._tracker
+
+    async def run(self) -> int:
+        """Process batches until none remain, sending pauses or time runs out.
+
+        Returns:
+            Number of items brought to a final status
+        """
+        self.log_started("run")
+        deadline = time.monotonic() + self.tick_budget_seconds
+        total = await self.finalize_interrupted()
+        while True:
+            processed, claimed, throttled = await self.process_batch()
+            total += processed
+            if throttled or claimed < self.batch_size:
+                break
+            if time.monotonic() >= deadline:
+                break
+        self.log_completed("run", processed=total)
+        return total
+
+    async def process_batch(self) -> tuple[int, int, bool]:
+        """Claim, send and record one batch of pending items.
+
+        Returns:
+            ``(processed, claimed, throttled)``: items finalized, items
+            claimed, and whether the rate limiter paused sending
+        """
+        async with self._factory()() as session:
+            stmt = self._items_stmt(InvoiceNotificationItem.status == "pending")
+            rows = (await session.execute(stmt)).all()
+            if not rows:
+                return 0, 0, False
+            # Committed before sending: a restart never resends these
+            await session.execute(
+                update(InvoiceNotificationItem)
+                .where(InvoiceNotificationItem.id.in_([item.id for item, _, _ in rows]))
+                .values(status="sending", claimed_at=datetime.now(timezone.utc)),
+            )
+            await session.commit()
+
+            customer_ids = {invoice.customer_id for _, invoice, _ in rows}
+            customers = {
+                c.id: c
+                for c in (
+                    await session.execute(
+                        select(Customer).where(Customer.id.in_(customer_ids)),
+                    )
+                ).scalars()
+            }
+            stopped = await find_hard_stopped_phones(
+                session,
+                [c.phone for c in customers.values() if c.phone],
+            )
+
+            outcomes: dict[UUID, _Outcome] = {}
+            groups: defaultdict[UUID, list[_Send]] = defaultdict(list)
+            for item, invoice, run in rows:
+                customer = customers.get(invoice.customer_id)
+                if customer is None or not customer.phone:
+                    outcomes[item.id] = ("skipped", "no_phone")
+                elif customer.phone in stopped:
+                    outcomes[item.id] = ("skipped", "consent_denied")
+                else:
+                    groups[customer.id].append(
+                        (item.id, invoice, customer, run.message_template),
+                    )
+
+            throttled = await self._send_groups(groups, outcomes)
+            await self._record(session, rows, outcomes)
+            await session.commit()
+
+        self.logger.info(
+            "invoice.mass_notify.batch_processed",
+            claimed=len(rows),
+            processed=len(outcomes),
+            throttled=throttled,
+        )
+        return len(outcomes), len(rows), throttled
+
+    async def finalize_interrupted(self) -> int:
+        """Record items abandoned mid-send by a dead worker as failed.
+
+        Returns:
+            Number of items finalized
+        """
+        cutoff = datetime.now(timezone.utc) - MASS_NOTIFY_SEND_LEASE
+        async with self._factory()() as session:
+            stmt = self._items_stmt(
+                InvoiceNotificationItem.status == "sending",
+                InvoiceNotificationItem.claimed_at < cutoff,
+            )
+            rows = (await session.execute(stmt)).all()
+            if not rows:
+                return 0
+            outcomes: dict[UUID, _Outcome] = {
+                item.id: ("failed", "interrupted") for item, _, _ in rows
+            }
+            await self._record(session, rows, outcomes)
+            await session.commit()
+
+        self.logger.warning(
+            "invoice.mass_notify.interrupted_items_failed",
+            count=len(rows),
+        )
+        return len(rows)
+
+    def _items_stmt(self, *criteria: Any) -> Select[Any]:
+        """Lock a batch of items matching *criteria* with invoice and run."""
+        return (
+            select(InvoiceNotificationItem, Invoice, InvoiceNotificationRun)
+            .join(Invoice, Invoice.id == InvoiceNotificationItem.invoice_id)
+            .join(
+                InvoiceNotificationRun,
+                InvoiceNotificationRun.id == InvoiceNotificationItem.run_id,
+            )
+            .where(*criteria)
+            .order_by(InvoiceNotificationItem.created_at)
+            .limit(self.batch_size)
+            .with_for_update(of=InvoiceNotificationItem, skip_locked=True)
+        )
+
+    async def _send_groups(
+        self,
+        groups: dict[UUID, list[_Send]],
+        outcomes: dict[UUID, _Outcome],
+    ) -> bool:
+        """Send each customer's items, customers concurrently.
+
+        A customer's items go out in order through one session, so the SMS
+        service's per-customer dedupe sees the earlier send. Items not
+        attempted because the rate limiter closed stay pending.
+
+        Returns:
+            Whether the rate limiter paused sending
+        """
+        if not groups:
+            return False
+
+        from grins_platform.schemas.ai import MessageType  # noqa: PLC0415
+        from grins_platform.services.sms.recipient import (  # noqa: PLC0415
+            Recipient,
+        )
+        from grins_platform.services.sms_service import (  # noqa: PLC0415
+            SMSConsentDeniedError,
+            SMSService,
+        )
+
+        provider, tracker = self._sms_dependencies()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        paused = asyncio.Event()
+
+        async def send_group(items: list[_Send]) -> None:
+            async with semaphore, self._factory()() as send_session:
+                sms = SMSService(
+                    send_session,
+                    provider=provider,
+                    rate_limit_tracker=tracker,
+                )
+                for item_id, invoice, customer, template in items:
+                    if paused.is_set() or not (await tracker.check()).allowed:
+                        paused.set()
+                        return
+                    try:
+                        result = await sms.send_message(
+                            recipient=Recipient.from_customer(customer),
+                            message=render_mass_notify_message(
+                                template,
+                                invoice,
+                                customer,
+                            ),
+                            message_type=MessageType.PAYMENT_REMINDER,
+                            consent_type="transactional",
+                        )
+                        await send_session.commit()
+                    except SMSConsentDeniedError:
+                        await send_session.rollback()
+                        outcomes[item_id] = ("skipped", "consent_denied")
+                    except Exception as e:
+                        await send_session.rollback()
+                        self.logger.warning(
+                            "invoice.mass_notify.single_failure",
+                            invoice_id=str(invoice.id),
+                            error=str(e),
+                        )
+                        outcomes[item_id] = ("failed", str(e)[:500])
+                    else:
+                        if result.get("success"):
+                            outcomes[item_id] = ("sent", None)
+                        else:
+                            reason = str(result.get("reason", "not_sent"))
+                            outcomes[item_id] = ("skipped", reason[:500])
+
+        await asyncio.gather(*(send_group(items) for items in groups.values()))
+        return paused.is_set()
+
+    async def _record(
+        self,
+        session: AsyncSession,
+        rows: list[Any],
+        outcomes: dict[UUID, _Outcome],
+    ) -> None:
+        """Write item statuses, reminder counts and run progress.
+
+        Claimed items without an outcome were not attempted and go back to
+        pending.
+        """
+        now = datetime.now(timezone.utc)
+        by_outcome: defaultdict[_Outcome, list[UUID]] = defaultdict(list)
+        for item_id, outcome in outcomes.items():
+            by_outcome[outcome].append(item_id)
+        for (status, error), item_ids in by_outcome.items():
+            await session.execute(
+                update(InvoiceNotificationItem)
+                .where(InvoiceNotificationItem.id.in_(item_ids))
+                .values(status=status, error=error, processed_at=now),
+            )
+        unattempted = [item.id for item, _, _ in rows if item.id not in outcomes]
+        if unattempted:
+            await session.execute(
+                update(InvoiceNotificationItem)
+                .where(InvoiceNotificationItem.id.in_(unattempted))
+                .values(status="pending", claimed_at=None),
+            )
+
+        sent_invoice_ids = [
+            invoice.id
+            for item, invoice, _ in rows
+            if outcomes.get(item.id, ("pending", None))[0] == "sent"
+        ]
+        if sent_invoice_ids:
+            await session.execute(
+                update(Invoice)
+                .where(Invoice.id.in_(sent_invoice_ids))
+                .values(
+                    reminder_count=Invoice.reminder_count + 1,
+                    last_reminder_sent=now,
+                ),
+            )
+
+        progress: defaultdict[UUID, Counter[str]] = defaultdict(Counter)
+        for item, _, run in rows:
+            if item.id in outcomes:
+                progress[run.id][outcomes[item.id][0]] += 1
+        run_table = InvoiceNotificationRun
+        for run_id, counts in progress.items():
+            await session.execute(
+                update(run_table)
+                .where(run_table.id == run_id)
+                .values(
+                    status="sending",
+                    sent=run_table.sent + counts["sent"],
+                    failed=run_table.failed + counts["failed"],
+                    skipped=run_table.skipped + counts["skipped"],
+                ),
+            )
+        unfinished = (
+            select(InvoiceNotificationItem.id)
+            .where(
+                InvoiceNotificationItem.run_id == run_table.id,
+                InvoiceNotificationItem.status.in_(("pending", "sending")),
+            )
+            .exists()
+        )
+        await session.execute(
+            update(run_table)
+            .where(run_table.id.in_({run.id for _, _, run in rows}), ~unfinished)
+            .values(status="completed", completed_at=now),
+        )
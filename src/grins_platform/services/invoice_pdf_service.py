@@ -3,22 +3,81 @@
 Generates professional PDFs using WeasyPrint, uploads to S3,
 and provides pre-signed download URLs.
 
+WeasyPrint rendering is CPU-bound and boto3 is blocking, so rendering runs
+in a bounded process pool (``INVOICE_PDF_RENDER_WORKERS``) and uploads run
+in worker threads; the event loop only awaits them. PDFs are stored under a
+key derived from a hash of the rendered HTML (invoice data plus branding),
+so an invoice whose stored key still matches is served without rendering.
+
 Validates: CRM Gap Closure Req 80.2, 80.3, 80.4, 87.7
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any, Protocol
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from grins_platform.log_config import LoggerMixin
 from grins_platform.models.invoice import Invoice
+from grins_platform.schemas.invoice import (
+    InvoicePDFBatchItem,
+    InvoicePDFBatchResponse,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
+INVOICE_PDF_RENDER_WORKERS = int(os.getenv("INVOICE_PDF_RENDER_WORKERS", "2"))
+
+_render_executor: ProcessPoolExecutor | None = None
+
+
+def render_pdf_bytes(html_content: str) -> bytes:
+    """Convert HTML to PDF bytes with WeasyPrint (runs in a worker process)."""
+    from weasyprint import HTML  # noqa: PLC0415
+
+    pdf: bytes = HTML(string=html_content).write_pdf()
+    return pdf
+
+
+def get_pdf_render_executor() -> Executor:
+    """Return the shared process pool used for PDF rendering.
+
+    Workers are spawned rather than forked: a fork of the running server
+    would copy its event loop, thread state and open connections.
+    """
+    global _render_executor  # noqa: PLW0603
+    if _render_executor is None:
+        _render_executor = ProcessPoolExecutor(
+            max_workers=max(INVOICE_PDF_RENDER_WORKERS, 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _render_executor
+
+
+def shutdown_pdf_render_executor() -> None:
+    """Stop the shared render pool (application shutdown)."""
+    global _render_executor  # noqa: PLW0603
+    if _render_executor is not None:
+        _render_executor.shutdown(wait=False, cancel_futures=True)
+        _render_executor = None
+
+
+def invoice_pdf_key(invoice_id: UUID, html_content: str) -> str:
+    """S3 key for an invoice PDF rendered from *html_content*."""
+    digest = hashlib.sha256(html_content.encode()).hexdigest()[:16]
+    return f"invoices/{invoice_id}/{digest}.pdf"
+
 
 class S3ClientProtocol(Protocol):
     """Protocol for S3 client interface."""
@@ -65,16 +124,20 @@ class InvoicePDFService(LoggerMixin):
         self,
         s3_client: S3ClientProtocol | None = None,
         s3_bucket: str = "grins-platform-files",
+        render_executor: Executor | None = None,
     ) -> None:
         """Initialize InvoicePDFService.
 
         Args:
             s3_client: boto3 S3 client instance.
             s3_bucket: S3 bucket name for PDF storage.
+            render_executor: Executor for WeasyPrint rendering (defaults to
+                the shared process pool).
         """
         super().__init__()
         self.s3_client = s3_client
         self.s3_bucket = s3_bucket
+        self.render_executor = render_executor
 
     async def _get_company_branding(
         self,
@@ -225,34 +288,26 @@ class InvoicePDFService(LoggerMixin):
 </body>
 </html>"""
 
-    async def generate_pdf(
+    async def _load_invoices(
         self,
         db: AsyncSession,
-        invoice_id: UUID,
-    ) -> str:
-        """Generate a professional PDF for the invoice.
-
-        Renders HTML template with invoice data and company branding,
-        converts to PDF via WeasyPrint, uploads to S3, updates
-        invoice.document_url.
-
-        Args:
-            db: Database session.
-            invoice_id: Invoice UUID.
+        invoice_ids: Sequence[UUID],
+    ) -> list[Invoice]:
+        """Load invoices with their customers in one query."""
+        stmt = (
+            select(Invoice)
+            .options(selectinload(Invoice.customer))  # type: ignore[arg-type]
+            .where(Invoice.id.in_(invoice_ids))
+        )
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
 
-        Returns:
-            Pre-signed download URL for the generated PDF.
+    async def _load_invoice(self, db: AsyncSession, invoice_id: UUID) -> Invoice:
+        """Load one invoice with its customer.
 
         Raises:
             InvoiceNotFoundError: If invoice not found.
-
-        Validates: Req 80.2, 80.3, 87.7
         """
-        self.log_started("generate_pdf", invoice_id=str(invoice_id))
-
-        # Load invoice with customer
-        from sqlalchemy.orm import selectinload  # noqa: PLC0415
-
         stmt = (
             select(Invoice)
             .options(selectinload(Invoice.customer))  # type: ignore[arg-type]
@@ -260,70 +315,163 @@ class InvoicePDFService(LoggerMixin):
         )
         result = await db.execute(stmt)
         invoice = result.scalar_one_or_none()
-
         if invoice is None:
             raise InvoiceNotFoundError(invoice_id)
+        return invoice
 
-        # Get company branding from business_settings (Req 87.7)
-        branding = await self._get_company_branding(db)
+    async def _publish_pdf(
+        self,
+        invoice: Invoice,
+        branding: dict[str, Any],
+    ) -> bool:
+        """Render and upload the invoice PDF unless the stored one is current.
 
-        # Render HTML
+        Sets ``invoice.document_url`` to the content-addressed key; the
+        caller flushes.
+
+        Returns:
+            True when the stored PDF was reused.
+        """
         html_content = self._render_invoice_html(invoice, branding)
+        s3_key = invoice_pdf_key(invoice.id, html_content)
+        if invoice.document_url == s3_key:
+            return True
 
-        # Convert to PDF via WeasyPrint
+        loop = asyncio.get_running_loop()
         try:
-            from weasyprint import HTML  # noqa: PLC0415
-
-            pdf_bytes = HTML(string=html_content).write_pdf()
-        except ImportError:
-            self.log_failed(
-                "generate_pdf",
-                error=Exception("WeasyPrint not installed"),
-                invoice_id=str(invoice_id),
+            pdf_bytes = await loop.run_in_executor(
+                self.render_executor or get_pdf_render_executor(),
+                render_pdf_bytes,
+                html_content,
             )
-            raise
         except Exception as exc:
-            self.log_failed(
-                "generate_pdf",
-                error=exc,
-                invoice_id=str(invoice_id),
-            )
+            self.log_failed("generate_pdf", error=exc, invoice_id=str(invoice.id))
             raise
 
-        # Upload to S3
-        s3_key = f"invoices/{invoice_id}.pdf"
         if self.s3_client is not None:
             try:
-                self.s3_client.put_object(
+                await asyncio.to_thread(
+                    self.s3_client.put_object,
                     Bucket=self.s3_bucket,
                     Key=s3_key,
                     Body=pdf_bytes,
                     ContentType="application/pdf",
                 )
             except Exception as exc:
-                self.log_failed(
-                    "upload_pdf",
-                    error=exc,
-                    invoice_id=str(invoice_id),
-                )
+                self.log_failed("upload_pdf", error=exc, invoice_id=str(invoice.id))
                 raise
 
-        # Update invoice.document_url
         invoice.document_url = s3_key
-        await db.flush()
-
-        # Generate pre-signed URL
-        download_url = self._generate_presigned_url(s3_key)
-
         self.logger.info(
             "invoice.pdf.generated",
-            invoice_id=str(invoice_id),
+            invoice_id=str(invoice.id),
             invoice_number=invoice.invoice_number,
             s3_key=s3_key,
         )
-        self.log_completed("generate_pdf", invoice_id=str(invoice_id))
+        return False
+
+    async def generate_pdf(
+        self,
+        db: AsyncSession,
+        invoice_id: UUID,
+    ) -> str:
+        """Generate a professional PDF for the invoice.
+
+        Renders HTML template with invoice data and company branding,
+        converts to PDF via WeasyPrint off the event loop, uploads to S3,
+        updates invoice.document_url. Reuses the stored PDF when the
+        rendered content is unchanged.
+
+        Args:
+            db: Database session.
+            invoice_id: Invoice UUID.
+
+        Returns:
+            Pre-signed download URL for the generated PDF.
+
+        Raises:
+            InvoiceNotFoundError: If invoice not found.
+
+        Validates: Req 80.2, 80.3, 87.7
+        """
+        self.log_started("generate_pdf", invoice_id=str(invoice_id))
+
+        invoice = await self._load_invoice(db, invoice_id)
+        # Get company branding from business_settings (Req 87.7)
+        branding = await self._get_company_branding(db)
+
+        cached = await self._publish_pdf(invoice, branding)
+        if not cached:
+            await db.flush()
+
+        download_url = self._generate_presigned_url(invoice.document_url or "")
+        self.log_completed("generate_pdf", invoice_id=str(invoice_id), cached=cached)
         return download_url
 
+    async def generate_pdfs(
+        self,
+        db: AsyncSession,
+        invoice_ids: Sequence[UUID],
+    ) -> InvoicePDFBatchResponse:
+        """Generate PDFs for many invoices concurrently.
+
+        Invoices load in one query and branding is read once; renders share
+        the bounded render pool. A failure is reported per invoice and does
+        not stop the rest.
+
+        Args:
+            db: Database session.
+            invoice_ids: Invoices to render.
+
+        Returns:
+            InvoicePDFBatchResponse with one item per requested invoice.
+        """
+        self.log_started("generate_pdfs", count=len(invoice_ids))
+
+        invoices = {inv.id: inv for inv in await self._load_invoices(db, invoice_ids)}
+        branding = await self._get_company_branding(db)
+        ordered = [invoices[i] for i in dict.fromkeys(invoice_ids) if i in invoices]
+        outcomes = await asyncio.gather(
+            *(self._publish_pdf(invoice, branding) for invoice in ordered),
+            return_exceptions=True,
+        )
+        await db.flush()
+
+        results = [
+            InvoicePDFBatchItem(invoice_id=invoice_id, error="Invoice not found")
+            for invoice_id in dict.fromkeys(invoice_ids)
+            if invoice_id not in invoices
+        ]
+        for invoice, outcome in zip(ordered, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                results.append(
+                    InvoicePDFBatchItem(invoice_id=invoice.id, error=str(outcome)),
+                )
+                continue
+            results.append(
+                InvoicePDFBatchItem(
+                    invoice_id=invoice.id,
+                    document_url=self._generate_presigned_url(
+                        invoice.document_url or "",
+                    ),
+                    cached=outcome,
+                ),
+            )
+
+        response = InvoicePDFBatchResponse(
+            generated=sum(1 for r in results if r.document_url and not r.cached),
+            cached=sum(1 for r in results if r.cached),
+            failed=sum(1 for r in results if r.error),
+            results=results,
+        )
+        self.log_completed(
+            "generate_pdfs",
+            generated=response.generated,
+            cached=response.cached,
+            failed=response.failed,
+        )
+        return response
+
     async def get_pdf_url(
         self,
         db: AsyncSession,
@@ -331,6 +479,9 @@ class InvoicePDFService(LoggerMixin):
     ) -> str:
         """Return a pre-signed S3 download URL for an existing invoice PDF.
 
+        The stored PDF is served when the invoice content is unchanged since
+        it was rendered; otherwise it is regenerated first.
+
         Args:
             db: Database session.
             invoice_id: Invoice UUID.
@@ -346,19 +497,18 @@ class InvoicePDFService(LoggerMixin):
         """
         self.log_started("get_pdf_url", invoice_id=str(invoice_id))
 
-        stmt = select(Invoice).where(Invoice.id == invoice_id)
-        result = await db.execute(stmt)
-        invoice = result.scalar_one_or_none()
-
-        if invoice is None:
-            raise InvoiceNotFoundError(invoice_id)
-
+        invoice = await self._load_invoice(db, invoice_id)
         if invoice.document_url is None:
             raise InvoicePDFNotFoundError(invoice_id)
 
+        branding = await self._get_company_branding(db)
+        cached = await self._publish_pdf(invoice, branding)
+        if not cached:
+            await db.flush()
+
         url = self._generate_presigned_url(invoice.document_url)
 
-        self.log_completed("get_pdf_url", invoice_id=str(invoice_id))
+        self.log_completed("get_pdf_url", invoice_id=str(invoice_id), cached=cached)
         return url
 
     def _generate_presigned_url(self, s3_key: str) -> str:
@@ -10,12 +10,14 @@ from __future__ import annotations
 
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import TYPE_CHECKING, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 from uuid import UUID
 
-from grins_platform.log_config import LoggerMixin
+from grins_platform.log_config import LoggerMixin, get_logger
 from grins_platform.models.enums import InvoiceStatus
 from grins_platform.schemas.invoice import (
+    InvoiceBatchGenerateRequest,
+    InvoiceBatchGenerateResponse,
     InvoiceCreate,
     InvoiceDetailResponse,
     InvoiceLineItem,
@@ -28,9 +30,19 @@ from grins_platform.schemas.invoice import (
     PaginatedInvoiceResponse,
     PaymentRecord,
 )
+from grins_platform.services.outbox_service import (
+    OutboxHandler,
+    enqueue_outbox_events,
+)
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
     from grins_platform.models.invoice import Invoice
+    from grins_platform.models.invoice_notification_run import (
+        InvoiceNotificationRun,
+    )
+    from grins_platform.models.job import Job
     from grins_platform.repositories.invoice_repository import InvoiceRepository
     from grins_platform.repositories.job_repository import JobRepository
 
@@ -43,6 +55,31 @@ LIEN_ELIGIBLE_TYPES: set[str] = {
     "system_upgrade",
 }
 
+# Days from invoice date to due date for invoices generated from jobs
+DEFAULT_DUE_DAYS = 30
+
+INVOICE_PDF_EVENT = "invoice.render_pdf"
+INVOICE_SEND_EVENT = "invoice.send"
+
+
+def _job_line_items(job: Job) -> tuple[Decimal, list[InvoiceLineItem]]:
+    """Invoice amount and line items for a job.
+
+    Uses final_amount if present, otherwise quoted_amount.
+    """
+    amount = job.final_amount or job.quoted_amount or Decimal(0)
+    description = job.description[:500] if job.description else job.job_type
+    if not description:
+        return amount, []
+    return amount, [
+        InvoiceLineItem(
+            description=description,
+            quantity=Decimal(1),
+            unit_price=amount,
+            total=amount,
+        ),
+    ]
+
 
 class InvoiceNotFoundError(Exception):
     """Raised when an invoice is not found."""
@@ -341,9 +378,19 @@ class InvoiceService(LoggerMixin):
             page_size=params.page_size,
         )
 
-        invoices, total = await self.invoice_repository.list_with_filters(params)
+        next_cursor: str | None = None
+        total: int | None
+        if params.cursor is not None:
+            page = await self.invoice_repository.list_keyset(params)
+            invoices, total, next_cursor = page.items, page.total, page.next_cursor
+        else:
+            invoices, total = await self.invoice_repository.list_with_filters(params)
 
-        total_pages = (total + params.page_size - 1) // params.page_size
+        total_pages = (
+            None
+            if total is None
+            else (total + params.page_size - 1) // params.page_size
+        )
 
         self.log_completed("list_invoices", count=len(invoices), total=total)
 
@@ -362,6 +409,7 @@ class InvoiceService(LoggerMixin):
             page=params.page,
             page_size=params.page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
 
     # =========================================================================
@@ -750,30 +798,13 @@ class InvoiceService(LoggerMixin):
                 msg,
             )
 
-        # Use final_amount if present, otherwise quoted_amount
-        amount = job.final_amount or job.quoted_amount or Decimal(0)
-
-        # Create line items from job
-        line_items: list[InvoiceLineItem] = []
-        description = job.description[:500] if job.description else job.job_type
-        if description:
-            line_items.append(
-                InvoiceLineItem(
-                    description=description,
-                    quantity=Decimal(1),
-                    unit_price=amount,
-                    total=amount,
-                ),
-            )
-
-        # Default due date is 30 days from today
-        due_date = date.today() + timedelta(days=30)
+        amount, line_items = _job_line_items(job)
 
         invoice_data = InvoiceCreate(
             job_id=job_id,
             amount=amount,
             late_fee_amount=Decimal(0),
-            due_date=due_date,
+            due_date=date.today() + timedelta(days=DEFAULT_DUE_DAYS),
             line_items=line_items if line_items else None,
             notes=f"Invoice generated from job: {job.job_type}",
         )
@@ -787,6 +818,89 @@ class InvoiceService(LoggerMixin):
         )
         return result
 
+    async def generate_batch(
+        self,
+        request: InvoiceBatchGenerateRequest,
+    ) -> InvoiceBatchGenerateResponse:
+        """Invoice every uninvoiced completed job matching the filters.
+
+        Jobs are selected (and locked) in one query, invoice numbers are
+        allocated as one block, invoices are built in memory and inserted
+        with multi-row INSERTs. PDF rendering and sending are queued on the
+        outbox in the same transaction rather than done inline.
+
+        Args:
+            request: Job filters and follow-up options
+
+        Returns:
+            Created invoice ids and queued follow-up counts
+
+        Validates: Requirements 10.1-10.7
+        """
+        self.log_started("generate_batch", limit=request.limit)
+
+        jobs = await self.job_repository.find_uninvoiced_completed(
+            completed_from=request.completed_from,
+            completed_to=request.completed_to,
+            customer_id=request.customer_id,
+            job_type=request.job_type,
+            limit=request.limit,
+        )
+        if not jobs:
+            self.log_completed("generate_batch", created=0)
+            return InvoiceBatchGenerateResponse(
+                created=0,
+                invoice_ids=[],
+                pdf_queued=0,
+                send_queued=0,
+            )
+
+        today = date.today()
+        year = today.year
+        due_date = today + timedelta(days=DEFAULT_DUE_DAYS)
+        sequences = await self.invoice_repository.get_next_sequences(len(jobs))
+        rows: list[dict[str, Any]] = []
+        for job, seq in zip(jobs, sequences, strict=True):
+            amount, line_items = _job_line_items(job)
+            rows.append(
+                {
+                    "job_id": job.id,
+                    "customer_id": job.customer_id,
+                    "invoice_number": f"INV-{year}-{seq:06d}",
+                    "amount": amount,
+                    "late_fee_amount": Decimal(0),
+                    "total_amount": amount,
+                    "invoice_date": today,
+                    "due_date": due_date,
+                    "status": InvoiceStatus.DRAFT.value,
+                    "lien_eligible": job.job_type.lower() in LIEN_ELIGIBLE_TYPES,
+                    "line_items": [item.model_dump(mode="json") for item in line_items]
+                    or None,
+                    "notes": f"Invoice generated from job: {job.job_type}",
+                },
+            )
+        invoice_ids = await self.invoice_repository.bulk_create(rows)
+
+        session = self.invoice_repository.session
+        if request.render_pdf:
+            await enqueue_outbox_events(session, INVOICE_PDF_EVENT, invoice_ids)
+        if request.send:
+            await enqueue_outbox_events(session, INVOICE_SEND_EVENT, invoice_ids)
+
+        response = InvoiceBatchGenerateResponse(
+            created=len(invoice_ids),
+            invoice_ids=invoice_ids,
+            pdf_queued=len(invoice_ids) if request.render_pdf else 0,
+            send_queued=len(invoice_ids) if request.send else 0,
+        )
+        self.log_completed(
+            "generate_batch",
+            created=response.created,
+            pdf_queued=response.pdf_queued,
+            send_queued=response.send_queued,
+        )
+        return response
+
     # =========================================================================
     # Mass Notification (Requirement 29.3, 29.4)
     # =========================================================================
@@ -816,7 +930,11 @@ class InvoiceService(LoggerMixin):
         lien_min_amount: float = 500.0,
         template: str | None = None,
     ) -> MassNotifyResponse:
-        """Send mass notifications to customers based on invoice criteria.
+        """Queue mass notifications to customers based on invoice criteria.
+
+        Records a run with one item per invoice whose customer has a phone
+        and returns at once; the invoice notification worker sends the
+        items in the background. Poll ``get_mass_notify_run`` for progress.
 
         Args:
             notification_type: One of past_due, due_soon, lien_eligible.
@@ -826,7 +944,7 @@ class InvoiceService(LoggerMixin):
             template: Custom message template (uses default if None).
 
         Returns:
-            MassNotifyResponse with counts.
+            MassNotifyResponse for the queued run.
 
         Validates: Requirements 29.3, 29.4
         """
@@ -849,81 +967,117 @@ class InvoiceService(LoggerMixin):
         else:
             invoices = []
 
-        targeted = len(invoices)
-        sent = 0
-        failed = 0
-        skipped = 0
-
         msg_template = template or self._DEFAULT_TEMPLATES.get(
             notification_type,
             self._DEFAULT_TEMPLATES["past_due"],
         )
+        reachable = [
+            inv.id
+            for inv in invoices
+            if inv.customer is not None and getattr(inv.customer, "phone", None)
+        ]
+        run = await self.invoice_repository.create_notification_run(
+            notification_type=notification_type,
+            message_template=msg_template,
+            targeted=len(invoices),
+            skipped=len(invoices) - len(reachable),
+            invoice_ids=reachable,
+        )
 
-        for inv in invoices:
-            try:
-                customer = inv.customer  # type: ignore[union-attr]
-                if customer is None or not getattr(customer, "phone", None):
-                    skipped += 1
-                    continue
-
-                # Render template with invoice/customer fields
-                body = msg_template.format(
-                    first_name=customer.first_name,
-                    last_name=customer.last_name,
-                    invoice_number=inv.invoice_number,
-                    amount=f"{inv.total_amount:.2f}",
-                    due_date=inv.due_date.isoformat() if inv.due_date else "",
-                )
-
-                # Import SMS dependencies lazily to avoid circular imports
-                from grins_platform.schemas.ai import (  # noqa: PLC0415
-                    MessageType,
-                )
-                from grins_platform.services.sms.recipient import (  # noqa: PLC0415
-                    Recipient,
-                )
-                from grins_platform.services.sms_service import (  # noqa: PLC0415
-                    SMSService,
-                )
-
-                sms_service = SMSService(
-                    self.invoice_repository.session,
-                )
-                recipient = Recipient.from_customer(customer)
-                await sms_service.send_message(
-                    recipient=recipient,
-                    message=body,
-                    message_type=MessageType.PAYMENT_REMINDER,
-                    consent_type="transactional",
-                )
-
-                # Update reminder count
-                await self.invoice_repository.update(
-                    inv.id,
-                    reminder_count=inv.reminder_count + 1,
-                    last_reminder_sent=datetime.now(timezone.utc),
-                )
-                sent += 1
-            except Exception:
-                self.logger.warning(
-                    "invoice.mass_notify.single_failure",
-                    invoice_id=str(inv.id),
-                    notification_type=notification_type,
-                )
-                failed += 1
-
+        response = _mass_notify_response(run)
         self.log_completed(
             "mass_notify",
             notification_type=notification_type,
-            targeted=targeted,
-            sent=sent,
-            failed=failed,
-            skipped=skipped,
+            run_id=str(run.id),
+            targeted=response.targeted,
+            queued=response.pending,
+            skipped=response.skipped,
         )
-        return MassNotifyResponse(
-            notification_type=notification_type,
-            targeted=targeted,
-            sent=sent,
-            failed=failed,
-            skipped=skipped,
+        return response
+
+    async def get_mass_notify_run(self, run_id: UUID) -> MassNotifyResponse:
+        """Return the progress of a mass-notification run.
+
+        Args:
+            run_id: Run ID returned by mass_notify
+
+        Returns:
+            MassNotifyResponse with the run's current counts
+
+        Raises:
+            InvalidInvoiceOperationError: If the run does not exist
+
+        Validates: Requirement 29.3
+        """
+        run = await self.invoice_repository.get_notification_run(run_id)
+        if run is None:
+            msg = f"Mass notification run not found: {run_id}"
+            raise InvalidInvoiceOperationError(msg)
+        return _mass_notify_response(run)
+
+
+def _mass_notify_response(run: InvoiceNotificationRun) -> MassNotifyResponse:
+    return MassNotifyResponse(
+        run_id=run.id,
+        status=run.status,
+        notification_type=run.notification_type,
+        targeted=run.targeted,
+        sent=run.sent,
+        failed=run.failed,
+        skipped=run.skipped,
+        pending=max(run.targeted - run.sent - run.failed - run.skipped, 0),
+    )
+
+
+async def _render_invoice_pdf(
+    session: AsyncSession,
+    invoice_id: UUID,
+    _payload: dict[str, Any],
+) -> None:
+    """Outbox handler: render and store a generated invoice's PDF."""
+    from grins_platform.services.invoice_pdf_service import (  # noqa: PLC0415
+        InvoiceNotFoundError as PDFInvoiceNotFoundError,
+        InvoicePDFService,
+    )
+
+    try:
+        await InvoicePDFService().generate_pdf(session, invoice_id)
+    except PDFInvoiceNotFoundError:
+        get_logger(__name__).info(
+            "invoice.pdf.skipped",
+            invoice_id=str(invoice_id),
+            reason="invoice_missing",
         )
+
+
+async def _send_generated_invoice(
+    session: AsyncSession,
+    invoice_id: UUID,
+    _payload: dict[str, Any],
+) -> None:
+    """Outbox handler: send a generated invoice still in draft."""
+    from grins_platform.repositories.invoice_repository import (  # noqa: PLC0415
+        InvoiceRepository,
+    )
+    from grins_platform.repositories.job_repository import (  # noqa: PLC0415
+        JobRepository,
+    )
+
+    service = InvoiceService(
+        invoice_repository=InvoiceRepository(session=session),
+        job_repository=JobRepository(session=session),
+    )
+    try:
+        await service.send_invoice(invoice_id)
+    except (InvoiceNotFoundError, InvalidInvoiceOperationError) as e:
+        get_logger(__name__).info(
+            "invoice.send.skipped",
+            invoice_id=str(invoice_id),
+            reason=str(e),
+        )
+
+
+INVOICE_OUTBOX_HANDLERS: dict[str, OutboxHandler] = {
+    INVOICE_PDF_EVENT: _render_invoice_pdf,
+    INVOICE_SEND_EVENT: _send_generated_invoice,
+}
@@ -93,10 +93,12 @@ class JobConfirmationService(LoggerMixin):
         raw_body: str,
         from_phone: str,
         provider_sid: str | None = None,
+        original: SentMessage | None = None,
     ) -> dict[str, Any]:
         """Process an inbound confirmation reply.
 
-        Correlates via provider_thread_id on sent_messages, then dispatches
+        Correlates via provider_thread_id on sent_messages (unless the caller
+        already resolved the ``original`` confirmation SMS), then dispatches
         to the appropriate handler based on keyword.
 
         Validates: CRM Changes Update 2 Req 24.2-24.8
@@ -108,7 +110,8 @@ class JobConfirmationService(LoggerMixin):
         )
 
         # 1. Correlate thread_id → original confirmation SMS
-        original = await self.find_confirmation_message(thread_id)
+        if original is None:
+            original = await self.find_confirmation_message(thread_id)
         if original is None:
             self.log_rejected(
                 "handle_confirmation",
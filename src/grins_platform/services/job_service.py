@@ -13,7 +13,7 @@ from __future__ import annotations
 import contextlib
 from datetime import date, datetime
 from decimal import ROUND_HALF_UP, Decimal
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from grins_platform.exceptions import (
     CustomerNotFoundError,
@@ -42,6 +42,7 @@ if TYPE_CHECKING:
     from grins_platform.models.job_status_history import JobStatusHistory
     from grins_platform.repositories.customer_repository import CustomerRepository
     from grins_platform.repositories.job_repository import JobRepository
+    from grins_platform.repositories.pagination import CountMode, KeysetPage
     from grins_platform.repositories.property_repository import PropertyRepository
     from grins_platform.repositories.service_offering_repository import (
         ServiceOfferingRepository,
@@ -608,6 +609,43 @@ class JobService(LoggerMixin):
         self.log_completed("list_jobs", count=len(jobs), total=total)
         return jobs, total
 
+    async def list_jobs_keyset(
+        self,
+        *,
+        cursor: str | None,
+        page_size: int = 20,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        count: CountMode = "cached",
+        **filters: Any,
+    ) -> KeysetPage[Job]:
+        """List jobs a page at a time after *cursor* (see ``list_jobs``).
+
+        Args:
+            cursor: ``next_cursor`` of the previous page, or None/"" to start
+            page_size: Number of items per page
+            sort_by: Field to sort by
+            sort_order: Sort order (asc/desc)
+            count: Total count mode
+            **filters: Same filters as ``list_jobs``
+
+        Returns:
+            KeysetPage of jobs
+        """
+        self.log_started("list_jobs_keyset", page_size=page_size)
+
+        page = await self.job_repository.list_keyset(
+            cursor=cursor,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            count=count,
+            **filters,
+        )
+
+        self.log_completed("list_jobs_keyset", count=len(page.items))
+        return page
+
     async def get_ready_to_schedule(
         self,
         page: int = 1,
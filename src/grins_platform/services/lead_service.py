@@ -58,12 +58,18 @@ from grins_platform.schemas.lead import (
     PaginatedFollowUpQueueResponse,
     PaginatedLeadResponse,
 )
+from grins_platform.services.outbox_service import (
+    OutboxHandler,
+    OutboxProcessor,
+    enqueue_outbox_event,
+)
 from grins_platform.utils.zip_lookup import extract_zip_from_address, lookup_zip
 
 if TYPE_CHECKING:
     from uuid import UUID
 
     from fastapi import BackgroundTasks
+    from sqlalchemy.ext.asyncio import AsyncSession
 
     from grins_platform.models.google_sheet_submission import (
         GoogleSheetSubmission,
@@ -78,106 +84,155 @@ if TYPE_CHECKING:
     from grins_platform.services.sms_service import SMSService
 
 
-async def send_lead_confirmations_post_commit(lead_id: UUID) -> None:
-    """Send SMS + email confirmations after the intake transaction commits.
+LEAD_CONFIRMATION_SMS_EVENT = "lead.confirmation_sms"
+LEAD_CONFIRMATION_EMAIL_EVENT = "lead.confirmation_email"
 
-    Runs as a FastAPI BackgroundTask with a fresh database session so any
-    SQLAlchemy error raised inside the notification path cannot roll back
-    the lead that was just persisted in the request transaction. Errors
-    are logged at ERROR severity for production visibility.
+_LEAD_CONFIRMATION_SMS = (
+    "Thanks for reaching out to Grins Irrigation! "
+    "We received your request and will be in touch soon."
+)
 
-    Validates: Requirements 46.7, 55.1-55.3 (async confirmation delivery);
-    BUG-001 fix (2026-04-14 lead-form silent-rollback when sms_consent=true).
+
+# SMSService declines that retrying cannot change: the recipient opted
+# out, or the same confirmation already went out.
+_TERMINAL_SMS_DECLINES = frozenset(
+    {
+        "opted_out",
+        "Duplicate message prevented",
+        "Duplicate: same recipient+campaign within 24h",
+    },
+)
+
+
+async def _deliver_lead_sms_confirmation(
+    session: AsyncSession,
+    lead_id: UUID,
+    _payload: dict[str, Any],
+) -> None:
+    """Outbox handler: send the SMS confirmation for a new lead.
+
+    A send the SMS service declines for consent (opt-out) or as a
+    duplicate is logged, not retried; any other failure, such as a
+    provider or network error, raises so the outbox retries with backoff.
+    """
+    from grins_platform.repositories.lead_repository import (  # noqa: PLC0415
+        LeadRepository,
+    )
+    from grins_platform.services.sms_service import (  # noqa: PLC0415
+        SMSError,
+        SMSService,
+    )
+
+    log = get_logger(__name__)
+    lead = await LeadRepository(session=session).get_by_id(lead_id)
+    if lead is None or not lead.sms_consent or not lead.phone:
+        log.info(
+            "lead.confirmation.sms_skipped",
+            lead_id=str(lead_id),
+            reason="lead_missing_or_no_consent",
+        )
+        return
+
+    result = await SMSService(session=session).send_automated_message(
+        phone=lead.phone,
+        message=_LEAD_CONFIRMATION_SMS,
+        message_type="lead_confirmation",
+    )
+    if not result.get("success"):
+        reason = str(result.get("reason", "unknown"))
+        if reason not in _TERMINAL_SMS_DECLINES:
+            raise SMSError(reason)
+        log.info(
+            "lead.confirmation.sms_skipped",
+            lead_id=str(lead.id),
+            reason=reason,
+        )
+    elif result.get("deferred"):
+        log.info(
+            "lead.confirmation.sms_deferred",
+            lead_id=str(lead.id),
+            scheduled_for=result.get("scheduled_for"),
+        )
+    else:
+        log.info("lead.confirmation.sms_sent", lead_id=str(lead.id))
+
+
+async def _deliver_lead_email_confirmation(
+    session: AsyncSession,
+    lead_id: UUID,
+    _payload: dict[str, Any],
+) -> None:
+    """Outbox handler: send the email confirmation for a new lead.
+
+    Provider errors propagate so the outbox retries with backoff. An
+    email that is not sent because email is not configured is final and
+    only logged, since retrying cannot change that.
     """
-    from grins_platform.database import get_database_manager  # noqa: PLC0415
     from grins_platform.repositories.lead_repository import (  # noqa: PLC0415
         LeadRepository,
     )
     from grins_platform.services.email_service import (  # noqa: PLC0415
         EmailService,
     )
-    from grins_platform.services.sms_service import SMSService  # noqa: PLC0415
 
     log = get_logger(__name__)
-    db_manager = get_database_manager()
+    lead = await LeadRepository(session=session).get_by_id(lead_id)
+    if lead is None or not lead.email:
+        log.info(
+            "lead.email_confirmation.skipped",
+            lead_id=str(lead_id),
+            reason="lead_missing_or_no_email",
+        )
+        return
 
-    async with db_manager.session_factory() as session:
-        try:
-            repo = LeadRepository(session=session)
-            lead = await repo.get_by_id(lead_id)
-            if lead is None:
-                log.error(
-                    "lead.post_commit_confirmations.lead_not_found",
-                    lead_id=str(lead_id),
-                )
-                return
+    email_service = EmailService()
+    if not email_service.settings.is_configured:
+        log.info(
+            "lead.email_confirmation.skipped",
+            lead_id=str(lead.id),
+            reason="email_not_configured",
+        )
+        return
 
-            sms_service = SMSService(session=session)
-            email_service = EmailService()
+    result = email_service.send_lead_confirmation(lead)
+    if not result.get("sent"):
+        log.info(
+            "lead.email_confirmation.skipped",
+            lead_id=str(lead.id),
+            reason=str(result.get("reason", "not_sent")),
+        )
+        return
+    log.info("lead.email_confirmation.sent", lead_id=str(lead.id))
 
-            if lead.sms_consent and lead.phone:
-                try:
-                    confirmation_msg = (
-                        "Thanks for reaching out to Grins Irrigation! "
-                        "We received your request and will be in touch soon."
-                    )
-                    result = await sms_service.send_automated_message(
-                        phone=lead.phone,
-                        message=confirmation_msg,
-                        message_type="lead_confirmation",
-                    )
-                    if result.get("success"):
-                        if result.get("deferred"):
-                            log.info(
-                                "lead.confirmation.sms_deferred",
-                                lead_id=str(lead.id),
-                                scheduled_for=result.get("scheduled_for"),
-                            )
-                        else:
-                            log.info(
-                                "lead.confirmation.sms_sent",
-                                lead_id=str(lead.id),
-                            )
-                    else:
-                        log.info(
-                            "lead.confirmation.sms_skipped",
-                            lead_id=str(lead.id),
-                            reason=result.get("reason", "unknown"),
-                        )
-                except Exception as exc:  # noqa: BLE001
-                    log.error(
-                        "lead.confirmation.sms_failed",
-                        lead_id=str(lead.id),
-                        error=str(exc),
-                        exc_info=True,
-                    )
-                    await session.rollback()
 
-            if lead.email:
-                try:
-                    email_service.send_lead_confirmation(lead)
-                    log.info(
-                        "lead.email_confirmation.sent",
-                        lead_id=str(lead.id),
-                    )
-                except Exception as exc:  # noqa: BLE001
-                    log.error(
-                        "lead.email_confirmation.failed",
-                        lead_id=str(lead.id),
-                        error=str(exc),
-                        exc_info=True,
-                    )
+LEAD_OUTBOX_HANDLERS: dict[str, OutboxHandler] = {
+    LEAD_CONFIRMATION_SMS_EVENT: _deliver_lead_sms_confirmation,
+    LEAD_CONFIRMATION_EMAIL_EVENT: _deliver_lead_email_confirmation,
+}
 
-            try:
-                await session.commit()
-            except Exception as exc:  # noqa: BLE001
-                log.error(
-                    "lead.post_commit_confirmations.commit_failed",
-                    lead_id=str(lead_id),
-                    error=str(exc),
-                    exc_info=True,
-                )
-                await session.rollback()
+
+async def send_lead_confirmations_post_commit(lead_id: UUID) -> None:
+    """Deliver a new lead's confirmations right after intake commits.
+
+    The confirmations are outbox rows written in the intake transaction;
+    this post-commit kick delivers them immediately in a fresh session so
+    the usual case is as fast as an inline send. Anything it cannot
+    deliver (provider outage, process restart) stays pending and the
+    scheduled outbox worker retries it with backoff, so nothing in the
+    notification path can roll back or lose the lead.
+
+    Validates: Requirements 46.7, 55.1-55.3 (async confirmation delivery);
+    BUG-001 fix (2026-04-14 lead-form silent-rollback when sms_consent=true).
+    """
+    from grins_platform.database import get_database_manager  # noqa: PLC0415
+
+    log = get_logger(__name__)
+    db_manager = get_database_manager()
+
+    async with db_manager.session_factory() as session:
+        try:
+            await OutboxProcessor().process_due(session, aggregate_id=lead_id)
+            await session.commit()
         except Exception as exc:  # noqa: BLE001
             log.error(
                 "lead.post_commit_confirmations.unhandled",
@@ -412,20 +467,22 @@ class LeadService(LoggerMixin):
         5. If active duplicate found: update existing lead (merge fields)
         6. If no duplicate: create new lead with status "new"
         7. Create SmsConsentRecord for the lead
-        8. Log lead.submitted event (lead_id + source_site only, no PII)
-        9. Schedule SMS + email confirmations as post-commit background task
+        8. Record SMS + email confirmations as outbox events (same
+           transaction as the lead)
+        9. Log lead.submitted event (lead_id + source_site only, no PII)
+        10. Schedule a post-commit background task that delivers them
 
-        The SMS/email confirmations are scheduled to run *after* the
-        request transaction commits, in a fresh session, so any failure
-        in the notification path cannot roll back the lead insert
-        (BUG-001, 2026-04-14).
+        The confirmations are delivered *after* the request transaction
+        commits, in a fresh session, so any failure in the notification
+        path cannot roll back the lead insert (BUG-001, 2026-04-14). The
+        outbox worker retries whatever the post-commit task cannot send.
 
         Args:
             data: LeadSubmission schema with form data
             background_tasks: Optional FastAPI BackgroundTasks for
-                scheduling post-commit confirmations. When None (e.g.
-                direct service calls from non-HTTP callers), no
-                confirmation is sent.
+                delivering confirmations right after commit. When None
+                (e.g. direct service calls from non-HTTP callers), the
+                outbox worker delivers them on its next tick.
 
         Returns:
             LeadSubmissionResponse with success status and lead_id
@@ -556,17 +613,32 @@ class LeadService(LoggerMixin):
         # Step 6: Create SmsConsentRecord for the lead
         await self._create_lead_consent_record(lead, data)
 
-        # Step 7: Log (no PII)
+        # Step 7: Record the confirmations in the outbox, in this same
+        # transaction, so they exist exactly when the lead commits.
+        if data.sms_consent and lead.phone:
+            await enqueue_outbox_event(
+                self.lead_repository.session,
+                LEAD_CONFIRMATION_SMS_EVENT,
+                lead.id,
+            )
+        if data.email:
+            await enqueue_outbox_event(
+                self.lead_repository.session,
+                LEAD_CONFIRMATION_EMAIL_EVENT,
+                lead.id,
+            )
+
+        # Step 8: Log (no PII)
         self.logger.info(
             "lead.submitted",
             lead_id=str(lead.id),
             source_site=data.source_site,
         )
 
-        # Step 8: Schedule SMS + email confirmations to run *after* the
-        # request transaction commits, in a fresh session. Failures in
-        # the notification path cannot roll back the lead insert
-        # (BUG-001 fix, 2026-04-14).
+        # Step 9: Kick delivery once the request transaction commits, in a
+        # fresh session. Failures in the notification path cannot roll
+        # back the lead insert (BUG-001 fix, 2026-04-14); undelivered
+        # events are retried by the outbox worker.
         if background_tasks is not None:
             background_tasks.add_task(
                 send_lead_confirmations_post_commit,
@@ -574,7 +646,7 @@ class LeadService(LoggerMixin):
             )
         else:
             self.logger.info(
-                "lead.confirmations.not_scheduled",
+                "lead.confirmations.deferred_to_worker",
                 lead_id=str(lead.id),
                 reason="no_background_task_scheduler",
             )
@@ -811,9 +883,17 @@ class LeadService(LoggerMixin):
 
         Validates: Requirement 5.1-5.5
         """
-        leads, total = await self.lead_repository.list_with_filters(params)
+        next_cursor: str | None = None
+        total: int | None
+        if params.cursor is not None:
+            page = await self.lead_repository.list_keyset(params)
+            leads, total, next_cursor = page.items, page.total, page.next_cursor
+        else:
+            leads, total = await self.lead_repository.list_with_filters(params)
 
-        total_pages = ceil(total / params.page_size) if total > 0 else 0
+        total_pages: int | None = None
+        if total is not None:
+            total_pages = ceil(total / params.page_size) if total > 0 else 0
 
         return PaginatedLeadResponse(
             items=[LeadResponse.model_validate(lead) for lead in leads],
@@ -821,6 +901,7 @@ class LeadService(LoggerMixin):
             page=params.page,
             page_size=params.page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
 
     async def update_lead(
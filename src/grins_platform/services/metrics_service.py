@@ -3,19 +3,31 @@
 Computes active agreement count, MRR, ARPA, renewal rate,
 churn rate, past-due amount, MRR history, and tier distribution.
 
+History for closed months is read from ``agreement_metrics_snapshots``:
+``snapshot_month`` reconstructs each agreement's status at the month's end
+from ``agreement_status_logs`` (latest transition before the boundary, else
+the first later transition's old status, else the current status) and
+stores per-tier counts of agreements in force (active, past due, paused or
+pending renewal). Only the nightly job writes snapshots; reads compute a
+month that has none yet without storing it. Prices are today's
+``annual_price``; price history is not recorded.
+
 Validates: Requirement 20.1, 22.3, 22.4
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
 from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from grins_platform.log_config import LoggerMixin
+from grins_platform.models.agreement_metrics_snapshot import AgreementMetricsSnapshot
 from grins_platform.models.agreement_status_log import AgreementStatusLog
 from grins_platform.models.enums import (
     AgreementPaymentStatus,
@@ -25,8 +37,46 @@ from grins_platform.models.service_agreement import ServiceAgreement
 from grins_platform.models.service_agreement_tier import ServiceAgreementTier
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy import Select
     from sqlalchemy.ext.asyncio import AsyncSession
 
+SNAPSHOT_HISTORY_MONTHS = 36
+# Statuses counted in a closed month's history (the live month counts
+# ACTIVE only)
+_IN_FORCE_STATUSES = (
+    AgreementStatus.ACTIVE.value,
+    AgreementStatus.PAST_DUE.value,
+    AgreementStatus.PAUSED.value,
+    AgreementStatus.PENDING_RENEWAL.value,
+)
+_SNAPSHOT_COUNTS = (
+    "active_count",
+    "mrr",
+    "cancelled_count",
+    "renewed_count",
+    "not_renewed_count",
+)
+
+
+def add_months(month: date, months: int) -> date:
+    """Return the first day of the month *months* after *month*."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _month_start_utc(month: date) -> datetime:
+    return datetime.combine(month.replace(day=1), time.min, tzinfo=timezone.utc)
+
+
+def _rate(numerator: int, denominator: int) -> Decimal:
+    if denominator == 0:
+        return Decimal("0.00")
+    return (Decimal(numerator) / Decimal(denominator) * Decimal(100)).quantize(
+        Decimal("0.01"),
+    )
+
 
 @dataclass
 class AgreementMetrics:
@@ -65,6 +115,30 @@ class MrrHistory:
     data_points: list[MrrDataPoint] = field(default_factory=list)
 
 
+@dataclass
+class TierMonthlyMetrics:
+    """One tier's agreement metrics for a closed month."""
+
+    tier_id: str
+    tier_name: str
+    active_count: int
+    mrr: Decimal
+    churn_rate: Decimal
+    renewal_rate: Decimal
+
+
+@dataclass
+class MonthlyAgreementMetrics:
+    """Agreement metrics for a closed month, in total and per tier."""
+
+    month: str  # YYYY-MM
+    active_count: int
+    mrr: Decimal
+    churn_rate: Decimal
+    renewal_rate: Decimal
+    tiers: list[TierMonthlyMetrics] = field(default_factory=list)
+
+
 @dataclass
 class TierDistribution:
     """Active agreement counts grouped by tier."""
@@ -211,61 +285,310 @@ class MetricsService(LoggerMixin):
         return Decimal(str(result.scalar() or 0))
 
     async def get_mrr_history(self, months: int = 12) -> MrrHistory:
-        """Compute MRR for each of the trailing N months.
+        """Get MRR for each of the trailing N months.
 
-        For each month, MRR = sum(annual_price / 12) for agreements that
-        were ACTIVE at the end of that month (created before month end,
-        not cancelled/expired before month end).
+        Closed months come from the monthly snapshots (end-of-month MRR of
+        agreements in force); the current month is the live MRR of ACTIVE
+        agreements.
 
         Validates: Requirement 22.3
         """
         self.log_started("get_mrr_history", months=months)
-        now = datetime.now(timezone.utc)
-        data_points: list[MrrDataPoint] = []
-
-        for i in range(months - 1, -1, -1):
-            # Compute the last day of the target month
-            target = now - timedelta(days=i * 30)
-            month_str = target.strftime("%Y-%m")
-
-            # For current month, use current active MRR
-            if i == 0:
-                _, mrr = await self._get_active_metrics()
-                data_points.append(
-                    MrrDataPoint(month=month_str, mrr=mrr.quantize(Decimal("0.01"))),
+        current = datetime.now(timezone.utc).date().replace(day=1)
+        first = add_months(current, -(months - 1))
+        closed = await self._closed_months(first, months - 1)
+        _, live_mrr = await self._get_active_metrics()
+
+        data_points = [
+            MrrDataPoint(
+                month=month.strftime("%Y-%m"),
+                mrr=sum(
+                    (Decimal(str(c["mrr"])) for c in tiers.values()),
+                    Decimal(0),
+                ).quantize(Decimal("0.01")),
+            )
+            for month, tiers in closed.items()
+        ]
+        data_points.append(
+            MrrDataPoint(
+                month=current.strftime("%Y-%m"),
+                mrr=live_mrr.quantize(Decimal("0.01")),
+            ),
+        )
+
+        self.log_completed("get_mrr_history", count=len(data_points))
+        return MrrHistory(data_points=data_points)
+
+    async def get_metrics_history(
+        self,
+        months: int = 12,
+    ) -> list[MonthlyAgreementMetrics]:
+        """Get snapshot metrics for the trailing N closed months.
+
+        Args:
+            months: Number of closed months, oldest first
+
+        Returns:
+            One entry per month with totals and a per-tier breakdown
+        """
+        self.log_started("get_metrics_history", months=months)
+        current = datetime.now(timezone.utc).date().replace(day=1)
+        tier_names = await self._tier_names()
+        closed = await self._closed_months(
+            add_months(current, -months),
+            months,
+            tier_names,
+        )
+
+        history: list[MonthlyAgreementMetrics] = []
+        for month, by_tier in closed.items():
+            rows = [
+                (by_tier[tier_id], tier_id, tier_name)
+                for tier_id, tier_name in tier_names.items()
+                if tier_id in by_tier
+            ]
+            active = sum(r["active_count"] for r, _, _ in rows)
+            cancelled = sum(r["cancelled_count"] for r, _, _ in rows)
+            renewed = sum(r["renewed_count"] for r, _, _ in rows)
+            not_renewed = sum(r["not_renewed_count"] for r, _, _ in rows)
+            history.append(
+                MonthlyAgreementMetrics(
+                    month=month.strftime("%Y-%m"),
+                    active_count=active,
+                    mrr=sum(
+                        (Decimal(str(r["mrr"])) for r, _, _ in rows),
+                        Decimal(0),
+                    ).quantize(Decimal("0.01")),
+                    churn_rate=_rate(cancelled, active + cancelled),
+                    renewal_rate=_rate(renewed, renewed + not_renewed),
+                    tiers=[
+                        TierMonthlyMetrics(
+                            tier_id=str(tier_id),
+                            tier_name=tier_name,
+                            active_count=r["active_count"],
+                            mrr=Decimal(str(r["mrr"])).quantize(Decimal("0.01")),
+                            churn_rate=_rate(
+                                r["cancelled_count"],
+                                r["active_count"] + r["cancelled_count"],
+                            ),
+                            renewal_rate=_rate(
+                                r["renewed_count"],
+                                r["renewed_count"] + r["not_renewed_count"],
+                            ),
+                        )
+                        for r, tier_id, tier_name in rows
+                    ],
+                ),
+            )
+
+        self.log_completed("get_metrics_history", count=len(history))
+        return history
+
+    async def _closed_months(
+        self,
+        first: date,
+        months: int,
+        tier_names: dict[UUID, str] | None = None,
+    ) -> dict[date, dict[UUID, dict[str, Any]]]:
+        """Per-tier counts of *months* closed months from *first*, oldest first.
+
+        Stored snapshots are read in one query. A month without snapshots
+        is computed from the status log but not stored: reads stay free of
+        writes and the nightly job fills the gap.
+        """
+        end = add_months(first, months)
+        stmt = select(AgreementMetricsSnapshot).where(
+            AgreementMetricsSnapshot.month >= first,
+            AgreementMetricsSnapshot.month < end,
+        )
+        stored: dict[date, dict[UUID, dict[str, Any]]] = {}
+        for snapshot in (await self.session.execute(stmt)).scalars().all():
+            stored.setdefault(snapshot.month, {})[snapshot.tier_id] = {
+                c: getattr(snapshot, c) for c in _SNAPSHOT_COUNTS
+            }
+
+        closed: dict[date, dict[UUID, dict[str, Any]]] = {}
+        for month in (add_months(first, i) for i in range(months)):
+            if month not in stored:
+                if tier_names is None:
+                    tier_names = await self._tier_names()
+                stored[month] = await self._compute_month(month, tier_names)
+            closed[month] = stored[month]
+        return closed
+
+    async def _tier_names(self) -> dict[UUID, str]:
+        """Tier names keyed by id, in display order."""
+        stmt = select(ServiceAgreementTier.id, ServiceAgreementTier.name).order_by(
+            ServiceAgreementTier.display_order,
+        )
+        return {row[0]: row[1] for row in (await self.session.execute(stmt)).all()}
+
+    async def ensure_snapshots(self, months: int = SNAPSHOT_HISTORY_MONTHS) -> int:
+        """Snapshot any of the trailing N closed months that have no rows.
+
+        Args:
+            months: How many closed months back to cover
+
+        Returns:
+            Number of months snapshotted
+        """
+        if months <= 0:
+            return 0
+        current = datetime.now(timezone.utc).date().replace(day=1)
+        first = add_months(current, -months)
+        stmt = (
+            select(AgreementMetricsSnapshot.month)
+            .where(
+                AgreementMetricsSnapshot.month >= first,
+                AgreementMetricsSnapshot.month < current,
+            )
+            .distinct()
+        )
+        present = set((await self.session.execute(stmt)).scalars().all())
+        missing = [
+            month
+            for month in (add_months(first, i) for i in range(months))
+            if month not in present
+        ]
+        if not missing:
+            return 0
+
+        self.log_started("ensure_snapshots", missing=len(missing))
+        for month in missing:
+            await self.snapshot_month(month)
+        self.log_completed("ensure_snapshots", snapshotted=len(missing))
+        return len(missing)
+
+    async def snapshot_month(self, month: date) -> int:
+        """Compute and upsert one closed month's per-tier snapshot rows.
+
+        Args:
+            month: Any day in the month to snapshot
+
+        Returns:
+            Number of tier rows written
+        """
+        month = month.replace(day=1)
+        self.log_started("snapshot_month", month=month.isoformat())
+        counts = await self._compute_month(month, await self._tier_names())
+
+        if counts:
+            rows = [
+                {"month": month, "tier_id": tier_id, **values}
+                for tier_id, values in counts.items()
+            ]
+            insert_stmt = pg_insert(AgreementMetricsSnapshot).values(rows)
+            await self.session.execute(
+                insert_stmt.on_conflict_do_update(
+                    constraint="uq_agreement_metrics_snapshots_month_tier",
+                    set_={
+                        **{c: insert_stmt.excluded[c] for c in _SNAPSHOT_COUNTS},
+                        "computed_at": func.now(),
+                    },
+                ),
+            )
+
+        self.log_completed("snapshot_month", month=month.isoformat(), tiers=len(counts))
+        return len(counts)
+
+    async def _compute_month(
+        self,
+        month: date,
+        tier_ids: Iterable[UUID],
+    ) -> dict[UUID, dict[str, Any]]:
+        """Reconstruct one closed month's per-tier counts from the status log."""
+        start = _month_start_utc(month)
+        end = _month_start_utc(add_months(month, 1))
+        counts: dict[UUID, dict[str, Any]] = {
+            tier_id: dict.fromkeys(_SNAPSHOT_COUNTS, 0) for tier_id in tier_ids
+        }
+
+        for tier_id, active_count, mrr in (
+            await self.session.execute(self._end_of_month_state_stmt(end))
+        ).all():
+            if tier_id in counts:
+                counts[tier_id].update(
+                    active_count=int(active_count),
+                    mrr=Decimal(str(mrr or 0)).quantize(Decimal("0.01")),
                 )
-                continue
-
-            # For past months: agreements created before month end that were
-            # active (not cancelled/expired before that month end).
-            # Approximation: count agreements whose start_date <= month end
-            # and (status is still active OR cancelled_at > month end).
-            month_end = target.replace(day=28) + timedelta(days=4)
-            month_end = month_end.replace(day=1)  # first of next month
-
-            stmt = select(
-                func.coalesce(func.sum(ServiceAgreement.annual_price / 12), 0),
-            ).where(
-                and_(
-                    ServiceAgreement.created_at < month_end,
-                    ServiceAgreement.status.in_(
+        for tier_id, cancelled, renewed, not_renewed in (
+            await self.session.execute(self._transitions_stmt(start, end))
+        ).all():
+            if tier_id in counts:
+                counts[tier_id].update(
+                    cancelled_count=int(cancelled),
+                    renewed_count=int(renewed),
+                    not_renewed_count=int(not_renewed),
+                )
+        return counts
+
+    @staticmethod
+    def _end_of_month_state_stmt(end: datetime) -> Select[Any]:
+        """Per-tier in-force count and MRR as of *end*, from the status log."""
+        log = AgreementStatusLog
+        status_before = (
+            select(log.new_status)
+            .where(log.agreement_id == ServiceAgreement.id, log.created_at < end)
+            .order_by(log.created_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        status_left = (
+            select(log.old_status)
+            .where(log.agreement_id == ServiceAgreement.id, log.created_at >= end)
+            .order_by(log.created_at.asc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        state = (
+            select(
+                ServiceAgreement.tier_id.label("tier_id"),
+                ServiceAgreement.annual_price.label("annual_price"),
+                func.coalesce(
+                    status_before,
+                    status_left,
+                    ServiceAgreement.status,
+                ).label("status"),
+            )
+            .where(ServiceAgreement.created_at < end)
+            .subquery("agreement_state")
+        )
+        active = state.c.status.in_(_IN_FORCE_STATUSES)
+        return select(
+            state.c.tier_id,
+            func.count().filter(active),
+            func.sum(state.c.annual_price / 12).filter(active),
+        ).group_by(state.c.tier_id)
+
+    @staticmethod
+    def _transitions_stmt(start: datetime, end: datetime) -> Select[Any]:
+        """Per-tier cancellation and renewal transition counts in [start, end)."""
+        log = AgreementStatusLog
+        from_pending = log.old_status == AgreementStatus.PENDING_RENEWAL.value
+        return (
+            select(
+                ServiceAgreement.tier_id,
+                func.count().filter(
+                    log.new_status == AgreementStatus.CANCELLED.value,
+                ),
+                func.count().filter(
+                    from_pending,
+                    log.new_status == AgreementStatus.ACTIVE.value,
+                ),
+                func.count().filter(
+                    from_pending,
+                    log.new_status.in_(
                         [
-                            AgreementStatus.ACTIVE.value,
-                            AgreementStatus.PAST_DUE.value,
-                            AgreementStatus.PAUSED.value,
-                            AgreementStatus.PENDING_RENEWAL.value,
+                            AgreementStatus.EXPIRED.value,
+                            AgreementStatus.CANCELLED.value,
                         ],
                     ),
                 ),
             )
-            result = await self.session.execute(stmt)
-            mrr_val = Decimal(str(result.scalar() or 0))
-            data_points.append(
-                MrrDataPoint(month=month_str, mrr=mrr_val.quantize(Decimal("0.01"))),
-            )
-
-        self.log_completed("get_mrr_history", count=len(data_points))
-        return MrrHistory(data_points=data_points)
+            .join(ServiceAgreement, ServiceAgreement.id == log.agreement_id)
+            .where(log.created_at >= start, log.created_at < end)
+            .group_by(ServiceAgreement.tier_id)
+        )
 
     async def get_tier_distribution(self) -> TierDistribution:
         """Get active agreement counts grouped by tier.
@@ -22,14 +22,13 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import and_, select
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from grins_platform.log_config import LoggerMixin
 from grins_platform.models.appointment import Appointment
 from grins_platform.models.customer import Customer
 from grins_platform.models.enums import (
-    AppointmentStatus,
     InvoiceStatus,
     NotificationType,
 )
@@ -201,17 +200,20 @@ class NotificationService(LoggerMixin):
         appointment_id: UUID | None = None,
         job_id: UUID | None = None,
         lead_id: UUID | None = None,
+        sms_blocked: bool = False,
     ) -> NotificationResult:
         """Send a notification via SMS (if consented) and email (always).
 
-        Creates a SentMessage record for tracking.
+        Creates a SentMessage record for tracking. ``sms_blocked`` skips
+        SMS for a recipient whose consent the caller already resolved as
+        revoked.
 
         Validates: Req 39.8 — all notifications consent-gated.
         """
         result = NotificationResult()
 
         # --- SMS (consent-gated) ---
-        if customer.sms_opt_in and self.sms_service is not None:
+        if customer.sms_opt_in and not sms_blocked and self.sms_service is not None:
             try:
                 from grins_platform.services.sms.recipient import (  # noqa: PLC0415
                     Recipient,
@@ -240,7 +242,7 @@ class NotificationService(LoggerMixin):
         else:
             self.log_rejected(
                 "send_sms",
-                reason="sms_not_consented",
+                reason="sms_hard_stopped" if sms_blocked else "sms_not_consented",
                 notification_type=notification_type.value,
                 customer_id=str(customer.id),
             )
@@ -329,93 +331,21 @@ class NotificationService(LoggerMixin):
     async def send_day_of_reminders(self, db: AsyncSession) -> int:
         """Send day-of reminders for today's appointments at 7AM CT.
 
-        Queries all appointments for today with status in
-        (scheduled, confirmed) and sends SMS (if consented) + email.
+        Runs the batched ``DayOfReminderEngine`` over all appointments for
+        today with status in (scheduled, confirmed): SMS (if consented) +
+        email, each reminder at most once per appointment and day.
 
         Returns:
             Count of notifications sent.
 
         Validates: Req 39.1, 39.7, 39.8
         """
-        self.log_started("send_day_of_reminders")
-
-        today = date.today()
-        stmt = (
-            select(Appointment)
-            .options(
-                selectinload(Appointment.job),  # type: ignore[arg-type]
-                selectinload(Appointment.staff),  # type: ignore[arg-type]
-            )
-            .where(
-                and_(
-                    Appointment.scheduled_date == today,
-                    Appointment.status.in_(
-                        [
-                            AppointmentStatus.SCHEDULED.value,
-                            AppointmentStatus.CONFIRMED.value,
-                        ],
-                    ),
-                ),
-            )
+        from grins_platform.services.day_of_reminder_engine import (  # noqa: PLC0415
+            DayOfReminderEngine,
         )
-        result = await db.execute(stmt)
-        appointments = list(result.scalars().all())
 
-        sent_count = 0
-        for appt in appointments:
-            customer = await self._get_customer_for_appointment(db, appt)
-            if customer is None:
-                self.log_rejected(
-                    "send_day_of_reminders",
-                    reason="customer_not_found",
-                    appointment_id=str(appt.id),
-                )
-                continue
-
-            staff_name = ""
-            if appt.staff is not None:
-                staff_name = getattr(appt.staff, "name", "your technician")
-
-            from grins_platform.services.sms.formatters import (  # noqa: PLC0415
-                format_sms_time_12h,
-            )
-
-            window_start = format_sms_time_12h(appt.time_window_start)
-            window_end = format_sms_time_12h(appt.time_window_end)
-
-            sms_body = (
-                f"Reminder: You have an appointment today with "
-                f"Grins Irrigation between {window_start} and "
-                f"{window_end}. {staff_name} will be your technician."
-            )
-            email_body = (
-                f"<p>This is a reminder that you have an appointment "
-                f"scheduled today with Grins Irrigation.</p>"
-                f"<p><strong>Time window:</strong> {window_start} - "
-                f"{window_end}</p>"
-                f"<p><strong>Technician:</strong> {staff_name}</p>"
-            )
-
-            notif_result = await self._send_notification(
-                db,
-                customer=customer,
-                notification_type=NotificationType.DAY_OF_REMINDER,
-                message_type=MessageType.APPOINTMENT_REMINDER,
-                subject="Appointment Reminder — Grins Irrigation",
-                sms_body=sms_body,
-                email_body=email_body,
-                appointment_id=appt.id,
-                job_id=appt.job_id,
-            )
-            if notif_result.sms_sent or notif_result.email_sent:
-                sent_count += 1
-
-        self.log_completed(
-            "send_day_of_reminders",
-            sent_count=sent_count,
-            total_appointments=len(appointments),
-        )
-        return sent_count
+        summary = await DayOfReminderEngine(email_service=self.email_service).run(db)
+        return summary.sent
 
     async def send_on_my_way(
         self,
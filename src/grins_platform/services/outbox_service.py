@@ -0,0 +1,185 @@
+"""Transactional outbox for side effects deferred out of a request.
+
+``enqueue_outbox_event`` writes an ``outbox_events`` row in the caller's
+transaction, so the side effect exists exactly when the data it describes
+commits. ``OutboxProcessor.process_due`` claims due rows with
+``FOR UPDATE SKIP LOCKED`` (so the scheduled worker and a post-commit
+kick never deliver the same row twice), runs each handler in a savepoint,
+and reschedules failures with exponential backoff until
+``OUTBOX_MAX_ATTEMPTS``. Delivery is at-least-once; handlers should be
+safe to repeat.
+
+Validates: Requirements 46.7, 55.1-55.3
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import insert, select, update
+
+from grins_platform.log_config import LoggerMixin
+from grins_platform.models.outbox_event import OutboxEvent
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+OUTBOX_BATCH_SIZE = 50
+OUTBOX_MAX_ATTEMPTS = 8
+OUTBOX_RETRY_BASE = timedelta(seconds=30)
+OUTBOX_RETRY_MAX = timedelta(hours=1)
+
+OutboxHandler = Callable[["AsyncSession", "UUID", dict[str, Any]], Awaitable[None]]
+
+
+async def enqueue_outbox_event(
+    session: AsyncSession,
+    event_type: str,
+    aggregate_id: UUID,
+    payload: dict[str, Any] | None = None,
+) -> None:
+    """Record a side effect in the caller's transaction (no commit)."""
+    await session.execute(
+        insert(OutboxEvent).values(
+            event_type=event_type,
+            aggregate_id=aggregate_id,
+            payload=payload or {},
+        ),
+    )
+
+
+async def enqueue_outbox_events(
+    session: AsyncSession,
+    event_type: str,
+    aggregate_ids: Sequence[UUID],
+) -> None:
+    """Record one side effect per aggregate in a single INSERT (no commit)."""
+    if not aggregate_ids:
+        return
+    await session.execute(
+        insert(OutboxEvent).values(
+            [
+                {"event_type": event_type, "aggregate_id": aggregate_id, "payload": {}}
+                for aggregate_id in aggregate_ids
+            ],
+        ),
+    )
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt after *attempts* failures."""
+    delay = OUTBOX_RETRY_BASE * (2 ** max(attempts - 1, 0))
+    return min(delay, OUTBOX_RETRY_MAX)
+
+
+def _default_handlers() -> dict[str, OutboxHandler]:
+    from grins_platform.services.invoice_service import (  # noqa: PLC0415
+        INVOICE_OUTBOX_HANDLERS,
+    )
+    from grins_platform.services.lead_service import (  # noqa: PLC0415
+        LEAD_OUTBOX_HANDLERS,
+    )
+
+    return {**LEAD_OUTBOX_HANDLERS, **INVOICE_OUTBOX_HANDLERS}
+
+
+class OutboxProcessor(LoggerMixin):
+    """Delivers due outbox events through their registered handlers."""
+
+    DOMAIN = "outbox"
+
+    def __init__(self, handlers: Mapping[str, OutboxHandler] | None = None) -> None:
+        """Initialize with event handlers (defaults to every registered one).
+
+        Args:
+            handlers: event_type -> async handler(session, aggregate_id, payload)
+        """
+        super().__init__()
+        self.handlers = dict(handlers) if handlers is not None else _default_handlers()
+
+    async def process_due(
+        self,
+        session: AsyncSession,
+        *,
+        aggregate_id: UUID | None = None,
+        limit: int = OUTBOX_BATCH_SIZE,
+    ) -> int:
+        """Deliver up to *limit* due events; the caller commits.
+
+        Args:
+            session: Database session; claimed rows stay locked until commit
+            aggregate_id: Only deliver events about this record
+            limit: Maximum events to claim
+
+        Returns:
+            Number of events delivered successfully
+        """
+        self.log_started("process_due", aggregate_id=str(aggregate_id or ""))
+        stmt = (
+            select(
+                OutboxEvent.id,
+                OutboxEvent.event_type,
+                OutboxEvent.aggregate_id,
+                OutboxEvent.payload,
+                OutboxEvent.attempts,
+            )
+            .where(
+                OutboxEvent.status == "pending",
+                OutboxEvent.next_attempt_at <= datetime.now(timezone.utc),
+            )
+            .order_by(OutboxEvent.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if aggregate_id is not None:
+            stmt = stmt.where(OutboxEvent.aggregate_id == aggregate_id)
+        events = (await session.execute(stmt)).all()
+
+        delivered = 0
+        for event_id, event_type, event_aggregate_id, payload, prior in events:
+            handler = self.handlers.get(event_type)
+            attempts = prior + 1
+            now = datetime.now(timezone.utc)
+            try:
+                if handler is None:
+                    msg = f"No outbox handler for {event_type}"
+                    raise LookupError(msg)  # noqa: TRY301
+                async with session.begin_nested():
+                    await handler(session, event_aggregate_id, payload or {})
+            except Exception as e:
+                exhausted = attempts >= OUTBOX_MAX_ATTEMPTS
+                values: dict[str, Any] = {
+                    "attempts": attempts,
+                    "last_error": str(e)[:2000],
+                }
+                if exhausted:
+                    values.update(status="failed", processed_at=now)
+                    self.log_failed(
+                        "process_due",
+                        error=e,
+                        event_id=str(event_id),
+                        event_type=event_type,
+                        attempts=attempts,
+                    )
+                else:
+                    values["next_attempt_at"] = now + retry_delay(attempts)
+                    self.logger.warning(
+                        "outbox.outboxprocessor.delivery_retry_scheduled",
+                        event_id=str(event_id),
+                        event_type=event_type,
+                        attempts=attempts,
+                        error=str(e),
+                    )
+            else:
+                delivered += 1
+                values = {"attempts": attempts, "status": "done", "processed_at": now}
+            await session.execute(
+                update(OutboxEvent).where(OutboxEvent.id == event_id).values(values),
+            )
+
+        self.log_completed("process_due", claimed=len(events), delivered=delivered)
+        return delivered
@@ -42,6 +42,8 @@ class S3ClientProtocol(Protocol):
 
     def put_object(self, **kwargs: Any) -> dict[str, Any]: ...
 
+    def get_object(self, **kwargs: Any) -> dict[str, Any]: ...
+
     def delete_object(
         self,
         **kwargs: Any,
@@ -357,6 +359,15 @@ class PhotoService(LoggerMixin):
         )
         return url
 
+    def download_file(self, file_key: str) -> bytes:
+        """Read a stored file's bytes from S3."""
+        response = self._client.get_object(
+            Bucket=self._bucket,
+            Key=file_key,
+        )
+        data: bytes = response["Body"].read()
+        return data
+
     def delete_file(self, file_key: str) -> None:
         """Delete a file from S3."""
         _ = self._client.delete_object(
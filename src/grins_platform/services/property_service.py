@@ -26,6 +26,9 @@ if TYPE_CHECKING:
 
     from grins_platform.models.lead import Lead
     from grins_platform.repositories.property_repository import PropertyRepository
+    from grins_platform.services.duplicate_detection_service import (
+        DuplicateDetectionService,
+    )
 
 
 class PropertyNotFoundError(Exception):
@@ -53,20 +56,31 @@ class PropertyService(LoggerMixin):
 
     Attributes:
         repository: PropertyRepository for database operations
+        duplicate_detector: Re-scores the owner's duplicate candidates when
+            an address changes, if set
 
     Validates: Requirement 2.1, 2.5-2.11
     """
 
     DOMAIN = "business"
 
-    def __init__(self, repository: PropertyRepository) -> None:
+    # Fields that feed the duplicate score (address and ZIP of the primary)
+    DUPLICATE_SIGNAL_FIELDS = frozenset({"address", "zip_code", "is_primary"})
+
+    def __init__(
+        self,
+        repository: PropertyRepository,
+        duplicate_detector: DuplicateDetectionService | None = None,
+    ) -> None:
         """Initialize service with repository.
 
         Args:
             repository: PropertyRepository for database operations
+            duplicate_detector: Optional detector run after address changes
         """
         super().__init__()
         self.repository = repository
+        self.duplicate_detector = duplicate_detector
 
     async def add_property(
         self,
@@ -136,6 +150,12 @@ class PropertyService(LoggerMixin):
             longitude=data.longitude,
         )
 
+        if self.duplicate_detector is not None:
+            await self.duplicate_detector.check_customer_on_write(
+                self.repository.session,
+                customer_id,
+            )
+
         self.log_completed(
             "add_property",
             property_id=str(property_obj.id),
@@ -267,6 +287,15 @@ class PropertyService(LoggerMixin):
             )
             raise PropertyNotFoundError(property_id)
 
+        if (
+            self.duplicate_detector is not None
+            and self.DUPLICATE_SIGNAL_FIELDS & update_data.keys()
+        ):
+            await self.duplicate_detector.check_customer_on_write(
+                self.repository.session,
+                updated.customer_id,
+            )
+
         self.log_completed(
             "update_property",
             property_id=str(property_id),
@@ -0,0 +1,373 @@
+"""Background extraction of queued receipts.
+
+``AccountingService.queue_receipt_extractions`` stores uploaded receipts
+and records a batch with one item per receipt, completing items whose
+content is already in the extraction cache. Each tick of this worker
+claims due items with ``FOR UPDATE SKIP LOCKED``, marks them
+``processing`` and commits, so no row stays locked while receipts are
+downloaded and sent to the vision model. Items cached since they were
+queued are answered from one lookup, and each remaining distinct receipt
+is extracted once (duplicates within the batch share the result) with
+bounded concurrency. Confident results are cached by content hash, item
+results and batch counters are written in a second transaction.
+
+A transient failure (rate limit, server error, timeout, lost connection)
+puts the item back to ``pending`` with backoff until
+``RECEIPT_EXTRACTION_MAX_ATTEMPTS``; other failures are final. A claim
+abandoned by a crashed worker is taken over once its lease expires.
+
+Validates: CRM Gap Closure Req 60.1, 60.2
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import and_, or_, select, update
+
+from grins_platform.log_config import LoggerMixin
+from grins_platform.models.receipt_extraction import (
+    ReceiptExtractionBatch,
+    ReceiptExtractionItem,
+)
+from grins_platform.repositories.expense_repository import ExpenseRepository
+from grins_platform.services.accounting_service import (
+    AccountingService,
+    cached_receipt_extraction,
+    receipt_cache_row,
+    receipt_extraction_values,
+)
+from grins_platform.services.outbox_service import retry_delay
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from grins_platform.schemas.expense import ReceiptExtractionResponse
+    from grins_platform.services.photo_service import PhotoService
+
+RECEIPT_EXTRACTION_BATCH_SIZE = 20
+RECEIPT_EXTRACTION_CONCURRENCY = 4
+# Stop claiming new batches after this long so ticks do not overlap
+RECEIPT_EXTRACTION_TICK_BUDGET_SECONDS = 20.0
+RECEIPT_EXTRACTION_MAX_ATTEMPTS = 5
+# A processing claim older than this was abandoned by its worker
+RECEIPT_EXTRACTION_LEASE = timedelta(minutes=10)
+
+# HTTP statuses that may succeed when retried; other 4xx are final
+_RETRYABLE_STATUSES = frozenset({408, 409, 429})
+
+# (status, column values, answered from the cache); status "retry" marks
+# a transient failure
+_Outcome = tuple[str, dict[str, Any], bool]
+
+
+def is_retryable_extraction_error(exc: BaseException) -> bool:
+    """Whether a failed download or extraction may succeed if tried again.
+
+    Errors carrying an HTTP status (OpenAI API errors, S3 client errors)
+    are retried for rate limits, timeouts and server errors only; errors
+    without one, such as timeouts and connection failures, are retried.
+    """
+    cause = exc.__cause__ or exc
+    status = getattr(cause, "status_code", None)
+    if status is None:
+        response = getattr(cause, "response", None)
+        if isinstance(response, dict):
+            status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    if not isinstance(status, int):
+        return True
+    return status >= 500 or status in _RETRYABLE_STATUSES
+
+
+class ReceiptExtractionWorker(LoggerMixin):
+    """Extracts pending receipt extraction items."""
+
+    DOMAIN = "accounting"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        *,
+        photo_service: PhotoService | None = None,
+        batch_size: int = RECEIPT_EXTRACTION_BATCH_SIZE,
+        concurrency: int = RECEIPT_EXTRACTION_CONCURRENCY,
+        tick_budget_seconds: float = RECEIPT_EXTRACTION_TICK_BUDGET_SECONDS,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            session_factory: Opens sessions (defaults to the application's)
+            photo_service: Reads stored receipts (defaults to the S3-backed
+                PhotoService)
+            batch_size: Items claimed per batch
+            concurrency: Receipts extracted at once
+            tick_budget_seconds: Time after which no new batch is claimed
+        """
+        super().__init__()
+        self._session_factory = session_factory
+        self._photo_service = photo_service
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.tick_budget_seconds = tick_budget_seconds
+
+    def _factory(self) -> Callable[[], AsyncSession]:
+        if self._session_factory is None:
+            from grins_platform.database import get_database_manager  # noqa: PLC0415
+
+            self._session_factory = get_database_manager().session_factory
+        return self._session_factory
+
+    def _photos(self) -> PhotoService:
+        if self._photo_service is None:
+            from grins_platform.services.photo_service import (  # noqa: PLC0415
+                PhotoService,
+            )
+
+            self._photo_service = PhotoService()
+        return self._photo_service
+
+    async def run(self) -> int:
+        """Process batches until none remain or time runs out.
+
+        Returns:
+            Number of items claimed
+        """
+        self.log_started("run")
+        deadline = time.monotonic() + self.tick_budget_seconds
+        total = 0
+        while True:
+            processed = await self.process_batch()
+            total += processed
+            if processed < self.batch_size or time.monotonic() >= deadline:
+                break
+        self.log_completed("run", processed=total)
+        return total
+
+    async def process_batch(self) -> int:
+        """Claim, extract and record one batch of due items.
+
+        Returns:
+            Number of items claimed (each is finalized or rescheduled)
+        """
+        async with self._factory()() as session:
+            repo = ExpenseRepository(session)
+            items, attempts, cache = await self._claim(session, repo)
+            if not items:
+                return 0
+
+            outcomes: dict[str, _Outcome] = {
+                content_hash: (
+                    "completed",
+                    cached_receipt_extraction(hit).model_dump(),
+                    True,
+                )
+                for content_hash, hit in cache.items()
+            }
+            to_extract: dict[str, ReceiptExtractionItem] = {}
+            for item in items:
+                if item.content_hash not in outcomes:
+                    to_extract.setdefault(item.content_hash, item)
+
+            extracted = await self._extract(
+                AccountingService(repo),
+                to_extract,
+                outcomes,
+            )
+            await repo.save_receipt_extractions(
+                [
+                    row
+                    for content_hash, result in extracted.items()
+                    if (row := receipt_cache_row(content_hash, result)) is not None
+                ],
+            )
+            await self._record(session, items, attempts, outcomes)
+            await session.commit()
+
+        self.logger.info(
+            "accounting.receipt_extraction.batch_processed",
+            claimed=len(items),
+            extracted=len(extracted),
+            failed=len(to_extract) - len(extracted),
+        )
+        return len(items)
+
+    async def _claim(
+        self,
+        session: AsyncSession,
+        repo: ExpenseRepository,
+    ) -> tuple[list[ReceiptExtractionItem], dict[UUID, int], dict[str, Any]]:
+        """Claim due items, look up cached results and commit the claim.
+
+        Returns:
+            The claimed items, each item's attempt number, and cached
+            extractions keyed by content hash
+        """
+        now = datetime.now(timezone.utc)
+        stmt = (
+            select(ReceiptExtractionItem)
+            .where(
+                or_(
+                    and_(
+                        ReceiptExtractionItem.status == "pending",
+                        or_(
+                            ReceiptExtractionItem.next_attempt_at.is_(None),
+                            ReceiptExtractionItem.next_attempt_at <= now,
+                        ),
+                    ),
+                    and_(
+                        ReceiptExtractionItem.status == "processing",
+                        ReceiptExtractionItem.claimed_at
+                        < now - RECEIPT_EXTRACTION_LEASE,
+                    ),
+                ),
+            )
+            .order_by(ReceiptExtractionItem.created_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        items = list((await session.execute(stmt)).scalars())
+        if not items:
+            return [], {}, {}
+
+        attempts = {item.id: item.attempts + 1 for item in items}
+        await session.execute(
+            update(ReceiptExtractionItem)
+            .where(ReceiptExtractionItem.id.in_(attempts))
+            .values(
+                status="processing",
+                claimed_at=now,
+                attempts=ReceiptExtractionItem.attempts + 1,
+            ),
+        )
+        cache = await repo.get_receipt_extractions(
+            [item.content_hash for item in items],
+        )
+        await session.commit()
+        return items, attempts, cache
+
+    async def _extract(
+        self,
+        accounting: AccountingService,
+        to_extract: dict[str, ReceiptExtractionItem],
+        outcomes: dict[str, _Outcome],
+    ) -> dict[str, ReceiptExtractionResponse]:
+        """Download and extract each distinct receipt, several at once.
+
+        Returns:
+            Successful extractions keyed by content hash
+        """
+        extracted: dict[str, ReceiptExtractionResponse] = {}
+        if not to_extract:
+            return extracted
+        photos = self._photos()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def extract(content_hash: str, item: ReceiptExtractionItem) -> None:
+            async with semaphore:
+                try:
+                    data = await asyncio.to_thread(photos.download_file, item.file_key)
+                    result = await accounting.extract_receipt(data, item.content_type)
+                except Exception as e:
+                    retryable = is_retryable_extraction_error(e)
+                    self.logger.warning(
+                        "accounting.receipt_extraction.single_failure",
+                        file_key=item.file_key,
+                        error=str(e),
+                        retryable=retryable,
+                    )
+                    outcomes[content_hash] = (
+                        "retry" if retryable else "failed",
+                        {"error": str(e)[:500]},
+                        False,
+                    )
+                else:
+                    extracted[content_hash] = result
+                    outcomes[content_hash] = (
+                        "completed",
+                        receipt_extraction_values(result),
+                        False,
+                    )
+
+        await asyncio.gather(
+            *(extract(content_hash, item) for content_hash, item in to_extract.items()),
+        )
+        return extracted
+
+    async def _record(
+        self,
+        session: AsyncSession,
+        items: Sequence[ReceiptExtractionItem],
+        attempts: dict[UUID, int],
+        outcomes: dict[str, _Outcome],
+    ) -> None:
+        """Write item results and batch progress."""
+        now = datetime.now(timezone.utc)
+        # (content hash, status, attempt number of a retried item)
+        grouped: defaultdict[tuple[str, str, int], list[UUID]] = defaultdict(list)
+        progress: defaultdict[UUID, Counter[str]] = defaultdict(Counter)
+        for item in items:
+            status, _, cached = outcomes[item.content_hash]
+            retry_attempt = 0
+            if status == "retry":
+                retry_attempt = attempts[item.id]
+                if retry_attempt >= RECEIPT_EXTRACTION_MAX_ATTEMPTS:
+                    status, retry_attempt = "failed", 0
+                else:
+                    status = "pending"
+            grouped[item.content_hash, status, retry_attempt].append(item.id)
+            progress[item.batch_id][status] += 1
+            progress[item.batch_id]["cached"] += cached
+
+        for (content_hash, status, retry_attempt), item_ids in grouped.items():
+            _, values, cached = outcomes[content_hash]
+            if status == "pending":
+                values = {
+                    **values,
+                    "next_attempt_at": now + retry_delay(retry_attempt),
+                }
+            else:
+                values = {
+                    "error": None,
+                    **values,
+                    "cached": cached,
+                    "processed_at": now,
+                }
+            await session.execute(
+                update(ReceiptExtractionItem)
+                .where(ReceiptExtractionItem.id.in_(item_ids))
+                .values(status=status, **values),
+            )
+
+        batch_table = ReceiptExtractionBatch
+        for batch_id, counts in progress.items():
+            await session.execute(
+                update(batch_table)
+                .where(batch_table.id == batch_id)
+                .values(
+                    status="processing",
+                    completed=batch_table.completed + counts["completed"],
+                    failed=batch_table.failed + counts["failed"],
+                    cached=batch_table.cached + counts["cached"],
+                ),
+            )
+        unfinished = (
+            select(ReceiptExtractionItem.id)
+            .where(
+                ReceiptExtractionItem.batch_id == batch_table.id,
+                ReceiptExtractionItem.status.in_(("pending", "processing")),
+            )
+            .exists()
+        )
+        await session.execute(
+            update(batch_table)
+            .where(batch_table.id.in_(progress), ~unfinished)
+            .values(status="completed", completed_at=now),
+        )
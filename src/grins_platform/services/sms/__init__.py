@@ -16,6 +16,8 @@ Public API:
     SMSRateLimitTracker — Header-based rate limit tracker for CallRail
     RateLimitState — Snapshot of rate-limit counters
     CheckResult — Result of a rate-limit check
+    ConversationIndex — Open-conversation index for inbound reply routing
+    OpenConversation — What a provider thread is awaiting a reply to
     render_template — Safe merge-field substitution (missing keys → "")
     SafeDict — Dict that returns "" for missing keys
     check_sms_consent — Type-scoped consent check with hard-STOP precedence
@@ -26,10 +28,15 @@ Public API:
     transition — Validate and execute a state transition
     orphan_recovery_query — Mark stuck 'sending' recipients as 'failed'
     count_segments — SMS segment counter (GSM-7 vs UCS-2)
+    estimate_segments — Bulk segment estimate for a template over an audience
+    SegmentEstimate — Segment totals and GSM-7/UCS-2 split for an audience
     Encoding — Literal type for SMS encoding
     parse_csv — Parse CSV bytes into staged recipients
     match_recipients — Match staged recipients against DB customers/leads
     CsvParseResult — Result of CSV parsing
+    stage_csv_upload — Stream a CSV file into the staging table in chunks
+    load_staged_recipients — Load a staged upload as ad-hoc recipient rows
+    CsvStageResult — Result of streaming CSV staging
     StagedRecipient — A successfully parsed recipient
     RejectedRow — A row that could not be processed
 """
@@ -51,12 +58,19 @@ from grins_platform.services.sms.consent import (
     bulk_insert_attestation_consent,
     check_sms_consent,
 )
+from grins_platform.services.sms.conversation_index import (
+    ConversationIndex,
+    OpenConversation,
+)
 from grins_platform.services.sms.csv_upload import (
     CsvParseResult,
+    CsvStageResult,
     RejectedRow,
     StagedRecipient,
+    load_staged_recipients,
     match_recipients,
     parse_csv,
+    stage_csv_upload,
 )
 from grins_platform.services.sms.factory import get_sms_provider
 from grins_platform.services.sms.ghost_lead import (
@@ -75,7 +89,12 @@ from grins_platform.services.sms.rate_limit_tracker import (
     SMSRateLimitTracker,
 )
 from grins_platform.services.sms.recipient import Recipient, SourceType
-from grins_platform.services.sms.segment_counter import Encoding, count_segments
+from grins_platform.services.sms.segment_counter import (
+    Encoding,
+    SegmentEstimate,
+    count_segments,
+    estimate_segments,
+)
 from grins_platform.services.sms.state_machine import (
     InvalidStateTransitionError,
     RecipientState,
@@ -94,11 +113,14 @@ __all__ = [
     "CallRailValidationError",
     "CheckResult",
     "ConsentType",
+    "ConversationIndex",
     "CsvParseResult",
+    "CsvStageResult",
     "Encoding",
     "InboundSMS",
     "InvalidStateTransitionError",
     "NullProvider",
+    "OpenConversation",
     "PhoneNormalizationError",
     "ProviderSendResult",
     "RateLimitState",
@@ -107,6 +129,7 @@ __all__ = [
     "RejectedRow",
     "SMSRateLimitTracker",
     "SafeDict",
+    "SegmentEstimate",
     "SourceType",
     "StagedRecipient",
     "TwilioProvider",
@@ -114,13 +137,16 @@ __all__ = [
     "check_sms_consent",
     "count_segments",
     "create_or_get_ghost_lead",
+    "estimate_segments",
     "get_sms_provider",
     "is_central_timezone",
+    "load_staged_recipients",
     "lookup_timezone",
     "match_recipients",
     "normalize_to_e164",
     "orphan_recovery_query",
     "parse_csv",
     "render_template",
+    "stage_csv_upload",
     "transition",
 ]
@@ -27,6 +27,8 @@ from grins_platform.models.sms_consent_record import SmsConsentRecord
 from grins_platform.services.sms.phone_normalizer import normalize_to_e164
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = get_logger(__name__)
@@ -67,6 +69,44 @@ async def check_sms_consent(
     return await _has_marketing_opt_in(session, e164)
 
 
+async def find_hard_stopped_phones(
+    session: AsyncSession,
+    phones: Iterable[str],
+) -> set[str]:
+    """Return which of *phones* have a hard-STOP revocation, in one query.
+
+    Bulk form of the hard-STOP half of ``check_sms_consent`` for senders
+    resolving consent for many recipients at once. Phones are returned in
+    the form they were given.
+
+    Args:
+        session: DB session.
+        phones: Phone numbers (any format).
+
+    Returns:
+        The subset of *phones* that must not receive non-operational SMS.
+    """
+    owners: dict[str, set[str]] = {}
+    for phone in set(phones):
+        for variant in _phone_variants(phone):
+            owners.setdefault(variant, set()).add(phone)
+    if not owners:
+        return set()
+
+    stmt = select(SmsConsentRecord.phone_number).where(
+        and_(
+            SmsConsentRecord.phone_number.in_(list(owners)),
+            SmsConsentRecord.consent_method == "text_stop",
+            SmsConsentRecord.consent_given.is_(False),
+        ),
+    )
+    result = await session.execute(stmt)
+    stopped: set[str] = set()
+    for number in result.scalars().all():
+        stopped |= owners.get(number, set())
+    return stopped
+
+
 def _phone_variants(phone: str) -> list[str]:
     """Return the set of phone-string forms we accept for DB lookups.
 
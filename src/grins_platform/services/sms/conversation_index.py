@@ -0,0 +1,134 @@
+"""Open-conversation index for inbound SMS routing.
+
+Maps a provider thread to what is awaiting a reply on it — the latest
+outbound message (and its campaign, when it was a campaign send) and the
+latest appointment confirmation — so ``SMSService.handle_inbound`` can pick
+the poll-reply or confirmation branch with one Redis lookup instead of
+probing ``sent_messages`` for each branch in turn.
+
+The index is written on every successful outbound send and expires after
+``CONVERSATION_TTL_SECONDS`` without activity. It is a cache: a miss (no
+Redis, expired entry, or a thread last used before the index existed)
+means "unknown" and callers fall back to the database correlation path.
+
+Keyed by provider thread ID rather than phone: CallRail masks the inbound
+sender (``***3312``), and each thread is already scoped to one recipient
+phone.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from grins_platform.log_config import LoggerMixin, get_logger
+from grins_platform.schemas.ai import MessageType
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    from grins_platform.models.sent_message import SentMessage
+
+_logger = get_logger(__name__)
+
+_REDIS_KEY_PREFIX = "sms:conv"
+CONVERSATION_TTL_SECONDS = 30 * 24 * 60 * 60  # 30 days
+
+
+@dataclass(frozen=True)
+class OpenConversation:
+    """What a provider thread is awaiting a reply to."""
+
+    sent_message_id: UUID | None
+    campaign_id: UUID | None
+    recipient_phone: str | None
+    # None when no confirmation was indexed — not proof that none exists
+    confirmation_message_id: UUID | None
+
+    @property
+    def awaiting_poll_reply(self) -> bool:
+        """Whether the latest outbound on the thread was a campaign send."""
+        return self.campaign_id is not None
+
+
+def _parse_uuid(raw: str | None) -> UUID | None:
+    if not raw:
+        return None
+    try:
+        return UUID(raw)
+    except ValueError:
+        return None
+
+
+class ConversationIndex(LoggerMixin):
+    """Redis-backed index of open SMS conversations by provider thread."""
+
+    DOMAIN = "sms"
+
+    def __init__(
+        self,
+        redis_client: Redis | None = None,
+        ttl_seconds: int = CONVERSATION_TTL_SECONDS,
+    ) -> None:
+        super().__init__()
+        self._redis = redis_client
+        self._ttl = ttl_seconds
+
+    @staticmethod
+    def _key(thread_id: str) -> str:
+        return f"{_REDIS_KEY_PREFIX}:{thread_id}"
+
+    async def record_outbound(self, sent_message: SentMessage) -> None:
+        """Index a successfully sent message under its provider thread.
+
+        Failures are logged and swallowed; the send has already succeeded.
+        """
+        thread_id = sent_message.provider_thread_id
+        if self._redis is None or not thread_id:
+            return
+
+        fields: dict[str, str] = {
+            "sent_message_id": str(sent_message.id),
+            "campaign_id": (
+                str(sent_message.campaign_id) if sent_message.campaign_id else ""
+            ),
+            "recipient_phone": sent_message.recipient_phone or "",
+        }
+        if sent_message.message_type == MessageType.APPOINTMENT_CONFIRMATION.value:
+            fields["confirmation_message_id"] = str(sent_message.id)
+
+        key = self._key(thread_id)
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                _ = pipe.hset(key, mapping=fields)
+                _ = pipe.expire(key, self._ttl)
+                _ = await pipe.execute()
+        except Exception:
+            _logger.warning(
+                "sms.conversation_index.record_failed",
+                thread_id=thread_id,
+                exc_info=True,
+            )
+
+    async def lookup(self, thread_id: str) -> OpenConversation | None:
+        """Return the open conversation for a thread, or None if unknown."""
+        if self._redis is None or not thread_id:
+            return None
+        try:
+            raw = await self._redis.hgetall(self._key(thread_id))
+        except Exception:
+            _logger.warning(
+                "sms.conversation_index.lookup_failed",
+                thread_id=thread_id,
+                exc_info=True,
+            )
+            return None
+        if not raw:
+            return None
+        return OpenConversation(
+            sent_message_id=_parse_uuid(raw.get("sent_message_id")),
+            campaign_id=_parse_uuid(raw.get("campaign_id")),
+            recipient_phone=raw.get("recipient_phone") or None,
+            confirmation_message_id=_parse_uuid(raw.get("confirmation_message_id")),
+        )
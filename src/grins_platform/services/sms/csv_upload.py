@@ -3,18 +3,27 @@
 Parses uploaded CSV files, normalizes phones, matches against existing
 customers/leads, and stages the result for campaign creation.
 
+Large uploads go through :func:`stage_csv_upload`, which decodes the file
+incrementally and processes it in fixed-size row chunks: each chunk is
+matched against customers and leads with a single query and written to
+``csv_upload_staged_recipients``, so memory stays bounded regardless of
+file size.
+
 Validates: Requirement 35
 """
 
 from __future__ import annotations
 
+import codecs
 import csv
 import io
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
-from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+from typing import IO, TYPE_CHECKING, Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import String, cast, delete, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from grins_platform.log_config import LoggerMixin, get_logger
 from grins_platform.services.sms.phone_normalizer import (
@@ -23,6 +32,9 @@ from grins_platform.services.sms.phone_normalizer import (
 )
 
 if TYPE_CHECKING:
+    from codecs import IncrementalDecoder
+    from collections.abc import Awaitable, Callable, Iterator
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = get_logger(__name__)
@@ -30,6 +42,23 @@ logger = get_logger(__name__)
 MAX_FILE_SIZE = 2 * 1024 * 1024  # 2 MB
 MAX_ROWS = 5000
 
+# Limits for the streaming path (stage_csv_upload)
+STREAM_MAX_FILE_SIZE = 25 * 1024 * 1024  # 25 MB
+STREAM_MAX_ROWS = 100_000
+STREAM_CHUNK_ROWS = 1000
+_READ_BLOCK_SIZE = 64 * 1024
+
+# Uploads up to this many recipients are also returned inline so they can
+# be embedded in ``target_audience.ad_hoc.recipients``; larger uploads are
+# referenced by ``csv_upload_id`` only.
+INLINE_RECIPIENT_LIMIT = MAX_ROWS
+
+# Cap on rejected rows echoed back to the client (the count is not capped)
+MAX_REPORTED_REJECTED_ROWS = 500
+
+# Staged uploads older than this are purged
+STAGED_UPLOAD_RETENTION_DAYS = 30
+
 # Encodings to try in order
 _ENCODINGS = ["utf-8-sig", "utf-8", "latin-1", "cp1252"]
 
@@ -69,6 +98,30 @@ class CsvParseResult:
     total_rows: int = 0
 
 
+@dataclass
+class CsvStageResult:
+    """Result of streaming a CSV file into the staging table."""
+
+    upload_id: UUID = field(default_factory=uuid4)
+    total_rows: int = 0
+    staged: int = 0
+    matched_customers: int = 0
+    matched_leads: int = 0
+    will_become_ghost_leads: int = 0
+    rejected_count: int = 0
+    rejected: list[RejectedRow] = field(default_factory=list)
+    duplicates_collapsed: int = 0
+    # Populated only while ``staged`` <= INLINE_RECIPIENT_LIMIT, else None
+    inline_recipients: list[StagedRecipient] | None = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class _Columns:
+    phone: int
+    first_name: int | None
+    last_name: int | None
+
+
 class _CsvUploadLog(LoggerMixin):
     DOMAIN = "sms"
 
@@ -103,6 +156,62 @@ def _find_column(headers: list[str], aliases: set[str]) -> int | None:
     return None
 
 
+def _resolve_columns(reader: Iterator[list[str]]) -> _Columns:
+    """Read the header row and locate the phone and name columns."""
+    try:
+        headers = next(reader)
+    except StopIteration:
+        msg = "CSV file is empty"
+        raise ValueError(msg)  # noqa: B904
+
+    phone_idx = _find_column(headers, _PHONE_ALIASES)
+    if phone_idx is None:
+        msg = "CSV must contain a 'phone' column"
+        raise ValueError(msg)
+
+    return _Columns(
+        phone=phone_idx,
+        first_name=_find_column(headers, _FIRST_NAME_ALIASES),
+        last_name=_find_column(headers, _LAST_NAME_ALIASES),
+    )
+
+
+def _parse_row(
+    row: list[str],
+    row_num: int,
+    cols: _Columns,
+) -> StagedRecipient | RejectedRow:
+    """Normalize a single data row."""
+    if cols.phone >= len(row):
+        return RejectedRow(row_num, "", "Row too short — missing phone column")
+
+    phone_raw = row[cols.phone].strip()
+    if not phone_raw:
+        return RejectedRow(row_num, phone_raw, "Empty phone")
+
+    try:
+        e164 = normalize_to_e164(phone_raw)
+    except PhoneNormalizationError as e:
+        return RejectedRow(row_num, phone_raw, str(e))
+
+    first_name = (
+        row[cols.first_name].strip()
+        if cols.first_name is not None and cols.first_name < len(row)
+        else None
+    )
+    last_name = (
+        row[cols.last_name].strip()
+        if cols.last_name is not None and cols.last_name < len(row)
+        else None
+    )
+    return StagedRecipient(
+        phone_e164=e164,
+        first_name=first_name or None,
+        last_name=last_name or None,
+        row_number=row_num,
+    )
+
+
 def parse_csv(raw_bytes: bytes) -> CsvParseResult:
     """Parse CSV bytes into staged recipients.
 
@@ -121,21 +230,7 @@ def parse_csv(raw_bytes: bytes) -> CsvParseResult:
 
     text = _detect_and_decode(raw_bytes)
     reader = csv.reader(io.StringIO(text))
-
-    # Read header
-    try:
-        headers = next(reader)
-    except StopIteration:
-        msg = "CSV file is empty"
-        raise ValueError(msg)  # noqa: B904
-
-    phone_idx = _find_column(headers, _PHONE_ALIASES)
-    if phone_idx is None:
-        msg = "CSV must contain a 'phone' column"
-        raise ValueError(msg)
-
-    first_name_idx = _find_column(headers, _FIRST_NAME_ALIASES)
-    last_name_idx = _find_column(headers, _LAST_NAME_ALIASES)
+    cols = _resolve_columns(reader)
 
     result = CsvParseResult()
     seen_phones: dict[str, int] = {}  # e164 -> first row number
@@ -147,49 +242,18 @@ def parse_csv(raw_bytes: bytes) -> CsvParseResult:
             msg = f"CSV exceeds {MAX_ROWS} row limit"
             raise ValueError(msg)
 
-        if phone_idx >= len(row):
-            result.rejected.append(
-                RejectedRow(row_num, "", "Row too short — missing phone column"),
-            )
-            continue
-
-        phone_raw = row[phone_idx].strip()
-        if not phone_raw:
-            result.rejected.append(RejectedRow(row_num, phone_raw, "Empty phone"))
-            continue
-
-        try:
-            e164 = normalize_to_e164(phone_raw)
-        except PhoneNormalizationError as e:
-            result.rejected.append(RejectedRow(row_num, phone_raw, str(e)))
+        parsed = _parse_row(row, row_num, cols)
+        if isinstance(parsed, RejectedRow):
+            result.rejected.append(parsed)
             continue
 
         # Dedupe within file — first occurrence wins
-        if e164 in seen_phones:
+        if parsed.phone_e164 in seen_phones:
             result.duplicates_collapsed += 1
             continue
 
-        seen_phones[e164] = row_num
-
-        first_name = (
-            row[first_name_idx].strip()
-            if first_name_idx is not None and first_name_idx < len(row)
-            else None
-        )
-        last_name = (
-            row[last_name_idx].strip()
-            if last_name_idx is not None and last_name_idx < len(row)
-            else None
-        )
-
-        result.recipients.append(
-            StagedRecipient(
-                phone_e164=e164,
-                first_name=first_name or None,
-                last_name=last_name or None,
-                row_number=row_num,
-            ),
-        )
+        seen_phones[parsed.phone_e164] = row_num
+        result.recipients.append(parsed)
 
     if result.total_rows == 0:
         msg = "CSV contains no data rows"
@@ -198,6 +262,34 @@ def parse_csv(raw_bytes: bytes) -> CsvParseResult:
     return result
 
 
+async def _match_phones(
+    session: AsyncSession,
+    phones: list[str],
+) -> tuple[set[str], set[str]]:
+    """Return (customer_phones, lead_phones) among ``phones`` in one query."""
+    from grins_platform.models.customer import Customer  # noqa: PLC0415
+    from grins_platform.models.lead import Lead  # noqa: PLC0415
+
+    if not phones:
+        return set(), set()
+
+    stmt = (
+        select(Customer.phone, literal("customer").label("source"))
+        .where(Customer.phone.in_(phones))
+        .union_all(
+            select(Lead.phone, literal("lead").label("source")).where(
+                Lead.phone.in_(phones),
+            ),
+        )
+    )
+    result = await session.execute(stmt)
+    customer_phones: set[str] = set()
+    lead_phones: set[str] = set()
+    for phone, source in result.all():
+        (customer_phones if source == "customer" else lead_phones).add(phone)
+    return customer_phones, lead_phones
+
+
 async def match_recipients(
     session: AsyncSession,
     recipients: list[StagedRecipient],
@@ -207,24 +299,11 @@ async def match_recipients(
     Returns:
         (matched_customers, matched_leads, will_become_ghost_leads)
     """
-    from grins_platform.models.customer import Customer  # noqa: PLC0415
-    from grins_platform.models.lead import Lead  # noqa: PLC0415
-
     phones = [r.phone_e164 for r in recipients]
     if not phones:
         return 0, 0, 0
 
-    # Batch query customers by phone
-    cust_result = await session.execute(
-        select(Customer.phone).where(Customer.phone.in_(phones)),
-    )
-    customer_phones: set[str] = {row[0] for row in cust_result.all()}
-
-    # Batch query leads by phone
-    lead_result = await session.execute(
-        select(Lead.phone).where(Lead.phone.in_(phones)),
-    )
-    lead_phones: set[str] = {row[0] for row in lead_result.all()}
+    customer_phones, lead_phones = await _match_phones(session, phones)
 
     matched_customers = 0
     matched_leads = 0
@@ -239,3 +318,263 @@ async def match_recipients(
             will_become_ghost += 1
 
     return matched_customers, matched_leads, will_become_ghost
+
+
+# ---------------------------------------------------------------------------
+# Streaming ingestion
+# ---------------------------------------------------------------------------
+
+
+def _feed_decoder(decoder: IncrementalDecoder, block: bytes, *, final: bool) -> bool:
+    """Feed a block to an incremental decoder; False if it cannot decode it."""
+    try:
+        _ = decoder.decode(block, final=final)
+    except (UnicodeDecodeError, ValueError):
+        return False
+    return True
+
+
+def _sniff_encoding(fileobj: IO[bytes], max_size: int) -> str:
+    """Pick the first encoding in ``_ENCODINGS`` that decodes the whole file.
+
+    Streams the file once through an incremental decoder per candidate
+    instead of decoding the full buffer for each encoding in turn, enforces
+    ``max_size`` along the way, then rewinds the file.
+
+    Raises:
+        ValueError: If the file exceeds ``max_size`` or no encoding fits.
+    """
+    decoders = {enc: codecs.getincrementaldecoder(enc)() for enc in _ENCODINGS}
+    size = 0
+    while True:
+        block = fileobj.read(_READ_BLOCK_SIZE)
+        size += len(block)
+        if size > max_size:
+            msg = f"File exceeds {max_size // (1024 * 1024)} MB limit"
+            raise ValueError(msg)
+        decoders = {
+            enc: dec
+            for enc, dec in decoders.items()
+            if _feed_decoder(dec, block, final=not block)
+        }
+        if not block:
+            break
+    _ = fileobj.seek(0)
+    for enc in _ENCODINGS:
+        if enc in decoders:
+            return enc
+    msg = "Could not decode CSV with any supported encoding"
+    raise ValueError(msg)
+
+
+async def _stage_chunk(
+    session: AsyncSession,
+    result: CsvStageResult,
+    chunk: list[StagedRecipient],
+    on_chunk: Callable[[list[str]], Awaitable[None]] | None,
+) -> None:
+    """Match one chunk against customers/leads and insert it into staging."""
+    from grins_platform.models.campaign import (  # noqa: PLC0415
+        CsvUploadStagedRecipient,
+    )
+
+    customer_phones, lead_phones = await _match_phones(
+        session,
+        [r.phone_e164 for r in chunk],
+    )
+
+    def _match_type(phone: str) -> str:
+        if phone in customer_phones:
+            return "customer"
+        if phone in lead_phones:
+            return "lead"
+        return "ghost"
+
+    rows = [
+        {
+            "upload_id": result.upload_id,
+            "phone_e164": r.phone_e164,
+            "first_name": r.first_name,
+            "last_name": r.last_name,
+            "row_number": r.row_number,
+            "match_type": _match_type(r.phone_e164),
+        }
+        for r in chunk
+    ]
+    # The primary key collapses phones already staged by an earlier chunk
+    # (first occurrence wins); RETURNING tells us which rows were new.
+    stmt = (
+        pg_insert(CsvUploadStagedRecipient)
+        .values(rows)
+        .on_conflict_do_nothing()
+        .returning(CsvUploadStagedRecipient.phone_e164)
+    )
+    inserted: set[str] = set((await session.execute(stmt)).scalars().all())
+    result.duplicates_collapsed += len(rows) - len(inserted)
+
+    staged = [r for r in chunk if r.phone_e164 in inserted]
+    for r in staged:
+        match_type = _match_type(r.phone_e164)
+        if match_type == "customer":
+            result.matched_customers += 1
+        elif match_type == "lead":
+            result.matched_leads += 1
+        else:
+            result.will_become_ghost_leads += 1
+    result.staged += len(staged)
+
+    if result.inline_recipients is not None:
+        if result.staged <= INLINE_RECIPIENT_LIMIT:
+            result.inline_recipients.extend(staged)
+        else:
+            result.inline_recipients = None
+
+    if on_chunk is not None and staged:
+        await on_chunk([r.phone_e164 for r in staged])
+
+
+async def stage_csv_upload(
+    session: AsyncSession,
+    fileobj: IO[bytes],
+    *,
+    on_chunk: Callable[[list[str]], Awaitable[None]] | None = None,
+    chunk_rows: int = STREAM_CHUNK_ROWS,
+) -> CsvStageResult:
+    """Stream a CSV file into ``csv_upload_staged_recipients``.
+
+    The file is decoded incrementally and processed ``chunk_rows`` rows at a
+    time. Each chunk costs one match query and one insert, and only the
+    current chunk is held in memory (plus inline recipients for small
+    uploads).
+
+    Args:
+        session: DB session. Staged rows are written in the caller's
+            transaction, so a failure part-way through leaves nothing staged.
+        fileobj: Seekable binary file (e.g. ``UploadFile.file``). It is
+            rewound after encoding detection and left open.
+        on_chunk: Awaited with the E.164 phones newly staged by each chunk.
+        chunk_rows: Distinct phones per chunk.
+
+    Returns:
+        CsvStageResult with the upload ID, match breakdown and stats.
+
+    Raises:
+        ValueError: If file exceeds size/row limits or has no phone column.
+    """
+    encoding = _sniff_encoding(fileobj, STREAM_MAX_FILE_SIZE)
+    text = io.TextIOWrapper(fileobj, encoding=encoding, newline="")
+    try:
+        reader = csv.reader(text)
+        cols = _resolve_columns(reader)
+
+        result = CsvStageResult()
+        chunk: dict[str, StagedRecipient] = {}
+
+        for row_num, row in enumerate(reader, start=2):
+            result.total_rows += 1
+
+            if result.total_rows > STREAM_MAX_ROWS:
+                msg = f"CSV exceeds {STREAM_MAX_ROWS} row limit"
+                raise ValueError(msg)
+
+            parsed = _parse_row(row, row_num, cols)
+            if isinstance(parsed, RejectedRow):
+                result.rejected_count += 1
+                if len(result.rejected) < MAX_REPORTED_REJECTED_ROWS:
+                    result.rejected.append(parsed)
+                continue
+
+            if parsed.phone_e164 in chunk:
+                result.duplicates_collapsed += 1
+                continue
+            chunk[parsed.phone_e164] = parsed
+
+            if len(chunk) >= chunk_rows:
+                await _stage_chunk(session, result, list(chunk.values()), on_chunk)
+                chunk = {}
+
+        if chunk:
+            await _stage_chunk(session, result, list(chunk.values()), on_chunk)
+    finally:
+        # Hand the underlying file back to the caller unclosed
+        _ = text.detach()
+
+    if result.total_rows == 0:
+        msg = "CSV contains no data rows"
+        raise ValueError(msg)
+
+    _log.log_completed(
+        "stage_csv_upload",
+        upload_id=str(result.upload_id),
+        total_rows=result.total_rows,
+        staged=result.staged,
+        rejected=result.rejected_count,
+    )
+    return result
+
+
+async def load_staged_recipients(
+    session: AsyncSession,
+    upload_id: UUID,
+) -> list[dict[str, Any]]:
+    """Load a staged upload as ad-hoc recipient rows, in file order.
+
+    Rows have the same shape as ``target_audience.ad_hoc.recipients``.
+    """
+    from grins_platform.models.campaign import (  # noqa: PLC0415
+        CsvUploadStagedRecipient,
+    )
+
+    result = await session.execute(
+        select(
+            CsvUploadStagedRecipient.phone_e164,
+            CsvUploadStagedRecipient.first_name,
+            CsvUploadStagedRecipient.last_name,
+        )
+        .where(CsvUploadStagedRecipient.upload_id == upload_id)
+        .order_by(CsvUploadStagedRecipient.row_number),
+    )
+    return [
+        {"phone": phone, "first_name": first_name, "last_name": last_name}
+        for phone, first_name, last_name in result.all()
+    ]
+
+
+async def purge_staged_uploads(
+    session: AsyncSession,
+    older_than_days: int = STAGED_UPLOAD_RETENTION_DAYS,
+) -> int:
+    """Delete staged upload rows older than ``older_than_days``.
+
+    Uploads still referenced by a draft, scheduled or sending campaign
+    (``target_audience.ad_hoc.csv_upload_id``) are kept whatever their
+    age, since the campaign loads its recipients from them at send time.
+
+    Returns:
+        Number of staged rows deleted.
+    """
+    from grins_platform.models.campaign import (  # noqa: PLC0415
+        Campaign,
+        CsvUploadStagedRecipient,
+    )
+    from grins_platform.models.enums import CampaignStatus  # noqa: PLC0415
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    referenced_upload = Campaign.target_audience["ad_hoc"]["csv_upload_id"].astext
+    in_use = select(literal(1)).where(
+        Campaign.status.in_(
+            [
+                CampaignStatus.DRAFT.value,
+                CampaignStatus.SCHEDULED.value,
+                CampaignStatus.SENDING.value,
+            ],
+        ),
+        referenced_upload == cast(CsvUploadStagedRecipient.upload_id, String),
+    )
+    result = await session.execute(
+        delete(CsvUploadStagedRecipient).where(
+            CsvUploadStagedRecipient.created_at < cutoff,
+            ~in_use.exists(),
+        ),
+    )
+    return int(result.rowcount or 0)  # type: ignore[attr-defined]
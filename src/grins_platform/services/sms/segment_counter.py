@@ -1,13 +1,27 @@
 """SMS segment counter — GSM-7 vs UCS-2 detection and segment calculation.
 
 Includes the auto-appended sender prefix and STOP footer in the count.
+
+``estimate_segments`` sizes a whole audience at once: the template is split
+into literal text and merge fields a single time, per-part character stats
+are cached, and recipients with identical merge values are counted together
+instead of rendering every message.
 """
 
 from __future__ import annotations
 
 import math
 import os
-from typing import Literal
+import string
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Literal
+
+from grins_platform.services.sms.templating import render_template
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
 
 # GSM-7 basic character set (standard 7-bit encoding)
 _GSM7_BASIC: frozenset[str] = frozenset(
@@ -21,6 +35,8 @@ _GSM7_BASIC: frozenset[str] = frozenset(
 # GSM-7 extension characters (each costs 2 chars: escape + char)
 _GSM7_EXTENSION: frozenset[str] = frozenset("^{}\\[~]|€")
 
+_GSM7_ALPHABET: frozenset[str] = _GSM7_BASIC | _GSM7_EXTENSION
+
 Encoding = Literal["GSM-7", "UCS-2"]
 
 # Defaults
@@ -28,17 +44,58 @@ _DEFAULT_PREFIX = "Grins Irrigation: "
 _DEFAULT_FOOTER = " Reply STOP to opt out."
 
 
+@dataclass(frozen=True)
+class _TextStats:
+    """Additive character stats for a piece of message text."""
+
+    is_gsm7: bool
+    gsm7_units: int
+    length: int
+
+    def __add__(self, other: _TextStats) -> _TextStats:
+        return _TextStats(
+            is_gsm7=self.is_gsm7 and other.is_gsm7,
+            gsm7_units=self.gsm7_units + other.gsm7_units,
+            length=self.length + other.length,
+        )
+
+    def segments(self) -> tuple[Encoding, int, int]:
+        """Return ``(encoding, segments, char_count)`` for the whole message."""
+        if self.is_gsm7:
+            chars = self.gsm7_units
+            return "GSM-7", 1 if chars <= 160 else math.ceil(chars / 153), chars
+        chars = self.length
+        return "UCS-2", 1 if chars <= 70 else math.ceil(chars / 67), chars
+
+
+_EMPTY_STATS = _TextStats(is_gsm7=True, gsm7_units=0, length=0)
+
+
+def _stats(text: str) -> _TextStats:
+    """Compute stats using set/str builtins rather than a per-char loop."""
+    is_gsm7 = _GSM7_ALPHABET.issuperset(text)
+    units = _gsm7_char_count(text) if is_gsm7 else len(text)
+    return _TextStats(is_gsm7=is_gsm7, gsm7_units=units, length=len(text))
+
+
+# Template literals and merge values (names) repeat heavily across an
+# audience, so their stats are memoized.
+_cached_stats = lru_cache(maxsize=4096)(_stats)
+
+
 def _detect_encoding(text: str) -> Encoding:
     """Return 'GSM-7' if all chars are in GSM-7 alphabet, else 'UCS-2'."""
-    for ch in text:
-        if ch not in _GSM7_BASIC and ch not in _GSM7_EXTENSION:
-            return "UCS-2"
-    return "GSM-7"
+    return "GSM-7" if _GSM7_ALPHABET.issuperset(text) else "UCS-2"
 
 
 def _gsm7_char_count(text: str) -> int:
     """Count GSM-7 character units (extension chars cost 2)."""
-    return sum(2 if ch in _GSM7_EXTENSION else 1 for ch in text)
+    return len(text) + sum(text.count(ch) for ch in _GSM7_EXTENSION)
+
+
+def sender_prefix() -> str:
+    """Return the configured sender prefix (``SMS_SENDER_PREFIX``)."""
+    return os.environ.get("SMS_SENDER_PREFIX", _DEFAULT_PREFIX)
 
 
 def count_segments(
@@ -46,25 +103,116 @@ def count_segments(
     *,
     include_prefix: bool = True,
     include_footer: bool = True,
+    prefix: str | None = None,
 ) -> tuple[Encoding, int, int]:
     """Count SMS segments for *text* including prefix and STOP footer.
 
     Returns ``(encoding, segments, char_count)`` where *char_count* is
     the total character units (GSM-7 extension chars count as 2).
+    Pass *prefix* to skip the ``SMS_SENDER_PREFIX`` lookup when counting
+    many messages.
     """
-    prefix = (
-        os.environ.get("SMS_SENDER_PREFIX", _DEFAULT_PREFIX) if include_prefix else ""
-    )
+    if not include_prefix:
+        prefix = ""
+    elif prefix is None:
+        prefix = sender_prefix()
     footer = _DEFAULT_FOOTER if include_footer else ""
-    full = f"{prefix}{text}{footer}"
+    return _stats(f"{prefix}{text}{footer}").segments()
+
+
+@dataclass(frozen=True)
+class SegmentEstimate:
+    """Segment totals for one template rendered across many recipients."""
+
+    messages: int = 0
+    total_segments: int = 0
+    gsm7_messages: int = 0
+    ucs2_messages: int = 0
+    gsm7_segments: int = 0
+    ucs2_segments: int = 0
+    max_segments_per_message: int = 0
+
+
+@lru_cache(maxsize=256)
+def _compile_template(body: str) -> tuple[tuple[str, ...], tuple[str, ...]] | None:
+    """Split *body* into literal chunks and merge-field names.
+
+    Returns None when the template uses anything beyond plain ``{name}``
+    fields (format specs, conversions, attribute/index access, positional
+    fields, malformed braces); those are rendered per recipient instead.
+    """
+    literals: list[str] = []
+    fields: list[str] = []
+    try:
+        parsed = list(string.Formatter().parse(body))
+    except ValueError:
+        return None
+    for literal, field, spec, conversion in parsed:
+        literals.append(literal)
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            return None
+        fields.append(field)
+    return tuple(literals), tuple(fields)
+
+
+def estimate_segments(
+    body: str,
+    contexts: Iterable[Mapping[str, str | None]],
+    *,
+    include_prefix: bool = True,
+    include_footer: bool = True,
+) -> SegmentEstimate:
+    """Estimate segments for *body* rendered once per merge-field context.
 
-    encoding = _detect_encoding(full)
+    Matches ``render_template`` + ``count_segments`` per recipient, but
+    reads the prefix once, scans template literals once, and counts each
+    distinct combination of merge values once.
+    """
+    prefix = sender_prefix() if include_prefix else ""
+    footer = _DEFAULT_FOOTER if include_footer else ""
 
-    if encoding == "GSM-7":
-        chars = _gsm7_char_count(full)
-        segments = 1 if chars <= 160 else math.ceil(chars / 153)
-    else:
-        chars = len(full)
-        segments = 1 if chars <= 70 else math.ceil(chars / 67)
+    compiled = _compile_template(body)
+    fields = compiled[1] if compiled is not None else ("first_name", "last_name")
+    groups: Counter[tuple[str, ...]] = Counter(
+        tuple(ctx.get(f) or "" for f in fields) for ctx in contexts
+    )
 
-    return encoding, segments, chars
+    static = _EMPTY_STATS
+    if compiled is not None:
+        static = _cached_stats(prefix) + _cached_stats(footer)
+        for literal in compiled[0]:
+            static += _cached_stats(literal)
+
+    messages = total = max_segments = 0
+    gsm7_messages = ucs2_messages = gsm7_segments = ucs2_segments = 0
+    for values, count in groups.items():
+        if compiled is not None:
+            stats = static
+            for value in values:
+                stats += _cached_stats(value)
+        else:
+            rendered = render_template(body, dict(zip(fields, values, strict=True)))
+            stats = _stats(f"{prefix}{rendered}{footer}")
+        encoding, segments, _ = stats.segments()
+
+        messages += count
+        total += segments * count
+        max_segments = max(max_segments, segments)
+        if encoding == "GSM-7":
+            gsm7_messages += count
+            gsm7_segments += segments * count
+        else:
+            ucs2_messages += count
+            ucs2_segments += segments * count
+
+    return SegmentEstimate(
+        messages=messages,
+        total_segments=total,
+        gsm7_messages=gsm7_messages,
+        ucs2_messages=ucs2_messages,
+        gsm7_segments=gsm7_segments,
+        ucs2_segments=ucs2_segments,
+        max_segments_per_message=max_segments,
+    )
@@ -5,17 +5,34 @@ machine that prevents double-sends on worker crashes.  The state machine
 is the **sole** double-send protection — CallRail's Idempotency-Key
 header is inconclusive.
 
+Every state change is mirrored into ``campaign_delivery_counters`` in the
+same transaction, so campaign status derivation and stats are O(1) reads.
+``reconcile_delivery_counters`` rewrites the counters from the recipient
+rows and runs periodically to correct any drift.
+
 Validates: Requirement 28 (S13)
 """
 
 from __future__ import annotations
 
+from collections import defaultdict
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    UUID as PGUUID,
+    insert as pg_insert,
+)
+from sqlalchemy.sql import func
+
+from grins_platform.models.campaign import CampaignDeliveryCounter
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from uuid import UUID
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -82,22 +99,193 @@ def transition(
     return to_state
 
 
+# Delivery states tracked as columns on ``campaign_delivery_counters``.
+# ``opted_out`` is written directly by the synchronous send path and never
+# transitions, but is counted so stats stay a single-row read.
+COUNTED_STATES: tuple[str, ...] = (
+    RecipientState.pending.value,
+    RecipientState.sending.value,
+    RecipientState.sent.value,
+    RecipientState.failed.value,
+    RecipientState.cancelled.value,
+    "opted_out",
+)
+
+
+async def adjust_delivery_counters(
+    session: AsyncSession,
+    campaign_id: UUID,
+    deltas: Mapping[str, int],
+) -> None:
+    """Apply signed per-state *deltas* to a campaign's delivery counters.
+
+    Creates the counter row on first use. Unknown states and zero deltas
+    are ignored; nothing is executed when no delta remains.
+    """
+    changes = {
+        state: delta
+        for state, delta in deltas.items()
+        if state in COUNTED_STATES and delta
+    }
+    if not changes:
+        return
+
+    table = CampaignDeliveryCounter.__table__
+    stmt = pg_insert(CampaignDeliveryCounter).values(
+        campaign_id=campaign_id,
+        **{state: max(delta, 0) for state, delta in changes.items()},
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["campaign_id"],
+        set_={
+            **{state: table.c[state] + delta for state, delta in changes.items()},
+            "updated_at": func.now(),
+        },
+    )
+    _ = await session.execute(stmt)
+
+
+class DeliveryCounterDeltas:
+    """Accumulates counter changes for a unit of work.
+
+    The campaign worker records each recipient transition here and calls
+    :meth:`flush` once per tick, so a batch costs one upsert per campaign
+    rather than one per transition. Must be flushed in the same
+    transaction as the recipient updates it describes.
+    """
+
+    def __init__(self) -> None:
+        self._deltas: dict[UUID, dict[str, int]] = defaultdict(
+            lambda: defaultdict(int),
+        )
+
+    def record(
+        self,
+        campaign_id: UUID,
+        from_state: str | None,
+        to_state: str,
+        count: int = 1,
+    ) -> None:
+        """Record *count* recipients moving ``from_state`` → ``to_state``.
+
+        Pass ``from_state=None`` for newly inserted recipients.
+        """
+        if from_state == to_state:
+            return
+        if from_state is not None:
+            self._deltas[campaign_id][from_state] -= count
+        self._deltas[campaign_id][to_state] += count
+
+    async def flush(self, session: AsyncSession) -> None:
+        """Write the accumulated deltas and reset the buffer."""
+        pending, self._deltas = self._deltas, defaultdict(lambda: defaultdict(int))
+        for campaign_id, deltas in pending.items():
+            await adjust_delivery_counters(session, campaign_id, deltas)
+
+
 _ORPHAN_RECOVERY_SQL = text(
-    "UPDATE campaign_recipients cr "
-    "SET delivery_status = 'failed', "
-    "    error_message = 'worker_interrupted' "
-    "FROM campaigns c "
-    "WHERE cr.campaign_id = c.id "
-    "  AND c.status = 'sending' "
-    "  AND cr.delivery_status = 'sending' "
-    "  AND cr.sending_started_at < now() - interval '5 minutes'",
+    "WITH recovered AS ( "
+    "  UPDATE campaign_recipients cr "
+    "  SET delivery_status = 'failed', "
+    "      error_message = 'worker_interrupted' "
+    "  FROM campaigns c "
+    "  WHERE cr.campaign_id = c.id "
+    "    AND c.status = 'sending' "
+    "    AND cr.delivery_status = 'sending' "
+    "    AND cr.sending_started_at < now() - interval '5 minutes' "
+    "  RETURNING cr.campaign_id "
+    "), per_campaign AS ( "
+    "  SELECT campaign_id, count(*) AS n FROM recovered GROUP BY campaign_id "
+    "), bumped AS ( "
+    "  UPDATE campaign_delivery_counters dc "
+    "  SET sending = dc.sending - pc.n, "
+    "      failed = dc.failed + pc.n, "
+    "      updated_at = now() "
+    "  FROM per_campaign pc "
+    "  WHERE dc.campaign_id = pc.campaign_id "
+    ") "
+    "SELECT count(*) FROM recovered",
 )
 
 
 async def orphan_recovery_query(session: AsyncSession) -> int:
     """Mark stuck ``sending`` recipients as ``failed``.
 
+    The matching counter adjustment runs in the same statement.
+
     Returns the number of rows recovered.
     """
     result = await session.execute(_ORPHAN_RECOVERY_SQL)
-    return result.rowcount  # type: ignore[no-any-return]
+    return int(result.scalar_one())
+
+
+# Locks the counter rows first so concurrent workers queue behind the
+# rewrite; the recount statement then gets a fresh READ COMMITTED snapshot
+# and any delta applied after we commit lands on top of a correct base.
+_RECONCILE_LOCK_SQL = text(
+    "SELECT campaign_id FROM campaign_delivery_counters "
+    "WHERE campaign_id = ANY(:campaign_ids) "
+    "FOR UPDATE",
+).bindparams(bindparam("campaign_ids", type_=ARRAY(PGUUID(as_uuid=True))))
+
+_RECONCILE_UPSERT_SQL = text(
+    "INSERT INTO campaign_delivery_counters "
+    "  (campaign_id, pending, sending, sent, failed, cancelled, opted_out, "
+    "   reconciled_at, updated_at) "
+    "SELECT cr.campaign_id, "
+    "  count(*) FILTER (WHERE cr.delivery_status = 'pending'), "
+    "  count(*) FILTER (WHERE cr.delivery_status = 'sending'), "
+    "  count(*) FILTER (WHERE cr.delivery_status = 'sent'), "
+    "  count(*) FILTER (WHERE cr.delivery_status = 'failed'), "
+    "  count(*) FILTER (WHERE cr.delivery_status = 'cancelled'), "
+    "  count(*) FILTER (WHERE cr.delivery_status = 'opted_out'), "
+    "  now(), now() "
+    "FROM campaign_recipients cr "
+    "WHERE cr.campaign_id = ANY(:campaign_ids) "
+    "GROUP BY cr.campaign_id "
+    "ON CONFLICT (campaign_id) DO UPDATE SET "
+    "  pending = EXCLUDED.pending, "
+    "  sending = EXCLUDED.sending, "
+    "  sent = EXCLUDED.sent, "
+    "  failed = EXCLUDED.failed, "
+    "  cancelled = EXCLUDED.cancelled, "
+    "  opted_out = EXCLUDED.opted_out, "
+    "  reconciled_at = EXCLUDED.reconciled_at, "
+    "  updated_at = EXCLUDED.updated_at",
+).bindparams(bindparam("campaign_ids", type_=ARRAY(PGUUID(as_uuid=True))))
+
+# Campaigns still dispatching, plus any whose counters moved since the
+# last reconciliation (retries on SENT campaigns, late cancellations).
+_RECONCILE_CANDIDATES_SQL = text(
+    "SELECT c.id FROM campaigns c "
+    "WHERE c.status IN ('sending', 'scheduled') "
+    "UNION "
+    "SELECT dc.campaign_id FROM campaign_delivery_counters dc "
+    "WHERE dc.reconciled_at IS NULL OR dc.updated_at > dc.reconciled_at",
+)
+
+
+async def reconcile_delivery_counters(
+    session: AsyncSession,
+    campaign_ids: Sequence[UUID] | None = None,
+) -> int:
+    """Rewrite delivery counters from ``campaign_recipients``.
+
+    Args:
+        session: Database session; the caller commits.
+        campaign_ids: Campaigns to reconcile. Defaults to campaigns still
+            sending or whose counters changed since the last run.
+
+    Returns:
+        Number of campaigns reconciled.
+    """
+    if campaign_ids is None:
+        result = await session.execute(_RECONCILE_CANDIDATES_SQL)
+        campaign_ids = [row[0] for row in result.all()]
+    if not campaign_ids:
+        return 0
+
+    ids = list(campaign_ids)
+    _ = await session.execute(_RECONCILE_LOCK_SQL, {"campaign_ids": ids})
+    _ = await session.execute(_RECONCILE_UPSERT_SQL, {"campaign_ids": ids})
+    return len(ids)
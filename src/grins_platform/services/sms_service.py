@@ -23,10 +23,12 @@ from sqlalchemy import select
 from grins_platform.log_config import LoggerMixin, get_logger
 from grins_platform.models.sent_message import SentMessage
 from grins_platform.models.sms_consent_record import SmsConsentRecord
+from grins_platform.redis_manager import get_redis_manager
 from grins_platform.repositories.sent_message_repository import SentMessageRepository
 from grins_platform.schemas.ai import DeliveryStatus, MessageType
 from grins_platform.services.sms.audit import log_consent_hard_stop
 from grins_platform.services.sms.consent import ConsentType, check_sms_consent
+from grins_platform.services.sms.conversation_index import ConversationIndex
 from grins_platform.services.sms.templating import render_template
 
 if TYPE_CHECKING:
@@ -36,6 +38,7 @@ if TYPE_CHECKING:
         BaseSMSProvider,
         ProviderSendResult,
     )
+    from grins_platform.services.sms.conversation_index import OpenConversation
     from grins_platform.services.sms.rate_limit_tracker import SMSRateLimitTracker
     from grins_platform.services.sms.recipient import Recipient
 
@@ -125,6 +128,7 @@ class SMSService(LoggerMixin):
         session: AsyncSession,
         provider: BaseSMSProvider | None = None,
         rate_limit_tracker: SMSRateLimitTracker | None = None,
+        conversation_index: ConversationIndex | None = None,
     ) -> None:
         """Initialize SMS service.
 
@@ -135,6 +139,9 @@ class SMSService(LoggerMixin):
                 default to ``callrail``. Callers that need a silent stub should
                 pass ``NullProvider()`` explicitly.
             rate_limit_tracker: Optional rate limit tracker.
+            conversation_index: Open-conversation index used to route
+                inbound replies. Defaults to one on the shared Redis pool
+                (a no-op when Redis is not configured).
         """
         super().__init__()
         self.session = session
@@ -148,6 +155,9 @@ class SMSService(LoggerMixin):
 
             self.provider = get_sms_provider()
         self.rate_limit_tracker = rate_limit_tracker
+        self.conversation_index = conversation_index or ConversationIndex(
+            get_redis_manager().client,
+        )
         self._prefix = os.environ.get("SMS_SENDER_PREFIX", _DEFAULT_PREFIX)
         self._footer = _DEFAULT_FOOTER
 
@@ -353,6 +363,9 @@ class SMSService(LoggerMixin):
             sent_message.sent_at = datetime.now(tz=timezone.utc)
             await self.session.flush()
 
+            # Index the thread so replies route with one lookup
+            await self.conversation_index.record_outbound(sent_message)
+
             latency_ms = int((_time_mod.monotonic() - _send_t0) * 1000)
             logger.info(
                 "sms.send.succeeded",
@@ -609,14 +622,26 @@ class SMSService(LoggerMixin):
         # the resolved real E.164 (bughunt L-7 / L-11).
         await self._touch_lead_last_contacted(phone=from_phone)
 
+        # Open-conversation index: one lookup tells us what the thread is
+        # awaiting a reply to. ``None`` means unknown (no Redis, expired, or
+        # thread predates the index) and every branch falls back to its own
+        # sent_messages correlation.
+        conversation = (
+            await self.conversation_index.lookup(thread_id) if thread_id else None
+        )
+
         # 10.1: Exact opt-out keyword match (Req 8.1, 8.2, 8.3, 8.4)
         if body_lower in EXACT_OPT_OUT_KEYWORDS:
             result = await self._process_exact_opt_out(
-                from_phone, body_lower, thread_id=thread_id
+                from_phone,
+                body_lower,
+                thread_id=thread_id,
+                conversation=conversation,
             )
             # Bookkeeping: record STOP as campaign response (Req 6.1-6.4)
-            # Independent — failure must not block consent revocation
-            if thread_id:
+            # Independent — failure must not block consent revocation.
+            # Skipped when the index shows the thread is not a campaign's.
+            if thread_id and (conversation is None or conversation.awaiting_poll_reply):
                 await self._record_opt_out_bookkeeping(
                     from_phone,
                     body,
@@ -631,14 +656,25 @@ class SMSService(LoggerMixin):
 
         # Poll reply branch: attempt correlation when thread_id present (Req 7.1-7.4)
         if thread_id:
-            poll_result = await self._try_poll_reply(
-                from_phone,
-                body,
-                provider_sid,
-                thread_id,
-            )
-            if poll_result is not None:
-                return poll_result
+            if conversation is None or conversation.awaiting_poll_reply:
+                poll_result = await self._try_poll_reply(
+                    from_phone,
+                    body,
+                    provider_sid,
+                    thread_id,
+                )
+                if poll_result is not None:
+                    return poll_result
+            else:
+                # Indexed non-campaign thread: record the orphan directly
+                # instead of correlating only to find no campaign (Req 7.4).
+                await self._record_orphan_reply(
+                    from_phone,
+                    body,
+                    provider_sid,
+                    thread_id,
+                    conversation.sent_message_id,
+                )
 
         # Y/R/C confirmation reply branch (CRM2 Req 24.1-24.8)
         if thread_id:
@@ -647,6 +683,9 @@ class SMSService(LoggerMixin):
                 body_stripped,
                 provider_sid,
                 thread_id,
+                confirmation_message_id=(
+                    conversation.confirmation_message_id if conversation else None
+                ),
             )
             if confirmation_result is not None:
                 return confirmation_result
@@ -689,6 +728,33 @@ class SMSService(LoggerMixin):
                 exc_info=True,
             )
 
+    async def _record_orphan_reply(
+        self,
+        from_phone: str,
+        body: str,
+        provider_sid: str,
+        thread_id: str,
+        sent_message_id: UUID | None,
+    ) -> None:
+        """Record an inbound reply on a non-campaign thread as an orphan.
+
+        Validates: Req 7.4
+        """
+        from grins_platform.services.campaign_response_service import (  # noqa: PLC0415
+            CampaignResponseService,
+        )
+        from grins_platform.services.sms.base import InboundSMS  # noqa: PLC0415
+
+        _ = await CampaignResponseService(self.session).record_orphan(
+            InboundSMS(
+                from_phone=from_phone,
+                body=body,
+                provider_sid=provider_sid,
+                thread_id=thread_id,
+            ),
+            sent_message_id=sent_message_id,
+        )
+
     async def _try_poll_reply(
         self,
         from_phone: str,
@@ -773,9 +839,15 @@ class SMSService(LoggerMixin):
         body: str,
         provider_sid: str,
         thread_id: str,
+        *,
+        confirmation_message_id: UUID | None = None,
     ) -> dict[str, Any] | None:
         """Route inbound SMS to JobConfirmationService if thread matches a confirmation.
 
+        ``confirmation_message_id`` comes from the open-conversation index;
+        when given, the original confirmation is loaded by primary key
+        instead of searching the thread's sent messages.
+
         Returns result dict if matched, None to fall through.
 
         Validates: CRM Changes Update 2 Req 24.1-24.4
@@ -788,7 +860,11 @@ class SMSService(LoggerMixin):
         svc = JobConfirmationService(self.session)
         # Check if thread_id correlates to an APPOINTMENT_CONFIRMATION message
         # (bughunt L-14: use the public name now that one exists).
-        original = await svc.find_confirmation_message(thread_id)
+        original: SentMessage | None = None
+        if confirmation_message_id is not None:
+            original = await self.session.get(SentMessage, confirmation_message_id)
+        if original is None:
+            original = await svc.find_confirmation_message(thread_id)
         if original is None:
             return None
 
@@ -799,6 +875,7 @@ class SMSService(LoggerMixin):
             raw_body=body,
             from_phone=from_phone,
             provider_sid=provider_sid,
+            original=original,
         )
 
         # Prefer the real E.164 phone from the original SentMessage. CallRail
@@ -859,6 +936,7 @@ class SMSService(LoggerMixin):
         keyword: str,
         *,
         thread_id: str | None = None,
+        conversation: OpenConversation | None = None,
     ) -> dict[str, Any]:
         """Process exact opt-out keyword: create consent record and send confirmation.
 
@@ -866,6 +944,7 @@ class SMSService(LoggerMixin):
             phone: Sender phone number
             keyword: The matched keyword
             thread_id: Provider thread/conversation ID for resolving masked phones
+            conversation: Indexed conversation for the thread, if known
 
         Returns:
             Processing result
@@ -877,7 +956,9 @@ class SMSService(LoggerMixin):
         # Resolve real phone from thread_id when provider masks the sender
         # (e.g. CallRail sends "***3312" instead of the full number).
         real_phone = phone
-        if thread_id:
+        if conversation is not None and conversation.recipient_phone:
+            real_phone = conversation.recipient_phone
+        elif thread_id:
             try:
                 from grins_platform.services.campaign_response_service import (  # noqa: PLC0415
                     CampaignResponseService,
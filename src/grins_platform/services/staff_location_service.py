@@ -140,16 +140,7 @@ class StaffLocationService(LoggerMixin):
             raw = await self.redis.get(key)
             if raw is None:
                 return None
-
-            data = json.loads(raw)
-            appt_id = data.get("appointment_id")
-            return StaffLocation(
-                staff_id=UUID(data["staff_id"]),
-                latitude=float(data["latitude"]),
-                longitude=float(data["longitude"]),
-                timestamp=data["timestamp"],
-                appointment_id=UUID(appt_id) if appt_id else None,
-            )
+            return self._parse_location(raw)
         except Exception as exc:
             self.log_failed(
                 "get_location",
@@ -164,6 +155,8 @@ class StaffLocationService(LoggerMixin):
     ) -> list[StaffLocation]:
         """Retrieve current locations for multiple staff members.
 
+        Fetches every key in a single ``MGET`` round trip.
+
         Args:
             staff_ids: List of staff UUIDs.
 
@@ -172,9 +165,39 @@ class StaffLocationService(LoggerMixin):
 
         Validates: Req 41.5
         """
+        if self.redis is None or not staff_ids:
+            return []
+
+        keys = [f"{STAFF_LOCATION_PREFIX}{staff_id}" for staff_id in staff_ids]
+        try:
+            raws = await self.redis.mget(keys)
+        except Exception as exc:
+            self.log_failed("get_all_locations", error=exc, count=len(keys))
+            return []
+
         locations: list[StaffLocation] = []
-        for staff_id in staff_ids:
-            loc = await self.get_location(staff_id)
-            if loc is not None:
-                locations.append(loc)
+        for staff_id, raw in zip(staff_ids, raws):
+            if raw is None:
+                continue
+            try:
+                locations.append(self._parse_location(raw))
+            except Exception as exc:
+                self.log_failed(
+                    "get_all_locations",
+                    error=exc,
+                    staff_id=str(staff_id),
+                )
         return locations
+
+    @staticmethod
+    def _parse_location(raw: str | bytes) -> StaffLocation:
+        """Deserialize a stored location payload."""
+        data = json.loads(raw)
+        appt_id = data.get("appointment_id")
+        return StaffLocation(
+            staff_id=UUID(data["staff_id"]),
+            latitude=float(data["latitude"]),
+            longitude=float(data["longitude"]),
+            timestamp=data["timestamp"],
+            appointment_id=UUID(appt_id) if appt_id else None,
+        )
@@ -9,10 +9,11 @@ Validates: Requirements 39.11, 54.7, 55.7
 
 from __future__ import annotations
 
+from contextlib import ExitStack
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -25,6 +26,7 @@ from grins_platform.models.enums import (
     InvoiceStatus,
 )
 from grins_platform.services.campaign_service import CampaignService
+from grins_platform.services.day_of_reminder_engine import DayOfReminderEngine
 from grins_platform.services.estimate_service import EstimateService
 from grins_platform.services.notification_service import (
     NotificationService,
@@ -218,28 +220,67 @@ def _mock_db_for_day_of_reminders(
     appointments: list[MagicMock],
     customers: list[MagicMock | None],
 ) -> AsyncMock:
-    """Create a mock db for send_day_of_reminders."""
-    db = AsyncMock()
-
-    # First execute returns all appointments
-    appt_result = MagicMock()
-    appt_scalars = MagicMock()
-    appt_scalars.all.return_value = appointments
-    appt_result.scalars.return_value = appt_scalars
+    """Create a mock db for send_day_of_reminders.
 
-    # Subsequent executes return customers one by one
-    customer_results: list[MagicMock] = []
-    for cust in customers:
-        cr = MagicMock()
-        cr.scalar_one_or_none.return_value = cust
-        customer_results.append(cr)
+    The appointments query returns (appointment, customer, staff) rows,
+    no phone is hard-stopped and every reminder is claimed.
+    """
+    rows = [
+        (appt, cust, appt.staff)
+        for appt, cust in zip(appointments, customers, strict=True)
+    ]
+
+    def execute(stmt: Any, *_args: Any, **_kwargs: Any) -> MagicMock:
+        sql = str(stmt)
+        result = MagicMock()
+        if sql.startswith("INSERT INTO notification_dispatches"):
+            result.scalars.return_value = [
+                value
+                for key, value in stmt.compile().params.items()
+                if key.startswith("idempotency_key")
+            ]
+        elif "FROM appointments" in sql:
+            result.all.return_value = rows
+        else:
+            result.scalars.return_value.all.return_value = []
+        return result
 
-    db.execute = AsyncMock(side_effect=[appt_result, *customer_results])
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=execute)
     db.add = MagicMock()
     db.flush = AsyncMock()
     return db
 
 
+def _patch_day_of_engine(db: AsyncMock, sms_service: Any) -> ExitStack:
+    """Send day-of reminders through *db* and *sms_service*."""
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=db)
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    stack = ExitStack()
+    stack.enter_context(
+        patch.object(
+            DayOfReminderEngine,
+            "_factory",
+            return_value=MagicMock(return_value=ctx),
+        ),
+    )
+    stack.enter_context(
+        patch.object(
+            DayOfReminderEngine,
+            "_sms_dependencies",
+            return_value=(MagicMock(), MagicMock()),
+        ),
+    )
+    stack.enter_context(
+        patch(
+            "grins_platform.services.day_of_reminder_engine.SMSService",
+            return_value=sms_service,
+        ),
+    )
+    return stack
+
+
 def _mock_db_for_invoices(
     invoices: list[MagicMock],
 ) -> AsyncMock:
@@ -365,7 +406,8 @@ class TestDayOfReminderJob:
             [cust1, cust2, cust3],
         )
 
-        count = await svc.send_day_of_reminders(db)
+        with _patch_day_of_engine(db, svc.sms_service):
+            count = await svc.send_day_of_reminders(db)
 
         # All 3 should get notifications (SMS or email fallback)
         assert count == 3
@@ -377,7 +419,8 @@ class TestDayOfReminderJob:
         appt = _make_appointment(scheduled_date=date.today())
         db = _mock_db_for_day_of_reminders([appt], [None])
 
-        count = await svc.send_day_of_reminders(db)
+        with _patch_day_of_engine(db, svc.sms_service):
+            count = await svc.send_day_of_reminders(db)
         assert count == 0
 
     async def test_day_of_reminders_empty_schedule_returns_zero(self) -> None:
@@ -385,7 +428,8 @@ class TestDayOfReminderJob:
         svc = _build_notification_service()
         db = _mock_db_for_day_of_reminders([], [])
 
-        count = await svc.send_day_of_reminders(db)
+        with _patch_day_of_engine(db, svc.sms_service):
+            count = await svc.send_day_of_reminders(db)
         assert count == 0
 
 
@@ -9,6 +9,7 @@ Validates: Requirements 38.7, 45.12, 53.10, 52.8, 74.6, 81.10, 80.9, 79.8
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from typing import Any
@@ -531,26 +532,15 @@ class TestAccountingSummaryWorkflow:
         expense_repo = AsyncMock(spec=ExpenseRepository)
         service = AccountingService(expense_repository=expense_repo)
 
-        expense_repo.get_total_spend.return_value = Decimal("3500.00")
-
         db = AsyncMock()
-
-        revenue_scalar = MagicMock()
-        revenue_scalar.scalar.return_value = Decimal("10000.00")
-
-        pending_scalar = MagicMock()
-        pending_scalar.scalar.return_value = Decimal("2000.00")
-
-        past_due_scalar = MagicMock()
-        past_due_scalar.scalar.return_value = Decimal("1500.00")
-
-        db.execute = AsyncMock(
-            side_effect=[
-                revenue_scalar,
-                pending_scalar,
-                past_due_scalar,
-            ],
-        )
+        totals = MagicMock()
+        totals.mappings.return_value.one.return_value = {
+            "revenue": Decimal("10000.00"),
+            "expenses": Decimal("3500.00"),
+            "pending_total": Decimal("2000.00"),
+            "past_due_total": Decimal("1500.00"),
+        }
+        db.execute = AsyncMock(return_value=totals)
 
         summary = await service.get_summary(
             db=db,
@@ -572,15 +562,15 @@ class TestAccountingSummaryWorkflow:
         expense_repo = AsyncMock(spec=ExpenseRepository)
         service = AccountingService(expense_repository=expense_repo)
 
-        expense_repo.get_total_spend.return_value = Decimal("500.00")
-
         db = AsyncMock()
-        zero_scalar = MagicMock()
-        zero_scalar.scalar.return_value = Decimal(0)
-
-        db.execute = AsyncMock(
-            side_effect=[zero_scalar, zero_scalar, zero_scalar],
-        )
+        totals = MagicMock()
+        totals.mappings.return_value.one.return_value = {
+            "revenue": Decimal(0),
+            "expenses": Decimal("500.00"),
+            "pending_total": Decimal(0),
+            "past_due_total": Decimal(0),
+        }
+        db.execute = AsyncMock(return_value=totals)
 
         summary = await service.get_summary(
             db=db,
@@ -862,6 +852,7 @@ class TestInvoicePDFGenerationWorkflow:
         service = InvoicePDFService(
             s3_client=s3_client,
             s3_bucket="grins-platform-files",
+            render_executor=ThreadPoolExecutor(max_workers=1),
         )
 
         invoice_id = uuid4()
@@ -899,10 +890,10 @@ class TestInvoicePDFGenerationWorkflow:
         s3_client.put_object.assert_called_once()
         call_kwargs = s3_client.put_object.call_args[1]
         assert call_kwargs["Bucket"] == "grins-platform-files"
-        assert call_kwargs["Key"] == f"invoices/{invoice_id}.pdf"
+        assert call_kwargs["Key"].startswith(f"invoices/{invoice_id}/")
         assert call_kwargs["ContentType"] == "application/pdf"
 
-        assert mock_inv.document_url == f"invoices/{invoice_id}.pdf"
+        assert mock_inv.document_url == call_kwargs["Key"]
         db.flush.assert_called_once()
         assert "s3.amazonaws.com" in url
 
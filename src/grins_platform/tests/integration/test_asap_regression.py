@@ -165,6 +165,7 @@ def _make_mock_customer(**overrides: object) -> MagicMock:
     customer.internal_notes = overrides.get("internal_notes")
     customer.preferred_service_times = overrides.get("preferred_service_times")
     customer.properties = overrides.get("properties", [])
+    customer.service_history_summary = overrides.get("service_history_summary")
     customer.created_at = datetime.now(timezone.utc)
     customer.updated_at = datetime.now(timezone.utc)
     return customer
@@ -139,6 +139,9 @@ def _build_mock_redis() -> AsyncMock:
             return None
         return value
 
+    async def mock_mget(keys: list[str]) -> list[str | None]:
+        return [await mock_get(key) for key in keys]
+
     async def mock_delete(key: str) -> int:
         if key in store:
             del store[key]
@@ -157,6 +160,7 @@ def _build_mock_redis() -> AsyncMock:
 
     redis.set = AsyncMock(side_effect=mock_set)
     redis.get = AsyncMock(side_effect=mock_get)
+    redis.mget = AsyncMock(side_effect=mock_mget)
     redis.delete = AsyncMock(side_effect=mock_delete)
     redis.ttl = AsyncMock(side_effect=mock_ttl)
     redis._store = store
@@ -11,7 +11,8 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from unittest.mock import AsyncMock
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import FastAPI
@@ -29,11 +30,19 @@ from grins_platform.schemas.customer import (
 )
 from grins_platform.services.customer_service import CustomerService
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 # =============================================================================
 # Test Fixtures
 # =============================================================================
 
 
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
 @pytest.fixture
 def mock_service() -> AsyncMock:
     """Create a mock CustomerService."""
@@ -862,15 +871,13 @@ class TestExportCustomers:
         client: TestClient,
         mock_service: AsyncMock,
     ) -> None:
-        """Test successful customer export returns CSV."""
-        csv_content = (
-            "id,first_name,last_name,phone,email,status,is_priority,"
-            "is_red_flag,is_slow_payer,is_new_customer,sms_opt_in,"
-            "email_opt_in,lead_source,created_at\n"
-            "123,John,Doe,6125551234,john@example.com,active,False,"
-            "False,False,True,False,False,website,2024-01-01T00:00:00\n"
+        """Test successful customer export streams CSV."""
+        mock_service.export_customers = MagicMock(
+            return_value=_chunks(
+                b"id,first_name,last_name\n",
+                b"123,John,Doe\n",
+            ),
         )
-        mock_service.export_customers_csv.return_value = csv_content
 
         response = client.post("/api/v1/customers/export")
 
@@ -878,51 +885,71 @@ class TestExportCustomers:
         assert response.headers["content-type"] == "text/csv; charset=utf-8"
         assert "attachment" in response.headers["content-disposition"]
         assert "customers.csv" in response.headers["content-disposition"]
+        assert response.text == "id,first_name,last_name\n123,John,Doe\n"
+
+    def test_export_customers_with_list_filters(
+        self,
+        client: TestClient,
+        mock_service: AsyncMock,
+    ) -> None:
+        """Test customer export accepts the list endpoint filters."""
+        mock_service.export_customers = MagicMock(return_value=_chunks(b"id\n"))
+
+        response = client.post(
+            "/api/v1/customers/export",
+            params={"city": "Eden Prairie", "is_priority": "true"},
+        )
+
+        assert response.status_code == 200
+        params = mock_service.export_customers.call_args.args[0]
+        assert params.city == "Eden Prairie"
+        assert params.is_priority is True
 
-    def test_export_customers_with_city_filter(
+    def test_export_customers_limit_is_uncapped(
         self,
         client: TestClient,
         mock_service: AsyncMock,
     ) -> None:
-        """Test customer export with city filter."""
-        mock_service.export_customers_csv.return_value = "id,first_name\n"
+        """Test export limit is optional and no longer capped at 1000."""
+        mock_service.export_customers = MagicMock(return_value=_chunks(b"id\n"))
 
         response = client.post(
             "/api/v1/customers/export",
-            params={"city": "Eden Prairie"},
+            params={"limit": 20000},
         )
 
         assert response.status_code == 200
-        mock_service.export_customers_csv.assert_called_once()
-        call_kwargs = mock_service.export_customers_csv.call_args.kwargs
-        assert call_kwargs["city"] == "Eden Prairie"
+        call_kwargs = mock_service.export_customers.call_args.kwargs
+        assert call_kwargs["limit"] == 20000
 
-    def test_export_customers_with_limit(
+    def test_export_customers_xlsx(
         self,
         client: TestClient,
         mock_service: AsyncMock,
     ) -> None:
-        """Test customer export with custom limit."""
-        mock_service.export_customers_csv.return_value = "id,first_name\n"
+        """Test XLSX export sets the spreadsheet media type."""
+        mock_service.export_customers = MagicMock(return_value=_chunks(b"PK"))
 
         response = client.post(
             "/api/v1/customers/export",
-            params={"limit": 500},
+            params={"format": "xlsx"},
         )
 
         assert response.status_code == 200
-        call_kwargs = mock_service.export_customers_csv.call_args.kwargs
-        assert call_kwargs["limit"] == 500
+        assert "spreadsheetml" in response.headers["content-type"]
+        assert "customers.xlsx" in response.headers["content-disposition"]
+        call_kwargs = mock_service.export_customers.call_args.kwargs
+        assert call_kwargs["export_format"] == "xlsx"
 
-    def test_export_customers_limit_exceeds_max_returns_422(
+    def test_export_customers_invalid_format_returns_422(
         self,
         client: TestClient,
         mock_service: AsyncMock,
     ) -> None:
-        """Test export with limit > 1000 returns 422."""
+        """Test export with an unknown format returns 422."""
         response = client.post(
             "/api/v1/customers/export",
-            params={"limit": 2000},
+            params={"format": "pdf"},
         )
 
         assert response.status_code == 422
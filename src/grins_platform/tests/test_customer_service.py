@@ -9,8 +9,10 @@ Validates: Requirement 1.1-1.6, 3.1-3.6, 4.1-4.7, 6.6, 8.1-8.4, 11.1-11.6, 12.1-
 
 from __future__ import annotations
 
+import gzip
 import uuid
 from datetime import datetime
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -31,6 +33,9 @@ from grins_platform.schemas.customer import (
 )
 from grins_platform.services.customer_service import MAX_BULK_RECORDS, CustomerService
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 
 @pytest.fixture
 def mock_repository() -> AsyncMock:
@@ -44,6 +49,15 @@ def customer_service(mock_repository: AsyncMock) -> CustomerService:
     return CustomerService(repository=mock_repository)
 
 
+async def _aiter(items: list[MagicMock]) -> AsyncIterator[MagicMock]:
+    for item in items:
+        yield item
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
 @pytest.fixture
 def sample_customer() -> MagicMock:
     """Create a sample customer mock object."""
@@ -605,52 +619,60 @@ class TestCustomerServiceBulkOperations:
         mock_repository: AsyncMock,
         sample_customer: MagicMock,
     ) -> None:
-        """Test successful CSV export."""
-        # Arrange - return customers on first call, empty on second to stop pagination
-        mock_repository.list_with_filters.side_effect = [
-            ([sample_customer], 1),
-            ([], 0),
-        ]
+        """Test successful streamed CSV export."""
+        mock_repository.iter_for_export = MagicMock(
+            return_value=_aiter([sample_customer]),
+        )
 
         # Act
-        result = await customer_service.export_customers_csv()
+        result = await _collect(
+            customer_service.export_customers(CustomerListParams()),
+        )
 
         # Assert
-        assert "id,first_name,last_name,phone,email" in result
-        assert "John" in result
-        assert "Doe" in result
+        text = result.decode()
+        assert text.startswith("id,first_name,last_name,phone,email")
+        assert "John" in text
+        assert "Doe" in text
 
     @pytest.mark.asyncio
-    async def test_export_customers_csv_with_city_filter(
+    async def test_export_customers_passes_filters_and_limit(
         self,
         customer_service: CustomerService,
         mock_repository: AsyncMock,
         sample_customer: MagicMock,
     ) -> None:
-        """Test CSV export with city filter."""
-        # Arrange - return customers on first call, empty on second to stop pagination
-        mock_repository.list_with_filters.side_effect = [
-            ([sample_customer], 1),
-            ([], 0),
-        ]
+        """Test export streams with the list filters and optional cap."""
+        mock_repository.iter_for_export = MagicMock(
+            return_value=_aiter([sample_customer]),
+        )
+        params = CustomerListParams(city="Eden Prairie")
 
         # Act
-        result = await customer_service.export_customers_csv(city="Eden Prairie")
+        _ = await _collect(customer_service.export_customers(params, limit=5000))
 
         # Assert
-        assert "John" in result
-        # Verify the filter was passed
-        call_args = mock_repository.list_with_filters.call_args_list[0]
-        assert call_args[0][0].city == "Eden Prairie"
+        mock_repository.iter_for_export.assert_called_once_with(params, limit=5000)
 
     @pytest.mark.asyncio
-    async def test_export_customers_csv_exceeds_limit(
+    async def test_export_customers_gzip(
         self,
         customer_service: CustomerService,
+        mock_repository: AsyncMock,
+        sample_customer: MagicMock,
     ) -> None:
-        """Test that exceeding export limit raises error."""
-        # Act & Assert
-        with pytest.raises(BulkOperationError) as exc_info:
-            await customer_service.export_customers_csv(limit=MAX_BULK_RECORDS + 1)
+        """Test gzipped export decompresses to the CSV."""
+        mock_repository.iter_for_export = MagicMock(
+            return_value=_aiter([sample_customer]),
+        )
 
-        assert exc_info.value.max_allowed == MAX_BULK_RECORDS
+        # Act
+        result = await _collect(
+            customer_service.export_customers(
+                CustomerListParams(),
+                export_format="csv.gz",
+            ),
+        )
+
+        # Assert
+        assert b"John" in gzip.decompress(result)
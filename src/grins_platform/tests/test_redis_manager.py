@@ -0,0 +1,83 @@
+"""Tests for Redis configuration and connection management."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from grins_platform.redis_manager import (
+    RedisManager,
+    RedisSettings,
+    get_redis_manager,
+)
+
+
+def _configured() -> RedisManager:
+    return RedisManager(RedisSettings(redis_url="redis://localhost:6379/0"))
+
+
+class TestRedisManager:
+    """Test suite for RedisManager."""
+
+    def test_unconfigured_client_is_none(self) -> None:
+        """Test no client is created when REDIS_URL is unset."""
+        manager = RedisManager(RedisSettings(redis_url=None))
+        assert manager.is_configured is False
+        assert manager.client is None
+
+    def test_client_is_created_once_and_shared(self) -> None:
+        """Test the pooled client is reused across accesses."""
+        manager = _configured()
+        client = manager.client
+        assert client is not None
+        assert manager.client is client
+        assert client.connection_pool is manager._pool
+
+    def test_pool_uses_settings(self) -> None:
+        """Test pool options come from RedisSettings."""
+        manager = RedisManager(
+            RedisSettings(
+                redis_url="redis://localhost:6379/0",
+                redis_max_connections=7,
+            ),
+        )
+        _ = manager.client
+        assert manager._pool is not None
+        assert manager._pool.max_connections == 7
+
+    @pytest.mark.asyncio
+    async def test_pipeline_yields_none_when_unconfigured(self) -> None:
+        """Test pipeline helper degrades to None without Redis."""
+        manager = RedisManager(RedisSettings(redis_url=None))
+        async with manager.pipeline() as pipe:
+            assert pipe is None
+
+    @pytest.mark.asyncio
+    async def test_health_check_disabled(self) -> None:
+        """Test health check reports disabled when not configured."""
+        manager = RedisManager(RedisSettings(redis_url=None))
+        health = await manager.health_check()
+        assert health["status"] == "disabled"
+
+    @pytest.mark.asyncio
+    async def test_health_check_ping_failure(self) -> None:
+        """Test health check reports unhealthy when PING fails."""
+        manager = _configured()
+        client = manager.client
+        assert client is not None
+        client.ping = AsyncMock(side_effect=ConnectionError("refused"))
+        health = await manager.health_check()
+        assert health["status"] == "unhealthy"
+        assert "refused" in health["error"]
+
+    @pytest.mark.asyncio
+    async def test_close_resets_client(self) -> None:
+        """Test close releases the pool so a new one is built on next use."""
+        manager = _configured()
+        _ = manager.client
+        await manager.close()
+        assert manager._client is None
+        assert manager._pool is None
+
+    def test_get_redis_manager_singleton(self) -> None:
+        """Test global manager is a singleton."""
+        assert get_redis_manager() is get_redis_manager()
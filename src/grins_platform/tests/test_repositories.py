@@ -10,7 +10,7 @@ including CRUD operations, query methods, and property-based tests.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -19,6 +19,7 @@ from uuid import UUID, uuid4
 import pytest
 
 from grins_platform.models.customer import Customer
+from grins_platform.models.customer_summary import CustomerSummary
 from grins_platform.models.enums import CustomerStatus
 from grins_platform.models.property import Property
 from grins_platform.repositories.customer_repository import CustomerRepository
@@ -565,7 +566,10 @@ class TestCustomerRepositoryGetServiceSummary:
         self,
         mock_session: AsyncMock,
     ) -> None:
-        """Test getting service summary returns a summary object."""
+        """Test a customer without a summary row gets an empty summary."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
         repo = CustomerRepository(mock_session)
         result = await repo.get_service_summary(uuid4())
 
@@ -574,6 +578,37 @@ class TestCustomerRepositoryGetServiceSummary:
         assert result.last_service_date is None
         assert result.total_revenue == 0.0
 
+    @pytest.mark.asyncio
+    async def test_get_service_summary_reads_projection(
+        self,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test the summary is read from the customer_summaries row."""
+        last_service = datetime(2026, 4, 1, 15, 0, tzinfo=timezone.utc)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = CustomerSummary(
+            customer_id=uuid4(),
+            total_jobs=7,
+            last_service_date=last_service,
+            lifetime_revenue=Decimal("1840.50"),
+            outstanding_balance=Decimal("125.00"),
+            active_agreement_tier="Premium",
+            last_contact_at=None,
+        )
+        mock_session.execute.return_value = mock_result
+        repo = CustomerRepository(mock_session)
+
+        result = await repo.get_service_summary(uuid4())
+
+        assert result.total_jobs == 7
+        assert result.last_service_date == last_service
+        assert result.total_revenue == 1840.5
+        assert result.outstanding_balance == 125.0
+        assert result.active_agreement_tier == "Premium"
+        assert mock_session.execute.await_count == 1
+        sql = str(mock_session.execute.await_args.args[0])
+        assert "customer_summaries" in sql
+
 
 class TestCustomerRepositoryBulkUpdatePreferences:
     """Test suite for CustomerRepository.bulk_update_preferences method."""
@@ -2,7 +2,8 @@
 
 Tests accounting summary, expense aggregation, per-job financials,
 tax summary, tax estimation, what-if projections, receipt OCR parsing,
-Plaid MCC auto-categorization, and edge cases (zero division, missing keys).
+the receipt extraction cache and batch queueing, Plaid MCC
+auto-categorization, and edge cases (zero division, missing keys).
 
 Properties:
   P53: Accounting summary calculation correctness
@@ -20,19 +21,27 @@ Validates: Requirements 52.2, 52.5, 52.7, 53.3, 53.5, 53.8, 53.9,
 
 from __future__ import annotations
 
+from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from grins_platform.models.enums import ExpenseCategory
 from grins_platform.schemas.accounting import TaxProjectionRequest
+from grins_platform.schemas.expense import ReceiptExtractionResponse
 from grins_platform.services.accounting_service import (
     MCC_CATEGORY_MAP,
+    RECEIPT_BATCH_MAX_FILES,
     AccountingService,
+    expense_categories_statement,
+    period_totals_statement,
+    receipt_content_hash,
 )
+from grins_platform.services.photo_service import UploadResult
 
 # =============================================================================
 # Helpers
@@ -70,6 +79,29 @@ def _mock_db_execute_results(
     return db
 
 
+def _mock_rollup_db(
+    categories: list[tuple[str, Decimal, int]] | None = None,
+    **totals: Decimal,
+) -> AsyncMock:
+    """Create a mock db session answering the daily-rollup queries.
+
+    ``mappings().one()`` gives the period totals (omitted ones are 0) and
+    ``all()`` gives the per-category expense rows.
+    """
+    result = MagicMock()
+    result.mappings.return_value.one.return_value = {
+        "revenue": Decimal(0),
+        "expenses": Decimal(0),
+        "pending_total": Decimal(0),
+        "past_due_total": Decimal(0),
+        **totals,
+    }
+    result.all.return_value = categories or []
+    db = AsyncMock()
+    db.execute.return_value = result
+    return db
+
+
 def _make_expense_mock(
     *,
     amount: Decimal,
@@ -105,22 +137,18 @@ class TestProperty53AccountingSummaryCalculation:
         self,
     ) -> None:
         """Revenue=10000, expenses=3000 → profit=7000, margin=70%."""
-        repo = AsyncMock()
-        repo.get_total_spend.return_value = Decimal("3000.00")
-        svc = _build_service(expense_repo=repo)
-
-        # db.execute returns: revenue, pending, past_due
-        db = AsyncMock()
-        revenue_result = MagicMock()
-        revenue_result.scalar.return_value = Decimal("10000.00")
-        pending_result = MagicMock()
-        pending_result.scalar.return_value = Decimal("2000.00")
-        past_due_result = MagicMock()
-        past_due_result.scalar.return_value = Decimal("500.00")
-        db.execute.side_effect = [revenue_result, pending_result, past_due_result]
+        svc = _build_service()
+        db = _mock_rollup_db(
+            revenue=Decimal("10000.00"),
+            expenses=Decimal("3000.00"),
+            pending_total=Decimal("2000.00"),
+            past_due_total=Decimal("500.00"),
+        )
 
         result = await svc.get_summary(db)
 
+        db.execute.assert_awaited_once()
+
         assert result.revenue == Decimal("10000.00")
         assert result.expenses == Decimal("3000.00")
         assert result.profit == Decimal("7000.00")
@@ -133,18 +161,8 @@ class TestProperty53AccountingSummaryCalculation:
         self,
     ) -> None:
         """When revenue is 0, profit margin should be 0.0 (no division error)."""
-        repo = AsyncMock()
-        repo.get_total_spend.return_value = Decimal("500.00")
-        svc = _build_service(expense_repo=repo)
-
-        db = AsyncMock()
-        revenue_result = MagicMock()
-        revenue_result.scalar.return_value = Decimal(0)
-        pending_result = MagicMock()
-        pending_result.scalar.return_value = Decimal(0)
-        past_due_result = MagicMock()
-        past_due_result.scalar.return_value = Decimal(0)
-        db.execute.side_effect = [revenue_result, pending_result, past_due_result]
+        svc = _build_service()
+        db = _mock_rollup_db(expenses=Decimal("500.00"))
 
         result = await svc.get_summary(db)
 
@@ -156,18 +174,8 @@ class TestProperty53AccountingSummaryCalculation:
     @pytest.mark.asyncio
     async def test_get_summary_with_no_data_returns_all_zeros(self) -> None:
         """Empty database returns all-zero summary."""
-        repo = AsyncMock()
-        repo.get_total_spend.return_value = Decimal(0)
-        svc = _build_service(expense_repo=repo)
-
-        db = AsyncMock()
-        zero_result = MagicMock()
-        zero_result.scalar.return_value = Decimal(0)
-        db.execute.side_effect = [
-            MagicMock(scalar=MagicMock(return_value=Decimal(0))),
-            MagicMock(scalar=MagicMock(return_value=Decimal(0))),
-            MagicMock(scalar=MagicMock(return_value=Decimal(0))),
-        ]
+        svc = _build_service()
+        db = _mock_rollup_db()
 
         result = await svc.get_summary(db)
 
@@ -179,6 +187,38 @@ class TestProperty53AccountingSummaryCalculation:
         assert result.past_due_total == Decimal(0)
 
 
+@pytest.mark.unit
+class TestAccountingRollupStatements:
+    """Period figures read the daily rollups, not invoices or expenses."""
+
+    def test_period_totals_is_one_rollup_query(self) -> None:
+        sql = str(
+            period_totals_statement(
+                date(2026, 1, 1),
+                date(2026, 3, 31),
+                date(2026, 4, 15),
+            ).compile(dialect=postgresql.dialect()),
+        )
+
+        assert sql.endswith("FROM accounting_daily_rollups")
+        assert "FROM invoices" not in sql
+        assert "FROM expenses" not in sql
+        for column in ("revenue", "expenses", "pending_total", "past_due_total"):
+            assert f"AS {column}" in sql
+
+    def test_expense_categories_filters_only_given_bounds(self) -> None:
+        unbounded = str(expense_categories_statement().compile())
+        bounded = str(
+            expense_categories_statement(
+                date(2026, 1, 1), date(2026, 12, 31)
+            ).compile(),
+        )
+
+        assert "accounting_daily_rollups.day" not in unbounded
+        assert bounded.count("accounting_daily_rollups.day") == 2
+        assert "HAVING" in bounded
+
+
 # =============================================================================
 # Property 54: Expense category aggregation and per-job cost linkage
 # Validates: Requirements 53.3, 53.5
@@ -200,14 +240,14 @@ class TestProperty54ExpenseCategoryAggregation:
         self,
     ) -> None:
         """Aggregation returns correct category, total, count tuples."""
-        repo = AsyncMock()
-        repo.aggregate_by_category.return_value = [
-            ("materials", Decimal("5000.00"), 10),
-            ("fuel", Decimal("1200.00"), 25),
-            ("labor", Decimal("800.00"), 5),
-        ]
-        svc = _build_service(expense_repo=repo)
-        db = AsyncMock()
+        svc = _build_service()
+        db = _mock_rollup_db(
+            categories=[
+                ("materials", Decimal("5000.00"), 10),
+                ("fuel", Decimal("1200.00"), 25),
+                ("labor", Decimal("800.00"), 5),
+            ],
+        )
 
         result = await svc.get_expenses_by_category(db)
 
@@ -225,10 +265,10 @@ class TestProperty54ExpenseCategoryAggregation:
         self,
     ) -> None:
         """No expenses returns empty list."""
-        repo = AsyncMock()
-        repo.aggregate_by_category.return_value = []
-        svc = _build_service(expense_repo=repo)
-        db = AsyncMock()
+        svc = _build_service()
+        db = _mock_rollup_db(
+            categories=[],
+        )
 
         result = await svc.get_expenses_by_category(db)
 
@@ -393,13 +433,13 @@ class TestProperty57CustomerAcquisitionCost:
     @pytest.mark.asyncio
     async def test_expenses_by_category_includes_marketing_spend(self) -> None:
         """Marketing expenses are correctly aggregated for CAC input."""
-        repo = AsyncMock()
-        repo.aggregate_by_category.return_value = [
-            ("marketing", Decimal("3000.00"), 15),
-            ("materials", Decimal("2000.00"), 8),
-        ]
-        svc = _build_service(expense_repo=repo)
-        db = AsyncMock()
+        svc = _build_service()
+        db = _mock_rollup_db(
+            categories=[
+                ("marketing", Decimal("3000.00"), 15),
+                ("materials", Decimal("2000.00"), 8),
+            ],
+        )
 
         result = await svc.get_expenses_by_category(db)
 
@@ -411,12 +451,12 @@ class TestProperty57CustomerAcquisitionCost:
     @pytest.mark.asyncio
     async def test_expenses_by_category_with_zero_marketing_spend(self) -> None:
         """No marketing expenses → marketing category absent from results."""
-        repo = AsyncMock()
-        repo.aggregate_by_category.return_value = [
-            ("materials", Decimal("1000.00"), 5),
-        ]
-        svc = _build_service(expense_repo=repo)
-        db = AsyncMock()
+        svc = _build_service()
+        db = _mock_rollup_db(
+            categories=[
+                ("materials", Decimal("1000.00"), 5),
+            ],
+        )
 
         result = await svc.get_expenses_by_category(db)
 
@@ -443,18 +483,15 @@ class TestProperty58TaxSummaryAggregation:
     @pytest.mark.asyncio
     async def test_get_tax_summary_returns_categories_and_revenue(self) -> None:
         """Tax summary includes expense categories and revenue for year."""
-        repo = AsyncMock()
-        repo.aggregate_by_category.return_value = [
-            ("materials", Decimal("8000.00"), 40),
-            ("fuel", Decimal("3000.00"), 60),
-            ("labor", Decimal("5000.00"), 20),
-        ]
-        svc = _build_service(expense_repo=repo)
-
-        revenue_result = MagicMock()
-        revenue_result.scalar.return_value = Decimal("50000.00")
-        db = AsyncMock()
-        db.execute.return_value = revenue_result
+        svc = _build_service()
+        db = _mock_rollup_db(
+            categories=[
+                ("materials", Decimal("8000.00"), 40),
+                ("fuel", Decimal("3000.00"), 60),
+                ("labor", Decimal("5000.00"), 20),
+            ],
+            revenue=Decimal("50000.00"),
+        )
 
         result = await svc.get_tax_summary(db, tax_year=2024)
 
@@ -469,14 +506,11 @@ class TestProperty58TaxSummaryAggregation:
         self,
     ) -> None:
         """No expenses → total_deductions = 0."""
-        repo = AsyncMock()
-        repo.aggregate_by_category.return_value = []
-        svc = _build_service(expense_repo=repo)
-
-        revenue_result = MagicMock()
-        revenue_result.scalar.return_value = Decimal("20000.00")
-        db = AsyncMock()
-        db.execute.return_value = revenue_result
+        svc = _build_service()
+        db = _mock_rollup_db(
+            categories=[],
+            revenue=Decimal("20000.00"),
+        )
 
         result = await svc.get_tax_summary(db, tax_year=2024)
 
@@ -505,14 +539,8 @@ class TestProperty59TaxEstimation:
     @pytest.mark.asyncio
     async def test_get_tax_estimate_calculates_correctly(self) -> None:
         """(revenue - deductions) x rate = estimated_tax_due."""
-        repo = AsyncMock()
-        repo.get_total_spend.return_value = Decimal("15000.00")
-        svc = _build_service(expense_repo=repo, effective_tax_rate=0.30)
-
-        revenue_result = MagicMock()
-        revenue_result.scalar.return_value = Decimal("50000.00")
-        db = AsyncMock()
-        db.execute.return_value = revenue_result
+        svc = _build_service(effective_tax_rate=0.30)
+        db = _mock_rollup_db(revenue=Decimal("50000.00"), expenses=Decimal("15000.00"))
 
         result = await svc.get_tax_estimate(db)
 
@@ -531,14 +559,8 @@ class TestProperty59TaxEstimation:
         self,
     ) -> None:
         """Deductions > revenue → taxable_income = 0, tax = 0."""
-        repo = AsyncMock()
-        repo.get_total_spend.return_value = Decimal("60000.00")
-        svc = _build_service(expense_repo=repo, effective_tax_rate=0.30)
-
-        revenue_result = MagicMock()
-        revenue_result.scalar.return_value = Decimal("40000.00")
-        db = AsyncMock()
-        db.execute.return_value = revenue_result
+        svc = _build_service(effective_tax_rate=0.30)
+        db = _mock_rollup_db(revenue=Decimal("40000.00"), expenses=Decimal("60000.00"))
 
         result = await svc.get_tax_estimate(db)
 
@@ -548,15 +570,8 @@ class TestProperty59TaxEstimation:
     @pytest.mark.asyncio
     async def test_project_tax_adds_hypothetical_and_recalculates(self) -> None:
         """project_tax adds additional_revenue/expenses to current estimate."""
-        repo = AsyncMock()
-        repo.get_total_spend.return_value = Decimal("10000.00")
-        svc = _build_service(expense_repo=repo, effective_tax_rate=0.25)
-
-        revenue_result = MagicMock()
-        revenue_result.scalar.return_value = Decimal("40000.00")
-        db = AsyncMock()
-        # get_tax_estimate is called internally by project_tax
-        db.execute.return_value = revenue_result
+        svc = _build_service(effective_tax_rate=0.25)
+        db = _mock_rollup_db(revenue=Decimal("40000.00"), expenses=Decimal("10000.00"))
 
         projection = TaxProjectionRequest(
             additional_revenue=Decimal("10000.00"),
@@ -583,14 +598,8 @@ class TestProperty59TaxEstimation:
     @pytest.mark.asyncio
     async def test_project_tax_difference_is_correct(self) -> None:
         """difference = projected_tax - current_tax."""
-        repo = AsyncMock()
-        repo.get_total_spend.return_value = Decimal("5000.00")
-        svc = _build_service(expense_repo=repo, effective_tax_rate=0.30)
-
-        revenue_result = MagicMock()
-        revenue_result.scalar.return_value = Decimal("20000.00")
-        db = AsyncMock()
-        db.execute.return_value = revenue_result
+        svc = _build_service(effective_tax_rate=0.30)
+        db = _mock_rollup_db(revenue=Decimal("20000.00"), expenses=Decimal("5000.00"))
 
         projection = TaxProjectionRequest(
             additional_revenue=Decimal(0),
@@ -760,3 +769,206 @@ class TestExtractReceiptAndSyncEdgeCases:
             count = await svc.sync_transactions(db, access_token=None)
 
         assert count == 0
+
+
+# =============================================================================
+# Receipt extraction cache and batch queueing
+# Validates: Requirements 60.1, 60.2
+# =============================================================================
+
+
+def _cache_hit(vendor: str = "Home Depot") -> MagicMock:
+    return MagicMock(
+        amount=Decimal("42.10"),
+        vendor=vendor,
+        category="materials",
+        confidence=0.9,
+    )
+
+
+def _photo_service() -> MagicMock:
+    photos = MagicMock()
+    photos.upload_file.side_effect = lambda data, name, _context: UploadResult(
+        file_key=f"receipts/{name}",
+        file_name=name,
+        file_size=len(data),
+        content_type="image/jpeg",
+    )
+    return photos
+
+
+@pytest.mark.unit
+class TestReceiptExtractionCache:
+    """Tests for content-hash caching of receipt extraction."""
+
+    @pytest.mark.asyncio
+    async def test_reupload_is_answered_from_cache(self) -> None:
+        data = b"receipt-bytes"
+        repo = AsyncMock()
+        repo.get_receipt_extractions.return_value = {
+            receipt_content_hash(data): _cache_hit(),
+        }
+        svc = _build_service(expense_repo=repo)
+
+        with patch.object(svc, "extract_receipt", AsyncMock()) as extract:
+            result = await svc.extract_receipt_cached(data)
+
+        extract.assert_not_awaited()
+        assert result.vendor == "Home Depot"
+        assert result.amount == Decimal("42.10")
+        repo.save_receipt_extractions.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_miss_caches_confident_result(self) -> None:
+        repo = AsyncMock()
+        repo.get_receipt_extractions.return_value = {}
+        svc = _build_service(expense_repo=repo)
+        extracted = ReceiptExtractionResponse(
+            amount=Decimal("18.00"),
+            vendor="Shell " * 50,
+            category="fuel",
+            confidence=0.8,
+        )
+
+        with patch.object(svc, "extract_receipt", AsyncMock(return_value=extracted)):
+            result = await svc.extract_receipt_cached(b"new", "image/png")
+
+        assert result == extracted
+        (row,) = repo.save_receipt_extractions.await_args.args[0]
+        assert row["content_hash"] == receipt_content_hash(b"new")
+        assert row["amount"] == Decimal("18.00")
+        assert len(row["vendor"]) == 200
+
+    @pytest.mark.asyncio
+    async def test_unreadable_result_is_not_cached(self) -> None:
+        repo = AsyncMock()
+        repo.get_receipt_extractions.return_value = {}
+        svc = _build_service(expense_repo=repo)
+
+        with patch.object(
+            svc,
+            "extract_receipt",
+            AsyncMock(return_value=ReceiptExtractionResponse(confidence=0.0)),
+        ):
+            await svc.extract_receipt_cached(b"blurry")
+
+        repo.save_receipt_extractions.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_queue_completes_cached_receipts_at_once(self) -> None:
+        batch = MagicMock(
+            id=uuid4(),
+            status="queued",
+            total=2,
+            completed=1,
+            failed=0,
+            cached=1,
+        )
+        repo = AsyncMock()
+        repo.get_receipt_extractions.return_value = {
+            receipt_content_hash(b"seen"): _cache_hit(),
+        }
+        repo.create_receipt_batch.return_value = batch
+        repo.get_receipt_batch.return_value = (batch, [])
+        photos = _photo_service()
+        svc = AccountingService(expense_repository=repo, photo_service=photos)
+        user_id = uuid4()
+
+        result = await svc.queue_receipt_extractions(
+            [(b"seen", "a.jpg"), (b"new", "b.jpg")],
+            created_by=user_id,
+        )
+
+        assert photos.upload_file.call_count == 2
+        items, created_by = repo.create_receipt_batch.await_args.args
+        assert created_by == user_id
+        seen, new = items
+        assert seen.keys() == new.keys()
+        assert (seen["status"], seen["cached"], seen["vendor"]) == (
+            "completed",
+            True,
+            "Home Depot",
+        )
+        assert seen["processed_at"] is not None
+        assert (new["status"], new["cached"], new["amount"]) == (
+            "pending",
+            False,
+            None,
+        )
+        assert new["content_hash"] == receipt_content_hash(b"new")
+        assert new["file_key"] == "receipts/b.jpg"
+        assert (result.batch_id, result.pending, result.cached) == (batch.id, 1, 1)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("count", [0, RECEIPT_BATCH_MAX_FILES + 1])
+    async def test_queue_rejects_empty_or_oversized_batches(
+        self,
+        count: int,
+    ) -> None:
+        repo = AsyncMock()
+        photos = _photo_service()
+        svc = AccountingService(expense_repository=repo, photo_service=photos)
+
+        with pytest.raises(ValueError, match="receipts"):
+            await svc.queue_receipt_extractions([(b"x", "r.jpg")] * count)
+
+        photos.upload_file.assert_not_called()
+        repo.create_receipt_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_queue_validates_every_file_before_uploading(self) -> None:
+        photos = _photo_service()
+        photos.validate_file.side_effect = [None, ValueError("not a receipt")]
+        svc = AccountingService(expense_repository=AsyncMock(), photo_service=photos)
+
+        with pytest.raises(ValueError, match="not a receipt"):
+            await svc.queue_receipt_extractions([(b"a", "a.jpg"), (b"b", "b.exe")])
+
+        photos.upload_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_queue_deletes_stored_receipts_when_batch_is_not_recorded(
+        self,
+    ) -> None:
+        repo = AsyncMock()
+        repo.get_receipt_extractions.return_value = {}
+        repo.create_receipt_batch.side_effect = RuntimeError("db down")
+        photos = _photo_service()
+        svc = AccountingService(expense_repository=repo, photo_service=photos)
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await svc.queue_receipt_extractions([(b"a", "a.jpg"), (b"b", "b.jpg")])
+
+        assert sorted(c.args[0] for c in photos.delete_file.call_args_list) == [
+            "receipts/a.jpg",
+            "receipts/b.jpg",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_queue_deletes_stored_receipts_when_an_upload_fails(self) -> None:
+        photos = _photo_service()
+        store = photos.upload_file.side_effect
+
+        def upload(data: bytes, name: str, context: Any) -> UploadResult:
+            if name == "b.jpg":
+                msg = "s3 down"
+                raise RuntimeError(msg)
+            return store(data, name, context)
+
+        photos.upload_file.side_effect = upload
+        repo = AsyncMock()
+        svc = AccountingService(expense_repository=repo, photo_service=photos)
+
+        with pytest.raises(RuntimeError, match="s3 down"):
+            await svc.queue_receipt_extractions([(b"a", "a.jpg"), (b"b", "b.jpg")])
+
+        photos.delete_file.assert_called_once_with("receipts/a.jpg")
+        repo.create_receipt_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_receipt_batch_returns_none_when_missing(self) -> None:
+        repo = AsyncMock()
+        repo.get_receipt_batch.return_value = None
+        svc = _build_service(expense_repo=repo)
+
+        assert await svc.get_receipt_batch(uuid4()) is None
@@ -344,19 +344,27 @@ class TestRegisterScheduledJobs:
     """Tests for register_scheduled_jobs."""
 
     def test_registers_all_four_jobs(self):
-        """All seven scheduled jobs are registered."""
+        """All fifteen scheduled jobs are registered."""
         mock_scheduler = MagicMock()
         register_scheduled_jobs(mock_scheduler)
-        assert mock_scheduler.add_job.call_count == 7
+        assert mock_scheduler.add_job.call_count == 15
 
         job_ids = [call.kwargs["id"] for call in mock_scheduler.add_job.call_args_list]
         assert "escalate_failed_payments" in job_ids
         assert "check_upcoming_renewals" in job_ids
         assert "send_annual_notices" in job_ids
         assert "cleanup_orphaned_consent_records" in job_ids
+        assert "reconcile_campaign_delivery_counters" in job_ids
+        assert "purge_csv_upload_staging" in job_ids
         assert "remind_incomplete_onboarding" in job_ids
         assert "process_pending_campaign_recipients" in job_ids
         assert "duplicate_detection_sweep" in job_ids
+        assert "process_outbox_events" in job_ids
+        assert "snapshot_agreement_metrics" in job_ids
+        assert "process_invoice_notifications" in job_ids
+        assert "sync_bank_transactions" in job_ids
+        assert "process_receipt_extractions" in job_ids
+        assert "send_day_of_reminders" in job_ids
 
     def test_escalate_runs_daily(self):
         """escalate_failed_payments is a daily cron job."""
@@ -370,6 +378,20 @@ class TestRegisterScheduledJobs:
         )
         assert escalate_call.args[1] == "cron"
 
+    def test_day_of_reminders_at_7am_central(self):
+        """send_day_of_reminders runs daily at 7AM Central Time."""
+        mock_scheduler = MagicMock()
+        register_scheduled_jobs(mock_scheduler)
+
+        reminder_call = next(
+            c
+            for c in mock_scheduler.add_job.call_args_list
+            if c.kwargs["id"] == "send_day_of_reminders"
+        )
+        assert reminder_call.args[1] == "cron"
+        assert reminder_call.kwargs["hour"] == 7
+        assert str(reminder_call.kwargs["timezone"]) == "America/Chicago"
+
     def test_renewal_check_at_9am(self):
         """check_upcoming_renewals runs at 9 AM."""
         mock_scheduler = MagicMock()
@@ -0,0 +1,155 @@
+"""Unit tests for campaign delivery counter maintenance."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from grins_platform.repositories.campaign_repository import CampaignRepository
+from grins_platform.services.sms.state_machine import (
+    DeliveryCounterDeltas,
+    adjust_delivery_counters,
+    reconcile_delivery_counters,
+)
+
+
+def _upsert_params(session: AsyncMock) -> dict[str, object]:
+    stmt = session.execute.call_args_list[0].args[0]
+    return stmt.compile().params
+
+
+@pytest.mark.unit
+class TestAdjustDeliveryCounters:
+    """Tests for adjust_delivery_counters."""
+
+    @pytest.mark.asyncio
+    async def test_zero_and_unknown_deltas_skip_execute(self) -> None:
+        session = AsyncMock()
+        await adjust_delivery_counters(
+            session,
+            uuid4(),
+            {"pending": 0, "delivered": 3},
+        )
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upsert_seeds_positive_deltas_only(self) -> None:
+        session = AsyncMock()
+        await adjust_delivery_counters(
+            session,
+            uuid4(),
+            {"pending": -1, "sent": 1},
+        )
+        params = _upsert_params(session)
+        assert params["sent"] == 1
+        assert params["pending"] == 0
+
+
+@pytest.mark.unit
+class TestDeliveryCounterDeltas:
+    """Tests for the per-tick delta buffer."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_transition_nets_to_no_write(self) -> None:
+        """pending → sending → pending (rate-limit revert) writes nothing."""
+        session = AsyncMock()
+        cid = uuid4()
+        deltas = DeliveryCounterDeltas()
+        deltas.record(cid, "pending", "sending")
+        deltas.record(cid, "sending", "pending")
+
+        await deltas.flush(session)
+
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_one_upsert_per_campaign(self) -> None:
+        session = AsyncMock()
+        a, b = uuid4(), uuid4()
+        deltas = DeliveryCounterDeltas()
+        deltas.record(a, "pending", "sending")
+        deltas.record(a, "sending", "sent")
+        deltas.record(a, "pending", "sending")
+        deltas.record(a, "sending", "failed")
+        deltas.record(b, None, "pending", count=5)
+
+        await deltas.flush(session)
+        await deltas.flush(session)  # buffer was reset
+
+        assert session.execute.await_count == 2
+
+    def test_same_state_is_ignored(self) -> None:
+        deltas = DeliveryCounterDeltas()
+        deltas.record(uuid4(), "sent", "sent")
+        assert not deltas._deltas
+
+
+@pytest.mark.unit
+class TestReconcileDeliveryCounters:
+    """Tests for reconcile_delivery_counters."""
+
+    @pytest.mark.asyncio
+    async def test_no_candidates_returns_zero(self) -> None:
+        session = AsyncMock()
+        candidates = MagicMock()
+        candidates.all.return_value = []
+        session.execute.return_value = candidates
+
+        assert await reconcile_delivery_counters(session) == 0
+        assert session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_explicit_ids_lock_then_recount(self) -> None:
+        session = AsyncMock()
+        ids = [uuid4(), uuid4()]
+
+        assert await reconcile_delivery_counters(session, ids) == 2
+
+        lock_sql = str(session.execute.call_args_list[0].args[0])
+        upsert_sql = str(session.execute.call_args_list[1].args[0])
+        assert "FOR UPDATE" in lock_sql
+        assert "ON CONFLICT (campaign_id) DO UPDATE" in upsert_sql
+
+
+@pytest.mark.unit
+class TestCampaignRepositoryStats:
+    """get_campaign_stats reads the counter row when present."""
+
+    @pytest.mark.asyncio
+    async def test_stats_from_counter_row(self) -> None:
+        counter = MagicMock(
+            pending=3,
+            sending=1,
+            sent=10,
+            failed=2,
+            cancelled=4,
+            opted_out=1,
+        )
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = counter
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        stats = await CampaignRepository(session).get_campaign_stats(uuid4())
+
+        assert session.execute.await_count == 1
+        assert stats["total"] == 21
+        assert stats["sent"] == 10
+        assert stats["pending"] == 3
+        assert stats["opted_out"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_pending_adjusts_counters(self) -> None:
+        update_result = MagicMock(rowcount=4)
+        session = AsyncMock()
+        session.execute.return_value = update_result
+
+        cancelled = await CampaignRepository(session).cancel_pending_recipients(
+            uuid4(),
+        )
+
+        assert cancelled == 4
+        upsert = session.execute.call_args_list[1].args[0].compile().params
+        assert upsert["cancelled"] == 4
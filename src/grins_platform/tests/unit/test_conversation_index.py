@@ -0,0 +1,216 @@
+"""Unit tests for the open-conversation index and indexed inbound routing."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from grins_platform.schemas.ai import MessageType
+from grins_platform.services.sms.conversation_index import (
+    ConversationIndex,
+    OpenConversation,
+)
+from grins_platform.services.sms_service import SMSService
+
+
+class _FakeRedis:
+    """Minimal hash store with a pipeline, enough for ConversationIndex."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        del transaction
+        return _FakePipeline(self)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, str, object]] = []
+
+    async def __aenter__(self) -> _FakePipeline:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def hset(self, key: str, mapping: dict[str, str]) -> None:
+        self._ops.append(("hset", key, mapping))
+
+    def expire(self, key: str, ttl: int) -> None:
+        self._ops.append(("expire", key, ttl))
+
+    async def execute(self) -> list[object]:
+        for op, key, arg in self._ops:
+            if op == "hset":
+                self._redis.hashes.setdefault(key, {}).update(arg)  # type: ignore[arg-type]
+            else:
+                self._redis.ttls[key] = arg  # type: ignore[assignment]
+        return []
+
+
+def _sent(
+    message_type: MessageType,
+    campaign_id: object = None,
+    thread_id: str | None = "THR-1",
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        provider_thread_id=thread_id,
+        campaign_id=campaign_id,
+        recipient_phone="+19527373312",
+        message_type=message_type.value,
+    )
+
+
+@pytest.mark.unit
+class TestConversationIndex:
+    """Tests for ConversationIndex record/lookup."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_redis(self) -> None:
+        index = ConversationIndex(None)
+        await index.record_outbound(_sent(MessageType.CAMPAIGN))  # type: ignore[arg-type]
+        assert await index.lookup("THR-1") is None
+
+    @pytest.mark.asyncio
+    async def test_campaign_send_awaits_poll_reply(self) -> None:
+        redis = _FakeRedis()
+        index = ConversationIndex(redis, ttl_seconds=60)  # type: ignore[arg-type]
+        campaign_id = uuid4()
+        msg = _sent(MessageType.CAMPAIGN, campaign_id=campaign_id)
+
+        await index.record_outbound(msg)  # type: ignore[arg-type]
+        conv = await index.lookup("THR-1")
+
+        assert conv is not None
+        assert conv.awaiting_poll_reply
+        assert conv.campaign_id == campaign_id
+        assert conv.sent_message_id == msg.id
+        assert conv.recipient_phone == "+19527373312"
+        assert redis.ttls["sms:conv:THR-1"] == 60
+
+    @pytest.mark.asyncio
+    async def test_confirmation_survives_later_non_campaign_send(self) -> None:
+        redis = _FakeRedis()
+        index = ConversationIndex(redis)  # type: ignore[arg-type]
+        confirmation = _sent(MessageType.APPOINTMENT_CONFIRMATION)
+        reminder = _sent(MessageType.APPOINTMENT_REMINDER)
+
+        await index.record_outbound(confirmation)  # type: ignore[arg-type]
+        await index.record_outbound(reminder)  # type: ignore[arg-type]
+        conv = await index.lookup("THR-1")
+
+        assert conv is not None
+        assert not conv.awaiting_poll_reply
+        assert conv.sent_message_id == reminder.id
+        assert conv.confirmation_message_id == confirmation.id
+
+    @pytest.mark.asyncio
+    async def test_message_without_thread_not_indexed(self) -> None:
+        redis = _FakeRedis()
+        index = ConversationIndex(redis)  # type: ignore[arg-type]
+        await index.record_outbound(_sent(MessageType.CAMPAIGN, thread_id=None))  # type: ignore[arg-type]
+        assert redis.hashes == {}
+
+    @pytest.mark.asyncio
+    async def test_lookup_error_is_a_miss(self) -> None:
+        redis = MagicMock()
+        redis.hgetall = AsyncMock(side_effect=ConnectionError("down"))
+        assert await ConversationIndex(redis).lookup("THR-1") is None
+
+
+def _service(conversation: OpenConversation | None) -> SMSService:
+    index = MagicMock()
+    index.lookup = AsyncMock(return_value=conversation)
+    service = SMSService(AsyncMock(), provider=AsyncMock(), conversation_index=index)
+    service._touch_lead_last_contacted = AsyncMock()  # type: ignore[method-assign]
+    service._try_poll_reply = AsyncMock(return_value=None)  # type: ignore[method-assign]
+    service._record_orphan_reply = AsyncMock()  # type: ignore[method-assign]
+    service._try_confirmation_reply = AsyncMock(  # type: ignore[method-assign]
+        return_value={"action": "confirmation_reply"},
+    )
+    return service
+
+
+@pytest.mark.unit
+class TestIndexedInboundRouting:
+    """handle_inbound routes from the index when the thread is known."""
+
+    @pytest.mark.asyncio
+    async def test_confirmation_thread_skips_poll_correlation(self) -> None:
+        confirmation_id = uuid4()
+        sent_id = uuid4()
+        service = _service(
+            OpenConversation(
+                sent_message_id=sent_id,
+                campaign_id=None,
+                recipient_phone="+19527373312",
+                confirmation_message_id=confirmation_id,
+            ),
+        )
+
+        result = await service.handle_inbound("***3312", "Y", "SM-in", "THR-1")
+
+        assert result["action"] == "confirmation_reply"
+        service._try_poll_reply.assert_not_awaited()  # type: ignore[attr-defined]
+        service._record_orphan_reply.assert_awaited_once()  # type: ignore[attr-defined]
+        assert service._record_orphan_reply.await_args.args[4] == sent_id  # type: ignore[attr-defined]
+        kwargs = service._try_confirmation_reply.await_args.kwargs  # type: ignore[attr-defined]
+        assert kwargs["confirmation_message_id"] == confirmation_id
+
+    @pytest.mark.asyncio
+    async def test_campaign_thread_tries_poll_first(self) -> None:
+        service = _service(
+            OpenConversation(
+                sent_message_id=uuid4(),
+                campaign_id=uuid4(),
+                recipient_phone="+19527373312",
+                confirmation_message_id=None,
+            ),
+        )
+        service._try_poll_reply.return_value = {"action": "poll_reply"}  # type: ignore[attr-defined]
+
+        result = await service.handle_inbound("***3312", "1", "SM-in", "THR-1")
+
+        assert result["action"] == "poll_reply"
+        service._record_orphan_reply.assert_not_awaited()  # type: ignore[attr-defined]
+        service._try_confirmation_reply.assert_not_awaited()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_index_miss_uses_legacy_chain(self) -> None:
+        service = _service(None)
+
+        _ = await service.handle_inbound("***3312", "Y", "SM-in", "THR-1")
+
+        service._try_poll_reply.assert_awaited_once()  # type: ignore[attr-defined]
+        service._record_orphan_reply.assert_not_awaited()  # type: ignore[attr-defined]
+        kwargs = service._try_confirmation_reply.await_args.kwargs  # type: ignore[attr-defined]
+        assert kwargs["confirmation_message_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_stop_uses_indexed_phone_and_skips_bookkeeping(self) -> None:
+        service = _service(
+            OpenConversation(
+                sent_message_id=uuid4(),
+                campaign_id=None,
+                recipient_phone="+19527373312",
+                confirmation_message_id=None,
+            ),
+        )
+        service._record_opt_out_bookkeeping = AsyncMock()  # type: ignore[method-assign]
+
+        _ = await service.handle_inbound("***3312", "STOP", "SM-in", "THR-1")
+
+        record = service.session.add.call_args_list[0].args[0]
+        assert record.phone_number == "+19527373312"
+        service.session.execute.assert_not_awaited()
+        service._record_opt_out_bookkeeping.assert_not_awaited()
@@ -0,0 +1,260 @@
+"""Unit tests for streaming CSV audience staging."""
+
+from __future__ import annotations
+
+import io
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import Insert
+
+from grins_platform.services.campaign_service import CampaignService
+from grins_platform.services.sms import csv_upload
+from grins_platform.services.sms.csv_upload import (
+    _sniff_encoding,
+    parse_csv,
+    stage_csv_upload,
+)
+
+
+def _csv(rows: list[str], header: str = "phone,first_name,last_name") -> io.BytesIO:
+    return io.BytesIO(("\n".join([header, *rows]) + "\n").encode())
+
+
+def _phone(i: int) -> str:
+    return f"952867{i:04d}"
+
+
+def _e164(i: int) -> str:
+    return f"+1952867{i:04d}"
+
+
+class _FakeSession:
+    """Answers match queries and staging inserts like Postgres would."""
+
+    def __init__(
+        self,
+        customers: set[str] | None = None,
+        leads: set[str] | None = None,
+    ) -> None:
+        self.customers = customers or set()
+        self.leads = leads or set()
+        self.staged: dict[str, dict[str, Any]] = {}
+        self.match_queries = 0
+        self.inserts = 0
+
+    async def execute(self, stmt: Any) -> MagicMock:
+        result = MagicMock()
+        params = stmt.compile().params
+        if isinstance(stmt, Insert):
+            self.inserts += 1
+            new: list[str] = []
+            i = 0
+            while f"phone_e164_m{i}" in params:
+                phone = params[f"phone_e164_m{i}"]
+                if phone not in self.staged:
+                    self.staged[phone] = {
+                        "first_name": params[f"first_name_m{i}"],
+                        "match_type": params[f"match_type_m{i}"],
+                    }
+                    new.append(phone)
+                i += 1
+            result.scalars.return_value.all.return_value = new
+            return result
+        self.match_queries += 1
+        phones = {p for v in params.values() if isinstance(v, (list, tuple)) for p in v}
+        result.all.return_value = [
+            *((p, "customer") for p in phones & self.customers),
+            *((p, "lead") for p in phones & self.leads),
+        ]
+        return result
+
+
+@pytest.mark.unit
+class TestSniffEncoding:
+    """Tests for single-pass encoding detection."""
+
+    def test_utf8_bom_detected_and_rewound(self) -> None:
+        f = io.BytesIO("\ufeffphone\n9528670001\n".encode())
+        assert _sniff_encoding(f, 1024) == "utf-8-sig"
+        assert f.tell() == 0
+
+    def test_invalid_utf8_falls_back_to_latin1(self) -> None:
+        f = io.BytesIO(b"phone,first_name\n9528670001,Jos\xe9\n")
+        assert _sniff_encoding(f, 1024) == "latin-1"
+
+    def test_size_limit_enforced(self) -> None:
+        f = io.BytesIO(b"x" * 2048)
+        with pytest.raises(ValueError, match="MB limit"):
+            _ = _sniff_encoding(f, 1024)
+
+
+@pytest.mark.unit
+class TestStageCsvUpload:
+    """Tests for stage_csv_upload."""
+
+    @pytest.mark.asyncio
+    async def test_one_match_query_and_insert_per_chunk(self) -> None:
+        session = _FakeSession(customers={_e164(1)}, leads={_e164(2)})
+        f = _csv([f"{_phone(i)},A{i},B{i}" for i in range(25)])
+
+        result = await stage_csv_upload(session, f, chunk_rows=10)  # type: ignore[arg-type]
+
+        assert session.match_queries == 3
+        assert session.inserts == 3
+        assert result.total_rows == 25
+        assert result.staged == 25
+        assert result.matched_customers == 1
+        assert result.matched_leads == 1
+        assert result.will_become_ghost_leads == 23
+        assert session.staged[_e164(1)]["match_type"] == "customer"
+        assert not f.closed
+
+    @pytest.mark.asyncio
+    async def test_duplicates_collapsed_within_and_across_chunks(self) -> None:
+        session = _FakeSession()
+        rows = [
+            f"{_phone(1)},First,",
+            f"{_phone(1)},Second,",  # same chunk
+            f"{_phone(2)},,",
+            f"{_phone(1)},Third,",  # later chunk
+        ]
+
+        result = await stage_csv_upload(session, _csv(rows), chunk_rows=2)  # type: ignore[arg-type]
+
+        assert result.staged == 2
+        assert result.duplicates_collapsed == 2
+        assert session.staged[_e164(1)]["first_name"] == "First"
+
+    @pytest.mark.asyncio
+    async def test_rejected_rows_counted_and_capped(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(csv_upload, "MAX_REPORTED_REJECTED_ROWS", 2)
+        session = _FakeSession()
+        rows = ["bad,,", ",,", "123,,", _phone(1) + ",,"]
+
+        result = await stage_csv_upload(session, _csv(rows))  # type: ignore[arg-type]
+
+        assert result.rejected_count == 3
+        assert len(result.rejected) == 2
+        assert result.staged == 1
+
+    @pytest.mark.asyncio
+    async def test_inline_recipients_dropped_over_limit(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(csv_upload, "INLINE_RECIPIENT_LIMIT", 3)
+        small = await stage_csv_upload(
+            _FakeSession(),  # type: ignore[arg-type]
+            _csv([_phone(i) + ",," for i in range(3)]),
+        )
+        large = await stage_csv_upload(
+            _FakeSession(),  # type: ignore[arg-type]
+            _csv([_phone(i) + ",," for i in range(4)]),
+            chunk_rows=2,
+        )
+
+        assert small.inline_recipients is not None
+        assert len(small.inline_recipients) == 3
+        assert large.inline_recipients is None
+        assert large.staged == 4
+
+    @pytest.mark.asyncio
+    async def test_on_chunk_receives_newly_staged_phones(self) -> None:
+        on_chunk = AsyncMock()
+        rows = [_phone(1) + ",,", _phone(2) + ",,", _phone(1) + ",,"]
+
+        _ = await stage_csv_upload(
+            _FakeSession(),  # type: ignore[arg-type]
+            _csv(rows),
+            on_chunk=on_chunk,
+            chunk_rows=2,
+        )
+
+        assert on_chunk.await_args_list[0].args[0] == [_e164(1), _e164(2)]
+        assert on_chunk.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_row_limit_enforced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(csv_upload, "STREAM_MAX_ROWS", 2)
+        with pytest.raises(ValueError, match="row limit"):
+            _ = await stage_csv_upload(
+                _FakeSession(),  # type: ignore[arg-type]
+                _csv([_phone(i) + ",," for i in range(3)]),
+            )
+
+    @pytest.mark.asyncio
+    async def test_missing_phone_column(self) -> None:
+        with pytest.raises(ValueError, match="phone"):
+            _ = await stage_csv_upload(
+                _FakeSession(),  # type: ignore[arg-type]
+                _csv(["x,y"], header="name,email"),
+            )
+
+
+@pytest.mark.unit
+class TestParseCsvCompat:
+    """parse_csv keeps its in-memory behavior for small files."""
+
+    def test_parse_csv_dedupes_and_rejects(self) -> None:
+        raw = b"phone,first_name\n9528670001,A\n9528670001,B\nbad,C\n"
+        result = parse_csv(raw)
+        assert [r.phone_e164 for r in result.recipients] == [_e164(1)]
+        assert result.duplicates_collapsed == 1
+        assert len(result.rejected) == 1
+
+
+@pytest.mark.unit
+class TestStagedAdhocRows:
+    """Campaign audiences fall back to staged uploads by csv_upload_id."""
+
+    @pytest.mark.asyncio
+    async def test_malformed_upload_id_returns_empty(self) -> None:
+        session = AsyncMock()
+        rows = await CampaignService._load_staged_adhoc_rows(
+            session,
+            {"csv_upload_id": "not-a-uuid"},
+        )
+        assert rows == []
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_loads_rows_for_upload_id(self) -> None:
+        result = MagicMock()
+        result.all.return_value = [(_e164(1), "A", None)]
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        rows = await CampaignService._load_staged_adhoc_rows(
+            session,
+            {"csv_upload_id": str(uuid4())},
+        )
+
+        assert rows == [{"phone": _e164(1), "first_name": "A", "last_name": None}]
+
+
+@pytest.mark.unit
+class TestPurgeStagedUploads:
+    """Retention purge of staged uploads."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_uploads_referenced_by_unsent_campaigns(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(rowcount=3)
+
+        purged = await csv_upload.purge_staged_uploads(session)
+
+        assert purged == 3
+        stmt = session.execute.await_args.args[0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "NOT (EXISTS" in sql
+        assert "campaigns.target_audience" in sql
+        statuses = next(v for v in compiled.params.values() if isinstance(v, list))
+        assert sorted(statuses) == ["draft", "scheduled", "sending"]
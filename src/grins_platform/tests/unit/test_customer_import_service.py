@@ -0,0 +1,174 @@
+"""Unit tests for CustomerImportService."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from grins_platform.exceptions import ValidationError
+from grins_platform.services import customer_import_service as import_module
+from grins_platform.services.customer_import_service import (
+    CustomerImportService,
+    normalize_header,
+)
+
+
+def _result(rows: list[tuple[Any, ...]]) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def _inserted_phones(stmt: Any) -> list[str]:
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    return [value for key, value in params.items() if key.startswith("phone_m")]
+
+
+def _csv(*lines: str) -> bytes:
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _xlsx(rows: dict[int, list[str]]) -> bytes:
+    """A worksheet of inline strings with only the given rows in its XML."""
+    xml = "".join(
+        f'<row r="{n}">'
+        + "".join(f'<c t="inlineStr"><is><t>{value}</t></is></c>' for value in values)
+        + "</row>"
+        for n, values in rows.items()
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "xl/worksheets/sheet1.xml",
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/'
+            f'2006/main"><sheetData>{xml}</sheetData></worksheet>',
+        )
+    return buffer.getvalue()
+
+
+def _db(existing: list[tuple[Any, ...]] | None = None) -> AsyncMock:
+    """Session whose duplicate lookup returns *existing* and inserts echo back."""
+    db = AsyncMock()
+
+    async def execute(stmt: Any) -> MagicMock:
+        if stmt.is_select:
+            return _result(existing or [])
+        if stmt.table.name == "customers":
+            return _result([(uuid4(), phone) for phone in _inserted_phones(stmt)])
+        return _result([])
+
+    db.execute.side_effect = execute
+    return db
+
+
+_HEADER = "First Name,Last Name,Phone,E-mail,Street Address,City,Zip,Property Type"
+
+
+@pytest.mark.unit
+class TestCustomerImportService:
+    """Tests for bulk customer import."""
+
+    def test_normalize_header_aliases(self) -> None:
+        assert normalize_header(" Postal Code ") == "zip_code"
+        assert normalize_header("E-mail") == "email"
+        assert normalize_header("first_name") == "first_name"
+
+    @pytest.mark.asyncio
+    async def test_reports_invalid_and_in_file_duplicates(self) -> None:
+        data = _csv(
+            _HEADER,
+            "Ann,Lee,(612) 555-0101,ann@example.com,1 Elm St,Edina,55424,RESIDENTIAL",
+            "Bob,Ray,123,,,,,",
+            "Ann,Lee,612.555.0101,,,,,",
+            ",,,,,,,",
+            "Cy,Ng,6125550102,ANN@example.com,,,,",
+            "Di,Oz,6125550103,,2 Oak Ave,Edina,,castle",
+        )
+        db = _db()
+
+        result = await CustomerImportService().import_customers(db, data, "csv")
+
+        assert result.total_rows == 5
+        assert (result.imported, result.properties_imported) == (1, 1)
+        assert (result.invalid, result.duplicates) == (2, 2)
+        errors = {e.row_number: (e.status, e.field) for e in result.errors}
+        assert errors == {
+            3: ("invalid", "phone"),
+            7: ("invalid", "property_type"),
+            4: ("duplicate_in_file", "phone"),
+            6: ("duplicate_in_file", "email"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_xlsx_errors_use_sheet_row_numbers(self) -> None:
+        # Excel leaves blank rows 3-5 out of the sheet XML
+        data = _xlsx(
+            {
+                1: ["first_name", "last_name", "phone"],
+                2: ["Ann", "Lee", "6125550101"],
+                6: ["Bob", "Ray", "123"],
+            },
+        )
+
+        result = await CustomerImportService().import_customers(_db(), data, "xlsx")
+
+        assert result.imported == 1
+        [error] = result.errors
+        assert (error.row_number, error.status) == (6, "invalid")
+
+    @pytest.mark.asyncio
+    async def test_existing_customers_are_duplicates(self) -> None:
+        existing_id = uuid4()
+        data = _csv(
+            "first_name,last_name,phone,email",
+            "Ann,Lee,6125550101,",
+            "Bo,Li,6125550199,bo@example.com",
+        )
+        db = _db(existing=[(existing_id, "6125550101", "old@example.com")])
+
+        result = await CustomerImportService().import_customers(db, data, "csv")
+
+        assert result.imported == 1
+        [error] = result.errors
+        assert (error.row_number, error.status) == (2, "duplicate")
+        assert error.existing_customer_id == existing_id
+
+    @pytest.mark.asyncio
+    async def test_inserts_in_chunks_and_dry_run_writes_nothing(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(import_module, "IMPORT_CHUNK_ROWS", 2)
+        lines = [f"C{i},Test,61255502{i:02d}" for i in range(5)]
+        data = _csv("first_name,last_name,phone", *lines)
+
+        db = _db()
+        result = await CustomerImportService().import_customers(db, data, "csv")
+        inserts = [c.args[0] for c in db.execute.call_args_list if c.args[0].is_insert]
+        assert result.imported == 5
+        assert [len(_inserted_phones(stmt)) for stmt in inserts] == [2, 2, 1]
+
+        db = _db()
+        result = await CustomerImportService().import_customers(
+            db,
+            data,
+            "csv",
+            dry_run=True,
+        )
+        assert (result.valid, result.imported) == (5, 0)
+        assert all(c.args[0].is_select for c in db.execute.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_rejects_missing_required_columns(self) -> None:
+        with pytest.raises(ValidationError, match="phone"):
+            await CustomerImportService().import_customers(
+                _db(),
+                _csv("first_name,last_name", "Ann,Lee"),
+                "csv",
+            )
@@ -0,0 +1,24 @@
+"""Unit tests for the customer summary projection migration."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.unit
+def test_refresh_locks_the_customer_before_aggregating() -> None:
+    versions = Path(__file__).parents[2] / "migrations" / "versions"
+    path = next(versions.glob("*_add_customer_summaries.py"))
+    spec = importlib.util.spec_from_file_location("summary_migration", path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    sql = module._REFRESH_FUNCTION
+    lock = sql.index("pg_advisory_xact_lock(")
+    assert "hashtext(p_customer_id::text)" in sql[lock : sql.index(";", lock)]
+    assert lock < sql.index("INSERT INTO customer_summaries")
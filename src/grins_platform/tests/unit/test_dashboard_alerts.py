@@ -0,0 +1,157 @@
+"""Unit tests for the dashboard alert engine."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from grins_platform.services.dashboard_alerts import (
+    ALERT_RULES,
+    AlertRule,
+    AlertSnapshot,
+    DashboardAlertEngine,
+    evaluate_alert_rule,
+)
+from grins_platform.services.dashboard_metrics import DashboardMetricsCache
+from grins_platform.services.dashboard_service import DashboardService
+
+_RULES = {rule.id: rule for rule in ALERT_RULES}
+
+
+def _session(rows: list[tuple[Any, ...]]) -> AsyncMock:
+    session = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = rows
+    session.execute.return_value = result
+    return session
+
+
+@pytest.mark.unit
+class TestEvaluateAlertRule:
+    """Tests for evaluate_alert_rule."""
+
+    @pytest.mark.asyncio
+    async def test_projection_is_capped_and_counts_all_matches(self) -> None:
+        first, second = uuid4(), uuid4()
+        session = _session([(first, "Jane", "Smith", 40), (second, None, None, 40)])
+
+        snapshot = await evaluate_alert_rule(
+            session,
+            _RULES["sales_needing_action"],
+            date(2026, 4, 15),
+            max_record_ids=2,
+        )
+
+        assert snapshot == AlertSnapshot(
+            count=40,
+            record_ids=[str(first), str(second)],
+            customer_name="Jane Smith",
+        )
+        sql = str(
+            session.execute.call_args.args[0].compile(dialect=postgresql.dialect()),
+        )
+        assert "count(*) OVER ()" in sql
+        assert "LIMIT" in sql
+        assert "sales_entries.notes" not in sql
+
+    @pytest.mark.asyncio
+    async def test_no_matches_and_missing_customer(self) -> None:
+        rule = _RULES["reschedule_requests"]
+        empty = await evaluate_alert_rule(_session([]), rule, date(2026, 4, 15))
+        orphan = await evaluate_alert_rule(
+            _session([(uuid4(), None, None, 1)]),
+            rule,
+            date(2026, 4, 15),
+        )
+
+        assert empty == AlertSnapshot(count=0)
+        assert orphan.customer_name == "Unknown"
+
+
+@pytest.mark.unit
+class TestDashboardAlertEngine:
+    """Tests for DashboardAlertEngine.evaluate."""
+
+    @pytest.mark.asyncio
+    async def test_rules_run_in_own_sessions_with_bounded_concurrency(self) -> None:
+        running = 0
+        peak = 0
+        sessions: list[AsyncMock] = []
+
+        async def execute(_stmt: Any) -> MagicMock:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            result = MagicMock()
+            result.all.return_value = [(uuid4(), 3)]
+            return result
+
+        def factory() -> MagicMock:
+            session = AsyncMock()
+            session.execute.side_effect = execute
+            sessions.append(session)
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=session)
+            context.__aexit__ = AsyncMock(return_value=None)
+            return context
+
+        engine = DashboardAlertEngine(factory, max_concurrency=2)  # type: ignore[arg-type]
+        snapshots = await engine.evaluate()
+
+        assert set(snapshots) == set(_RULES)
+        assert all(s.count == 3 for s in snapshots.values())
+        assert len(sessions) == len(ALERT_RULES)
+        assert peak == 2
+
+
+@pytest.mark.unit
+class TestDashboardServiceAlerts:
+    """Tests for DashboardService.get_alerts on top of the engine."""
+
+    @pytest.mark.asyncio
+    async def test_alerts_are_cached_until_a_rule_table_is_written(self) -> None:
+        invoice_id = uuid4()
+        engine = DashboardAlertEngine(
+            MagicMock(),
+            rules=[AlertRule("overdue_invoices", MagicMock(), frozenset({"invoices"}))],
+        )
+        engine.evaluate = AsyncMock(  # type: ignore[method-assign]
+            return_value={
+                "overdue_invoices": AlertSnapshot(
+                    count=300,
+                    record_ids=[str(invoice_id)],
+                ),
+            },
+        )
+        cache = DashboardMetricsCache()
+        service = DashboardService(
+            customer_repository=MagicMock(),
+            job_repository=MagicMock(),
+            staff_repository=MagicMock(),
+            appointment_repository=MagicMock(),
+            metrics_cache=cache,
+            alert_engine=engine,
+        )
+
+        response = await service.get_alerts()
+        await service.get_alerts()
+        cache.invalidate({"jobs"})
+        await service.get_alerts()
+        assert engine.evaluate.await_count == 1
+
+        cache.invalidate({"invoices"})
+        await service.get_alerts()
+        assert engine.evaluate.await_count == 2
+
+        [alert] = response.alerts
+        assert alert.count == 300
+        assert alert.description == "300 invoices past due"
+        assert alert.target_url == f"/invoices?status=overdue&highlight={invoice_id}"
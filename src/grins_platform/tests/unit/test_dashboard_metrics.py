@@ -0,0 +1,176 @@
+"""Unit tests for the dashboard metrics cache and overview aggregate."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from grins_platform.models.customer import Customer
+from grins_platform.models.enums import JobStatus
+from grins_platform.models.job import Job
+from grins_platform.services import dashboard_metrics
+from grins_platform.services.dashboard_metrics import (
+    DashboardMetricsCache,
+    overview_counts_statement,
+)
+from grins_platform.services.dashboard_service import DashboardService
+
+_OVERVIEW_ROW: dict[str, Any] = {
+    "total_customers": 100,
+    "today_appointments": 12,
+    "total_staff": 5,
+    "available_staff": 3,
+    "new_leads_today": 2,
+    "uncontacted_leads": 7,
+    **{status.value: 0 for status in JobStatus},
+    JobStatus.TO_BE_SCHEDULED.value: 15,
+    JobStatus.COMPLETED.value: 70,
+}
+
+
+def _service(cache: DashboardMetricsCache | None = None) -> DashboardService:
+    session = AsyncMock()
+    result = MagicMock()
+    result.mappings.return_value.one.return_value = _OVERVIEW_ROW
+    session.execute.return_value = result
+    return DashboardService(
+        customer_repository=MagicMock(),
+        job_repository=MagicMock(),
+        staff_repository=MagicMock(),
+        appointment_repository=MagicMock(),
+        lead_repository=MagicMock(),
+        session=session,
+        metrics_cache=cache,
+    )
+
+
+@pytest.mark.unit
+class TestDashboardMetricsCache:
+    """Tests for DashboardMetricsCache."""
+
+    @pytest.mark.asyncio
+    async def test_serves_hits_until_invalidated(self) -> None:
+        cache = DashboardMetricsCache()
+        loader = AsyncMock(side_effect=[1, 2])
+
+        assert await cache.get_or_load("k", loader, {"jobs"}) == 1
+        assert await cache.get_or_load("k", loader, {"jobs"}) == 1
+        cache.invalidate({"invoices"})
+        assert await cache.get_or_load("k", loader, {"jobs"}) == 1
+        cache.invalidate({"jobs", "invoices"})
+        assert await cache.get_or_load("k", loader, {"jobs"}) == 2
+        assert loader.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self) -> None:
+        cache = DashboardMetricsCache()
+        calls = 0
+
+        async def loader() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return calls
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("k", loader, {"jobs"}) for _ in range(5)),
+        )
+
+        assert results == [1] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_is_not_stored(self) -> None:
+        cache = DashboardMetricsCache()
+
+        async def stale() -> str:
+            cache.invalidate()
+            return "stale"
+
+        fresh = AsyncMock(return_value="fresh")
+        assert await cache.get_or_load("k", stale, {"jobs"}) == "stale"
+        assert await cache.get_or_load("k", fresh, {"jobs"}) == "fresh"
+
+
+@pytest.mark.unit
+class TestInvalidationHooks:
+    """Tests for the commit-time invalidation listeners."""
+
+    def test_commit_invalidates_flushed_tables(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        invalidate = MagicMock()
+        monkeypatch.setattr(
+            dashboard_metrics, "invalidate_dashboard_metrics", invalidate
+        )
+        session = Session()
+
+        dashboard_metrics._mark_flush(
+            MagicMock(new=[Customer()], dirty=[], deleted=[], info=session.info),
+            MagicMock(),
+        )
+
+        dashboard_metrics._mark_flush(
+            MagicMock(new=[], dirty=[Job()], deleted=[], info=session.info),
+            MagicMock(),
+        )
+        session.commit()
+        invalidate.assert_called_once_with({"customers", "jobs"})
+
+    def test_bulk_update_marks_session_and_rollback_clears(self) -> None:
+        session = Session()
+        state = MagicMock(
+            is_insert=False,
+            is_update=True,
+            is_delete=False,
+            statement=update(Job).values(status="completed"),
+            session=session,
+        )
+
+        dashboard_metrics._mark_bulk_write(state)
+        assert session.info[dashboard_metrics._DIRTY_KEY] == {"jobs"}
+
+        dashboard_metrics._forget_on_rollback(session)
+        assert dashboard_metrics._DIRTY_KEY not in session.info
+
+
+@pytest.mark.unit
+class TestOverviewAggregate:
+    """Tests for the single-statement overview path of DashboardService."""
+
+    def test_statement_counts_every_job_status(self) -> None:
+        sql = str(
+            overview_counts_statement(date(2026, 4, 15)).compile(
+                dialect=postgresql.dialect(),
+            ),
+        )
+
+        assert sql.startswith("WITH customer_counts AS")
+        for status in JobStatus:
+            assert f"AS {status.value}" in sql
+
+    @pytest.mark.asyncio
+    async def test_overview_uses_one_statement_and_cache(self) -> None:
+        service = _service(DashboardMetricsCache())
+
+        metrics = await service.get_overview_metrics()
+        again = await service.get_overview_metrics()
+        jobs = await service.get_jobs_by_status()
+
+        assert service._session is not None
+        service._session.execute.assert_awaited_once()  # type: ignore[attr-defined]
+        assert again is metrics
+        assert metrics.jobs_by_status == {
+            JobStatus.TO_BE_SCHEDULED.value: 15,
+            JobStatus.COMPLETED.value: 70,
+        }
+        assert (metrics.total_customers, metrics.uncontacted_leads) == (100, 7)
+        assert (jobs.to_be_scheduled, jobs.completed) == (15, 70)
@@ -0,0 +1,281 @@
+"""Unit tests for the batched day-of reminder engine."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from grins_platform.services.day_of_reminder_engine import (
+    DayOfReminderEngine,
+    day_of_reminder_key,
+)
+
+_TODAY = date(2025, 7, 20)
+
+
+class _Crash(BaseException):
+    """Stands in for the process dying mid-dispatch."""
+
+
+def _customer(
+    *,
+    phone: str = "5125551234",
+    email: str | None = "jane@example.com",
+    sms_opt_in: bool = True,
+) -> MagicMock:
+    return MagicMock(id=uuid4(), phone=phone, email=email, sms_opt_in=sms_opt_in)
+
+
+def _row(customer: MagicMock | None) -> tuple[MagicMock, MagicMock | None, Any]:
+    appt = MagicMock(
+        id=uuid4(),
+        job_id=uuid4(),
+        time_window_start=time(9, 0),
+        time_window_end=time(11, 0),
+    )
+    staff = MagicMock()
+    staff.name = "Alex"
+    return appt, customer, staff
+
+
+def _db(
+    rows: list[tuple[Any, ...]],
+    *,
+    stopped: list[str] | None = None,
+    ledger: dict[str, str] | None = None,
+    crashed: asyncio.Event | None = None,
+) -> AsyncMock:
+    """Mock session answering the load, consent and claim statements.
+
+    Claims and status updates are applied to *ledger* (idempotency key to
+    status), which a test can share between runs. Once *crashed* is set,
+    every statement fails, as if the process had died.
+    """
+    ledger = {} if ledger is None else ledger
+
+    async def execute(stmt: Any, *_args: Any, **_kwargs: Any) -> MagicMock:
+        if crashed is not None and crashed.is_set():
+            raise _Crash
+        sql = str(stmt)
+        params = stmt.compile().params
+        result = MagicMock()
+        if sql.startswith("INSERT INTO notification_dispatches"):
+            claimed = [
+                value
+                for key, value in params.items()
+                if key.startswith("idempotency_key")
+                and ledger.get(value, "failed") == "failed"
+            ]
+            ledger.update(dict.fromkeys(claimed, "sending"))
+            result.scalars.return_value = claimed
+        elif sql.startswith("UPDATE notification_dispatches"):
+            (keys,) = (v for k, v in params.items() if k.startswith("idempotency"))
+            ledger.update(dict.fromkeys(keys, params["status"]))
+        elif "FROM appointments" in sql:
+            result.all.return_value = rows
+        else:
+            result.scalars.return_value.all.return_value = stopped or []
+        return result
+
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=execute)
+    db.add = MagicMock()
+    return db
+
+
+def _engine(
+    db: AsyncMock,
+    email_service: MagicMock,
+    concurrency: int = 8,
+) -> DayOfReminderEngine:
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=db)
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    return DayOfReminderEngine(
+        MagicMock(return_value=ctx),
+        provider=MagicMock(),
+        rate_limit_tracker=MagicMock(),
+        email_service=email_service,
+        concurrency=concurrency,
+    )
+
+
+def _email(*, sent: bool = True) -> MagicMock:
+    email = MagicMock()
+    email._send_email = MagicMock(return_value=sent)
+    return email
+
+
+def _sms() -> AsyncMock:
+    sms = AsyncMock()
+    sms.send_message = AsyncMock(
+        return_value={"success": True, "message_id": str(uuid4())},
+    )
+    return sms
+
+
+def _statements(db: AsyncMock, prefix: str) -> list[Any]:
+    return [
+        call.args[0]
+        for call in db.execute.call_args_list
+        if str(call.args[0]).startswith(prefix)
+    ]
+
+
+@pytest.mark.unit
+class TestDayOfReminderEngine:
+    """Tests for DayOfReminderEngine.run."""
+
+    @pytest.mark.asyncio
+    async def test_loads_appointments_and_consent_in_one_query_each(self) -> None:
+        rows = [_row(_customer(phone=f"512555000{i}")) for i in range(3)]
+        db = _db(rows)
+        sms = _sms()
+
+        with patch(
+            "grins_platform.services.day_of_reminder_engine.SMSService",
+            return_value=sms,
+        ):
+            summary = await _engine(db, _email()).run(db, today=_TODAY)
+
+        assert summary.appointments == 3
+        assert summary.sent == 3
+        assert sms.send_message.await_count == 3
+        assert len(_statements(db, "SELECT appointments")) == 1
+        assert (
+            sum(
+                "sms_consent_records" in str(c.args[0])
+                for c in db.execute.call_args_list
+            )
+            == 1
+        )
+        claims = _statements(db, "INSERT INTO notification_dispatches")
+        assert len(claims) == 3
+        sql = str(claims[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (idempotency_key) DO UPDATE" in sql
+        assert "WHERE notification_dispatches.status = " in sql
+
+    @pytest.mark.asyncio
+    async def test_reminders_claimed_by_an_earlier_run_are_not_resent(self) -> None:
+        rows = [_row(_customer()), _row(_customer())]
+        db = _db(rows, ledger={day_of_reminder_key(rows[1][0].id, _TODAY): "sent"})
+        sms = _sms()
+        email = _email()
+
+        with patch(
+            "grins_platform.services.day_of_reminder_engine.SMSService",
+            return_value=sms,
+        ):
+            summary = await _engine(db, email).run(db, today=_TODAY)
+
+        assert summary.already_claimed == 1
+        assert summary.sent == 1
+        sms.send_message.assert_awaited_once()
+        assert sms.send_message.await_args.kwargs["appointment_id"] == rows[0][0].id
+        email._send_email.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rerun_after_interrupted_dispatch_reminds_the_rest(self) -> None:
+        rows = [_row(_customer(email=f"c{i}@example.com")) for i in range(3)]
+        ledger: dict[str, str] = {}
+        crash = asyncio.Event()
+
+        def send_email(**kwargs: Any) -> bool:
+            if crash.is_set() or kwargs["to_email"] == "c1@example.com":
+                crash.set()
+                raise _Crash
+            return True
+
+        crashed = MagicMock()
+        crashed._send_email = MagicMock(side_effect=send_email)
+        db = _db(rows, ledger=ledger, crashed=crash)
+
+        with patch(
+            "grins_platform.services.day_of_reminder_engine.SMSService",
+            return_value=_sms(),
+        ):
+            with pytest.raises(_Crash):
+                await _engine(db, crashed, concurrency=1).run(db, today=_TODAY)
+            db = _db(rows, ledger=ledger)
+            email = _email()
+            summary = await _engine(db, email, concurrency=1).run(db, today=_TODAY)
+
+        keys = [day_of_reminder_key(row[0].id, _TODAY) for row in rows]
+        # The first reminder went out and the second may have: neither is
+        # resent. The third was never reached and is sent on the rerun.
+        assert summary.already_claimed == 2
+        assert summary.sent == 1
+        email._send_email.assert_called_once()
+        assert email._send_email.call_args.kwargs["to_email"] == "c2@example.com"
+        assert [ledger.get(key) for key in keys] == ["sent", "sending", "sent"]
+
+    @pytest.mark.asyncio
+    async def test_hard_stopped_phone_gets_email_only(self) -> None:
+        db = _db([_row(_customer(phone="5125559999"))], stopped=["5125559999"])
+        sms = _sms()
+        email = _email()
+
+        with patch(
+            "grins_platform.services.day_of_reminder_engine.SMSService",
+            return_value=sms,
+        ):
+            summary = await _engine(db, email).run(db, today=_TODAY)
+
+        assert summary.sent == 1
+        sms.send_message.assert_not_awaited()
+        email._send_email.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_outcomes_are_recorded_per_status(self) -> None:
+        unreachable = _customer(sms_opt_in=False, email=None)
+        rows = [_row(_customer()), _row(unreachable), _row(None)]
+        db = _db(rows)
+        sms = _sms()
+
+        with patch(
+            "grins_platform.services.day_of_reminder_engine.SMSService",
+            return_value=sms,
+        ):
+            summary = await _engine(db, _email()).run(db, today=_TODAY)
+
+        assert summary.appointments == 3
+        assert summary.sent == 1
+        assert summary.skipped == 2
+        updates = {
+            stmt.compile().params["status"]: stmt
+            for stmt in _statements(db, "UPDATE notification_dispatches")
+        }
+        assert set(updates) == {"sent", "skipped"}
+        assert updates["skipped"].compile().params["error"] == "no_channel"
+        db.commit.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_send_errors_are_recorded_as_failed(self) -> None:
+        db = _db([_row(_customer(sms_opt_in=False))])
+        email = MagicMock()
+        email._send_email = MagicMock(side_effect=RuntimeError("smtp down"))
+
+        with patch("grins_platform.services.day_of_reminder_engine.SMSService"):
+            summary = await _engine(db, email).run(db, today=_TODAY)
+
+        assert summary.failed == 1
+        (update_stmt,) = _statements(db, "UPDATE notification_dispatches")
+        params = update_stmt.compile().params
+        assert params["status"] == "failed"
+        assert params["error"] == "smtp down"
+
+    @pytest.mark.asyncio
+    async def test_empty_day_claims_nothing(self) -> None:
+        db = _db([])
+
+        summary = await _engine(db, _email()).run(db, today=_TODAY)
+
+        assert summary.appointments == 0
+        assert not _statements(db, "INSERT INTO notification_dispatches")
+        db.commit.assert_not_awaited()
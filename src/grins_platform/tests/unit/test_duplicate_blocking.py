@@ -0,0 +1,196 @@
+"""Unit tests for duplicate-detection blocking."""
+
+from __future__ import annotations
+
+from uuid import UUID, uuid4
+
+import pytest
+from hypothesis import (
+    given,
+    settings,
+    strategies as st,
+)
+
+from grins_platform.services.duplicate_blocking import (
+    MAX_BLOCK_SIZE,
+    NEIGHBOURHOOD_WINDOW,
+    BlockingRecord,
+    BlockSorter,
+    candidate_pairs,
+    soundex,
+)
+from grins_platform.services.duplicate_detection_service import (
+    NAME_SIMILARITY_THRESHOLD,
+    _name_similarity,
+    jaro_winkler_similarity,
+)
+
+
+def _record(
+    first: str,
+    last: str,
+    *,
+    phone: str | None = None,
+    email: str | None = None,
+    address: str | None = None,
+    zip_code: str | None = None,
+) -> BlockingRecord:
+    return BlockingRecord(
+        id=uuid4(),
+        phone=phone,
+        email=email,
+        first_name=first,
+        last_name=last,
+        full_name=f"{first} {last}",
+        address=address,
+        zip_code=zip_code,
+    )
+
+
+def _pair(a: BlockingRecord, b: BlockingRecord) -> tuple[UUID, UUID]:
+    return (a.id, b.id) if a.id < b.id else (b.id, a.id)
+
+
+@pytest.mark.unit
+class TestSoundex:
+    """Tests for soundex."""
+
+    @pytest.mark.parametrize(
+        ("word", "code"),
+        [
+            ("robert", "R163"),
+            ("rupert", "R163"),
+            ("ashcraft", "A261"),
+            ("tymczak", "T522"),
+            ("pfister", "P236"),
+            ("anderson", "A536"),
+            ("andersen", "A536"),
+            ("lee", "L000"),
+            ("", ""),
+        ],
+    )
+    def test_known_codes(self, word: str, code: str) -> None:
+        assert soundex(word) == code
+
+
+@pytest.mark.unit
+class TestCandidatePairs:
+    """Tests for candidate_pairs."""
+
+    def test_shared_phone_is_paired(self) -> None:
+        a = _record("ann", "lee", phone="+16125550001")
+        b = _record("bob", "ng", phone="+16125550001")
+
+        assert _pair(a, b) in candidate_pairs([a, b])
+
+    def test_phonetic_surname_in_same_zip_is_paired(self) -> None:
+        a = _record("erik", "andersen", zip_code="55347")
+        b = _record("eric", "anderson", zip_code="55347")
+        others = [_record("zed", f"q{i:03d}", zip_code="90210") for i in range(30)]
+
+        assert _pair(a, b) in candidate_pairs([a, *others, b])
+
+    def test_typo_found_by_lsh_across_zip_codes(self) -> None:
+        a = _record(
+            "katherine",
+            "schwartzman",
+            address="4410 lakeview ct",
+            zip_code="55424",
+        )
+        b = _record(
+            "katharine",
+            "schwartzmann",
+            address="4410 lakeview ct",
+            zip_code="55435",
+        )
+        # Enough same-letter surnames to push a and b out of each other's
+        # sorted-neighbourhood window.
+        fillers = [_record("al", f"schwartzm{c}") for c in "abcdefghijklm"]
+
+        assert _pair(a, b) in candidate_pairs([a, *fillers, b])
+
+    def test_popular_surname_stays_linear(self) -> None:
+        def johnsons(n: int) -> list[BlockingRecord]:
+            return [
+                _record(f"first{i:04d}", "johnson", zip_code="55401") for i in range(n)
+            ]
+
+        small = len(candidate_pairs(johnsons(1_000)))
+        large = len(candidate_pairs(johnsons(2_000)))
+
+        # All-pairs would quadruple (~0.5M -> ~2M); blocking roughly doubles.
+        assert large < 2.5 * small
+        assert large < 2_000 * MAX_BLOCK_SIZE
+
+
+@pytest.mark.unit
+class TestBlockSorter:
+    """Tests for BlockSorter."""
+
+    @staticmethod
+    def _records() -> list[BlockingRecord]:
+        return [
+            _record(f"first{i:02d}", "johnson", phone=f"+1612555{i % 7:04d}")
+            for i in range(MAX_BLOCK_SIZE + 20)
+        ]
+
+    def test_spilled_runs_give_the_in_memory_pairs(self) -> None:
+        records = self._records()
+
+        with BlockSorter(run_size=37) as sorter:
+            for record in records:
+                sorter.add(record)
+            spilled = {(a.id, b.id) for _, a, b in sorter.pairs()}
+
+        assert spilled == candidate_pairs(records)
+        assert all(a < b for a, b in spilled)
+
+    def test_resumed_pairs_cover_the_rest_of_the_sweep(self) -> None:
+        records = self._records()
+
+        with BlockSorter(run_size=37) as sorter:
+            for record in records:
+                sorter.add(record)
+            keys = sorted({key for key, _, _ in sorter.pairs()})
+            checkpoint = keys[len(keys) // 2]
+            before = {(a.id, b.id) for key, a, b in sorter.pairs() if key <= checkpoint}
+            after = list(sorter.pairs(checkpoint))
+
+        assert all(key > checkpoint for key, _, _ in after)
+        assert before | {(a.id, b.id) for _, a, b in after} == candidate_pairs(
+            records,
+        )
+
+    def test_large_block_is_windowed(self) -> None:
+        records = [
+            _record(f"first{i:03d}", "johnson", phone="+16125550001")
+            for i in range(MAX_BLOCK_SIZE * 2)
+        ]
+
+        with BlockSorter() as sorter:
+            for record in records:
+                sorter.add(record)
+            phone_pairs = [
+                (a, b) for key, a, b in sorter.pairs() if key.startswith("phone:")
+            ]
+
+        assert len(phone_pairs) <= len(records) * NEIGHBOURHOOD_WINDOW
+
+
+@pytest.mark.unit
+class TestNameSimilarityShortcut:
+    """_name_similarity agrees with the full Jaro-Winkler computation."""
+
+    @given(
+        a=st.text(alphabet="abcdejklmnorsty ", min_size=1, max_size=24),
+        b=st.text(alphabet="abcdejklmnorsty ", min_size=1, max_size=24),
+    )
+    @settings(max_examples=300)
+    def test_matches_threshold_decision(self, a: str, b: str) -> None:
+        full = jaro_winkler_similarity(a, b)
+        shortcut = _name_similarity(a, b)
+
+        if full >= NAME_SIMILARITY_THRESHOLD:
+            assert shortcut == full
+        else:
+            assert shortcut is None
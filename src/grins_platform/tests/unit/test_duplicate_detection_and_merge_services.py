@@ -8,19 +8,27 @@ Validates: Requirements 5.1, 5.2, 5.3, 5.4, 6.4, 6.5, 6.7
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from grins_platform.exceptions import CustomerNotFoundError, MergeConflictError
-from grins_platform.schemas.customer_merge import MergeFieldSelection
+from grins_platform.schemas.customer import CustomerUpdate
+from grins_platform.schemas.customer_merge import BatchMergeItem, MergeFieldSelection
+from grins_platform.services import duplicate_detection_service as dds_module
 from grins_platform.services.customer_merge_service import (
     _REASSIGN_TABLES,
     CustomerMergeService,
 )
+from grins_platform.services.customer_service import CustomerService
 from grins_platform.services.duplicate_detection_service import (
     MAX_SCORE,
+    SWEEP_CHECKPOINT_KEY,
+    WATERMARK_SETTING_KEY,
     WEIGHT_ADDRESS,
     WEIGHT_EMAIL,
     WEIGHT_NAME,
@@ -272,6 +280,246 @@ class TestNormalization:
         assert jaro_winkler_similarity("", "hello") == 0.0
 
 
+# ===========================================================================
+# DuplicateDetectionService — Incremental (on-write) detection
+# ===========================================================================
+
+
+def _result(*, one=None, many=None):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = one
+    result.scalar_one.return_value = one
+    result.scalars.return_value.all.return_value = many or []
+    return result
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+class TestIncrementalDetection:
+    """Tests for check_customer and the watermark reconciliation."""
+
+    @pytest.mark.asyncio
+    async def test_check_customer_upserts_scored_neighbours_in_one_statement(
+        self,
+    ):
+        svc = DuplicateDetectionService()
+        customer = _mock_customer(email="a@x.com")
+        same_phone = _mock_customer(first_name="Jon", last_name="Doe")
+        same_email = _mock_customer(phone="6125550000", email="A@x.com")
+        unrelated = _mock_customer(
+            first_name="Zed",
+            last_name="Quinn",
+            phone="6125559999",
+        )
+        db = AsyncMock()
+        db.execute.side_effect = [
+            _result(one=customer),
+            _result(many=[same_phone, same_email, unrelated]),
+            MagicMock(),
+        ]
+
+        upserted = await svc.check_customer(db, customer.id)
+
+        assert upserted == 2
+        assert db.execute.await_count == 3
+        neighbour_sql = _sql(db.execute.await_args_list[1].args[0])
+        assert "customers.phone =" in neighbour_sql
+        assert "lower(customers.email)" in neighbour_sql
+        assert "<%" in neighbour_sql
+        upsert = db.execute.await_args_list[2].args[0]
+        upsert_sql = _sql(upsert)
+        assert "ON CONFLICT ON CONSTRAINT uq_merge_candidates_pair" in upsert_sql
+        assert "excluded.score" in upsert_sql
+        assert len(upsert.compile().params) > 5
+
+    @pytest.mark.asyncio
+    async def test_dismissed_pair_stays_dismissed_after_write_check(self):
+        svc = DuplicateDetectionService()
+        customer = _mock_customer()
+        dismissed_match = _mock_customer(first_name="Jon", last_name="Doe")
+        db = AsyncMock()
+        db.begin_nested = MagicMock(return_value=AsyncMock())
+        db.execute.side_effect = [
+            _result(one=customer),
+            _result(many=[dismissed_match]),
+            MagicMock(),
+        ]
+
+        await svc.check_customer_on_write(db, customer.id)
+
+        upsert_sql = _sql(db.execute.await_args_list[2].args[0])
+        do_update = upsert_sql.split("DO UPDATE", 1)[1]
+        assert "status" in upsert_sql.split("ON CONFLICT", 1)[0]
+        assert "SET score = excluded.score" in do_update
+        assert "status =" not in do_update.split("WHERE", 1)[0]
+        assert "WHERE customer_merge_candidates.status = " in do_update
+
+    @pytest.mark.asyncio
+    async def test_check_customer_skips_inactive_customer(self):
+        svc = DuplicateDetectionService()
+        db = AsyncMock()
+        db.execute.return_value = _result(one=None)
+
+        assert await svc.check_customer(db, uuid4()) == 0
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_reconciliation_rescores_only_changed_customers(self):
+        svc = DuplicateDetectionService()
+        now = datetime(2026, 4, 16, 1, 30, tzinfo=timezone.utc)
+        changed = _mock_customer()
+        neighbour = _mock_customer(first_name="Johnny")
+        db = AsyncMock()
+        db.execute.side_effect = [
+            _result(one=now),
+            _result(one={"changed_since": "2026-04-15T01:30:00+00:00"}),
+            _result(many=[changed]),
+            _result(many=[neighbour]),
+            MagicMock(),
+            MagicMock(),
+        ]
+
+        with patch.object(svc, "run_nightly_sweep") as full_sweep:
+            upserted = await svc.run_reconciliation(db)
+
+        full_sweep.assert_not_called()
+        assert upserted == 1
+        changed_sql = _sql(db.execute.await_args_list[2].args[0])
+        assert "customers.updated_at >" in changed_sql
+        assert "properties.updated_at >" in changed_sql
+        watermark = db.execute.await_args_list[-1].args[0].compile().params
+        assert watermark["setting_key"] == WATERMARK_SETTING_KEY
+        assert watermark["setting_value"] == {"changed_since": now.isoformat()}
+
+    @pytest.mark.asyncio
+    async def test_first_reconciliation_runs_full_sweep(self):
+        svc = DuplicateDetectionService()
+        now = datetime(2026, 4, 16, 1, 30, tzinfo=timezone.utc)
+        db = AsyncMock()
+        db.execute.side_effect = [_result(one=now), _result(one=None), MagicMock()]
+
+        with patch.object(
+            svc,
+            "run_nightly_sweep",
+            AsyncMock(return_value=4),
+        ) as full_sweep:
+            upserted = await svc.run_reconciliation(db)
+
+        full_sweep.assert_awaited_once_with(db)
+        assert upserted == 4
+
+    @pytest.mark.asyncio
+    async def test_customer_update_checks_duplicates_only_for_signal_fields(self):
+        customer = _mock_customer()
+        repository = AsyncMock()
+        repository.get_by_id.return_value = customer
+        repository.update.return_value = customer
+        detector = AsyncMock(spec=DuplicateDetectionService)
+        service = CustomerService(repository, duplicate_detector=detector)
+
+        with patch(
+            "grins_platform.services.customer_service.CustomerResponse",
+        ):
+            _ = await service.update_customer(
+                customer.id,
+                CustomerUpdate(internal_notes="gate code changed"),
+            )
+            detector.check_customer_on_write.assert_not_awaited()
+
+            _ = await service.update_customer(
+                customer.id,
+                CustomerUpdate(last_name="Doe-Smith"),
+            )
+        detector.check_customer_on_write.assert_awaited_once_with(
+            repository.session,
+            customer.id,
+        )
+
+
+def _sweep_row(*, phone: str, first_name: str = "Ann", last_name: str = "Lee"):
+    return SimpleNamespace(
+        id=uuid4(),
+        first_name=first_name,
+        last_name=last_name,
+        phone=phone,
+        email=None,
+        address="1 Main Street",
+        zip_code="55401",
+    )
+
+
+def _stream(rows):
+    async def _rows():
+        for row in rows:
+            yield row
+
+    return _rows()
+
+
+@pytest.mark.unit
+class TestNightlySweep:
+    """Tests for the streamed, checkpointed full sweep."""
+
+    @pytest.mark.asyncio
+    async def test_sweep_commits_checkpoints_and_clears_them(self, monkeypatch):
+        monkeypatch.setattr(dds_module, "SWEEP_CHECKPOINT_EVERY", 1)
+        svc = DuplicateDetectionService()
+        rows = [
+            _sweep_row(phone="6125550001"),
+            _sweep_row(phone="6125550001", first_name="Anne"),
+            _sweep_row(phone="6125550002", first_name="Zed", last_name="Quinn"),
+        ]
+        db = AsyncMock()
+        db.execute.return_value = _result(one=None)
+        db.stream.return_value = _stream(rows)
+
+        upserted = await svc.run_nightly_sweep(db)
+
+        # The phone pair shares several blocks; each block is checkpointed
+        assert upserted >= 1
+        assert db.commit.await_count >= 2
+        stream_sql = _sql(db.stream.await_args.args[0])
+        assert "LATERAL" in stream_sql
+        assert "customers.search_text" not in stream_sql
+        checkpoints = [
+            c.args[0].compile().params
+            for c in db.execute.await_args_list
+            if "business_settings" in _sql(c.args[0])
+        ]
+        assert checkpoints[1]["setting_key"] == SWEEP_CHECKPOINT_KEY
+        assert "after_key" in checkpoints[1]["setting_value"]
+        assert "DELETE FROM business_settings" in _sql(
+            db.execute.await_args_list[-1].args[0],
+        )
+
+    @pytest.mark.asyncio
+    async def test_sweep_resumes_after_checkpoint(self):
+        svc = DuplicateDetectionService()
+        rows = [_sweep_row(phone="6125550001") for _ in range(3)]
+        db = AsyncMock()
+        db.execute.side_effect = [
+            _result(
+                one={
+                    # Past the phone block; only the Soundex/ZIP block remains
+                    "after_key": "phone:~",
+                    "upserted": 5,
+                    "started_at": datetime.now(timezone.utc).isoformat(),
+                },
+            ),
+            MagicMock(),
+            MagicMock(),
+        ]
+        db.stream.return_value = _stream(rows)
+
+        upserted = await svc.run_nightly_sweep(db)
+
+        assert upserted == 5 + 3
+        assert db.execute.await_count == 3
+
+
 # ===========================================================================
 # CustomerMergeService — Blockers
 # ===========================================================================
@@ -476,3 +724,117 @@ class TestExecuteMerge:
             pytest.raises(CustomerNotFoundError),
         ):
             await svc.execute_merge(db, uuid4(), uuid4(), [])
+
+
+# ===========================================================================
+# CustomerMergeService — Batch Merge
+# ===========================================================================
+
+
+def _candidate(a, b, *, status="pending"):
+    return SimpleNamespace(
+        id=uuid4(),
+        customer_a_id=a.id,
+        customer_b_id=b.id,
+        status=status,
+    )
+
+
+def _batch_db(candidates, customers, subscribed=()):
+    """Session answering the candidate, customer and subscription reads."""
+    reads = [
+        _result(many=candidates),
+        MagicMock(scalars=MagicMock(return_value=customers)),
+        MagicMock(scalars=MagicMock(return_value=list(subscribed))),
+    ]
+    db = AsyncMock()
+
+    async def execute(stmt):
+        if reads and stmt.is_select:
+            return reads.pop(0)
+        return MagicMock(rowcount=1, scalar=MagicMock(return_value=3))
+
+    db.execute.side_effect = execute
+    db.add_all = MagicMock()
+    return db
+
+
+class TestExecuteBatchMerge:
+    """Tests for execute_batch_merge: chains, rejections, dry run."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_chain_moves_rows_to_final_survivor(self):
+        a = _mock_customer(email="a@test.com")
+        b = _mock_customer()
+        c = _mock_customer()
+        ab, bc = _candidate(a, b), _candidate(b, c)
+        db = _batch_db([ab, bc], [a, b, c])
+        merges = [
+            BatchMergeItem(candidate_id=ab.id, primary_id=b.id),
+            BatchMergeItem(candidate_id=bc.id, primary_id=c.id),
+        ]
+
+        result = await CustomerMergeService().execute_batch_merge(db, merges)
+
+        assert (result.merged, result.rejected) == (2, 0)
+        assert {r.survivor_id for r in result.results} == {c.id}
+        assert a.merged_into_customer_id == c.id
+        assert b.merged_into_customer_id == c.id
+        # a's email reaches c through b
+        assert c.email == "a@test.com"
+        reassigns = [
+            _sql(call.args[0])
+            for call in db.execute.call_args_list
+            if "FROM (VALUES" in _sql(call.args[0])
+        ]
+        assert len(reassigns) == len(_REASSIGN_TABLES)
+        assert result.reassigned == dict.fromkeys(_REASSIGN_TABLES, 1)
+        assert len(db.add_all.call_args.args[0]) == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rejects_resolved_cycles_and_blocked_groups(self):
+        a, b, c, d = (_mock_customer() for _ in range(4))
+        ab, resolved = _candidate(a, b), _candidate(c, d, status="dismissed")
+        ba, cd = _candidate(b, a), _candidate(c, d)
+        db = _batch_db([ab, ba, resolved, cd], [a, b, c, d], subscribed=[c.id, d.id])
+        merges = [
+            BatchMergeItem(candidate_id=ab.id, primary_id=b.id),
+            BatchMergeItem(candidate_id=ba.id, primary_id=a.id),
+            BatchMergeItem(candidate_id=resolved.id, primary_id=c.id),
+            BatchMergeItem(candidate_id=cd.id, primary_id=c.id),
+            BatchMergeItem(candidate_id=ab.id, primary_id=c.id),
+        ]
+
+        result = await CustomerMergeService().execute_batch_merge(db, merges)
+
+        statuses = [(r.status, r.reason) for r in result.results]
+        assert statuses[0] == ("merged", None)
+        assert "cycle" in statuses[1][1]
+        assert "already resolved" in statuses[2][1]
+        assert "Stripe" in statuses[3][1]
+        assert "not part" in statuses[4][1]
+        assert (result.merged, result.rejected) == (1, 4)
+        assert d.is_deleted is False
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_dry_run_counts_without_writing(self):
+        a, b = _mock_customer(), _mock_customer()
+        ab = _candidate(a, b)
+        db = _batch_db([ab], [a, b])
+
+        result = await CustomerMergeService().execute_batch_merge(
+            db,
+            [BatchMergeItem(candidate_id=ab.id, primary_id=a.id)],
+            dry_run=True,
+        )
+
+        assert result.results[0].status == "planned"
+        assert result.reassigned == dict.fromkeys(_REASSIGN_TABLES, 3)
+        assert b.is_deleted is False
+        assert all(call.args[0].is_select for call in db.execute.call_args_list)
+        db.add_all.assert_not_called()
+        customer_read = _sql(db.execute.call_args_list[1].args[0])
+        assert "FOR UPDATE" not in customer_read
@@ -0,0 +1,293 @@
+"""Unit tests for the invoice mass-notification worker."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from grins_platform.services import invoice_notification_worker
+from grins_platform.services.invoice_notification_worker import (
+    InvoiceNotificationWorker,
+    render_mass_notify_message,
+)
+
+
+def _customer(phone: str | None = "+16125551234") -> MagicMock:
+    customer = MagicMock()
+    customer.id = uuid4()
+    customer.first_name = "Jane"
+    customer.last_name = "Doe"
+    customer.phone = phone
+    return customer
+
+
+def _row(customer: MagicMock, run: MagicMock) -> tuple[Any, ...]:
+    item = MagicMock(id=uuid4())
+    invoice = MagicMock(
+        id=uuid4(),
+        customer_id=customer.id,
+        invoice_number="INV-2026-000001",
+        total_amount=Decimal("250.00"),
+        due_date=date(2026, 4, 1),
+    )
+    return item, invoice, run
+
+
+def _claim_session(rows: list[Any], customers: list[MagicMock]) -> AsyncMock:
+    claimed = MagicMock()
+    claimed.all.return_value = rows
+    loaded = MagicMock()
+    loaded.scalars.return_value = customers
+    session = AsyncMock()
+    session.execute.side_effect = [claimed, MagicMock(), loaded] + [MagicMock()] * 10
+    return session
+
+
+def _factory(claim: AsyncMock) -> tuple[MagicMock, list[AsyncMock]]:
+    """Session factory handing out *claim* first, then fresh send sessions."""
+    sends: list[AsyncMock] = []
+    opened: list[AsyncMock] = []
+
+    def open_session() -> MagicMock:
+        session = AsyncMock() if opened else claim
+        if opened:
+            sends.append(session)
+        opened.append(session)
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=session)
+        ctx.__aexit__ = AsyncMock(return_value=None)
+        return ctx
+
+    return MagicMock(side_effect=open_session), sends
+
+
+def _tracker(*allowed: bool) -> MagicMock:
+    tracker = MagicMock()
+    tracker.check = AsyncMock(
+        side_effect=[MagicMock(allowed=value) for value in allowed],
+    )
+    return tracker
+
+
+def _statements(session: AsyncMock) -> list[str]:
+    return [
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in session.execute.call_args_list
+    ]
+
+
+@pytest.mark.unit
+class TestRenderMassNotifyMessage:
+    """Tests for render_mass_notify_message."""
+
+    def test_fills_placeholders(self) -> None:
+        customer = _customer()
+        _, invoice, _ = _row(customer, MagicMock())
+
+        message = render_mass_notify_message(
+            "Hi {first_name}, {invoice_number} for ${amount} was due {due_date}.",
+            invoice,
+            customer,
+        )
+
+        assert message == "Hi Jane, INV-2026-000001 for $250.00 was due 2026-04-01."
+
+
+@pytest.mark.unit
+class TestInvoiceNotificationWorker:
+    """Tests for InvoiceNotificationWorker.process_batch."""
+
+    @pytest.mark.asyncio
+    async def test_sends_and_records_batch(self) -> None:
+        run = MagicMock(id=uuid4(), message_template="Hi {first_name}")
+        reachable, stopped = _customer(), _customer("+16125550000")
+        rows = [
+            _row(reachable, run),
+            _row(reachable, run),
+            _row(stopped, run),
+            _row(_customer(None), run),
+        ]
+        claim = _claim_session(rows, [reachable, stopped])
+        factory, sends = _factory(claim)
+        sms = MagicMock()
+        sms.send_message = AsyncMock(
+            side_effect=[{"success": True}, {"success": False, "reason": "dup"}],
+        )
+        worker = InvoiceNotificationWorker(
+            factory,
+            provider=MagicMock(),
+            rate_limit_tracker=_tracker(True, True),
+        )
+
+        with (
+            patch.object(
+                invoice_notification_worker,
+                "find_hard_stopped_phones",
+                AsyncMock(return_value={stopped.phone}),
+            ),
+            patch(
+                "grins_platform.services.sms_service.SMSService",
+                return_value=sms,
+            ),
+        ):
+            processed, claimed, throttled = await worker.process_batch()
+
+        assert (processed, claimed, throttled) == (4, 4, False)
+        assert len(sends) == 1
+        assert sms.send_message.await_count == 2
+        sql = _statements(claim)
+        assert "FOR UPDATE OF invoice_notification_items SKIP LOCKED" in sql[0]
+        marked = claim.execute.call_args_list[1].args[0].compile().params
+        assert marked["status"] == "sending"
+        assert sum("UPDATE invoice_notification_items" in s for s in sql) == 5
+        assert sum("reminder_count + " in s for s in sql) == 1
+        assert sum("UPDATE invoice_notification_runs" in s for s in sql) == 2
+        # The claim commits before sending, the results after
+        assert claim.commit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_leaves_items_pending(self) -> None:
+        run = MagicMock(id=uuid4(), message_template="Hi")
+        customer = _customer()
+        rows = [_row(customer, run), _row(customer, run)]
+        claim = _claim_session(rows, [customer])
+        factory, _ = _factory(claim)
+        sms = MagicMock()
+        sms.send_message = AsyncMock(return_value={"success": True})
+        worker = InvoiceNotificationWorker(
+            factory,
+            provider=MagicMock(),
+            rate_limit_tracker=_tracker(True, False),
+        )
+
+        with (
+            patch.object(
+                invoice_notification_worker,
+                "find_hard_stopped_phones",
+                AsyncMock(return_value=set()),
+            ),
+            patch(
+                "grins_platform.services.sms_service.SMSService",
+                return_value=sms,
+            ),
+        ):
+            processed, claimed, throttled = await worker.process_batch()
+
+        assert (processed, claimed, throttled) == (1, 2, True)
+        sms.send_message.assert_awaited_once()
+        (released,) = (
+            params
+            for call in claim.execute.call_args_list
+            if (params := call.args[0].compile().params).get("status") == "pending"
+        )
+        assert released["claimed_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_send_errors_are_recorded_as_failures(self) -> None:
+        run = MagicMock(id=uuid4(), message_template="Hi")
+        customer = _customer()
+        claim = _claim_session([_row(customer, run)], [customer])
+        factory, sends = _factory(claim)
+        sms = MagicMock()
+        sms.send_message = AsyncMock(side_effect=RuntimeError("SMS down"))
+        worker = InvoiceNotificationWorker(
+            factory,
+            provider=MagicMock(),
+            rate_limit_tracker=_tracker(True),
+        )
+
+        with (
+            patch.object(
+                invoice_notification_worker,
+                "find_hard_stopped_phones",
+                AsyncMock(return_value=set()),
+            ),
+            patch(
+                "grins_platform.services.sms_service.SMSService",
+                return_value=sms,
+            ),
+        ):
+            processed, _, throttled = await worker.process_batch()
+
+        assert (processed, throttled) == (1, False)
+        sends[0].rollback.assert_awaited_once()
+        assert not any("reminder_count + " in s for s in _statements(claim))
+
+    @pytest.mark.asyncio
+    async def test_claim_is_committed_before_sending(self) -> None:
+        run = MagicMock(id=uuid4(), message_template="Hi")
+        customer = _customer()
+        claim = _claim_session([_row(customer, run)], [customer])
+        factory, _ = _factory(claim)
+        commits_before_send: list[int] = []
+
+        async def send_message(**_kwargs: Any) -> dict[str, Any]:
+            commits_before_send.append(claim.commit.await_count)
+            return {"success": True}
+
+        sms = MagicMock()
+        sms.send_message = AsyncMock(side_effect=send_message)
+        worker = InvoiceNotificationWorker(
+            factory,
+            provider=MagicMock(),
+            rate_limit_tracker=_tracker(True),
+        )
+
+        with (
+            patch.object(
+                invoice_notification_worker,
+                "find_hard_stopped_phones",
+                AsyncMock(return_value=set()),
+            ),
+            patch(
+                "grins_platform.services.sms_service.SMSService",
+                return_value=sms,
+            ),
+        ):
+            await worker.process_batch()
+
+        assert commits_before_send == [1]
+
+    @pytest.mark.asyncio
+    async def test_abandoned_sending_items_fail_instead_of_resending(self) -> None:
+        run = MagicMock(id=uuid4(), message_template="Hi")
+        rows = [_row(_customer(), run), _row(_customer(), run)]
+        stale = MagicMock()
+        stale.all.return_value = rows
+        session = AsyncMock()
+        session.execute.side_effect = [stale] + [MagicMock()] * 5
+        factory, sends = _factory(session)
+        worker = InvoiceNotificationWorker(factory, provider=MagicMock())
+
+        assert await worker.finalize_interrupted() == 2
+
+        sql = _statements(session)
+        assert "invoice_notification_items.claimed_at < " in sql[0]
+        select_stmt, failed_stmt = (
+            call.args[0] for call in session.execute.call_args_list[:2]
+        )
+        assert "sending" in select_stmt.compile().params.values()
+        params = failed_stmt.compile().params
+        assert (params["status"], params["error"]) == ("failed", "interrupted")
+        assert not any("reminder_count + " in s for s in sql)
+        assert not sends
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_stops_when_queue_drains(self) -> None:
+        worker = InvoiceNotificationWorker(MagicMock(), batch_size=2)
+        worker.finalize_interrupted = AsyncMock(  # type: ignore[method-assign]
+            return_value=1,
+        )
+        worker.process_batch = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[(2, 2, False), (1, 1, False)],
+        )
+
+        assert await worker.run() == 4
+        assert worker.process_batch.await_count == 2
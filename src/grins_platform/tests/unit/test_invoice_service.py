@@ -8,6 +8,7 @@ Property 7: Lien Eligibility Determination
 
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -15,12 +16,14 @@ import pytest
 
 from grins_platform.models.enums import InvoiceStatus, PaymentMethod
 from grins_platform.schemas.invoice import (
+    InvoiceBatchGenerateRequest,
     InvoiceCreate,
     InvoiceLineItem,
     InvoiceListParams,
     InvoiceUpdate,
     PaymentRecord,
 )
+from grins_platform.services import invoice_service
 from grins_platform.services.invoice_service import (
     LIEN_ELIGIBLE_TYPES,
     InvalidInvoiceOperationError,
@@ -1344,6 +1347,107 @@ class TestInvoiceServiceGenerateFromJob:
         assert call_kwargs["line_items"] is not None
 
 
+@pytest.mark.unit
+class TestInvoiceServiceGenerateBatch:
+    """Tests for InvoiceService.generate_batch method."""
+
+    @pytest.fixture
+    def mock_invoice_repo(self) -> AsyncMock:
+        """Create mock invoice repository."""
+        repo = AsyncMock()
+        repo.session = AsyncMock()
+        return repo
+
+    @pytest.fixture
+    def mock_job_repo(self) -> AsyncMock:
+        """Create mock job repository."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def service(
+        self,
+        mock_invoice_repo: AsyncMock,
+        mock_job_repo: AsyncMock,
+    ) -> InvoiceService:
+        """Create service with mock repositories."""
+        return InvoiceService(
+            invoice_repository=mock_invoice_repo,
+            job_repository=mock_job_repo,
+        )
+
+    def _create_mock_job(self, job_type: str, amount: Decimal) -> MagicMock:
+        """Create a mock completed job."""
+        job = MagicMock()
+        job.id = uuid4()
+        job.customer_id = uuid4()
+        job.job_type = job_type
+        job.description = None
+        job.final_amount = amount
+        job.quoted_amount = None
+        return job
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_allocates_block_and_queues_follow_ups(
+        self,
+        service: InvoiceService,
+        mock_invoice_repo: AsyncMock,
+        mock_job_repo: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Invoices are built in memory, inserted once and queued."""
+        jobs = [
+            self._create_mock_job("seasonal", Decimal("120.00")),
+            self._create_mock_job("installation", Decimal("4800.00")),
+        ]
+        invoice_ids = [uuid4(), uuid4()]
+        mock_job_repo.find_uninvoiced_completed.return_value = jobs
+        mock_invoice_repo.get_next_sequences.return_value = [41, 42]
+        mock_invoice_repo.bulk_create.return_value = invoice_ids
+        enqueue = AsyncMock()
+        monkeypatch.setattr(invoice_service, "enqueue_outbox_events", enqueue)
+
+        result = await service.generate_batch(
+            InvoiceBatchGenerateRequest(customer_id=None, render_pdf=True),
+        )
+
+        mock_invoice_repo.get_next_sequences.assert_awaited_once_with(2)
+        rows = mock_invoice_repo.bulk_create.await_args.args[0]
+        year = date.today().year
+        assert [r["invoice_number"] for r in rows] == [
+            f"INV-{year}-000041",
+            f"INV-{year}-000042",
+        ]
+        assert [r["lien_eligible"] for r in rows] == [False, True]
+        assert rows[1]["total_amount"] == Decimal("4800.00")
+        assert rows[1]["line_items"][0]["description"] == "installation"
+        assert rows[0]["due_date"] == date.today() + timedelta(days=30)
+        enqueue.assert_awaited_once_with(
+            mock_invoice_repo.session,
+            invoice_service.INVOICE_PDF_EVENT,
+            invoice_ids,
+        )
+        assert (result.created, result.pdf_queued, result.send_queued) == (2, 2, 0)
+        assert result.invoice_ids == invoice_ids
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_with_no_jobs_allocates_nothing(
+        self,
+        service: InvoiceService,
+        mock_invoice_repo: AsyncMock,
+        mock_job_repo: AsyncMock,
+    ) -> None:
+        """No matching jobs means no sequence values are consumed."""
+        mock_job_repo.find_uninvoiced_completed.return_value = []
+
+        result = await service.generate_batch(
+            InvoiceBatchGenerateRequest(send=True),
+        )
+
+        assert result.created == 0
+        mock_invoice_repo.get_next_sequences.assert_not_awaited()
+        mock_invoice_repo.bulk_create.assert_not_awaited()
+
+
 @pytest.mark.unit
 class TestInvoiceServiceListInvoices:
     """Tests for InvoiceService.list_invoices method."""
@@ -2582,8 +2686,20 @@ class TestInvoiceServiceMassNotify:
 
     @pytest.fixture
     def mock_invoice_repo(self) -> AsyncMock:
+        def create_run(**kwargs: Any) -> MagicMock:
+            run = MagicMock()
+            run.id = uuid4()
+            run.notification_type = kwargs["notification_type"]
+            run.status = "queued" if kwargs["invoice_ids"] else "completed"
+            run.targeted = kwargs["targeted"]
+            run.skipped = kwargs["skipped"]
+            run.sent = 0
+            run.failed = 0
+            return run
+
         repo = AsyncMock()
         repo.update = AsyncMock()
+        repo.create_notification_run.side_effect = create_run
         return repo
 
     @pytest.fixture
@@ -2713,25 +2829,60 @@ class TestInvoiceServiceMassNotify:
         assert result.sent == 0
 
     @pytest.mark.asyncio
-    async def test_mass_notify_counts_send_failures(
+    async def test_mass_notify_queues_reachable_invoices(
         self,
         service: InvoiceService,
         mock_invoice_repo: AsyncMock,
     ) -> None:
-        """SMS send failures are counted, not raised."""
-        from unittest.mock import patch
+        """Reachable invoices are queued on a run instead of sent inline."""
+        reachable = self._mock_invoice_with_customer()
+        unreachable = self._mock_invoice_with_customer(phone=None)
+        mock_invoice_repo.find_past_due.return_value = [reachable, unreachable]
 
-        inv = self._mock_invoice_with_customer()
-        mock_invoice_repo.find_past_due.return_value = [inv]
+        result = await service.mass_notify("past_due", template="Hi {first_name}")
 
-        with patch(
-            "grins_platform.services.sms_service.SMSService",
-            side_effect=Exception("SMS down"),
-        ):
-            result = await service.mass_notify("past_due")
-        assert result.targeted == 1
-        assert result.failed == 1
+        kwargs = mock_invoice_repo.create_notification_run.await_args.kwargs
+        assert kwargs["invoice_ids"] == [reachable.id]
+        assert kwargs["message_template"] == "Hi {first_name}"
+        assert result.run_id is not None
+        assert result.status == "queued"
+        assert (result.targeted, result.pending, result.skipped) == (2, 1, 1)
         assert result.sent == 0
+        mock_invoice_repo.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_mass_notify_run_reports_progress(
+        self,
+        service: InvoiceService,
+        mock_invoice_repo: AsyncMock,
+    ) -> None:
+        """Run progress is read back with the remaining items pending."""
+        run = MagicMock(
+            id=uuid4(),
+            notification_type="past_due",
+            status="sending",
+            targeted=10,
+            sent=4,
+            failed=1,
+            skipped=2,
+        )
+        mock_invoice_repo.get_notification_run.return_value = run
+
+        result = await service.get_mass_notify_run(run.id)
+
+        assert result.run_id == run.id
+        assert (result.sent, result.failed, result.pending) == (4, 1, 3)
+
+    @pytest.mark.asyncio
+    async def test_get_mass_notify_run_not_found(
+        self,
+        service: InvoiceService,
+        mock_invoice_repo: AsyncMock,
+    ) -> None:
+        """Unknown runs raise InvalidInvoiceOperationError."""
+        mock_invoice_repo.get_notification_run.return_value = None
+        with pytest.raises(InvalidInvoiceOperationError):
+            await service.get_mass_notify_run(uuid4())
 
     @pytest.mark.asyncio
     async def test_mass_notify_default_lien_thresholds(
@@ -0,0 +1,192 @@
+"""Unit tests for keyset (cursor) pagination."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from grins_platform.exceptions import ValidationError
+from grins_platform.models.customer import Customer
+from grins_platform.models.lead import Lead
+from grins_platform.repositories import pagination
+from grins_platform.repositories.pagination import (
+    decode_cursor,
+    encode_cursor,
+    paginate_keyset,
+)
+
+
+@pytest.mark.unit
+class TestCursorEncoding:
+    """Tests for encode_cursor / decode_cursor."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime(2026, 4, 15, 9, 30, tzinfo=timezone.utc),
+            date(2026, 4, 15),
+            Decimal("125.50"),
+            uuid4(),
+            "Smith",
+            7,
+            None,
+        ],
+    )
+    def test_round_trips_typed_values(self, value: object) -> None:
+        row_id = uuid4()
+        cursor = encode_cursor("created_at:desc", value, row_id)
+
+        assert decode_cursor(cursor, "created_at:desc") == (value, row_id)
+
+    def test_cursor_is_url_safe(self) -> None:
+        cursor = encode_cursor("last_name:asc", "O'Brien & Sons", uuid4())
+
+        assert "=" not in cursor
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    def test_rejects_cursor_for_other_sort(self) -> None:
+        cursor = encode_cursor("last_name:asc", "Smith", uuid4())
+
+        with pytest.raises(ValidationError) as exc:
+            decode_cursor(cursor, "last_name:desc")
+        assert exc.value.field == "cursor"
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "!!!"])
+    def test_rejects_malformed_cursor(self, cursor: str) -> None:
+        with pytest.raises(ValidationError):
+            decode_cursor(cursor, "last_name:asc")
+
+
+def _session(*results: object) -> AsyncMock:
+    session = AsyncMock()
+    mocks = []
+    for value in results:
+        result = MagicMock()
+        if isinstance(value, list):
+            result.unique.return_value.scalars.return_value.all.return_value = value
+        else:
+            result.scalar.return_value = value
+        mocks.append(result)
+    session.execute.side_effect = mocks
+    return session
+
+
+def _sql(session: AsyncMock, call: int = -1) -> str:
+    stmt = session.execute.await_args_list[call].args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+class TestPaginateKeyset:
+    """Tests for paginate_keyset."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_count_cache(self) -> None:
+        pagination._count_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_first_page_counts_and_returns_next_cursor(self) -> None:
+        rows = [SimpleNamespace(id=uuid4(), last_name=n) for n in ("A", "B", "C")]
+        session = _session(42, rows)
+
+        page = await paginate_keyset(
+            session,
+            select(Customer),
+            sort_column=Customer.last_name,
+            id_column=Customer.id,
+            descending=False,
+            cursor="",
+            limit=2,
+        )
+
+        assert page.total == 42
+        assert [r.last_name for r in page.items] == ["A", "B"]
+        assert page.next_cursor is not None
+        assert decode_cursor(page.next_cursor, "last_name:asc") == ("B", rows[1].id)
+        assert "LIMIT" in _sql(session)
+        assert "OFFSET" not in _sql(session)
+
+    @pytest.mark.asyncio
+    async def test_follow_up_page_seeks_without_counting(self) -> None:
+        session = _session([])
+        cursor = encode_cursor("last_name:asc", "B", uuid4())
+
+        page = await paginate_keyset(
+            session,
+            select(Customer),
+            sort_column=Customer.last_name,
+            id_column=Customer.id,
+            descending=False,
+            cursor=cursor,
+            limit=2,
+        )
+
+        assert page.total is None
+        assert page.next_cursor is None
+        assert session.execute.await_count == 1
+        # last_name is NOT NULL, so the row-value comparison is used
+        assert "(customers.last_name, customers.id) >" in _sql(session)
+
+    @pytest.mark.asyncio
+    async def test_nullable_sort_keeps_nulls_last(self) -> None:
+        session = _session([])
+        cursor = encode_cursor("email:desc", "a@example.com", uuid4())
+
+        _ = await paginate_keyset(
+            session,
+            select(Lead),
+            sort_column=Lead.email,
+            id_column=Lead.id,
+            descending=True,
+            cursor=cursor,
+            limit=5,
+            count="none",
+        )
+
+        sql = _sql(session)
+        assert "leads.email IS NULL" in sql
+        assert "NULLS LAST" in sql
+
+    @pytest.mark.asyncio
+    async def test_cached_count_reused_for_same_filters(self) -> None:
+        stmt = select(Customer).where(Customer.is_priority.is_(True))
+        session = _session(7, [], [])
+
+        for _ in range(2):
+            page = await paginate_keyset(
+                session,
+                stmt,
+                sort_column=Customer.last_name,
+                id_column=Customer.id,
+                descending=False,
+                cursor=None,
+                limit=10,
+            )
+            assert page.total == 7
+
+        assert session.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_count_none_skips_count_query(self) -> None:
+        session = _session([])
+
+        page = await paginate_keyset(
+            session,
+            select(Customer),
+            sort_column=Customer.last_name,
+            id_column=Customer.id,
+            descending=False,
+            cursor=None,
+            limit=10,
+            count="none",
+        )
+
+        assert page.total is None
+        assert session.execute.await_count == 1
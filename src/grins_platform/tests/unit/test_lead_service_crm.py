@@ -22,7 +22,8 @@ Validates: Requirements 12.6, 12.7, 13.9, 13.10, 14.6, 14.7, 15.6, 15.7,
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -31,6 +32,7 @@ from hypothesis import (
     settings,
     strategies as st,
 )
+from sqlalchemy.dialects import postgresql
 
 from grins_platform.exceptions import LeadNotFoundError
 from grins_platform.models.enums import (
@@ -44,7 +46,15 @@ from grins_platform.schemas.lead import (
     LeadSubmission,
     MigrationSummary,
 )
-from grins_platform.services.lead_service import LeadService
+from grins_platform.services.email_config import EmailSettings
+from grins_platform.services.email_service import EmailService
+from grins_platform.services.lead_service import LEAD_OUTBOX_HANDLERS, LeadService
+from grins_platform.services.outbox_service import OutboxProcessor
+from grins_platform.services.sms_service import (
+    SMSConsentDeniedError,
+    SMSError,
+    SMSService,
+)
 from grins_platform.utils.zip_lookup import lookup_zip
 
 # =============================================================================
@@ -1578,6 +1588,153 @@ class TestProperty49SMSLeadConfirmation:
         assert scheduled_fn is send_lead_confirmations_post_commit
         assert scheduled_args[0] == created_lead.id
 
+    @pytest.mark.asyncio
+    async def test_submit_lead_records_confirmations_in_outbox(self) -> None:
+        """Confirmations are outbox rows written in the intake transaction."""
+        created_lead = _make_lead_mock(
+            sms_consent=True,
+            phone="6125551234",
+            email="ann@example.com",
+            action_tags=[ActionTag.NEEDS_CONTACT.value],
+        )
+        repo = AsyncMock()
+        repo.get_recent_by_phone_or_email = AsyncMock(return_value=None)
+        repo.get_by_phone_and_active_status = AsyncMock(return_value=None)
+        repo.create = AsyncMock(return_value=created_lead)
+        svc = _build_lead_service(lead_repo=repo)
+
+        data = LeadSubmission(
+            name="Test User",
+            phone="6125551234",
+            email="ann@example.com",
+            zip_code="80202",
+            situation=LeadSituation.NEW_SYSTEM,
+            sms_consent=True,
+            address="123 Main St, Denver, CO 80209",
+        )
+        await svc.submit_lead(data)
+
+        outbox_rows = [
+            call.args[0].compile().params
+            for call in repo.session.execute.call_args_list
+            if call.args[0].is_insert
+        ]
+        assert [row["event_type"] for row in outbox_rows] == [
+            "lead.confirmation_sms",
+            "lead.confirmation_email",
+        ]
+        assert {row["aggregate_id"] for row in outbox_rows} == {created_lead.id}
+
+    @staticmethod
+    async def _deliver_through_outbox(
+        event_type: str,
+        lead: MagicMock,
+    ) -> dict[str, Any]:
+        """Run one outbox event through the lead handlers; return its update."""
+        session = AsyncMock()
+        claimed = MagicMock()
+        claimed.all.return_value = [(uuid4(), event_type, lead.id, {}, 0)]
+        session.execute.side_effect = [claimed, MagicMock()]
+        session.begin_nested = MagicMock(return_value=AsyncMock())
+        with patch(
+            "grins_platform.repositories.lead_repository.LeadRepository.get_by_id",
+            AsyncMock(return_value=lead),
+        ):
+            await OutboxProcessor(LEAD_OUTBOX_HANDLERS).process_due(session)
+        update = session.execute.call_args_list[1].args[0]
+        return dict(update.compile(dialect=postgresql.dialect()).params)
+
+    @pytest.mark.asyncio
+    async def test_sms_provider_failure_reschedules_confirmation(self) -> None:
+        """A provider error leaves the SMS confirmation pending for retry."""
+        lead = _make_lead_mock(sms_consent=True, phone="6125551234")
+
+        with (
+            patch.object(SMSService, "enforce_time_window", return_value=None),
+            patch.object(
+                SMSService,
+                "send_message",
+                AsyncMock(side_effect=SMSError("provider down")),
+            ),
+        ):
+            update = await self._deliver_through_outbox(
+                "lead.confirmation_sms",
+                lead,
+            )
+
+        assert "status" not in update
+        assert "next_attempt_at" in update
+        assert update["last_error"] == "provider down"
+
+    @pytest.mark.asyncio
+    async def test_sms_opt_out_completes_confirmation(self) -> None:
+        """An opted-out lead's SMS confirmation is not retried."""
+        lead = _make_lead_mock(sms_consent=True, phone="6125551234")
+
+        with (
+            patch.object(SMSService, "enforce_time_window", return_value=None),
+            patch.object(
+                SMSService,
+                "send_message",
+                AsyncMock(side_effect=SMSConsentDeniedError("opted out")),
+            ),
+        ):
+            update = await self._deliver_through_outbox(
+                "lead.confirmation_sms",
+                lead,
+            )
+
+        assert update["status"] == "done"
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_email_completes_confirmation(self) -> None:
+        """Email that is not configured is not retried."""
+        lead = _make_lead_mock(email="ann@example.com")
+
+        with (
+            patch.object(
+                EmailSettings,
+                "is_configured",
+                new_callable=PropertyMock,
+                return_value=False,
+            ),
+            patch.object(EmailService, "send_lead_confirmation") as send,
+        ):
+            update = await self._deliver_through_outbox(
+                "lead.confirmation_email",
+                lead,
+            )
+
+        assert update["status"] == "done"
+        send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_email_provider_error_reschedules_confirmation(self) -> None:
+        """An email provider error leaves the confirmation pending for retry."""
+        lead = _make_lead_mock(email="ann@example.com")
+
+        with (
+            patch.object(
+                EmailSettings,
+                "is_configured",
+                new_callable=PropertyMock,
+                return_value=True,
+            ),
+            patch.object(
+                EmailService,
+                "send_lead_confirmation",
+                side_effect=ConnectionError("provider down"),
+            ),
+        ):
+            update = await self._deliver_through_outbox(
+                "lead.confirmation_email",
+                lead,
+            )
+
+        assert "status" not in update
+        assert "next_attempt_at" in update
+        assert update["last_error"] == "provider down"
+
     @pytest.mark.asyncio
     async def test_submit_lead_without_consent_does_not_trigger_sms(
         self,
@@ -8,13 +8,22 @@ Validates: Requirements 20.1, 40.1
 
 from __future__ import annotations
 
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
-from grins_platform.services.metrics_service import AgreementMetrics, MetricsService
+from grins_platform.models.agreement_metrics_snapshot import AgreementMetricsSnapshot
+from grins_platform.models.enums import AgreementStatus
+from grins_platform.services.metrics_service import (
+    AgreementMetrics,
+    MetricsService,
+    add_months,
+)
 
 
 def _make_row(*values: Any) -> MagicMock:
@@ -239,3 +248,138 @@ class TestMetricsService:
         metrics = await service.compute_metrics()
 
         assert isinstance(metrics, AgreementMetrics)
+
+
+def _make_rows_result(rows: list[tuple[Any, ...]]) -> MagicMock:
+    """Create a mock result with all() and scalars().all() returning rows."""
+    result = MagicMock()
+    result.all.return_value = rows
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+@pytest.mark.unit
+class TestMetricsSnapshots:
+    """Tests for monthly agreement metrics snapshots."""
+
+    def test_add_months_crosses_year_boundaries(self) -> None:
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+        assert add_months(date(2025, 11, 1), 14) == date(2027, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_month_upserts_one_row_per_tier(self) -> None:
+        busy, idle = uuid4(), uuid4()
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[
+                _make_rows_result([(busy, "Essential"), (idle, "Premium")]),
+                _make_rows_result([(busy, 3, Decimal("300.006"))]),  # month end
+                _make_rows_result([(busy, 1, 2, 1)]),  # transitions
+                MagicMock(),  # upsert
+            ],
+        )
+
+        written = await MetricsService(session).snapshot_month(date(2026, 3, 17))
+
+        assert written == 2
+        upsert = session.execute.call_args.args[0]
+        sql = str(upsert.compile(dialect=postgresql.dialect()))
+        assert (
+            "ON CONFLICT ON CONSTRAINT uq_agreement_metrics_snapshots_month_tier" in sql
+        )
+        params = upsert.compile(dialect=postgresql.dialect()).params
+        assert params["month_m0"] == date(2026, 3, 1)
+        assert (params["active_count_m0"], params["mrr_m0"]) == (3, Decimal("300.01"))
+        assert params["not_renewed_count_m0"] == 1
+        assert (params["active_count_m1"], params["cancelled_count_m1"]) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_ensure_snapshots_only_fills_missing_months(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        current = datetime.now(timezone.utc).date().replace(day=1)
+        present = [add_months(current, -1), add_months(current, -3)]
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=_make_rows_result(present))
+        service = MetricsService(session)
+        snapshot = AsyncMock(return_value=1)
+        monkeypatch.setattr(service, "snapshot_month", snapshot)
+
+        assert await service.ensure_snapshots(3) == 1
+        snapshot.assert_awaited_once_with(add_months(current, -2))
+
+    @pytest.mark.asyncio
+    async def test_history_reads_snapshots_and_derives_rates(self) -> None:
+        current = datetime.now(timezone.utc).date().replace(day=1)
+        last = add_months(current, -1)
+        tier_id = uuid4()
+        snapshot = AgreementMetricsSnapshot(
+            month=last,
+            tier_id=tier_id,
+            active_count=9,
+            mrr=Decimal("900.00"),
+            cancelled_count=1,
+            renewed_count=3,
+            not_renewed_count=1,
+        )
+        tiers = _make_rows_result([(tier_id, "Essential")])
+        # The month before last has no snapshot and is computed
+        computed = [
+            _make_rows_result([(tier_id, 4, Decimal("400.00"))]),  # month end
+            _make_rows_result([]),  # transitions
+        ]
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[
+                tiers,
+                _make_rows_result([snapshot]),
+                *computed,
+                _make_rows_result([snapshot]),
+                tiers,
+                *computed,
+                _make_one_result(10, Decimal("1000.00")),
+            ],
+        )
+        service = MetricsService(session)
+
+        history = await service.get_metrics_history(2)
+        mrr = await service.get_mrr_history(3)
+
+        assert [m.month for m in history] == [
+            add_months(current, -2).strftime("%Y-%m"),
+            last.strftime("%Y-%m"),
+        ]
+        assert (history[0].active_count, history[0].mrr) == (4, Decimal("400.00"))
+        latest = history[1]
+        assert (latest.active_count, latest.mrr) == (9, Decimal("900.00"))
+        assert latest.churn_rate == Decimal("10.00")
+        assert latest.renewal_rate == Decimal("75.00")
+        assert latest.tiers[0].tier_name == "Essential"
+        assert [(p.month, p.mrr) for p in mrr.data_points] == [
+            (add_months(current, -2).strftime("%Y-%m"), Decimal("400.00")),
+            (last.strftime("%Y-%m"), Decimal("900.00")),
+            (current.strftime("%Y-%m"), Decimal("1000.00")),
+        ]
+        # Reads never write snapshots
+        assert not any(
+            str(call.args[0]).startswith("INSERT")
+            for call in session.execute.call_args_list
+        )
+        session.commit.assert_not_awaited()
+
+    def test_month_end_state_counts_agreements_in_force(self) -> None:
+        stmt = MetricsService._end_of_month_state_stmt(
+            datetime(2026, 4, 1, tzinfo=timezone.utc),
+        )
+        params = stmt.compile(dialect=postgresql.dialect()).params
+
+        (statuses,) = (v for v in params.values() if isinstance(v, list))
+        assert sorted(statuses) == sorted(
+            [
+                AgreementStatus.ACTIVE.value,
+                AgreementStatus.PAST_DUE.value,
+                AgreementStatus.PAUSED.value,
+                AgreementStatus.PENDING_RENEWAL.value,
+            ],
+        )
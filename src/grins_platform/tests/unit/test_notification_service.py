@@ -13,6 +13,7 @@ Validates: Requirements 39.1, 39.2, 39.3, 39.4, 39.5, 39.8,
 
 from __future__ import annotations
 
+from contextlib import ExitStack
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from typing import Any
@@ -30,6 +31,7 @@ from grins_platform.models.enums import (
     AppointmentStatus,
     InvoiceStatus,
 )
+from grins_platform.services.day_of_reminder_engine import DayOfReminderEngine
 from grins_platform.services.notification_service import (
     CT_TZ,
     LIEN_THRESHOLD_DAYS,
@@ -190,28 +192,67 @@ def _mock_db_for_day_of_reminders(
     appointments: list[MagicMock],
     customers: list[MagicMock | None],
 ) -> AsyncMock:
-    """Create a mock db for send_day_of_reminders."""
-    db = AsyncMock()
-
-    # First execute returns all appointments
-    appt_result = MagicMock()
-    appt_scalars = MagicMock()
-    appt_scalars.all.return_value = appointments
-    appt_result.scalars.return_value = appt_scalars
+    """Create a mock db for send_day_of_reminders.
 
-    # Subsequent executes return customers one by one
-    customer_results = []
-    for c in customers:
-        r = MagicMock()
-        r.scalar_one_or_none.return_value = c
-        customer_results.append(r)
+    The appointments query returns (appointment, customer, staff) rows,
+    no phone is hard-stopped and every reminder is claimed.
+    """
+    rows = [
+        (appt, customer, appt.staff)
+        for appt, customer in zip(appointments, customers, strict=True)
+    ]
+
+    def execute(stmt: Any, *_args: Any, **_kwargs: Any) -> MagicMock:
+        sql = str(stmt)
+        result = MagicMock()
+        if sql.startswith("INSERT INTO notification_dispatches"):
+            result.scalars.return_value = [
+                value
+                for key, value in stmt.compile().params.items()
+                if key.startswith("idempotency_key")
+            ]
+        elif "FROM appointments" in sql:
+            result.all.return_value = rows
+        else:
+            result.scalars.return_value.all.return_value = []
+        return result
 
-    db.execute = AsyncMock(side_effect=[appt_result, *customer_results])
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=execute)
     db.add = MagicMock()
     db.flush = AsyncMock()
     return db
 
 
+def _patch_day_of_engine(db: AsyncMock, sms_service: AsyncMock) -> ExitStack:
+    """Send day-of reminders through *db* and *sms_service*."""
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=db)
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    stack = ExitStack()
+    stack.enter_context(
+        patch.object(
+            DayOfReminderEngine,
+            "_factory",
+            return_value=MagicMock(return_value=ctx),
+        ),
+    )
+    stack.enter_context(
+        patch.object(
+            DayOfReminderEngine,
+            "_sms_dependencies",
+            return_value=(MagicMock(), MagicMock()),
+        ),
+    )
+    stack.enter_context(
+        patch(
+            "grins_platform.services.day_of_reminder_engine.SMSService",
+            return_value=sms_service,
+        ),
+    )
+    return stack
+
+
 # =============================================================================
 # Property 42: All customer notifications are consent-gated
 # Validates: Requirements 39.1, 39.2, 39.3, 39.4, 39.5, 39.8
@@ -318,7 +359,8 @@ class TestProperty42ConsentGatedNotifications:
         svc = _build_service(sms_service=sms_svc, email_service=email_svc)
         db = _mock_db_for_day_of_reminders([appt], [customer])
 
-        count = await svc.send_day_of_reminders(db)
+        with _patch_day_of_engine(db, sms_svc):
+            count = await svc.send_day_of_reminders(db)
 
         assert count == 1
         sms_svc.send_message.assert_awaited_once()
@@ -352,7 +394,8 @@ class TestProperty42ConsentGatedNotifications:
         svc = _build_service(sms_service=sms_svc, email_service=email_svc)
         db = _mock_db_for_day_of_reminders([appt], [customer])
 
-        count = await svc.send_day_of_reminders(db)
+        with _patch_day_of_engine(db, sms_svc):
+            count = await svc.send_day_of_reminders(db)
 
         assert count == 1
         sms_svc.send_message.assert_not_awaited()
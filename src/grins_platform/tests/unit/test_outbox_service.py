@@ -0,0 +1,105 @@
+"""Unit tests for the transactional outbox."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from grins_platform.services.outbox_service import (
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_RETRY_MAX,
+    OutboxProcessor,
+    enqueue_outbox_event,
+    retry_delay,
+)
+
+
+def _session(events: list[tuple[Any, ...]]) -> AsyncMock:
+    session = AsyncMock()
+    claimed = MagicMock()
+    claimed.all.return_value = events
+    session.execute.side_effect = [claimed] + [MagicMock()] * len(events)
+    session.begin_nested = MagicMock(return_value=AsyncMock())
+    return session
+
+
+def _updates(session: AsyncMock) -> list[dict[str, Any]]:
+    params = []
+    for call in session.execute.call_args_list[1:]:
+        compiled = call.args[0].compile(dialect=postgresql.dialect())
+        params.append(compiled.params)
+    return params
+
+
+@pytest.mark.unit
+class TestOutboxProcessor:
+    """Tests for OutboxProcessor.process_due."""
+
+    @pytest.mark.asyncio
+    async def test_delivers_and_marks_done(self) -> None:
+        aggregate_id = uuid4()
+        handler = AsyncMock()
+        session = _session([(uuid4(), "lead.test", aggregate_id, {"a": 1}, 0)])
+
+        delivered = await OutboxProcessor({"lead.test": handler}).process_due(session)
+
+        assert delivered == 1
+        handler.assert_awaited_once_with(session, aggregate_id, {"a": 1})
+        [update] = _updates(session)
+        assert update["status"] == "done"
+        assert update["attempts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_is_rescheduled_then_abandoned(self) -> None:
+        handler = AsyncMock(side_effect=RuntimeError("provider down"))
+        session = _session(
+            [
+                (uuid4(), "lead.test", uuid4(), {}, 0),
+                (uuid4(), "lead.test", uuid4(), {}, OUTBOX_MAX_ATTEMPTS - 1),
+                (uuid4(), "lead.unknown", uuid4(), {}, 0),
+            ],
+        )
+
+        delivered = await OutboxProcessor({"lead.test": handler}).process_due(session)
+
+        assert delivered == 0
+        retried, abandoned, unknown = _updates(session)
+        assert "next_attempt_at" in retried
+        assert retried["last_error"] == "provider down"
+        assert abandoned["status"] == "failed"
+        assert "No outbox handler" in unknown["last_error"]
+
+    @pytest.mark.asyncio
+    async def test_claims_with_skip_locked_for_one_aggregate(self) -> None:
+        aggregate_id = uuid4()
+        session = _session([])
+
+        await OutboxProcessor({}).process_due(session, aggregate_id=aggregate_id)
+
+        sql = str(
+            session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "outbox_events.aggregate_id" in sql
+
+    def test_retry_delay_backs_off_to_cap(self) -> None:
+        assert retry_delay(1) == timedelta(seconds=30)
+        assert retry_delay(3) == timedelta(minutes=2)
+        assert retry_delay(20) == OUTBOX_RETRY_MAX
+
+    @pytest.mark.asyncio
+    async def test_enqueue_inserts_in_callers_session(self) -> None:
+        session = AsyncMock()
+        lead_id = uuid4()
+
+        await enqueue_outbox_event(session, "lead.test", lead_id)
+
+        stmt = session.execute.call_args.args[0]
+        assert stmt.is_insert
+        assert stmt.compile().params["aggregate_id"] == lead_id
+        session.commit.assert_not_called()
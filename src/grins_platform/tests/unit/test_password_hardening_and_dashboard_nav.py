@@ -21,6 +21,10 @@ import bcrypt
 import pytest
 
 from grins_platform.schemas.dashboard import DashboardAlert
+from grins_platform.services.dashboard_alerts import (
+    AlertSnapshot,
+    DashboardAlertEngine,
+)
 from grins_platform.services.dashboard_service import DashboardService
 
 # Import validate_password from the standalone script
@@ -133,28 +137,50 @@ class TestPasswordHardeningScript:
 # ---------------------------------------------------------------------------
 
 
+def _snapshot(records: list[MagicMock]) -> AlertSnapshot:
+    """Build what an alert rule would match for *records*."""
+    if not records:
+        return AlertSnapshot(count=0)
+    cust = getattr(records[0], "customer", None)
+    name = f"{cust.first_name} {cust.last_name}" if cust else None
+    return AlertSnapshot(
+        count=len(records),
+        record_ids=[str(r.id) for r in records],
+        customer_name=name,
+    )
+
+
 def _make_dashboard_service(
     *,
     overdue: list[MagicMock] | None = None,
     lien_warning: list[MagicMock] | None = None,
     uncontacted: int = 0,
     jobs_by_status: dict[str, int] | None = None,
+    sales_entries: list[MagicMock] | None = None,
+    reschedule_requests: list[MagicMock] | None = None,
+    renewal_proposals: list[MagicMock] | None = None,
 ) -> DashboardService:
-    """Create a DashboardService with mocked repositories."""
+    """Create a DashboardService whose alert rules match the given records."""
+    engine = DashboardAlertEngine(session_factory=MagicMock())
+    engine.evaluate = AsyncMock(  # type: ignore[method-assign]
+        return_value={
+            "overdue_invoices": _snapshot(overdue or []),
+            "lien_warnings": _snapshot(lien_warning or []),
+            "uncontacted_leads": AlertSnapshot(count=uncontacted),
+            "jobs_to_schedule": AlertSnapshot(
+                count=(jobs_by_status or {}).get("to_be_scheduled", 0),
+            ),
+            "sales_needing_action": _snapshot(sales_entries or []),
+            "reschedule_requests": _snapshot(reschedule_requests or []),
+            "pending_renewals": _snapshot(renewal_proposals or []),
+        },
+    )
     return DashboardService(
         customer_repository=AsyncMock(),
-        job_repository=AsyncMock(
-            count_by_status=AsyncMock(return_value=jobs_by_status or {}),
-        ),
+        job_repository=AsyncMock(),
         staff_repository=AsyncMock(),
         appointment_repository=AsyncMock(),
-        lead_repository=AsyncMock(
-            count_uncontacted=AsyncMock(return_value=uncontacted),
-        ),
-        invoice_repository=AsyncMock(
-            find_overdue=AsyncMock(return_value=overdue or []),
-            find_lien_warning_due=AsyncMock(return_value=lien_warning or []),
-        ),
+        alert_engine=engine,
     )
 
 
@@ -311,66 +337,6 @@ def _make_customer_mock(first: str = "John", last: str = "Doe") -> MagicMock:
     return cust
 
 
-def _make_session_with_results(
-    sales_entries: list[MagicMock] | None = None,
-    reschedule_requests: list[MagicMock] | None = None,
-    renewal_proposals: list[MagicMock] | None = None,
-) -> AsyncMock:
-    """Create a mock async session that returns different results per query.
-
-    The get_alerts method issues multiple select() calls against the session.
-    We use side_effect to return different results for each call.
-    """
-    session = AsyncMock()
-
-    # Build a list of mock execute results in the order the service calls them:
-    # 1. Sales entries query
-    # 2. Reschedule requests query
-    # 3. Contract renewal proposals query
-    results: list[MagicMock] = []
-
-    for data in [
-        sales_entries or [],
-        reschedule_requests or [],
-        renewal_proposals or [],
-    ]:
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = data
-        mock_result.scalars.return_value = mock_scalars
-        results.append(mock_result)
-
-    session.execute = AsyncMock(side_effect=results)
-    return session
-
-
-def _make_dashboard_service_with_session(
-    *,
-    session: AsyncMock,
-    overdue: list[MagicMock] | None = None,
-    lien_warning: list[MagicMock] | None = None,
-    uncontacted: int = 0,
-    jobs_by_status: dict[str, int] | None = None,
-) -> DashboardService:
-    """Create a DashboardService with mocked repositories and a session."""
-    return DashboardService(
-        customer_repository=AsyncMock(),
-        job_repository=AsyncMock(
-            count_by_status=AsyncMock(return_value=jobs_by_status or {}),
-        ),
-        staff_repository=AsyncMock(),
-        appointment_repository=AsyncMock(),
-        lead_repository=AsyncMock(
-            count_uncontacted=AsyncMock(return_value=uncontacted),
-        ),
-        invoice_repository=AsyncMock(
-            find_overdue=AsyncMock(return_value=overdue or []),
-            find_lien_warning_due=AsyncMock(return_value=lien_warning or []),
-        ),
-        session=session,
-    )
-
-
 @pytest.mark.unit
 class TestDashboardAlertSalesPipeline:
     """Tests for sales pipeline dashboard alerts (Req 3.1, 3.2)."""
@@ -380,8 +346,7 @@ class TestDashboardAlertSalesPipeline:
         """Single sales entry alert links to /sales/{id}."""
         entry_id = uuid.uuid4()
         entry = MagicMock(id=entry_id, customer=_make_customer_mock("Jane", "Smith"))
-        session = _make_session_with_results(sales_entries=[entry])
-        svc = _make_dashboard_service_with_session(session=session)
+        svc = _make_dashboard_service(sales_entries=[entry])
 
         result = await svc.get_alerts()
         alert = next(
@@ -398,8 +363,7 @@ class TestDashboardAlertSalesPipeline:
         """Multiple sales entries alert links to filtered list with highlight."""
         e1 = MagicMock(id=uuid.uuid4(), customer=_make_customer_mock())
         e2 = MagicMock(id=uuid.uuid4(), customer=_make_customer_mock())
-        session = _make_session_with_results(sales_entries=[e1, e2])
-        svc = _make_dashboard_service_with_session(session=session)
+        svc = _make_dashboard_service(sales_entries=[e1, e2])
 
         result = await svc.get_alerts()
         alert = next(
@@ -414,8 +378,7 @@ class TestDashboardAlertSalesPipeline:
     @pytest.mark.asyncio
     async def test_no_sales_alert_when_none_pending(self) -> None:
         """No sales alert when no entries at schedule_estimate status."""
-        session = _make_session_with_results(sales_entries=[])
-        svc = _make_dashboard_service_with_session(session=session)
+        svc = _make_dashboard_service(sales_entries=[])
 
         result = await svc.get_alerts()
         alert = next(
@@ -434,8 +397,7 @@ class TestDashboardAlertRescheduleRequests:
         """Single reschedule request alert includes customer name."""
         req_id = uuid.uuid4()
         req = MagicMock(id=req_id, customer=_make_customer_mock("Bob", "Jones"))
-        session = _make_session_with_results(reschedule_requests=[req])
-        svc = _make_dashboard_service_with_session(session=session)
+        svc = _make_dashboard_service(reschedule_requests=[req])
 
         result = await svc.get_alerts()
         alert = next(
@@ -453,8 +415,7 @@ class TestDashboardAlertRescheduleRequests:
         """Multiple reschedule requests alert links to queue with highlight."""
         r1 = MagicMock(id=uuid.uuid4(), customer=_make_customer_mock())
         r2 = MagicMock(id=uuid.uuid4(), customer=_make_customer_mock())
-        session = _make_session_with_results(reschedule_requests=[r1, r2])
-        svc = _make_dashboard_service_with_session(session=session)
+        svc = _make_dashboard_service(reschedule_requests=[r1, r2])
 
         result = await svc.get_alerts()
         alert = next(
@@ -469,8 +430,7 @@ class TestDashboardAlertRescheduleRequests:
     @pytest.mark.asyncio
     async def test_no_reschedule_alert_when_none_open(self) -> None:
         """No reschedule alert when no open requests."""
-        session = _make_session_with_results(reschedule_requests=[])
-        svc = _make_dashboard_service_with_session(session=session)
+        svc = _make_dashboard_service(reschedule_requests=[])
 
         result = await svc.get_alerts()
         alert = next(
@@ -3279,16 +3279,17 @@ def _mock_worker_session(
     session = AsyncMock()
 
     orphan_result = MagicMock()
-    orphan_result.rowcount = orphan_count
+    orphan_result.scalar_one.return_value = orphan_count
 
     claim_result = MagicMock()
     claim_result.scalars.return_value.all.return_value = recipients or []
 
-    count_result = MagicMock()
-    count_result.all.return_value = []
+    # Serves both the counter upsert and the counter read (no row yet).
+    counter_result = MagicMock()
+    counter_result.one_or_none.return_value = None
 
     session.execute = AsyncMock(
-        side_effect=[orphan_result, claim_result, count_result],
+        side_effect=[orphan_result, claim_result, counter_result, counter_result],
     )
 
     async def _get(model: type, _pk: object) -> object | None:
@@ -3586,17 +3587,19 @@ class TestProperty30CampaignCompletionDetection:
         session = AsyncMock()
 
         orphan_result = MagicMock()
-        orphan_result.rowcount = 0
+        orphan_result.scalar_one.return_value = 0
 
         claim_result = MagicMock()
         claim_result.scalars.return_value.all.return_value = [cr]
 
-        # All sent, no pending/sending
+        upsert_result = MagicMock()
+
+        # All sent, no pending/sending: (pending, sending, sent, failed, cancelled)
         count_result = MagicMock()
-        count_result.all.return_value = [("sent", 1)]
+        count_result.one_or_none.return_value = (0, 0, 1, 0, 0)
 
         session.execute = AsyncMock(
-            side_effect=[orphan_result, claim_result, count_result],
+            side_effect=[orphan_result, claim_result, upsert_result, count_result],
         )
         session.get = AsyncMock(
             side_effect=lambda model, _pk: campaign
@@ -3629,16 +3632,19 @@ class TestProperty30CampaignCompletionDetection:
         session = AsyncMock()
 
         orphan_result = MagicMock()
-        orphan_result.rowcount = 0
+        orphan_result.scalar_one.return_value = 0
 
         claim_result = MagicMock()
         claim_result.scalars.return_value.all.return_value = [cr]
 
+        upsert_result = MagicMock()
+
+        # Counters: (pending, sending, sent, failed, cancelled)
         count_result = MagicMock()
-        count_result.all.return_value = [("sent", 1), ("pending", 2)]
+        count_result.one_or_none.return_value = (2, 0, 1, 0, 0)
 
         session.execute = AsyncMock(
-            side_effect=[orphan_result, claim_result, count_result],
+            side_effect=[orphan_result, claim_result, upsert_result, count_result],
         )
         session.get = AsyncMock(
             side_effect=lambda model, _pk: campaign
@@ -9,9 +9,14 @@ Covers:
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
-from grins_platform.services.sms.consent import _phone_variants
+from grins_platform.services.sms.consent import (
+    _phone_variants,
+    find_hard_stopped_phones,
+)
 from grins_platform.services.sms.phone_normalizer import (
     PhoneNormalizationError,
     normalize_to_e164,
@@ -52,6 +57,32 @@ class TestPhoneVariants:
         assert variants == ["not-a-phone"]
 
 
+@pytest.mark.unit
+class TestFindHardStoppedPhones:
+    """Bulk hard-STOP lookup matches stored forms back to the input phones."""
+
+    @pytest.mark.asyncio
+    async def test_maps_stored_variants_to_inputs_in_one_query(self) -> None:
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = ["612-738-5301"]
+        session.execute.return_value = result
+
+        stopped = await find_hard_stopped_phones(
+            session,
+            ["+16127385301", "(952) 444-0100"],
+        )
+
+        assert stopped == {"+16127385301"}
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_phones_skips_query(self) -> None:
+        session = AsyncMock()
+        assert await find_hard_stopped_phones(session, []) == set()
+        session.execute.assert_not_awaited()
+
+
 @pytest.mark.unit
 class TestFccTestNumberRejection:
     """bughunt L-13: 555-0100..555-0199 is the FCC test range."""
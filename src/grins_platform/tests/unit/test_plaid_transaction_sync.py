@@ -0,0 +1,334 @@
+"""Unit tests for incremental Plaid transaction sync.
+
+The real ``plaid_api.PlaidApi`` client talks to a local stub of
+``/transactions/sync``, so request building, pagination and response
+deserialization are exercised end to end without network access.
+
+Validates: CRM Gap Closure Req 62.2, 62.3, 62.4, 62.5
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections.abc import Iterator
+from datetime import date
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import plaid
+import pytest
+from plaid.api import plaid_api
+from sqlalchemy.dialects import postgresql
+
+from grins_platform.models.enums import ExpenseCategory
+from grins_platform.repositories.expense_repository import ExpenseRepository
+from grins_platform.services.accounting_service import (
+    AccountingService,
+    PlaidConnectionError,
+    categorize_by_mcc,
+)
+
+_TOKEN = "access-sandbox-token"
+
+
+def _txn(
+    transaction_id: str,
+    amount: float,
+    *,
+    mcc: str | None = None,
+    name: str = "Home Depot",
+) -> dict[str, Any]:
+    txn: dict[str, Any] = {
+        "transaction_id": transaction_id,
+        "account_id": "acct",
+        "amount": amount,
+        "iso_currency_code": "USD",
+        "unofficial_currency_code": None,
+        "date": "2026-04-01",
+        "authorized_date": None,
+        "authorized_datetime": None,
+        "datetime": None,
+        "name": name,
+        "merchant_name": name,
+        "pending": False,
+        "payment_channel": "in store",
+        "transaction_code": None,
+    }
+    if mcc is not None:
+        txn["merchant_category_code"] = mcc
+    return txn
+
+
+def _page(
+    next_cursor: str,
+    *,
+    added: list[dict[str, Any]] | None = None,
+    modified: list[dict[str, Any]] | None = None,
+    removed: list[str] | None = None,
+    has_more: bool = False,
+) -> dict[str, Any]:
+    return {
+        "transactions_update_status": "HISTORICAL_UPDATE_COMPLETE",
+        "accounts": [],
+        "added": added or [],
+        "modified": modified or [],
+        "removed": [
+            {"transaction_id": txn_id, "account_id": "acct"} for txn_id in removed or []
+        ],
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+        "request_id": "req",
+    }
+
+
+_MUTATION_ERROR = {
+    "error_type": "TRANSACTIONS_ERROR",
+    "error_code": "TRANSACTIONS_SYNC_MUTATION_DURING_PAGINATION",
+    "error_message": "Underlying transaction data changed",
+    "display_message": None,
+    "request_id": "req",
+}
+
+
+class _StubPlaid:
+    """Answers /transactions/sync from a queue of (status, body) replies."""
+
+    def __init__(self, replies: list[tuple[int, dict[str, Any]]]) -> None:
+        self.replies = replies
+        self.requests: list[dict[str, Any]] = []
+
+    def handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                length = int(self.headers["Content-Length"])
+                stub.requests.append(json.loads(self.rfile.read(length)))
+                status, body = stub.replies.pop(0)
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *_args: Any) -> None:
+                return
+
+        return Handler
+
+
+@pytest.fixture
+def stub_plaid() -> Iterator[tuple[_StubPlaid, Any]]:
+    stub = _StubPlaid([])
+    server = ThreadingHTTPServer(("127.0.0.1", 0), stub.handler())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    configuration = plaid.Configuration(
+        host=f"http://127.0.0.1:{server.server_address[1]}",
+        api_key={"clientId": "client", "secret": "secret"},
+    )
+    try:
+        yield stub, plaid_api.PlaidApi(plaid.ApiClient(configuration))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _expense_repo(cursor: str | None = None) -> AsyncMock:
+    repo = AsyncMock()
+    repo.get_plaid_cursor.return_value = cursor
+    repo.upsert_plaid_transactions.side_effect = len
+    repo.delete_plaid_transactions.return_value = 0
+    return repo
+
+
+@pytest.mark.unit
+class TestLinkLegacyPlaidExpenses:
+    """Tests for ExpenseRepository.link_legacy_plaid_expenses."""
+
+    @pytest.mark.asyncio
+    async def test_links_each_legacy_expense_to_one_matching_row(self) -> None:
+        legacy_id = uuid4()
+        candidates = MagicMock()
+        candidates.all.return_value = [
+            (legacy_id, date(2026, 4, 1), Decimal("12.50"), "Home Depot"),
+            (uuid4(), date(2026, 4, 1), Decimal("99.00"), "Home Depot"),
+        ]
+        session = AsyncMock()
+        session.execute.side_effect = [candidates, MagicMock()]
+        row = {
+            "plaid_transaction_id": "t1",
+            "date": date(2026, 4, 1),
+            "amount": Decimal("12.5"),
+            "vendor": "Home Depot",
+        }
+
+        linked = await ExpenseRepository(session).link_legacy_plaid_expenses(
+            [row, {**row, "plaid_transaction_id": "t2"}],
+        )
+
+        assert linked == 1
+        stmt = session.execute.await_args_list[1].args[0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert str(compiled).startswith("UPDATE expenses SET plaid_transaction_id=")
+        assert "FROM (VALUES" in str(compiled)
+        assert list(compiled.params.values()) == [legacy_id, "t1"]
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_link_skips_update(self) -> None:
+        candidates = MagicMock()
+        candidates.all.return_value = []
+        session = AsyncMock()
+        session.execute.side_effect = [candidates]
+
+        linked = await ExpenseRepository(session).link_legacy_plaid_expenses(
+            [
+                {
+                    "plaid_transaction_id": "t1",
+                    "date": date(2026, 4, 1),
+                    "amount": Decimal(5),
+                    "vendor": None,
+                },
+            ],
+        )
+
+        assert linked == 0
+        session.execute.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestCategorizeByMcc:
+    """Tests for batch MCC categorization."""
+
+    def test_maps_batch_in_order(self) -> None:
+        assert categorize_by_mcc(["5211", "", "5541", "9999"]) == [
+            ExpenseCategory.MATERIALS,
+            ExpenseCategory.OTHER,
+            ExpenseCategory.FUEL,
+            ExpenseCategory.OTHER,
+        ]
+
+
+@pytest.mark.unit
+class TestSyncTransactions:
+    """Tests for AccountingService.sync_transactions against a stub Plaid."""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_pages_and_upserts_final_state(
+        self,
+        stub_plaid: tuple[_StubPlaid, Any],
+    ) -> None:
+        stub, client = stub_plaid
+        stub.replies = [
+            (
+                200,
+                _page(
+                    "c1",
+                    added=[_txn("t1", 12.5, mcc="5211"), _txn("t2", -20.0)],
+                    has_more=True,
+                ),
+            ),
+            (
+                200,
+                _page(
+                    "c2",
+                    added=[_txn("t3", 40.0, name="Shell")],
+                    modified=[_txn("t1", 15.0, mcc="5211")],
+                    removed=["t0"],
+                ),
+            ),
+        ]
+        repo = _expense_repo()
+        svc = AccountingService(expense_repository=repo, plaid_client=client)
+        db = AsyncMock()
+
+        created = await svc.sync_transactions(db, access_token=_TOKEN)
+
+        assert created == 2
+        assert "cursor" not in stub.requests[0]
+        assert stub.requests[1]["cursor"] == "c1"
+        assert {r["count"] for r in stub.requests} == {500}
+
+        rows = repo.upsert_plaid_transactions.await_args.args[0]
+        by_id = {row["plaid_transaction_id"]: row for row in rows}
+        assert set(by_id) == {"t1", "t3"}
+        assert by_id["t1"]["amount"] == Decimal("15.0")
+        assert by_id["t1"]["category"] == ExpenseCategory.MATERIALS.value
+        assert by_id["t1"]["date"] == date(2026, 4, 1)
+        assert by_id["t3"]["category"] == ExpenseCategory.OTHER.value
+        repo.link_legacy_plaid_expenses.assert_awaited_once_with(rows)
+        assert set(repo.delete_plaid_transactions.await_args.args[0]) == {
+            "t0",
+            "t2",
+        }
+        repo.save_plaid_cursor.assert_awaited_once_with(
+            hashlib.sha256(_TOKEN.encode()).hexdigest(),
+            "c2",
+        )
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_stored_cursor(
+        self,
+        stub_plaid: tuple[_StubPlaid, Any],
+    ) -> None:
+        stub, client = stub_plaid
+        stub.replies = [(200, _page("c3"))]
+        repo = _expense_repo(cursor="c2")
+        svc = AccountingService(expense_repository=repo, plaid_client=client)
+
+        created = await svc.sync_transactions(AsyncMock(), access_token=_TOKEN)
+
+        assert created == 0
+        assert stub.requests == [
+            {"access_token": _TOKEN, "count": 500, "cursor": "c2"},
+        ]
+        repo.upsert_plaid_transactions.assert_not_awaited()
+        repo.link_legacy_plaid_expenses.assert_not_awaited()
+        repo.save_plaid_cursor.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_mutation_during_pagination_restarts_from_cursor(
+        self,
+        stub_plaid: tuple[_StubPlaid, Any],
+    ) -> None:
+        stub, client = stub_plaid
+        stub.replies = [
+            (200, _page("c3", added=[_txn("t4", 9.0)], has_more=True)),
+            (400, _MUTATION_ERROR),
+            (200, _page("c4", added=[_txn("t5", 11.0)])),
+        ]
+        repo = _expense_repo(cursor="c2")
+        svc = AccountingService(expense_repository=repo, plaid_client=client)
+
+        await svc.sync_transactions(AsyncMock(), access_token=_TOKEN)
+
+        assert [r.get("cursor") for r in stub.requests] == ["c2", "c3", "c2"]
+        rows = repo.upsert_plaid_transactions.await_args.args[0]
+        assert [row["plaid_transaction_id"] for row in rows] == ["t5"]
+        assert repo.save_plaid_cursor.await_args.args[1] == "c4"
+
+    @pytest.mark.asyncio
+    async def test_api_error_raises_without_saving_cursor(
+        self,
+        stub_plaid: tuple[_StubPlaid, Any],
+    ) -> None:
+        stub, client = stub_plaid
+        stub.replies = [
+            (400, {**_MUTATION_ERROR, "error_code": "ITEM_LOGIN_REQUIRED"}),
+        ]
+        repo = _expense_repo()
+        svc = AccountingService(expense_repository=repo, plaid_client=client)
+        db = AsyncMock()
+
+        with pytest.raises(PlaidConnectionError):
+            await svc.sync_transactions(db, access_token=_TOKEN)
+
+        repo.save_plaid_cursor.assert_not_awaited()
+        db.commit.assert_not_awaited()
@@ -0,0 +1,228 @@
+"""Unit tests for the queued receipt extraction worker."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from grins_platform.schemas.expense import ReceiptExtractionResponse
+from grins_platform.services.accounting_service import (
+    AccountingService,
+    receipt_content_hash,
+)
+from grins_platform.services.receipt_extraction_worker import (
+    RECEIPT_EXTRACTION_MAX_ATTEMPTS,
+    ReceiptExtractionWorker,
+)
+
+
+class _StatusError(Exception):
+    """An API error carrying an HTTP status, like the OpenAI client's."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def _item(data: bytes, batch_id: Any, attempts: int = 0) -> MagicMock:
+    return MagicMock(
+        id=uuid4(),
+        batch_id=batch_id,
+        attempts=attempts,
+        file_key=f"receipts/{data.decode()}.jpg",
+        content_type="image/jpeg",
+        content_hash=receipt_content_hash(data),
+    )
+
+
+def _session(items: list[MagicMock], cached: list[Any] | None = None) -> AsyncMock:
+    claimed = MagicMock()
+    claimed.scalars.return_value = items
+    cache = MagicMock()
+    cache.scalars.return_value = cached or []
+    session = AsyncMock()
+    session.execute.side_effect = [claimed, MagicMock(), cache] + [MagicMock()] * 10
+    return session
+
+
+def _factory(session: AsyncMock) -> MagicMock:
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=session)
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=ctx)
+
+
+def _photos() -> MagicMock:
+    photos = MagicMock()
+    photos.download_file.side_effect = lambda key: key.encode()
+    return photos
+
+
+def _statements(session: AsyncMock) -> list[str]:
+    return [
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in session.execute.call_args_list
+    ]
+
+
+def _item_updates(session: AsyncMock) -> list[dict[str, Any]]:
+    return [
+        call.args[0].compile().params
+        for call in session.execute.call_args_list
+        if str(call.args[0]).startswith("UPDATE receipt_extraction_items")
+    ]
+
+
+def _extracted(confidence: float = 0.9) -> ReceiptExtractionResponse:
+    return ReceiptExtractionResponse(
+        amount=Decimal("12.00"),
+        vendor="Menards",
+        category="materials",
+        confidence=confidence,
+    )
+
+
+@pytest.mark.unit
+class TestReceiptExtractionWorker:
+    """Tests for ReceiptExtractionWorker.process_batch."""
+
+    @pytest.mark.asyncio
+    async def test_extracts_each_distinct_receipt_once(self) -> None:
+        batch_id = uuid4()
+        items = [
+            _item(b"a", batch_id),
+            _item(b"a", batch_id),
+            _item(b"b", batch_id),
+        ]
+        hit = MagicMock(
+            content_hash=receipt_content_hash(b"b"),
+            amount=Decimal("5.00"),
+            vendor="Shell",
+            category="fuel",
+            confidence=0.7,
+        )
+        session = _session(items, [hit])
+        photos = _photos()
+        worker = ReceiptExtractionWorker(_factory(session), photo_service=photos)
+
+        with patch.object(
+            AccountingService,
+            "extract_receipt",
+            AsyncMock(return_value=_extracted()),
+        ) as extract:
+            claimed = await worker.process_batch()
+
+        assert claimed == 3
+        extract.assert_awaited_once_with(b"receipts/a.jpg", "image/jpeg")
+        photos.download_file.assert_called_once_with("receipts/a.jpg")
+        sql = _statements(session)
+        assert "FOR UPDATE SKIP LOCKED" in sql[0]
+        assert "receipt_extraction_items.claimed_at <" in sql[0]
+        assert sql[1].startswith("UPDATE receipt_extraction_items")
+        assert sum("INSERT INTO receipt_extraction_cache" in s for s in sql) == 1
+        assert "ON CONFLICT (content_hash) DO NOTHING" in sql[3]
+        assert sum("UPDATE receipt_extraction_items" in s for s in sql) == 3
+        assert sum("UPDATE receipt_extraction_batches" in s for s in sql) == 2
+        # The claim is committed before anything is downloaded
+        assert session.commit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_claim_is_committed_before_extracting(self) -> None:
+        session = _session([_item(b"a", uuid4())])
+        worker = ReceiptExtractionWorker(_factory(session), photo_service=_photos())
+        commits_before_extract: list[int] = []
+
+        async def extract(*_args: Any) -> ReceiptExtractionResponse:
+            commits_before_extract.append(session.commit.await_count)
+            return _extracted()
+
+        with patch.object(AccountingService, "extract_receipt", extract):
+            await worker.process_batch()
+
+        assert commits_before_extract == [1]
+        claim = _item_updates(session)[0]
+        assert claim["status"] == "processing"
+        assert claim["claimed_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_failures_and_unconfident_results_are_not_cached(self) -> None:
+        batch_id = uuid4()
+        session = _session([_item(b"a", batch_id), _item(b"b", batch_id)])
+        worker = ReceiptExtractionWorker(_factory(session), photo_service=_photos())
+
+        with patch.object(
+            AccountingService,
+            "extract_receipt",
+            AsyncMock(side_effect=[_extracted(0.0), _StatusError(400)]),
+        ):
+            claimed = await worker.process_batch()
+
+        assert claimed == 2
+        sql = _statements(session)
+        assert not any("receipt_extraction_cache" in s for s in sql[3:])
+        updates = _item_updates(session)[1:]
+        assert {params["status"] for params in updates} == {"completed", "failed"}
+        failed = next(p for p in updates if p["status"] == "failed")
+        assert failed["error"] == "HTTP 400"
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried_with_backoff(self) -> None:
+        session = _session([_item(b"a", uuid4(), attempts=1)])
+        worker = ReceiptExtractionWorker(_factory(session), photo_service=_photos())
+
+        with patch.object(
+            AccountingService,
+            "extract_receipt",
+            AsyncMock(side_effect=_StatusError(429)),
+        ):
+            await worker.process_batch()
+
+        (retried,) = _item_updates(session)[1:]
+        assert retried["status"] == "pending"
+        assert retried["error"] == "HTTP 429"
+        assert retried["next_attempt_at"] is not None
+        assert "processed_at" not in retried
+        batch = [
+            call.args[0].compile().params
+            for call in session.execute.call_args_list
+            if str(call.args[0]).startswith("UPDATE receipt_extraction_batches")
+        ]
+        assert batch[0]["failed_1"] == 0
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_fails_after_max_attempts(self) -> None:
+        item = _item(b"a", uuid4(), attempts=RECEIPT_EXTRACTION_MAX_ATTEMPTS - 1)
+        session = _session([item])
+        photos = _photos()
+        photos.download_file.side_effect = ConnectionError("reset by peer")
+        worker = ReceiptExtractionWorker(_factory(session), photo_service=photos)
+
+        await worker.process_batch()
+
+        (failed,) = _item_updates(session)[1:]
+        assert failed["status"] == "failed"
+        assert failed["error"] == "reset by peer"
+        assert "next_attempt_at" not in failed
+
+    @pytest.mark.asyncio
+    async def test_empty_queue_claims_nothing(self) -> None:
+        session = _session([])
+        worker = ReceiptExtractionWorker(_factory(session), photo_service=_photos())
+
+        assert await worker.process_batch() == 0
+        session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_run_stops_when_queue_drains(self) -> None:
+        worker = ReceiptExtractionWorker(MagicMock(), batch_size=2)
+        worker.process_batch = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[2, 1],
+        )
+
+        assert await worker.run() == 3
+        assert worker.process_batch.await_count == 2
@@ -18,6 +18,7 @@ Validates: Requirements 41.6, 41.7, 42.6, 43.6, 44.7, 74.5, 79.6, 79.7,
 from __future__ import annotations
 
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from typing import Any
@@ -30,6 +31,7 @@ from grins_platform.models.enums import AppointmentStatus
 from grins_platform.schemas.audit import AuditLogFilters
 from grins_platform.schemas.portal import PortalInvoiceResponse
 from grins_platform.schemas.settings import BusinessSettingResponse
+from grins_platform.services import invoice_pdf_service
 from grins_platform.services.audit_service import AuditService
 from grins_platform.services.chat_service import (
     ChatResponse,
@@ -39,6 +41,7 @@ from grins_platform.services.invoice_pdf_service import (
     InvoiceNotFoundError,
     InvoicePDFNotFoundError,
     InvoicePDFService,
+    invoice_pdf_key,
 )
 from grins_platform.services.invoice_portal_service import (
     InvoicePortalService,
@@ -648,7 +651,11 @@ class TestProperty77InvoicePDFGeneration:
             return_value="https://s3.example.com/invoices/test.pdf",
         )
 
-        svc = InvoicePDFService(s3_client=s3, s3_bucket="test-bucket")
+        svc = InvoicePDFService(
+            s3_client=s3,
+            s3_bucket="test-bucket",
+            render_executor=ThreadPoolExecutor(max_workers=1),
+        )
 
         with patch("weasyprint.HTML") as mock_html:
             mock_html.return_value.write_pdf.return_value = b"%PDF-fake"
@@ -658,11 +665,11 @@ class TestProperty77InvoicePDFGeneration:
         s3.put_object.assert_called_once()
         put_kwargs = s3.put_object.call_args[1]
         assert put_kwargs["Bucket"] == "test-bucket"
-        assert put_kwargs["Key"] == f"invoices/{invoice.id}.pdf"
+        assert put_kwargs["Key"].startswith(f"invoices/{invoice.id}/")
         assert put_kwargs["ContentType"] == "application/pdf"
         assert put_kwargs["Body"] == b"%PDF-fake"
         # document_url should be set on the invoice
-        assert invoice.document_url == f"invoices/{invoice.id}.pdf"
+        assert invoice.document_url == put_kwargs["Key"]
 
     async def test_generate_pdf_with_missing_invoice_raises_not_found(
         self,
@@ -675,22 +682,33 @@ class TestProperty77InvoicePDFGeneration:
             await svc.generate_pdf(db, uuid4())
 
     async def test_get_pdf_url_with_document_url_returns_presigned(self) -> None:
-        """get_pdf_url returns pre-signed URL."""
-        invoice = _mock_invoice(document_url="invoices/abc.pdf")
-        db = _make_db_returning(invoice)
-
+        """get_pdf_url returns pre-signed URL for an up-to-date PDF."""
+        invoice = _mock_invoice()
+        branding = {"company_name": "Grins Irrigation"}
         s3 = MagicMock()
         s3.generate_presigned_url = MagicMock(
-            return_value="https://s3.example.com/signed/invoices/abc.pdf",
+            return_value="https://s3.example.com/signed/invoice.pdf",
         )
-
         svc = InvoicePDFService(s3_client=s3, s3_bucket="test-bucket")
-        url = await svc.get_pdf_url(db, invoice.id)
+        key = invoice_pdf_key(
+            invoice.id,
+            svc._render_invoice_html(invoice, branding),
+        )
+        invoice.document_url = key
+        db = _make_db_returning(invoice)
+
+        with patch.object(
+            svc,
+            "_get_company_branding",
+            AsyncMock(return_value=branding),
+        ):
+            url = await svc.get_pdf_url(db, invoice.id)
 
-        assert url == "https://s3.example.com/signed/invoices/abc.pdf"
+        assert url == "https://s3.example.com/signed/invoice.pdf"
+        s3.put_object.assert_not_called()
         s3.generate_presigned_url.assert_called_once_with(
             "get_object",
-            Params={"Bucket": "test-bucket", "Key": "invoices/abc.pdf"},
+            Params={"Bucket": "test-bucket", "Key": key},
             ExpiresIn=3600,
         )
 
@@ -704,6 +722,97 @@ class TestProperty77InvoicePDFGeneration:
             await svc.get_pdf_url(db, invoice.id)
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestInvoicePDFRenderingCache:
+    """Off-loop rendering, content-addressed reuse and batch generation."""
+
+    @pytest.fixture
+    def rendered(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Replace WeasyPrint with a recorder run on the injected executor."""
+        calls: list[str] = []
+
+        def fake_render(html_content: str) -> bytes:
+            calls.append(html_content)
+            return b"%PDF-fake"
+
+        monkeypatch.setattr(invoice_pdf_service, "render_pdf_bytes", fake_render)
+        return calls
+
+    @staticmethod
+    def _service(s3: MagicMock) -> InvoicePDFService:
+        svc = InvoicePDFService(
+            s3_client=s3,
+            s3_bucket="test-bucket",
+            render_executor=ThreadPoolExecutor(max_workers=2),
+        )
+        svc._get_company_branding = AsyncMock(  # type: ignore[method-assign]
+            return_value={"company_name": "Grins Irrigation"},
+        )
+        return svc
+
+    async def test_render_pool_spawns_its_workers(self) -> None:
+        executor = invoice_pdf_service.get_pdf_render_executor()
+        try:
+            assert isinstance(executor, ProcessPoolExecutor)
+            assert executor._mp_context.get_start_method() == "spawn"
+        finally:
+            invoice_pdf_service.shutdown_pdf_render_executor()
+
+    async def test_unchanged_invoice_reuses_stored_pdf(
+        self,
+        rendered: list[str],
+    ) -> None:
+        invoice = _mock_invoice(document_url=None)
+        db = _make_db_returning(invoice)
+        s3 = MagicMock()
+        svc = self._service(s3)
+
+        await svc.generate_pdf(db, invoice.id)
+        first_key = invoice.document_url
+        await svc.generate_pdf(db, invoice.id)
+
+        assert len(rendered) == 1
+        s3.put_object.assert_called_once()
+        assert invoice.document_url == first_key
+
+        invoice.status = "paid"
+        await svc.get_pdf_url(db, invoice.id)
+
+        assert len(rendered) == 2
+        assert invoice.document_url != first_key
+
+    async def test_generate_pdfs_reports_each_invoice(
+        self,
+        rendered: list[str],
+    ) -> None:
+        fresh = _mock_invoice(document_url=None)
+        current = _mock_invoice(document_url=None)
+        s3 = MagicMock()
+        s3.generate_presigned_url = MagicMock(return_value="https://signed")
+        svc = self._service(s3)
+        current.document_url = invoice_pdf_key(
+            current.id,
+            svc._render_invoice_html(current, {"company_name": "Grins Irrigation"}),
+        )
+        db = _make_db_returning(None)
+        db.execute.return_value.scalars.return_value.all.return_value = [
+            fresh,
+            current,
+        ]
+        missing = uuid4()
+
+        result = await svc.generate_pdfs(db, [fresh.id, current.id, missing])
+
+        assert (result.generated, result.cached, result.failed) == (1, 1, 1)
+        assert len(rendered) == 1
+        by_id = {item.invoice_id: item for item in result.results}
+        assert by_id[missing].error == "Invoice not found"
+        assert by_id[current.id].cached is True
+        assert by_id[fresh.id].document_url == "https://signed"
+        db.flush.assert_awaited_once()
+
+
 # =============================================================================
 # P81: Portal invoice access by token with correct data
 # Validates: Requirements 84.2, 84.4, 84.5, 84.8, 84.9
@@ -0,0 +1,124 @@
+"""Unit tests for trigram-indexed customer/lead search."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from grins_platform.models.customer import CUSTOMER_SEARCH_TEXT_SQL, Customer
+from grins_platform.models.lead import LEAD_SEARCH_TEXT_SQL
+from grins_platform.models.property import PROPERTY_SEARCH_TEXT_SQL
+from grins_platform.repositories.search_repository import (
+    SearchRepository,
+    normalize_search_term,
+    search_condition,
+)
+
+
+def _sql(term: str) -> tuple[str, dict[str, object]]:
+    compiled = search_condition(Customer.search_text, term).compile(
+        dialect=postgresql.dialect(),
+    )
+    return str(compiled), compiled.params
+
+
+@pytest.mark.unit
+class TestSearchCondition:
+    """Tests for search_condition / normalize_search_term."""
+
+    def test_normalizes_case_and_whitespace(self) -> None:
+        assert normalize_search_term("  John   SMITH ") == "john smith"
+
+    def test_fuzzy_branch_for_longer_terms(self) -> None:
+        sql, params = _sql("Jonh")
+        assert "<%" in sql
+        assert "%jonh%" in params.values()
+
+    def test_short_term_is_substring_only(self) -> None:
+        sql, _ = _sql("jo")
+        assert "<%" not in sql
+
+    def test_phone_digits_matched_without_country_code(self) -> None:
+        _, params = _sql("+1 (952) 867-0001")
+        assert "%9528670001%" in params.values()
+
+    def test_like_wildcards_escaped(self) -> None:
+        _, params = _sql("50%_off")
+        assert "%50\\%\\_off%" in params.values()
+
+
+def _row(**kwargs: object) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid4(), **kwargs)
+
+
+@pytest.mark.unit
+class TestSearchRepository:
+    """Tests for SearchRepository.search."""
+
+    @pytest.mark.asyncio
+    async def test_blank_query_skips_database(self) -> None:
+        session = AsyncMock()
+        assert await SearchRepository(session).search("   ") == []
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_merges_types_by_rank_and_limits(self) -> None:
+        customers = MagicMock()
+        customers.all.return_value = [
+            _row(
+                first_name="Ann",
+                last_name="Lee",
+                phone="9528670001",
+                email=None,
+                rank=0.5,
+            ),
+        ]
+        leads = MagicMock()
+        leads.all.return_value = [
+            _row(name="Anne Leigh", phone="9528670002", status="new", rank=0.9),
+            _row(name="Andy Low", phone="9528670003", status="new", rank=0.1),
+        ]
+        session = AsyncMock()
+        session.execute.side_effect = [customers, leads]
+
+        hits = await SearchRepository(session).search("ann lee", limit=2)
+
+        assert [(h.type, h.title) for h in hits] == [
+            ("lead", "Anne Leigh"),
+            ("customer", "Ann Lee"),
+        ]
+        assert hits[1].subtitle == "9528670001"
+
+    @pytest.mark.asyncio
+    async def test_types_restrict_queries(self) -> None:
+        result = MagicMock()
+        result.all.return_value = []
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        _ = await SearchRepository(session).search("smith", types=("lead",))
+
+        assert session.execute.await_count == 1
+
+
+@pytest.mark.unit
+def test_migration_expressions_match_models() -> None:
+    versions = Path(__file__).parents[2] / "migrations" / "versions"
+    path = next(versions.glob("*_add_search_text_trigram_indexes.py"))
+    spec = importlib.util.spec_from_file_location("search_migration", path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module._SEARCH_TEXT_SQL == {
+        "customers": CUSTOMER_SEARCH_TEXT_SQL,
+        "leads": LEAD_SEARCH_TEXT_SQL,
+        "properties": PROPERTY_SEARCH_TEXT_SQL,
+    }
@@ -0,0 +1,165 @@
+"""Unit tests for bulk segment estimation and the campaign estimate."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+from hypothesis import (
+    given,
+    settings,
+    strategies as st,
+)
+
+from grins_platform.services.campaign_service import CampaignService
+from grins_platform.services.sms.rate_limit_tracker import RateLimitState
+from grins_platform.services.sms.recipient import Recipient
+from grins_platform.services.sms.segment_counter import (
+    count_segments,
+    estimate_segments,
+)
+from grins_platform.services.sms.templating import render_template
+
+_names = st.one_of(
+    st.none(),
+    st.text(alphabet="abcXYZ é€[~", max_size=12),
+    st.sampled_from(["José", "Zoë", "李", "🙂"]),
+)
+
+
+def _per_recipient(body: str, contexts: list[dict[str, str | None]]) -> list[int]:
+    return [
+        count_segments(
+            render_template(
+                body,
+                {k: v or "" for k, v in ctx.items()},
+            ),
+        )[1]
+        for ctx in contexts
+    ]
+
+
+@pytest.mark.unit
+class TestEstimateSegments:
+    """estimate_segments matches rendering and counting each message."""
+
+    @given(
+        body=st.sampled_from(
+            [
+                "Hi {first_name}, spring startup is open!",
+                "{first_name} {last_name}: " + "x" * 150,
+                "Hola {first_name} — ¿listo?",
+                "Price {first_name:>5} {0}",
+                "Literal {{braces}} for {last_name}",
+                "broken {first_name",
+            ],
+        ),
+        names=st.lists(st.tuples(_names, _names), max_size=8),
+    )
+    @settings(max_examples=60)
+    def test_matches_per_message_count(
+        self,
+        body: str,
+        names: list[tuple[str | None, str | None]],
+    ) -> None:
+        contexts = [{"first_name": f, "last_name": last} for f, last in names]
+        expected = _per_recipient(body, contexts)
+
+        estimate = estimate_segments(body, contexts)
+
+        assert estimate.messages == len(contexts)
+        assert estimate.total_segments == sum(expected)
+        assert estimate.max_segments_per_message == max(expected, default=0)
+        assert estimate.gsm7_segments + estimate.ucs2_segments == sum(expected)
+
+    def test_ucs2_name_switches_only_that_message(self) -> None:
+        contexts: list[dict[str, str | None]] = [
+            {"first_name": "Ann"},
+            {"first_name": "Ann"},
+            {"first_name": "Zoë"},  # ë is not in GSM-7
+        ]
+
+        estimate = estimate_segments("Hi {first_name}", contexts)
+
+        assert estimate.gsm7_messages == 2
+        assert estimate.ucs2_messages == 1
+
+    def test_prefix_read_from_environment(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("SMS_SENDER_PREFIX", "")
+        short = estimate_segments("x" * 137, [{}])
+        monkeypatch.setenv("SMS_SENDER_PREFIX", "Grins Irrigation: ")
+        long = estimate_segments("x" * 137, [{}])
+
+        assert short.total_segments == 1
+        assert long.total_segments == 2
+
+
+def _recipient(first_name: str | None) -> Recipient:
+    return Recipient(
+        phone="+19528670001",
+        source_type="customer",
+        first_name=first_name,
+        last_name=None,
+    )
+
+
+@pytest.mark.unit
+class TestEstimateCampaign:
+    """CampaignService.estimate_campaign projections."""
+
+    @pytest.mark.asyncio
+    async def test_cost_and_duration_under_rate_limits(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("SMS_COST_PER_SEGMENT", "0.01")
+        service = CampaignService(campaign_repository=AsyncMock())
+        service._filter_recipients = AsyncMock(  # type: ignore[method-assign]
+            return_value=[_recipient("Ann")] * 300,
+        )
+        service._read_sms_rate_limit = AsyncMock(  # type: ignore[method-assign]
+            return_value=RateLimitState(hourly_allowed=100, daily_allowed=1000),
+        )
+
+        result = await service.estimate_campaign(
+            AsyncMock(),
+            "Hi {first_name}",
+            {"customers": {}},
+        )
+
+        assert result["recipients"] == 300
+        assert result["total_segments"] == 300
+        assert result["projected_cost"] == pytest.approx(3.0)
+        assert result["sends_per_hour"] == 100
+        assert result["estimated_send_hours"] == pytest.approx(3.0)
+        assert result["estimated_send_days"] == 1
+        assert result["rate_limit"]["hourly_allowed"] == 100
+
+    @pytest.mark.asyncio
+    async def test_cost_omitted_when_unconfigured(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.delenv("SMS_COST_PER_SEGMENT", raising=False)
+        service = CampaignService(campaign_repository=AsyncMock())
+        service._filter_recipients = AsyncMock(  # type: ignore[method-assign]
+            return_value=[_recipient(None)],
+        )
+        service._read_sms_rate_limit = AsyncMock(  # type: ignore[method-assign]
+            return_value=RateLimitState(),
+        )
+
+        result = await service.estimate_campaign(
+            AsyncMock(),
+            "Pick a day",
+            {},
+            [{"key": "1", "label": "Mon"}, {"key": "2", "label": "Tue"}],
+        )
+
+        assert result["projected_cost"] is None
+        assert result["cost_per_segment"] is None
+        assert result["sends_per_hour"] == 120
+        assert result["send_window_hours"] == 13
@@ -0,0 +1,87 @@
+"""Unit tests for streamed CSV/gzip/XLSX export encoders."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import zipfile
+from typing import TYPE_CHECKING
+from xml.etree import ElementTree
+
+import pytest
+
+from grins_platform.utils import tabular_export
+from grins_platform.utils.tabular_export import encode_rows
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+_NS = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+async def _rows(rows: Sequence[Sequence[object]]) -> AsyncIterator[Sequence[object]]:
+    for row in rows:
+        yield row
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+_ROWS = [
+    ["Ann", "O'Brien, Jr.", True, 3],
+    ["Zoë", "a < b & c", False, None],
+]
+
+
+@pytest.mark.unit
+class TestEncodeRows:
+    """Tests for encode_rows."""
+
+    @pytest.mark.asyncio
+    async def test_csv_streams_in_chunks(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(tabular_export, "ROWS_PER_CHUNK", 1)
+
+        chunks = await _collect(encode_rows("csv", ["a", "b", "c", "d"], _rows(_ROWS)))
+
+        assert len(chunks) >= 3
+        parsed = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        assert parsed[0] == ["a", "b", "c", "d"]
+        assert parsed[1] == ["Ann", "O'Brien, Jr.", "True", "3"]
+
+    @pytest.mark.asyncio
+    async def test_gzip_round_trips(self) -> None:
+        plain = b"".join(await _collect(encode_rows("csv", ["a"], _rows([["x"]]))))
+
+        chunks = await _collect(encode_rows("csv.gz", ["a"], _rows([["x"]])))
+
+        assert gzip.decompress(b"".join(chunks)) == plain
+
+    @pytest.mark.asyncio
+    async def test_xlsx_is_a_readable_workbook(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(tabular_export, "ROWS_PER_CHUNK", 1)
+
+        chunks = await _collect(
+            encode_rows("xlsx", ["a", "b", "c", "d"], _rows(_ROWS), sheet_name="X"),
+        )
+
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+            assert archive.testzip() is None
+            workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))  # noqa: S314
+            sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))  # noqa: S314
+        assert workbook.find(".//s:sheet", _NS).get("name") == "X"  # type: ignore[union-attr]
+        rows = sheet.findall(".//s:row", _NS)
+        assert len(rows) == 3
+        texts = [t.text for t in rows[2].iterfind(".//s:t", _NS)]
+        assert texts == ["Zoë", "a < b & c"]
+        bools = [
+            c.findtext("s:v", namespaces=_NS) for c in rows[1] if c.get("t") == "b"
+        ]
+        assert bools == ["1"]
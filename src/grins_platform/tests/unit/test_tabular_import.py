@@ -0,0 +1,124 @@
+"""Unit tests for the CSV/XLSX import readers."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from typing import TYPE_CHECKING
+
+import pytest
+
+from grins_platform.utils.tabular_export import encode_rows
+from grins_platform.utils.tabular_import import (
+    import_format_for,
+    iter_csv_rows,
+    iter_rows,
+    iter_xlsx_rows,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+async def _rows(rows: Sequence[Sequence[object]]) -> AsyncIterator[Sequence[object]]:
+    for row in rows:
+        yield row
+
+
+def _shared_string_workbook() -> bytes:
+    """A workbook laid out the way Excel saves it (shared strings, gaps).
+
+    Blank rows 2-3 are left out of the sheet XML, as Excel does.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "xl/workbook.xml",
+            f'<workbook xmlns="{_MAIN}" xmlns:r="{_REL}"><sheets>'
+            '<sheet name="Customers" sheetId="1" r:id="rId7"/></sheets></workbook>',
+        )
+        archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+            'relationships"><Relationship Id="rId7" Target="worksheets/data.xml"/>'
+            "</Relationships>",
+        )
+        archive.writestr(
+            "xl/sharedStrings.xml",
+            f'<sst xmlns="{_MAIN}"><si><t>first_name</t></si><si><t>zip</t></si>'
+            "<si><r><t>An</t></r><r><t>n</t></r></si></sst>",
+        )
+        archive.writestr(
+            "xl/worksheets/data.xml",
+            f'<worksheet xmlns="{_MAIN}"><sheetData>'
+            '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="C1" t="s"><v>1</v></c>'
+            "</row>"
+            '<row r="4"><c r="A4" t="s"><v>2</v></c><c r="B4" t="b"><v>1</v></c>'
+            '<c r="C4"><v>55401.0</v></c></row>'
+            "</sheetData></worksheet>",
+        )
+    return buffer.getvalue()
+
+
+@pytest.mark.unit
+class TestImportReaders:
+    """Tests for the tabular import readers."""
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("customers.CSV", "csv"),
+            ("customers.xlsx", "xlsx"),
+            ("customers.xls", None),
+            (None, None),
+        ],
+    )
+    def test_import_format_for(self, filename: str | None, expected: str) -> None:
+        assert import_format_for(filename) == expected
+
+    def test_csv_with_bom_and_cp1252(self) -> None:
+        utf8 = "﻿first_name,last_name\nZoë,Smith\n".encode()
+        cp1252 = "first_name,last_name\nZoë,Smith\n".encode("cp1252")
+
+        assert list(iter_csv_rows(utf8)) == [
+            (1, ["first_name", "last_name"]),
+            (2, ["Zoë", "Smith"]),
+        ]
+        assert list(iter_csv_rows(cp1252)) == list(iter_csv_rows(utf8))
+
+    @pytest.mark.asyncio
+    async def test_xlsx_round_trips_export(self) -> None:
+        chunks = encode_rows(
+            "xlsx",
+            ["first_name", "phone"],
+            _rows([["O'Brien & Co", 6125551234], ["Zoë", None]]),
+        )
+        data = b"".join([chunk async for chunk in chunks])
+
+        assert [values for _, values in iter_rows(data, "xlsx")] == [
+            ["first_name", "phone"],
+            ["O'Brien & Co", "6125551234"],
+            ["Zoë", ""],
+        ]
+
+    def test_xlsx_shared_strings_and_sparse_cells(self) -> None:
+        rows = list(iter_xlsx_rows(_shared_string_workbook()))
+
+        assert rows == [(1, ["first_name", "", "zip"]), (4, ["Ann", "true", "55401"])]
+
+    def test_csv_rows_are_numbered_by_starting_line(self) -> None:
+        data = b'first_name,notes\n\nAnn,"two\nlines"\nBob,x\n'
+
+        assert list(iter_csv_rows(data)) == [
+            (1, ["first_name", "notes"]),
+            (2, []),
+            (3, ["Ann", "two\nlines"]),
+            (5, ["Bob", "x"]),
+        ]
+
+    def test_xlsx_rejects_non_zip(self) -> None:
+        with pytest.raises(ValueError, match="not a valid XLSX"):
+            list(iter_xlsx_rows(b"first_name,last_name\n"))
@@ -0,0 +1,186 @@
+"""CSV and XLSX readers for bulk imports.
+
+The counterpart of ``tabular_export``: both readers yield each row as its
+1-based row number in the file and a list of strings (header first), so
+importers can map columns and report errors without caring about the file
+format. The number is the line a CSV record starts on, or the worksheet's
+``<row r="N">`` (Excel leaves blank rows out of the XML). XLSX is read
+with the standard library by streaming the first worksheet's XML; shared
+strings, inline strings, booleans and numbers are supported, which covers
+spreadsheets saved by Excel, Google Sheets and LibreOffice. Formulas yield
+their cached values.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import io
+import posixpath
+import re
+import zipfile
+from typing import TYPE_CHECKING, Literal
+from xml.etree import ElementTree
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+ImportFormat = Literal["csv", "xlsx"]
+
+# Decompressed size allowed for any single XLSX part (guards zip bombs).
+MAX_XLSX_PART_SIZE = 200 * 1024 * 1024
+
+_ENCODINGS = ("utf-8-sig", "cp1252", "latin-1")
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_CELL_REF = re.compile(r"([A-Z]+)")
+
+
+def import_format_for(filename: str | None) -> ImportFormat | None:
+    """Guess the import format from a file name, or None if unsupported."""
+    name = (filename or "").lower()
+    if name.endswith(".xlsx"):
+        return "xlsx"
+    if name.endswith((".csv", ".txt")):
+        return "csv"
+    return None
+
+
+def _decode(data: bytes) -> str:
+    # latin-1 maps every byte, so the last encoding always succeeds
+    *preferred, fallback = _ENCODINGS
+    for encoding in preferred:
+        with contextlib.suppress(UnicodeDecodeError):
+            return data.decode(encoding)
+    return data.decode(fallback)
+
+
+def iter_csv_rows(data: bytes) -> Iterator[tuple[int, list[str]]]:
+    """Yield the numbered rows of a CSV file (UTF-8 with or without BOM, or cp1252).
+
+    A quoted field may span lines, so a row is numbered by the line it
+    starts on.
+    """
+    reader = csv.reader(io.StringIO(_decode(data), newline=""))
+    line = 0
+    for values in reader:
+        yield line + 1, values
+        line = reader.line_num
+
+
+def _open_part(archive: zipfile.ZipFile, name: str) -> io.BufferedIOBase:
+    info = archive.getinfo(name)
+    if info.file_size > MAX_XLSX_PART_SIZE:
+        msg = f"Workbook part {name} is too large"
+        raise ValueError(msg)
+    return archive.open(info)  # type: ignore[return-value]
+
+
+def _first_sheet_path(archive: zipfile.ZipFile) -> str:
+    """Resolve the first worksheet's part name via the workbook relationships."""
+    default = "xl/worksheets/sheet1.xml"
+    names = set(archive.namelist())
+    if not {"xl/workbook.xml", "xl/_rels/workbook.xml.rels"} <= names:
+        return default
+    with _open_part(archive, "xl/workbook.xml") as f:
+        workbook = ElementTree.parse(f)  # noqa: S314 - expat rejects entity bombs
+    sheet = workbook.find(f"{_NS}sheets/{_NS}sheet")
+    rel_id = sheet.get(f"{_REL_NS}id") if sheet is not None else None
+    with _open_part(archive, "xl/_rels/workbook.xml.rels") as f:
+        rels = ElementTree.parse(f)  # noqa: S314
+    for rel in rels.iter(f"{_PKG_REL_NS}Relationship"):
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                return target.lstrip("/")
+            return posixpath.normpath(posixpath.join("xl", target))
+    return default
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+    strings: list[str] = []
+    with _open_part(archive, "xl/sharedStrings.xml") as f:
+        for _, elem in ElementTree.iterparse(f):  # noqa: S314
+            if elem.tag == f"{_NS}si":
+                strings.append("".join(t.text or "" for t in elem.iter(f"{_NS}t")))
+                elem.clear()
+    return strings
+
+
+def _column_index(ref: str | None, default: int) -> int:
+    match = _CELL_REF.match(ref or "")
+    if not match:
+        return default
+    index = 0
+    for letter in match.group(1):
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def _cell_text(cell: ElementTree.Element, shared: list[str]) -> str:
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        return "".join(t.text or "" for t in cell.iter(f"{_NS}t"))
+    value = cell.findtext(f"{_NS}v") or ""
+    if cell_type == "s":
+        return shared[int(value)] if value.isdigit() else ""
+    if cell_type == "b":
+        return "true" if value == "1" else "false"
+    if cell_type == "n" and value.endswith(".0"):
+        # Whole numbers (phones, ZIP codes) come back as e.g. "55401.0"
+        return value[:-2]
+    return value
+
+
+def _row_number(ref: str | None, default: int) -> int:
+    return int(ref) if ref and ref.isdigit() else default
+
+
+def iter_xlsx_rows(data: bytes) -> Iterator[tuple[int, list[str]]]:
+    """Yield the numbered rows of the first worksheet of an XLSX workbook."""
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(data))
+    except zipfile.BadZipFile as e:
+        msg = "File is not a valid XLSX workbook"
+        raise ValueError(msg) from e
+    with archive:
+        try:
+            shared = _shared_strings(archive)
+        except ElementTree.ParseError as e:
+            msg = f"Shared strings are not valid XML: {e}"
+            raise ValueError(msg) from e
+        try:
+            sheet = _open_part(archive, _first_sheet_path(archive))
+        except KeyError as e:
+            msg = "Workbook has no worksheet"
+            raise ValueError(msg) from e
+        with sheet:
+            number = 0
+            try:
+                for _, elem in ElementTree.iterparse(sheet):  # noqa: S314
+                    if elem.tag != f"{_NS}row":
+                        continue
+                    number = _row_number(elem.get("r"), number + 1)
+                    values: list[str] = []
+                    for cell in elem.iter(f"{_NS}c"):
+                        index = _column_index(cell.get("r"), len(values))
+                        values.extend([""] * (index - len(values)))
+                        values.append(_cell_text(cell, shared))
+                    elem.clear()
+                    yield number, values
+            except ElementTree.ParseError as e:
+                msg = f"Worksheet is not valid XML: {e}"
+                raise ValueError(msg) from e
+
+
+def iter_rows(
+    data: bytes,
+    import_format: ImportFormat,
+) -> Iterator[tuple[int, list[str]]]:
+    """Yield the numbered rows (header first) of an uploaded CSV or XLSX file."""
+    if import_format == "xlsx":
+        return iter_xlsx_rows(data)
+    return iter_csv_rows(data)